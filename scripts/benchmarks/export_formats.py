@@ -0,0 +1,115 @@
+"""
+Бенчмарк генераторов файлов экспорта партий: время генерации и размер файла по форматам.
+
+Генерирует партии в виде BatchRawDataDTO (как их отдает сервис экспорта) с --products-per-row
+продуктами в JSON колонке products и записывает их каждым генератором страницами по --page-size
+во временный файл, как при экспорте. БД и MinIO не нужны: измеряется только генератор.
+Форматы, для которых не установлена необязательная зависимость (pyarrow, zstandard), пропускаются.
+
+Запуск:
+    python -m scripts.benchmarks.export_formats --rows 100000 --formats xlsx csv csv.gz csv.zst parquet
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+from src.application.batches.dtos.raw_data import BatchRawDataDTO
+from src.infrastructure.common.exceptions.batches import BatchExportGenerationError
+from src.infrastructure.common.file_generators.batches.exports import BatchesExportGeneratorFactory
+
+
+def _make_pages(count: int, products_per_row: int, page_size: int) -> list[list[BatchRawDataDTO]]:
+    base_date = date(2026, 1, 1)
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    rows = []
+    for index in range(count):
+        batch_id = uuid4()
+        batch_date = base_date + timedelta(days=index % 365)
+        shift_start = datetime.combine(batch_date, datetime.min.time(), tzinfo=UTC) + timedelta(hours=8)
+        products = [
+            {
+                "unique_code": f"P{index:08d}-{n}",
+                "batch_id": str(batch_id),
+                "is_aggregated": False,
+                "aggregated_at": None,
+                "uuid": str(uuid4()),
+                "created_at": created_at.isoformat(),
+                "updated_at": None,
+            }
+            for n in range(products_per_row)
+        ]
+        rows.append(
+            BatchRawDataDTO(
+                uuid=batch_id,
+                created_at=created_at + timedelta(seconds=index),
+                batch_number=index + 1,
+                batch_date=batch_date,
+                nomenclature=f"Номенклатура {index % 500}",
+                ekn_code=f"EKN-{index % 1000:04d}",
+                shift="Дневная",
+                team=f"Бригада {index % 10}",
+                task_description="Производство партии",
+                shift_start=shift_start,
+                shift_end=shift_start + timedelta(hours=8),
+                is_closed=False,
+                work_center_identifier=f"WC-{index % 20:02d}",
+                work_center_name=f"Рабочий центр {index % 20}",
+                products=json.dumps(products),
+            )
+        )
+    return [rows[offset : offset + page_size] for offset in range(0, len(rows), page_size)]
+
+
+async def _iter_pages(pages: list[list[BatchRawDataDTO]]) -> AsyncIterator[list[BatchRawDataDTO]]:
+    for page in pages:
+        yield page
+
+
+async def _measure(file_format: str, pages: list[list[BatchRawDataDTO]]) -> tuple[float, int]:
+    generator = BatchesExportGeneratorFactory.create(file_format)
+    with tempfile.TemporaryFile() as output:
+        started = time.perf_counter()
+        await generator.write(_iter_pages(pages), output)
+        elapsed = time.perf_counter() - started
+        return elapsed, output.tell()
+
+
+async def _run(rows: int, formats: list[str], products_per_row: int, page_size: int) -> None:
+    pages = _make_pages(rows, products_per_row, page_size)
+
+    sys.stdout.write(f"rows={rows}, products_per_row={products_per_row}, page_size={page_size}\n")
+    sys.stdout.write(f"{'format':>8}  {'time, s':>8}  {'rows/s':>9}  {'size, MiB':>9}  {'bytes/row':>9}\n")
+
+    for file_format in formats:
+        try:
+            elapsed, size = await _measure(file_format, pages)
+        except BatchExportGenerationError as e:
+            sys.stdout.write(f"{file_format:>8}  skipped: {e}\n")
+            continue
+        sys.stdout.write(
+            f"{file_format:>8}  {elapsed:>8.2f}  {rows / elapsed:>9.0f}  {size / 1024 / 1024:>9.1f}  {size / rows:>9.0f}\n"
+        )
+        sys.stdout.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--formats", nargs="+", default=["xlsx", "csv", "csv.gz", "csv.zst", "parquet"])
+    parser.add_argument("--products-per-row", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.rows, args.formats, args.products_per_row, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
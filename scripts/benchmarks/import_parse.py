@@ -0,0 +1,154 @@
+"""
+Бенчмарк парсинга файлов импорта партий: полный parse против потокового parse_stream.
+
+Генерирует CSV и XLSX файлы с колонками импорта партий заданного размера во временном каталоге,
+затем замеряет время и пик памяти Python (tracemalloc) при чтении файла целиком и порциями.
+БД не нужна: измеряется только парсер. Время включает накладные расходы tracemalloc,
+одинаковые для обоих вариантов. Полный parse для больших файлов пропускается (--full-parse-limit),
+так как держит в памяти и байты файла, и все строки.
+
+Запуск:
+    python -m scripts.benchmarks.import_parse --sizes 10000 100000 1000000 --formats csv xlsx --chunk-size 1000
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from src.infrastructure.common.file_parsers import FileParserFactory
+
+COLUMNS = [
+    "batch_number",
+    "batch_date",
+    "nomenclature",
+    "ekn_code",
+    "task_description",
+    "shift",
+    "team",
+    "shift_start",
+    "shift_end",
+    "is_closed",
+    "closed_at",
+    "work_center_identifier",
+    "work_center_name",
+    "products",
+]
+
+
+def _make_rows(count: int):
+    base_date = date(2026, 1, 1)
+    for index in range(count):
+        batch_date = base_date + timedelta(days=index % 365)
+        shift_start = datetime.combine(batch_date, datetime.min.time()) + timedelta(hours=8)
+        yield [
+            index + 1,
+            batch_date.isoformat(),
+            f"Номенклатура {index % 500}",
+            f"EKN-{index % 1000:04d}",
+            "Производство партии",
+            "Дневная",
+            f"Бригада {index % 10}",
+            shift_start.isoformat(),
+            (shift_start + timedelta(hours=8)).isoformat(),
+            "false",
+            "",
+            f"WC-{index % 20:02d}",
+            f"Рабочий центр {index % 20}",
+            json.dumps([{"unique_code": f"P{index:08d}-{n}"} for n in range(3)]),
+        ]
+
+
+def _write_csv(path: Path, count: int) -> None:
+    with path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        writer.writerows(_make_rows(count))
+
+
+def _write_xlsx(path: Path, count: int) -> None:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append(COLUMNS)
+    for row in _make_rows(count):
+        worksheet.append(row)
+    workbook.save(path)
+
+
+WRITERS = {"csv": _write_csv, "xlsx": _write_xlsx}
+
+
+async def _measure_full(path: Path, file_format: str) -> tuple[int, float, int]:
+    parser = FileParserFactory.create(file_format)
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = await parser.parse(path.read_bytes())
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(rows), elapsed, peak
+
+
+async def _measure_stream(path: Path, file_format: str, chunk_size: int) -> tuple[int, float, int]:
+    parser = FileParserFactory.create(file_format)
+    total = 0
+    tracemalloc.start()
+    started = time.perf_counter()
+    with path.open("rb") as file:
+        async for chunk in parser.parse_stream(file, chunk_size=chunk_size):
+            total += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, elapsed, peak
+
+
+async def _run(sizes: list[int], formats: list[str], chunk_size: int, full_parse_limit: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sys.stdout.write(
+            f"{'format':>6}  {'rows':>8}  {'file, MB':>9}  {'full, s':>8}  {'full peak, MB':>13}  "
+            f"{'stream, s':>9}  {'stream peak, MB':>15}\n"
+        )
+        for file_format in formats:
+            for size in sizes:
+                path = Path(directory) / f"import_{size}.{file_format}"
+                WRITERS[file_format](path, size)
+                file_size = path.stat().st_size / 2**20
+
+                if size <= full_parse_limit:
+                    rows, full_time, full_peak = await _measure_full(path, file_format)
+                    full = f"{full_time:>8.2f}  {full_peak / 2**20:>13.1f}"
+                else:
+                    full = f"{'-':>8}  {'-':>13}"
+
+                rows, stream_time, stream_peak = await _measure_stream(path, file_format, chunk_size)
+                sys.stdout.write(
+                    f"{file_format:>6}  {rows:>8}  {file_size:>9.1f}  {full}  "
+                    f"{stream_time:>9.2f}  {stream_peak / 2**20:>15.1f}\n"
+                )
+                sys.stdout.flush()
+                path.unlink()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--formats", nargs="+", choices=sorted(WRITERS), default=["csv", "xlsx"])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--full-parse-limit", type=int, default=100_000)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.sizes, args.formats, args.chunk_size, args.full_parse_limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Бенчмарк подготовки строк импорта партий: в одном процессе против пула процессов.
+
+Генерирует строки в том виде, в каком их возвращает парсер (словари со строковыми значениями),
+и замеряет время разбора и валидации форматов (BatchImportRow.from_dict, validate_formats,
+JSON колонки products) порциями по --chunk-size строк. В пуле порция делится на части
+по --shard-size строк, как в BatchesImportService. БД не нужна.
+
+Строки передаются в процессы пула и обратно через pickle, и распаковка результата
+(BatchImportRow с Value Objects) выполняется в основном процессе. Поэтому пул окупается
+только для тяжелых строк, в первую очередь с большим JSON в колонке products (--products-per-row):
+коды продуктов возвращаются списком строк, который распаковывается дешево.
+
+Запуск:
+    python -m scripts.benchmarks.import_prepare --rows 100000 --products-per-row 3 100 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+from src.application.batches.services.import_rows import prepare_import_rows, prepare_import_rows_in_executor
+
+
+def _make_chunks(count: int, products_per_row: int, chunk_size: int) -> list[list[dict[str, str]]]:
+    base_date = date(2026, 1, 1)
+    rows = []
+    for index in range(count):
+        batch_date = base_date + timedelta(days=index % 365)
+        shift_start = datetime.combine(batch_date, datetime.min.time()) + timedelta(hours=8)
+        rows.append(
+            {
+                "batch_number": str(index + 1),
+                "batch_date": batch_date.isoformat(),
+                "nomenclature": f"Номенклатура {index % 500}",
+                "ekn_code": f"EKN-{index % 1000:04d}",
+                "task_description": "Производство партии",
+                "shift": "Дневная",
+                "team": f"Бригада {index % 10}",
+                "shift_start": shift_start.isoformat(),
+                "shift_end": (shift_start + timedelta(hours=8)).isoformat(),
+                "is_closed": "",
+                "closed_at": "",
+                "work_center_identifier": f"WC-{index % 20:02d}",
+                "work_center_name": f"Рабочий центр {index % 20}",
+                "products": json.dumps([{"unique_code": f"P{index:08d}-{n}"} for n in range(products_per_row)]),
+            }
+        )
+    return [rows[offset : offset + chunk_size] for offset in range(0, len(rows), chunk_size)]
+
+
+def _measure_inline(chunks: list[list[dict[str, str]]]) -> tuple[int, float]:
+    valid = 0
+    started = time.perf_counter()
+    first_row_number = 1
+    for chunk in chunks:
+        prepared = prepare_import_rows(chunk, first_row_number)
+        valid += sum(1 for row in prepared if row.validation.is_valid)
+        first_row_number += len(chunk)
+    return valid, time.perf_counter() - started
+
+
+async def _measure_pool(chunks: list[list[dict[str, str]]], workers: int, shard_size: int) -> tuple[int, float]:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        # Прогрев: запуск процессов пула и импорт модулей не входят в замер
+        await prepare_import_rows_in_executor(chunks[0][:workers], 1, executor, 1)
+
+        valid = 0
+        started = time.perf_counter()
+        first_row_number = 1
+        for chunk in chunks:
+            prepared = await prepare_import_rows_in_executor(chunk, first_row_number, executor, shard_size)
+            valid += sum(1 for row in prepared if row.validation.is_valid)
+            first_row_number += len(chunk)
+        return valid, time.perf_counter() - started
+
+
+async def _run(rows: int, products_per_row: list[int], workers: list[int], chunk_size: int, shard_size: int) -> None:
+    sys.stdout.write(f"rows={rows}, chunk_size={chunk_size}, shard_size={shard_size}, cpu_count={os.cpu_count()}\n")
+    sys.stdout.write(f"{'products':>8}  {'workers':>7}  {'valid':>8}  {'time, s':>8}  {'rows/s':>9}  {'speedup':>7}\n")
+
+    for products in products_per_row:
+        chunks = _make_chunks(rows, products, chunk_size)
+
+        valid, baseline = _measure_inline(chunks)
+        sys.stdout.write(
+            f"{products:>8}  {'inline':>7}  {valid:>8}  {baseline:>8.2f}  {rows / baseline:>9.0f}  {1:>7.2f}\n"
+        )
+        sys.stdout.flush()
+
+        for count in workers:
+            valid, elapsed = await _measure_pool(chunks, count, shard_size)
+            sys.stdout.write(
+                f"{products:>8}  {count:>7}  {valid:>8}  {elapsed:>8.2f}  {rows / elapsed:>9.0f}  "
+                f"{baseline / elapsed:>7.2f}\n"
+            )
+            sys.stdout.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--products-per-row", type=int, nargs="+", default=[3, 100])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--shard-size", type=int, default=250)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.rows, args.products_per_row, sorted(set(args.workers)), args.chunk_size, args.shard_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Бенчмарк диспетчеризации outbox: последовательная обработка против партиционированной по aggregate_id.
+
+Работает на синтетическом backlog без БД и брокера: обработка события эмулируется
+задержкой ввода-вывода, часть событий эмулирует медленную генерацию PDF отчета.
+
+Запуск:
+    python -m scripts.benchmarks.outbox_dispatch --events 10000 --aggregates 500 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.infrastructure.background_tasks.tasks.process_outbox_events import dispatch_partitions, partition_by_aggregate
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+
+def _make_backlog(events: int, aggregates: int, slow_every: int) -> list[SimpleNamespace]:
+    aggregate_ids = [uuid4() for _ in range(aggregates)]
+    rng = random.Random(42)
+    return [
+        SimpleNamespace(
+            uuid=uuid4(),
+            aggregate_id=rng.choice(aggregate_ids),
+            event_name="batch.closed" if slow_every and index % slow_every == 0 else "batch.product_added",
+            created_at=datetime.now(),
+        )
+        for index in range(events)
+    ]
+
+
+def _make_processor(latency: float, slow_latency: float):
+    async def _process(event, session) -> None:
+        await asyncio.sleep(slow_latency if event.event_name == "batch.closed" else latency)
+
+    return _process
+
+
+async def _run(backlog: list, batch_size: int, concurrency: int, partitioned: bool, process_event) -> float:
+    started = time.perf_counter()
+    for offset in range(0, len(backlog), batch_size):
+        batch = backlog[offset : offset + batch_size]
+        partitions = partition_by_aggregate(batch) if partitioned else [batch]
+        outcome = await dispatch_partitions(partitions, _FakeSession, process_event, concurrency)
+        assert len(outcome.done_ids) == len(batch)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--aggregates", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="задержка обычного события")
+    parser.add_argument("--slow-every", type=int, default=500, help="каждое N-е событие медленное (0 — нет)")
+    parser.add_argument("--slow-ms", type=float, default=200.0, help="задержка медленного события")
+    args = parser.parse_args()
+
+    backlog = _make_backlog(args.events, args.aggregates, args.slow_every)
+    process_event = _make_processor(args.latency_ms / 1000, args.slow_ms / 1000)
+
+    sequential = asyncio.run(_run(backlog, args.batch_size, 1, False, process_event))
+    partitioned = asyncio.run(_run(backlog, args.batch_size, args.concurrency, True, process_event))
+
+    sys.stdout.write(
+        f"events={args.events} aggregates={args.aggregates} batch_size={args.batch_size} "
+        f"concurrency={args.concurrency}\n"
+        f"sequential:  {sequential:8.2f}s  {args.events / sequential:10.0f} events/s\n"
+        f"partitioned: {partitioned:8.2f}s  {args.events / partitioned:10.0f} events/s\n"
+        f"speedup:     {sequential / partitioned:8.2f}x\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
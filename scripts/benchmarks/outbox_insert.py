@@ -0,0 +1,103 @@
+"""
+Бенчмарк вставки событий в outbox: ORM (add_all + flush) против bulk INSERT ... ON CONFLICT DO NOTHING.
+
+Требует запущенный PostgreSQL с примененными миграциями и синхронизированными типами событий
+(настройки подключения берутся из DB_* переменных окружения). Каждый замер выполняется
+в транзакции, которая откатывается, поэтому данные в БД не остаются.
+
+Запуск:
+    python -m scripts.benchmarks.outbox_insert --sizes 100 1000 10000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+
+from src.core.database import dispose_engine, init_engine, make_session_factory
+from src.core.settings import DatabaseSettings
+from src.core.time import datetime_aware_to_naive, datetime_now
+from src.infrastructure.persistence.models.event_type import EventType
+from src.infrastructure.persistence.models.outbox_event import OutboxEvent, OutboxEventStatusEnum
+from src.infrastructure.persistence.repositories.outbox import OutboxRepository
+
+
+def _make_events(count: int, event_type_id: UUID) -> list[OutboxEvent]:
+    now = datetime_aware_to_naive(datetime_now())
+    batch_id = uuid4()
+    events = []
+    for _ in range(count):
+        product_id = uuid4()
+        events.append(
+            OutboxEvent(
+                uuid=uuid4(),
+                event_type_id=event_type_id,
+                event_name="batch.product_added",
+                event_version=1,
+                aggregate_id=batch_id,
+                payload={"product_id": str(product_id), "unique_code": product_id.hex},
+                occurred_at=now,
+                created_at=now,
+                status=OutboxEventStatusEnum.PENDING,
+                attempts=0,
+                dedup_key=f"batch.product_added:{product_id}:{now.isoformat()}",
+            )
+        )
+    return events
+
+
+async def _measure(session_factory, count: int, event_type_id: UUID, bulk: bool) -> float:
+    events = _make_events(count, event_type_id)
+    async with session_factory() as session:
+        repository = OutboxRepository(session)
+        started = time.perf_counter()
+        if bulk:
+            await repository.bulk_insert_events(events)
+        else:
+            await repository.insert_events(events)
+        elapsed = time.perf_counter() - started
+        await session.rollback()
+    return elapsed
+
+
+async def _run(sizes: list[int], repeat: int) -> None:
+    engine = init_engine(DatabaseSettings().url)
+    session_factory = make_session_factory(engine)
+
+    try:
+        async with session_factory() as session:
+            event_type_id = (await session.execute(select(EventType.uuid).limit(1))).scalar_one()
+
+        sys.stdout.write(f"{'events':>8}  {'orm, ms':>10}  {'bulk, ms':>10}  {'speedup':>8}\n")
+        for size in sizes:
+            # Первый прогон прогревает пул соединений и кэш компиляции запросов
+            await _measure(session_factory, size, event_type_id, bulk=False)
+            await _measure(session_factory, size, event_type_id, bulk=True)
+
+            orm = statistics.median(
+                [await _measure(session_factory, size, event_type_id, False) for _ in range(repeat)]
+            )
+            bulk = statistics.median(
+                [await _measure(session_factory, size, event_type_id, True) for _ in range(repeat)]
+            )
+            sys.stdout.write(f"{size:>8}  {orm * 1000:>10.1f}  {bulk * 1000:>10.1f}  {orm / bulk:>7.2f}x\n")
+    finally:
+        await dispose_engine(engine)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
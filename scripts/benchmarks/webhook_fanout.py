@@ -0,0 +1,150 @@
+"""
+Бенчмарк рассылки одного события подписчикам webhooks: последовательно против конкурентной рассылки.
+
+Поднимает локальные HTTP заглушки (по одной на "хост") с заданной задержкой ответа; одна из них
+отвечает медленно. Подписки распределяются по хостам по кругу. БД и RabbitMQ не нужны:
+измеряется только отправка через WebhookSender, как в _process_single_event.
+
+Запуск:
+    python -m scripts.benchmarks.webhook_fanout --subscribers 50 --hosts 5 --latency-ms 50 --slow-latency-ms 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from uuid import uuid4
+
+from src.domain.common.enums import EventTypesEnum
+from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
+from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
+from src.domain.webhooks.enums import WebhookStatus
+from src.domain.webhooks.value_objects import RetryCount, SecretKey, Timeout, WebhookEvents, WebhookPayload, WebhookUrl
+from src.infrastructure.background_tasks.tasks.process_webhook_events import (
+    ProcessingStats,
+    _process_single_subscription,
+)
+from src.infrastructure.webhooks.limiter import HostConcurrencyLimiter
+from src.infrastructure.webhooks.sender import WebhookSender
+
+EVENT_TYPE = EventTypesEnum.BATCH_CREATED
+
+
+async def _start_stub(latency: float) -> asyncio.Server:
+    """HTTP заглушка: читает запрос, ждет latency секунд и отвечает 200"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                headers = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in headers.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                await asyncio.sleep(latency)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _make_subscriptions(ports: list[int], count: int) -> list[WebhookSubscriptionEntity]:
+    return [
+        WebhookSubscriptionEntity(
+            url=WebhookUrl(f"http://127.0.0.1:{ports[index % len(ports)]}/hook/{index}"),
+            events=WebhookEvents([EVENT_TYPE]),
+            secret_key=SecretKey("benchmark-secret"),
+            retry_count=RetryCount(0),
+            timeout=Timeout(30),
+        )
+        for index in range(count)
+    ]
+
+
+def _make_delivery(subscription: WebhookSubscriptionEntity, payload: dict) -> WebhookDeliveryEntity:
+    return WebhookDeliveryEntity(
+        subscription_id=subscription.uuid,
+        event_type_id=uuid4(),
+        event_type=EVENT_TYPE,
+        payload=WebhookPayload(payload),
+        status=WebhookStatus.PENDING,
+    )
+
+
+async def _sequential(sender: WebhookSender, subscriptions: list[WebhookSubscriptionEntity], payload: dict) -> float:
+    stats = ProcessingStats()
+    started = time.perf_counter()
+    body = sender.build_body(EVENT_TYPE, payload)
+    for subscription in subscriptions:
+        await _process_single_subscription(
+            subscription, EVENT_TYPE, payload, body, _make_delivery(subscription, payload), sender, stats
+        )
+    return time.perf_counter() - started
+
+
+async def _concurrent(sender: WebhookSender, subscriptions: list[WebhookSubscriptionEntity], payload: dict) -> float:
+    stats = ProcessingStats()
+    started = time.perf_counter()
+    body = sender.build_body(EVENT_TYPE, payload)
+    await asyncio.gather(
+        *(
+            _process_single_subscription(
+                subscription, EVENT_TYPE, payload, body, _make_delivery(subscription, payload), sender, stats
+            )
+            for subscription in subscriptions
+        )
+    )
+    return time.perf_counter() - started
+
+
+async def _run(args: argparse.Namespace) -> None:
+    latencies = [args.slow_latency_ms / 1000] + [args.latency_ms / 1000] * (args.hosts - 1)
+    servers = [await _start_stub(latency) for latency in latencies]
+    ports = [server.sockets[0].getsockname()[1] for server in servers]
+
+    subscriptions = _make_subscriptions(ports, args.subscribers)
+    payload = {"batch_id": str(uuid4()), "batch_number": 1}
+    sender = WebhookSender(HostConcurrencyLimiter(args.max_concurrency, args.max_per_host))
+
+    try:
+        # Прогрев: устанавливаем соединения с заглушками
+        await _concurrent(sender, subscriptions[: args.hosts], payload)
+
+        sequential = await _sequential(sender, subscriptions, payload)
+        concurrent = await _concurrent(sender, subscriptions, payload)
+    finally:
+        await sender.close()
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+
+    sys.stdout.write(
+        f"subscribers={args.subscribers} hosts={args.hosts} latency={args.latency_ms}ms "
+        f"slow_latency={args.slow_latency_ms}ms max_concurrency={args.max_concurrency} "
+        f"max_per_host={args.max_per_host}\n"
+    )
+    sys.stdout.write(f"{'sequential, ms':>16}  {'concurrent, ms':>16}  {'speedup':>8}\n")
+    sys.stdout.write(f"{sequential * 1000:>16.1f}  {concurrent * 1000:>16.1f}  {sequential / concurrent:>7.2f}x\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=50)
+    parser.add_argument("--hosts", type=int, default=5)
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--slow-latency-ms", type=int, default=2000)
+    parser.add_argument("--max-concurrency", type=int, default=50)
+    parser.add_argument("--max-per-host", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
 from src.application.batches.queries.filters import BatchReadFilters
-from src.application.common.dtos import ExportImportFileFormatEnum
+from src.application.common.dtos import ExportFileFormatEnum
 
 
 @dataclass
 class ExportBatchesInputDTO:
-    format: ExportImportFileFormatEnum
+    format: ExportFileFormatEnum
     filters: BatchReadFilters
 
 
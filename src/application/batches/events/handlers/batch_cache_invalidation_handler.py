@@ -1,5 +1,9 @@
 from src.application.common.cache.interfaces import CacheServiceProtocol
-from src.application.common.cache.keys.batches import get_batch_key, get_batches_list_pattern
+from src.application.common.cache.keys.batches import (
+    get_batch_key,
+    get_batches_data_version_key,
+    get_batches_list_pattern,
+)
 from src.core.logging import get_logger
 from src.domain.common.events import DomainEvent
 
@@ -20,6 +24,16 @@ class BatchCacheInvalidationHandler:
             logger.debug("Cache service is not available or disabled, skipping cache invalidation for batches")
             return
 
+        # Версия данных повышается первой и независимо от удаления ключей: новая версия меняет ключи
+        # кэша экспорта, поэтому готовые файлы экспорта перестают выдаваться, даже если удаление не удалось
+        try:
+            data_version = await self._cache_service.increment(
+                get_batches_data_version_key(self._cache_service.key_prefix)
+            )
+            logger.info(f"Batches data version bumped: data_version={data_version}")
+        except Exception as e:
+            logger.warning(f"Failed to bump batches data version: {e}", exc_info=True)
+
         if hasattr(event, "batch_id"):
             batch_id = event.batch_id
             await self._cache_service.delete(get_batch_key(batch_id, self._cache_service.key_prefix))
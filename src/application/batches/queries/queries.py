@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from src.application.batches.queries.filters import BatchReadFilters
 from src.application.batches.queries.sort import BatchSortSpec
-from src.domain.common.queries import PaginationSpec
+from src.domain.common.queries import KeysetPaginationSpec, PaginationSpec
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -10,3 +10,10 @@ class ListBatchesQuery:
     filters: BatchReadFilters | None = None
     pagination: PaginationSpec | None = None
     sort: BatchSortSpec | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListBatchesKeysetQuery:
+    filters: BatchReadFilters | None = None
+    pagination: KeysetPaginationSpec
+    include_products: bool = True
@@ -1,9 +1,9 @@
 from typing import Protocol
 from uuid import UUID
 
-from src.application.batches.queries.queries import ListBatchesQuery
+from src.application.batches.queries.queries import ListBatchesKeysetQuery, ListBatchesQuery
 from src.domain.batches import BatchEntity
-from src.domain.common.queries import QueryResult
+from src.domain.common.queries import KeysetQueryResult, QueryResult
 
 
 class BatchQueryServiceProtocol(Protocol):
@@ -14,3 +14,7 @@ class BatchQueryServiceProtocol(Protocol):
     async def list(self, query: ListBatchesQuery) -> QueryResult[BatchEntity]:
         """Получает список партий с фильтрацией, пагинацией и сортировкой"""
         ...
+
+    async def list_keyset(self, query: ListBatchesKeysetQuery) -> KeysetQueryResult[BatchEntity]:
+        """Получает страницу партий от новых к старым с keyset пагинацией (без подсчета общего количества)"""
+        ...
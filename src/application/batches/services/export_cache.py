@@ -0,0 +1,101 @@
+import json
+
+from dataclasses import dataclass
+
+from src.application.batches.dtos.export_batches import ExportBatchesOutputDTO
+from src.application.batches.queries.filters import BatchReadFilters
+from src.application.batches.services.export_service import BatchesExportService
+from src.application.common.cache.interfaces import CacheServiceProtocol
+from src.application.common.cache.keys.batches import (
+    get_batches_data_version_key,
+    get_batches_export_key,
+    get_batches_export_running_key,
+)
+from src.application.common.storage.interfaces import StorageServiceProtocol
+from src.core.logging import get_logger
+
+logger = get_logger("entities.export.cache")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachedExport:
+    """Готовый файл экспорта и задача, которая его создала"""
+
+    task_id: str
+    result: ExportBatchesOutputDTO
+
+
+class BatchesExportCache:
+    """
+    Кэш результатов экспорта партий.
+
+    Ключ строится из формата, фильтров и версии данных партий, которую увеличивает
+    BatchCacheInvalidationHandler при любом изменении партий, поэтому закэшированный файл
+    выдается только пока данные не менялись. Пока экспорт с ключом выполняется, под ключом
+    :running хранится ID задачи, и одинаковые запросы присоединяются к ней.
+    """
+
+    def __init__(self, cache_service: CacheServiceProtocol, storage_service: StorageServiceProtocol, ttl: int):
+        self._cache_service = cache_service
+        self._storage_service = storage_service
+        self._ttl = ttl
+
+    async def get_key(self, file_format: str, filters: BatchReadFilters | None) -> str:
+        """Возвращает ключ экспорта для текущей версии данных партий"""
+        prefix = self._cache_service.key_prefix
+        data_version = await self._cache_service.get(get_batches_data_version_key(prefix))
+        return get_batches_export_key(file_format, filters, int(data_version or 0), prefix)
+
+    async def get(self, key: str) -> CachedExport | None:
+        """Возвращает готовый экспорт с новым presigned URL, если файл еще есть в хранилище"""
+        cached_data = await self._cache_service.get(key)
+        if not cached_data:
+            return None
+
+        try:
+            entry = json.loads(cached_data)
+            file_url = entry["file_url"]
+            if not await self._storage_service.file_exists(BatchesExportService.EXPORT_BUCKET, file_url):
+                logger.info(f"Cached export file {file_url} no longer exists")
+                await self._cache_service.delete(key)
+                return None
+
+            presigned_url = await self._storage_service.get_presigned_url(
+                bucket_name=BatchesExportService.EXPORT_BUCKET, object_name=file_url, expires_seconds=3600
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get cached export: {e}")
+            return None
+
+        return CachedExport(
+            task_id=entry["task_id"],
+            result=ExportBatchesOutputDTO(
+                total_batches=entry["total_batches"], file_url=file_url, presigned_url=presigned_url
+            ),
+        )
+
+    async def claim(self, key: str, task_id: str) -> str | None:
+        """
+        Закрепляет экспорт с ключом за задачей task_id.
+
+        Returns:
+            None, если экспорт закреплен за task_id, иначе ID уже выполняющейся задачи
+        """
+        running_key = get_batches_export_running_key(key)
+        if await self._cache_service.set_if_absent(running_key, task_id.encode(), ttl=self._ttl):
+            return None
+
+        running_task_id = await self._cache_service.get(running_key)
+        # Ключ мог истечь между запросами или кэш недоступен: экспорт выполняется отдельной задачей
+        return running_task_id.decode() if running_task_id else None
+
+    async def put(self, key: str, task_id: str, result: ExportBatchesOutputDTO) -> None:
+        """Сохраняет результат экспорта и снимает отметку о выполняющейся задаче"""
+        if result.file_url:
+            entry = {"task_id": task_id, "file_url": result.file_url, "total_batches": result.total_batches}
+            await self._cache_service.set(key, json.dumps(entry).encode(), ttl=self._ttl)
+        await self.release(key)
+
+    async def release(self, key: str) -> None:
+        """Снимает отметку о выполняющейся задаче экспорта"""
+        await self._cache_service.delete(get_batches_export_running_key(key))
@@ -1,15 +1,24 @@
-from uuid import uuid4
+import tempfile
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
 
 from src.application.batches.dtos.export_batches import ExportBatchesInputDTO, ExportBatchesOutputDTO
+from src.application.batches.dtos.raw_data import BatchRawDataDTO
 from src.application.batches.mappers import entity_to_raw_data_dto
-from src.application.batches.queries.queries import ListBatchesQuery
+from src.application.batches.queries.filters import BatchReadFilters
+from src.application.batches.queries.queries import ListBatchesKeysetQuery
 from src.application.batches.queries.service import BatchQueryServiceProtocol
 from src.application.common.exceptions import ApplicationException
 from src.application.common.ports.file_generator import FileGeneratorProtocol
 from src.application.common.storage.interfaces import StorageServiceProtocol
-from src.application.work_centers.queries.queries import ListWorkCentersQuery
 from src.application.work_centers.queries.service import WorkCenterQueryServiceProtocol
 from src.core.logging import get_logger
+from src.domain.common.queries import KeysetCursor, KeysetPaginationSpec
+
+if TYPE_CHECKING:
+    from src.domain.work_centers import WorkCenterEntity
 
 logger = get_logger("entities.export.service")
 
@@ -29,12 +38,17 @@ class BatchesExportService:
     Application Service для экспорта партий в файлы.
 
     Оркестрирует процесс экспорта:
-    1. Получение данных через Query Service
-    2. Генерация файла через Generator
-    3. Сохранение в Storage
+    1. Постраничное получение данных через Query Service (keyset пагинация)
+    2. Потоковая генерация файла через Generator во временный файл
+    3. Загрузка временного файла в Storage multipart загрузкой
+
+    В памяти одновременно находится только текущая страница партий и рабочие центры,
+    на которые они ссылаются, поэтому потребление памяти не зависит от количества партий.
+    Временный файл до EXPORT_SPOOL_MAX_SIZE держится в памяти, больший сбрасывается на диск.
     """
 
     EXPORT_BUCKET = "exports"
+    EXPORT_SPOOL_MAX_SIZE = 32 * 1024 * 1024
 
     def __init__(
         self,
@@ -42,11 +56,13 @@ class BatchesExportService:
         work_center_query_service: WorkCenterQueryServiceProtocol,
         generator: FileGeneratorProtocol,
         storage_service: StorageServiceProtocol,
+        page_size: int = 1000,
     ):
         self._query_service = query_service
         self._work_center_query_service = work_center_query_service
         self._generator = generator
         self._storage_service = storage_service
+        self._page_size = page_size
 
     async def export_batches(self, input_dto: ExportBatchesInputDTO) -> ExportBatchesOutputDTO:
         """
@@ -64,41 +80,55 @@ class BatchesExportService:
         logger.info(f"Starting export: format={input_dto.format}, filters={input_dto.filters}")
 
         try:
-            # 1. Получение данных через Query Service
-            query = ListBatchesQuery(filters=input_dto.filters)
-            result = await self._query_service.list(query)
-            batches = result.items
-
-            if not batches:
-                logger.warning("No entities found for export")
-                return ExportBatchesOutputDTO(file_url="", total_batches=0)
-
-            # 2. Загрузка рабочих центров
-            query = ListWorkCentersQuery()
-            result = await self._work_center_query_service.list(query)
-            work_centers = result.items
-
-            # 3. Генерация файла
-            work_centers_by_id = {work_center.uuid: work_center for work_center in work_centers}
-            raw_data = [entity_to_raw_data_dto(batch, work_centers_by_id[batch.work_center_id]) for batch in batches]
-            file_data = await self._generator.generate(raw_data)
-
-            # 4. Сохранение в Storage
-            file_name = generate_file_name(str(input_dto.format))
-            file_url = await self._storage_service.upload_file(
-                bucket_name=self.EXPORT_BUCKET,
-                object_name=file_name,
-                file_data=file_data,
-                file_extension=input_dto.format,
-            )
+            with tempfile.SpooledTemporaryFile(max_size=self.EXPORT_SPOOL_MAX_SIZE) as export_file:
+                # 1-2. Постраничное чтение партий и потоковая генерация файла
+                total_batches = await self._generator.write(self._iter_raw_data(input_dto.filters), export_file)
+
+                if not total_batches:
+                    logger.warning("No entities found for export")
+                    return ExportBatchesOutputDTO(file_url="", presigned_url="", total_batches=0)
+
+                # 3. Загрузка в Storage
+                export_file.seek(0)
+                file_name = generate_file_name(str(input_dto.format))
+                file_url = await self._storage_service.upload_stream(
+                    bucket_name=self.EXPORT_BUCKET,
+                    object_name=file_name,
+                    stream=export_file,
+                    file_extension=input_dto.format,
+                )
 
             presigned_url = await self._storage_service.get_presigned_url(
                 bucket_name=self.EXPORT_BUCKET, object_name=file_url, expires_seconds=3600
             )
 
-            logger.info(f"Export completed: file_url={file_url}, total_batches={len(batches)}")
-            return ExportBatchesOutputDTO(file_url=file_url, presigned_url=presigned_url, total_batches=len(batches))
+            logger.info(f"Export completed: file_url={file_url}, total_batches={total_batches}")
+            return ExportBatchesOutputDTO(file_url=file_url, presigned_url=presigned_url, total_batches=total_batches)
 
         except Exception as e:
             logger.exception(f"Export failed: {e}")
             raise ApplicationException(f"Ошибка экспорта: {e}") from e
+
+    async def _iter_raw_data(self, filters: BatchReadFilters) -> AsyncIterator[list[BatchRawDataDTO]]:
+        """Возвращает партии страницами по page_size; рабочие центры загружаются при первом упоминании"""
+        work_centers_by_id: dict[UUID, WorkCenterEntity] = {}
+        after: KeysetCursor | None = None
+
+        while True:
+            query = ListBatchesKeysetQuery(
+                filters=filters, pagination=KeysetPaginationSpec(limit=self._page_size, after=after)
+            )
+            page = await self._query_service.list_keyset(query)
+
+            for work_center_id in {batch.work_center_id for batch in page.items} - work_centers_by_id.keys():
+                work_center = await self._work_center_query_service.get(work_center_id)
+                if work_center is None:
+                    raise ApplicationException(f"Рабочий центр {work_center_id} не найден")
+                work_centers_by_id[work_center_id] = work_center
+
+            if page.items:
+                yield [entity_to_raw_data_dto(batch, work_centers_by_id[batch.work_center_id]) for batch in page.items]
+
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.logging import get_logger
+from src.domain.batches.services import ValidationResult, validate_import_row_formats
+
+logger = get_logger("entities.import.rows")
+
+
+@dataclass
+class PreparedImportRow:
+    """
+    Строка файла импорта после разбора и валидации форматов.
+
+    Подготовка не обращается к БД и не зависит от состояния сервиса, поэтому
+    может выполняться в отдельных процессах; результат передается обратно через pickle.
+    """
+
+    row_number: int
+    validation: ValidationResult
+    product_codes: list[str] = field(default_factory=list)
+
+
+def prepare_import_rows(rows: list[dict[str, Any]], first_row_number: int) -> list[PreparedImportRow]:
+    """
+    Разбирает и валидирует форматы строк импорта.
+
+    Args:
+        rows: Строки файла в порядке следования
+        first_row_number: Номер первой строки в файле (строки нумеруются с 1)
+
+    Returns:
+        Подготовленные строки в том же порядке
+    """
+    return [
+        PreparedImportRow(
+            row_number=row_number,
+            validation=validate_import_row_formats(row_data),
+            product_codes=parse_product_codes(row_data.get("products", "[]"), row_number),
+        )
+        for row_number, row_data in enumerate(rows, start=first_row_number)
+    ]
+
+
+async def prepare_import_rows_in_executor(
+    rows: list[dict[str, Any]], first_row_number: int, executor: Executor, shard_size: int
+) -> list[PreparedImportRow]:
+    """
+    Подготавливает строки частями по shard_size строк параллельно в executor.
+
+    Returns:
+        Подготовленные строки в исходном порядке
+    """
+    loop = asyncio.get_running_loop()
+    shards = [
+        loop.run_in_executor(
+            executor, prepare_import_rows, rows[offset : offset + shard_size], first_row_number + offset
+        )
+        for offset in range(0, len(rows), shard_size)
+    ]
+    prepared: list[PreparedImportRow] = []
+    for shard in await asyncio.gather(*shards):
+        prepared.extend(shard)
+    return prepared
+
+
+def parse_product_codes(products_json: Any, row_number: int) -> list[str]:
+    """Извлекает коды продуктов из JSON поля products; некорректные данные пропускаются"""
+    if not products_json:
+        return []
+
+    try:
+        products_data = json.loads(products_json) if isinstance(products_json, str) else products_json
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        logger.warning(f"Failed to parse products JSON in row {row_number}: {e}")
+        return []
+
+    if not isinstance(products_data, list):
+        return []
+
+    product_codes: list[str] = []
+    for product_data in products_data:
+        unique_code = product_data.get("unique_code") if isinstance(product_data, dict) else None
+        if unique_code is None:
+            logger.warning(f"Product without unique_code in row {row_number}, skipping")
+            continue
+        product_codes.append(str(unique_code))
+
+    return product_codes
@@ -1,191 +1,488 @@
-import json
+import asyncio
 
-from typing import Any
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Any, BinaryIO
+from uuid import UUID, uuid4
 
-from src.application.batches.commands.add_product import AddProductToBatchCommand
-from src.application.batches.commands.create import CreateBatchCommand
-from src.application.batches.commands.update import UpdateBatchCommand
 from src.application.batches.dtos.import_batches import ImportBatchesOutputDTO, ImportRowResult
-from src.application.batches.dtos.raw_data import ProductRawDataDTO
-from src.application.batches.mappers import import_row_to_create_dto, import_row_to_update_dto
+from src.application.batches.mappers import create_input_dto_to_entity, import_row_to_create_dto
+from src.application.batches.services.import_rows import (
+    PreparedImportRow,
+    prepare_import_rows,
+    prepare_import_rows_in_executor,
+)
 from src.application.common.exceptions import FileParseError
 from src.application.common.ports.file_parser import FileParserProtocol
-from src.application.work_centers.commands.create import CreateWorkCenterCommand
+from src.application.common.uow.interfaces import UnitOfWorkProtocol
 from src.application.work_centers.dtos.create import CreateWorkCenterInputDTO
+from src.application.work_centers.mappers import create_input_dto_to_entity as create_work_center_entity
 from src.core.logging import get_logger
-from src.domain.batches.interfaces.repository import BatchRepositoryProtocol
-from src.domain.batches.services import BatchImportRowValidator
-from src.domain.common.exceptions import AlreadyExistsError
-from src.domain.work_centers.interfaces.repository import WorkCenterRepositoryProtocol
+from src.core.time import datetime_naive_to_aware, datetime_now
+from src.domain.batches import BatchEntity
+from src.domain.batches.events import BatchCreatedEvent, BatchUpdatedEvent
+from src.domain.batches.services import ShiftSchedule, validate_import_columns
+from src.domain.batches.value_objects import BatchImportRow
+from src.domain.common.exceptions import InvalidStateError
+from src.domain.products import ProductEntity
+from src.domain.products.value_objects import ProductCode
+from src.domain.work_centers import WorkCenterEntity
 
 logger = get_logger("entities.import.service")
 
 
+def generate_import_object_name(file_extension: str) -> str:
+    """Генерирует уникальное имя объекта для загруженного файла импорта."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    return f"batches/{timestamp}_{uuid4().hex}.{file_extension}"
+
+
+@dataclass
+class _ImportChunk:
+    """Состояние обработки одной порции строк: найденные сущности и изменения для пакетной записи"""
+
+    existing_keys: set[tuple[int, date]]
+    batches_by_key: dict[tuple[int, date], BatchEntity]
+    schedules: dict[UUID, ShiftSchedule]
+    new_work_centers: list[WorkCenterEntity] = field(default_factory=list)
+    new_batches: dict[UUID, BatchEntity] = field(default_factory=dict)
+    updated_batches: dict[UUID, BatchEntity] = field(default_factory=dict)
+    new_products: list[ProductEntity] = field(default_factory=list)
+
+
 class BatchesImportService:
     """
     Application Service для импорта партий из файлов.
 
     Оркестрирует процесс импорта:
-    1. Парсинг файла через Parser
-    2. Валидация данных через Domain Validator
-    3. Создание/обновление через Commands
+    1. Потоковый парсинг файла порциями через Parser
+    2. Разбор и валидация форматов строк порции без обращения к БД (в пуле процессов, если он задан)
+    3. Поиск рабочих центров, существующих партий и смен порции наборными запросами
+    4. Проверка бизнес-правил (уникальность, пересечение смен) в памяти
+    5. Пакетная запись рабочих центров, партий и продуктов
+
+    Количество запросов зависит от количества порций, а не строк и продуктов.
+    Проверка файла без записи (validate_import) выполняет один запрос на весь файл.
+    С пулом процессов порция делится на части по shard_size строк, и следующая порция
+    разбирается в пуле, пока текущая записывается в БД.
+    Прерванный импорт продолжается с первой незаписанной строки (resume_from); фиксацию
+    транзакции по частям выполняет вызывающий код в on_chunk_imported.
+    Загруженные файлы хранятся в bucket IMPORT_BUCKET до завершения импорта.
     """
 
+    IMPORT_BUCKET = "imports"
+
     def __init__(
         self,
         parser: FileParserProtocol,
-        validator: BatchImportRowValidator,
-        create_command: CreateBatchCommand,
-        update_command: UpdateBatchCommand,
-        add_product_command: AddProductToBatchCommand,
-        create_work_center_command: CreateWorkCenterCommand,
-        work_center_repository: WorkCenterRepositoryProtocol,
-        batch_repository: BatchRepositoryProtocol,
+        uow: UnitOfWorkProtocol,
+        chunk_size: int = 1000,
+        executor: Executor | None = None,
+        shard_size: int = 250,
     ):
         self._parser = parser
-        self._validator = validator
-        self._create_command = create_command
-        self._update_command = update_command
-        self._add_product_command = add_product_command
-        self._create_work_center_command = create_work_center_command
-        self._work_center_repository = work_center_repository
-        self._batch_repository = batch_repository
-
-    async def import_batches(self, import_file_data: bytes, update_existing: bool = False) -> ImportBatchesOutputDTO:
+        self._uow = uow
+        self._chunk_size = chunk_size
+        self._executor = executor
+        self._shard_size = shard_size
+
+    async def import_batches(
+        self,
+        import_file: BinaryIO,
+        update_existing: bool = False,
+        resume_from: ImportBatchesOutputDTO | None = None,
+        on_chunk_imported: Callable[[ImportBatchesOutputDTO], Awaitable[None]] | None = None,
+    ) -> ImportBatchesOutputDTO:
         """
         Импортирует партии из файла.
 
+        Файл читается потоково порциями по chunk_size строк, поэтому в памяти
+        одновременно находится только текущая порция.
+
         Args:
-            import_file_data: данные файла с сущностями для импорта
+            import_file: файловый объект с сущностями для импорта
             update_existing: обновлять ли существующие сущности
+            resume_from: отчет по уже импортированным строкам файла; первые resume_from.total строк
+                пропускаются, а результат импорта продолжает этот отчет
+            on_chunk_imported: вызывается с накопленным результатом после записи каждой порции
+                (коммит части импорта, обновление прогресса)
 
         Returns:
             Результат импорта (total, created, updated, failed, errors)
+
+        Raises:
+            FileParseError: Если файл оказался поврежден после того, как часть строк уже обработана;
+                транзакцию в этом случае нужно откатить
         """
-        logger.info(f"Starting import: update_existing={update_existing}")
+        skip_rows = resume_from.total if resume_from is not None else 0
+        logger.info(
+            f"Starting import: update_existing={update_existing}, chunk_size={self._chunk_size}, "
+            f"resume_from_row={skip_rows + 1}"
+        )
+
+        result = (
+            replace(resume_from, errors=list(resume_from.errors))
+            if resume_from is not None
+            else ImportBatchesOutputDTO(total=0, created=0, updated=0, failed=0, errors=[])
+        )
+        # Рабочие центры по идентификатору; известные центры не запрашиваются повторно в следующих порциях
+        work_centers: dict[str, WorkCenterEntity] = {}
+        # Подготовка следующей порции выполняется, пока текущая записывается в БД
+        pending: asyncio.Future[list[PreparedImportRow]] | None = None
+        next_row_number = 1
 
-        # 1. Парсинг файла
         try:
-            raw_data: list[dict[str, Any]] = await self._parser.parse(import_file_data)
+            # 1. Потоковый парсинг файла и обработка порций
+            async for rows in self._parser.parse_stream(import_file, chunk_size=self._chunk_size):
+                if skip_rows:
+                    # Строки, импортированные до перезапуска, уже записаны в БД
+                    skipped = min(skip_rows, len(rows))
+                    skip_rows -= skipped
+                    next_row_number += skipped
+                    rows = rows[skipped:]
+                    if not rows:
+                        continue
+
+                prepared = asyncio.ensure_future(self._prepare_rows(rows, next_row_number))
+                next_row_number += len(rows)
+                if pending is not None:
+                    await self._import_chunk(await pending, result, work_centers, update_existing=update_existing)
+                    if on_chunk_imported is not None:
+                        await on_chunk_imported(result)
+                pending = prepared
+
+            if pending is not None:
+                await self._import_chunk(await pending, result, work_centers, update_existing=update_existing)
+                pending = None
+                if on_chunk_imported is not None:
+                    await on_chunk_imported(result)
+
         except FileParseError as e:
+            if result.total:
+                logger.error(f"File parsing failed after {result.total} rows: {e}")
+                raise
             logger.error(f"File parsing failed: {e}")
             return ImportBatchesOutputDTO(
                 total=0, created=0, updated=0, failed=0, errors=[{"row": 0, "error": f"Ошибка парсинга файла: {e}"}]
             )
+        finally:
+            if pending is not None:
+                pending.cancel()
 
-        if not raw_data:
+        if not result.total:
             logger.warning("No data found in file")
-            return ImportBatchesOutputDTO(total=0, created=0, updated=0, failed=0, errors=[])
+            return result
 
-        # 2. Обработка каждой строки
-        total = len(raw_data)
-        created_count = 0
-        updated_count = 0
-        failed_count = 0
-        errors: list[dict[str, Any]] = []
+        logger.info(
+            f"Import completed: total={result.total}, created={result.created}, "
+            f"updated={result.updated}, failed={result.failed}"
+        )
+        return result
 
-        for row_number, row in enumerate(raw_data, start=1):
-            try:
-                result = await self._process_row(row, update_existing=update_existing)
+    async def validate_import(self, import_file: BinaryIO, update_existing: bool = False) -> ImportBatchesOutputDTO:
+        """
+        Проверяет файл импорта без записи в БД (dry run).
 
-                if result.created:
-                    created_count += 1
-                elif result.updated:
-                    updated_count += 1
-                else:
-                    failed_count += 1
-                    errors.append({"row": row_number, "error": result.error or "Unknown error"})
+        Форматы проверяются по колонкам с ошибками всех колонок строки, повторы пары
+        (номер партии, дата) внутри файла и конфликты с существующими партиями
+        находятся одним запросом на весь файл. Пересечения смен не проверяются.
 
-            except Exception as e:
-                logger.exception(f"Error processing row {row_number}: {e}")
-                failed_count += 1
-                errors.append({"row": row_number, "error": str(e)})
+        Args:
+            import_file: файловый объект с сущностями для импорта
+            update_existing: обновлять ли существующие сущности
+
+        Returns:
+            Ожидаемый результат импорта (created и updated — сколько партий будет создано и обновлено)
+        """
+        logger.info(f"Starting import dry run: update_existing={update_existing}")
+
+        errors_by_row: dict[int, list[str]] = {}
+        # Первая строка без ошибок форматов для каждой пары (номер партии, дата): строки с ошибками не импортируются
+        first_row_by_key: dict[tuple[int, date], int] = {}
+        duplicate_rows: list[int] = []
+        total = 0
+
+        try:
+            async for rows in self._parser.parse_stream(import_file, chunk_size=self._chunk_size):
+                for row_number, validation in enumerate(validate_import_columns(rows), start=total + 1):
+                    if validation.errors:
+                        errors_by_row[row_number] = list(validation.errors)
+
+                    import_row = validation.validated_row
+                    if import_row is None or validation.errors:
+                        continue
+
+                    key = (import_row.batch_number.value, import_row.batch_date)
+                    first_row = first_row_by_key.setdefault(key, row_number)
+                    if first_row != row_number:
+                        # При обновлении повтор обновляет партию, созданную предыдущей строкой
+                        if update_existing:
+                            duplicate_rows.append(row_number)
+                        else:
+                            errors_by_row.setdefault(row_number, []).append(
+                                f"Партия с номером {key[0]} и датой {key[1]} уже есть в файле (строка {first_row})"
+                            )
+                total += len(rows)
+
+        except FileParseError as e:
+            logger.error(f"File parsing failed: {e}")
+            return ImportBatchesOutputDTO(
+                total=0, created=0, updated=0, failed=0, errors=[{"row": 0, "error": f"Ошибка парсинга файла: {e}"}]
+            )
+
+        # Конфликты с существующими партиями: один запрос на все пары файла
+        existing_keys = await self._uow.batches.get_existing_numbers_and_dates(list(first_row_by_key))
 
+        created = updated = 0
+        for key, row_number in first_row_by_key.items():
+            if key in existing_keys and not update_existing:
+                errors_by_row.setdefault(row_number, []).append(
+                    f"Партия с номером {key[0]} и датой {key[1]} уже существует"
+                )
+            elif key in existing_keys:
+                updated += 1
+            else:
+                created += 1
+        updated += len(duplicate_rows)
+
+        result = ImportBatchesOutputDTO(
+            total=total,
+            created=created,
+            updated=updated,
+            failed=len(errors_by_row),
+            errors=[
+                {"row": row_number, "error": "; ".join(errors_by_row[row_number])}
+                for row_number in sorted(errors_by_row)
+            ],
+        )
         logger.info(
-            f"Import completed: total={total}, created={created_count}, updated={updated_count}, failed={failed_count}"
+            f"Import dry run completed: total={result.total}, created={result.created}, "
+            f"updated={result.updated}, failed={result.failed}"
         )
+        return result
+
+    async def _prepare_rows(self, rows: list[dict[str, Any]], first_row_number: int) -> list[PreparedImportRow]:
+        """Разбирает и валидирует форматы строк порции: в текущем процессе или частями в пуле процессов"""
+        if self._executor is None:
+            return prepare_import_rows(rows, first_row_number)
+
+        return await prepare_import_rows_in_executor(rows, first_row_number, self._executor, self._shard_size)
 
-        return ImportBatchesOutputDTO(
-            total=total, created=created_count, updated=updated_count, failed=failed_count, errors=errors
+    async def _import_chunk(
+        self,
+        prepared_rows: list[PreparedImportRow],
+        result: ImportBatchesOutputDTO,
+        work_centers: dict[str, WorkCenterEntity],
+        update_existing: bool,
+    ) -> None:
+        """Обрабатывает подготовленную порцию строк и пакетно записывает изменения"""
+        result.total += len(prepared_rows)
+
+        import_rows = [row.validation.validated_row for row in prepared_rows if row.validation.validated_row]
+        chunk = await self._load_chunk(import_rows, work_centers, update_existing)
+
+        # 2. Проверка бизнес-правил и подготовка изменений в памяти
+        for prepared_row in prepared_rows:
+            row_number = prepared_row.row_number
+            try:
+                row_result = self._process_row(prepared_row, chunk, work_centers, update_existing)
+            except Exception as e:
+                logger.exception(f"Error processing row {row_number}: {e}")
+                row_result = ImportRowResult(created=False, updated=False, error=str(e))
+
+            if row_result.created:
+                result.created += 1
+            elif row_result.updated:
+                result.updated += 1
+            else:
+                result.failed += 1
+                result.errors.append({"row": row_number, "error": row_result.error or "Unknown error"})
+
+        # 3. Пакетная запись: рабочие центры раньше партий, партии раньше продуктов (внешние ключи)
+        await self._uow.work_centers.create_many(chunk.new_work_centers)
+        await self._uow.batches.create_many(list(chunk.new_batches.values()))
+        await self._uow.batches.update_many(list(chunk.updated_batches.values()))
+        await self._uow.products.create_many(chunk.new_products)
+
+        logger.debug(f"Import chunk processed: rows={len(prepared_rows)}, total={result.total}")
+
+    async def _load_chunk(
+        self,
+        import_rows: list[BatchImportRow],
+        work_centers: dict[str, WorkCenterEntity],
+        update_existing: bool,
+    ) -> _ImportChunk:
+        """Загружает данные для проверки порции наборными запросами (по одному на вид данных)"""
+        keys = list({(row.batch_number.value, row.batch_date) for row in import_rows})
+
+        # Существующие партии порции: при обновлении нужны сами партии, иначе только факт существования
+        if update_existing:
+            existing_batches = await self._uow.batches.get_by_batch_numbers_and_dates(keys)
+            batches_by_key = {(batch.batch_number.value, batch.batch_date): batch for batch in existing_batches}
+            existing_keys = set(batches_by_key)
+        else:
+            batches_by_key = {}
+            existing_keys = await self._uow.batches.get_existing_numbers_and_dates(keys)
+
+        unknown_identifiers = list({row.work_center_identifier for row in import_rows} - work_centers.keys())
+        for work_center in await self._uow.work_centers.get_by_identifiers(unknown_identifiers):
+            work_centers[work_center.identifier.value] = work_center
+
+        # Смены рабочих центров порции в окне её смен; партии предыдущих порций уже записаны в БД
+        schedules: dict[UUID, ShiftSchedule] = {}
+        work_center_ids = list(
+            {
+                work_centers[row.work_center_identifier].uuid
+                for row in import_rows
+                if row.work_center_identifier in work_centers
+            }
         )
+        if work_center_ids:
+            start = min(datetime_naive_to_aware(row.shift_time_range.start) for row in import_rows)
+            end = max(datetime_naive_to_aware(row.shift_time_range.end) for row in import_rows)
+            for shift in await self._uow.batches.get_shifts(work_center_ids, start, end):
+                schedule = schedules.setdefault(shift.work_center_id, ShiftSchedule())
+                schedule.occupy(shift.batch_id, shift.shift_time_range)
+
+        return _ImportChunk(existing_keys=existing_keys, batches_by_key=batches_by_key, schedules=schedules)
 
-    async def _process_row(self, row_data: dict[str, Any], update_existing: bool = False) -> ImportRowResult:
+    def _process_row(
+        self,
+        prepared_row: PreparedImportRow,
+        chunk: _ImportChunk,
+        work_centers: dict[str, WorkCenterEntity],
+        update_existing: bool,
+    ) -> ImportRowResult:
         """
-        Обрабатывает одну строку данных.
+        Обрабатывает одну строку данных в памяти.
 
         Returns:
             Результат обработки строки
         """
-        # 1. Валидация через Domain Validator (создает BatchImportRow внутри)
-        validation_result = await self._validator.validate(row_data=row_data, update_existing=update_existing)
+        import_row = prepared_row.validation.validated_row
+        errors = list(prepared_row.validation.errors)
+        if import_row is None:
+            return ImportRowResult(created=False, updated=False, error="; ".join(errors))
 
-        if not validation_result.is_valid:
-            return ImportRowResult(created=False, updated=False, error="; ".join(validation_result.errors))
+        # 1. Уникальность (если не обновление): среди партий БД и уже созданных из файла
+        key = (import_row.batch_number.value, import_row.batch_date)
+        if not update_existing and (key in chunk.existing_keys or key in chunk.batches_by_key):
+            errors.append(
+                f"Партия с номером {import_row.batch_number.value} и датой {import_row.batch_date} уже существует"
+            )
 
-        # validation_result.validated_row содержит BatchImportRow после успешной валидации
-        import_row = validation_result.validated_row
-        if import_row is None:
-            return ImportRowResult(created=False, updated=False, error="Ошибка валидации: validated_row is None")
+        if errors:
+            return ImportRowResult(created=False, updated=False, error="; ".join(errors))
 
         # 2. Поиск или создание рабочего центра
-        work_center = await self._work_center_repository.get_by_identifier(import_row.work_center_identifier)
+        work_center = work_centers.get(import_row.work_center_identifier)
         if work_center is None:
             # Создание рабочего центра с дефолтным именем
-            create_work_center_dto = CreateWorkCenterInputDTO(
-                identifier=import_row.work_center_identifier, name=import_row.work_center_name
+            work_center = create_work_center_entity(
+                CreateWorkCenterInputDTO(identifier=import_row.work_center_identifier, name=import_row.work_center_name)
             )
-            work_center = await self._create_work_center_command.execute(create_work_center_dto)
+            work_centers[import_row.work_center_identifier] = work_center
+            chunk.new_work_centers.append(work_center)
             logger.info(f"Created work center: identifier={import_row.work_center_identifier}")
 
-        work_center_id = work_center.uuid
-
-        # 3. Преобразование в DTO и создание/обновление партии
-        batch_entity = None
-        if update_existing:
-            # Проверка существования партии
-            existing_batch = await self._batch_repository.get_by_batch_number_and_date(
-                str(import_row.batch_number), import_row.batch_date
-            )
-
-            if existing_batch:
-                # Обновление
-                update_dto = import_row_to_update_dto(import_row, existing_batch.uuid, work_center_id)
-                batch_entity = await self._update_command.execute(update_dto)
-                result = ImportRowResult(created=False, updated=True, error=None)
-            else:
-                # Создание новой партии
-                create_dto = import_row_to_create_dto(import_row, work_center_id)
-                batch_entity = await self._create_command.execute(create_dto)
-                result = ImportRowResult(created=True, updated=False, error=None)
-        else:
-            # Создание новой партии
-            create_dto = import_row_to_create_dto(import_row, work_center_id)
-            batch_entity = await self._create_command.execute(create_dto)
+        # 3. Создание/обновление партии
+        batch = chunk.batches_by_key.get(key) if update_existing else None
+        if batch is None:
+            batch = self._create_batch(import_row, work_center.uuid, chunk)
             result = ImportRowResult(created=True, updated=False, error=None)
+        else:
+            self._update_batch(batch, import_row, work_center.uuid, chunk)
+            result = ImportRowResult(created=False, updated=True, error=None)
 
         # 4. Импорт продуктов из JSON поля products
-        if batch_entity:
-            products_json = row_data.get("products", "[]")
-            if products_json:
-                try:
-                    products_data = json.loads(products_json) if isinstance(products_json, str) else products_json
-
-                    if isinstance(products_data, list):
-                        for product_data in products_data:
-                            try:
-                                product_dto = ProductRawDataDTO(**product_data)
-                                await self._add_product_command.execute(
-                                    batch_id=batch_entity.uuid, unique_code=product_dto.unique_code
-                                )
-                            except AlreadyExistsError:
-                                logger.warning(
-                                    f"Product with code {product_dto.unique_code} already exists in batch {batch_entity.uuid}, skipping"
-                                )
-                                continue
-                            except Exception as e:
-                                logger.warning(f"Failed to add product {product_dto.unique_code}: {e}, skipping")
-                                continue
-                except (json.JSONDecodeError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse products JSON: {e}")
+        self._add_products(batch, prepared_row.product_codes, chunk)
 
         return result
+
+    def _create_batch(self, import_row: BatchImportRow, work_center_id: UUID, chunk: _ImportChunk) -> BatchEntity:
+        """Создает партию в памяти с проверкой пересечения смены"""
+        batch = create_input_dto_to_entity(import_row_to_create_dto(import_row, work_center_id))
+
+        schedule = chunk.schedules.setdefault(work_center_id, ShiftSchedule())
+        if not schedule.is_free(batch.shift_time_range):
+            raise InvalidStateError("Время смены пересекается с другой партией")
+        schedule.occupy(batch.uuid, batch.shift_time_range)
+
+        batch.add_domain_event(
+            BatchCreatedEvent(
+                aggregate_id=batch.uuid,
+                batch_number=batch.batch_number,
+                batch_date=batch.batch_date,
+                work_center_id=batch.work_center_id,
+            )
+        )
+
+        chunk.batches_by_key[(batch.batch_number.value, batch.batch_date)] = batch
+        chunk.new_batches[batch.uuid] = batch
+        return batch
+
+    def _update_batch(
+        self, batch: BatchEntity, import_row: BatchImportRow, work_center_id: UUID, chunk: _ImportChunk
+    ) -> None:
+        """Обновляет партию данными строки; все проверки выполняются до изменения партии"""
+        shift_time_range = import_row.shift_time_range
+        shift_time_changed = datetime_naive_to_aware(shift_time_range.start) != datetime_naive_to_aware(
+            batch.shift_time_range.start
+        ) or datetime_naive_to_aware(shift_time_range.end) != datetime_naive_to_aware(batch.shift_time_range.end)
+        close = import_row.is_closed and not batch.is_closed
+
+        if shift_time_changed and batch.is_closed:
+            raise InvalidStateError("Нельзя изменять время смены для закрытой партии")
+        if close and not batch.can_close():
+            raise InvalidStateError("Невозможно закрыть партию")
+
+        if shift_time_changed or work_center_id != batch.work_center_id:
+            schedule = chunk.schedules.setdefault(work_center_id, ShiftSchedule())
+            if not schedule.is_free(shift_time_range, exclude_batch_id=batch.uuid):
+                raise InvalidStateError("Время смены пересекается с другой партией")
+            if batch.work_center_id in chunk.schedules:
+                chunk.schedules[batch.work_center_id].release(batch.uuid)
+            schedule.occupy(batch.uuid, shift_time_range)
+
+        batch.task_description = import_row.task_description
+        batch.shift = import_row.shift
+        batch.team = import_row.team
+        batch.nomenclature = import_row.nomenclature
+        batch.ekn_code = import_row.ekn_code
+        if shift_time_changed:
+            batch.update_shift_time_range(shift_time_range.start, shift_time_range.end)
+        batch.work_center_id = work_center_id
+
+        if close:
+            batch.close(import_row.closed_at)
+        elif not import_row.is_closed and batch.is_closed:
+            batch.open()
+
+        batch.updated_at = datetime_now()
+        batch.add_domain_event(
+            BatchUpdatedEvent(aggregate_id=batch.uuid, batch_number=batch.batch_number, updated_at=batch.updated_at)
+        )
+
+        if batch.uuid not in chunk.new_batches:
+            chunk.updated_batches[batch.uuid] = batch
+
+    def _add_products(self, batch: BatchEntity, product_codes: list[str], chunk: _ImportChunk) -> None:
+        """Добавляет продукты строки в партию; ошибочные и повторяющиеся продукты пропускаются"""
+        existing_codes = {product.unique_code.value for product in batch.products}
+        for unique_code in product_codes:
+            if unique_code in existing_codes:
+                logger.warning(f"Product with code {unique_code} already exists in batch {batch.uuid}, skipping")
+                continue
+
+            try:
+                product = ProductEntity(unique_code=ProductCode(unique_code), batch_id=batch.uuid)
+                batch.add_product(product)
+            except Exception as e:
+                logger.warning(f"Failed to add product {unique_code}: {e}, skipping")
+                continue
+
+            existing_codes.add(unique_code)
+            chunk.new_products.append(product)
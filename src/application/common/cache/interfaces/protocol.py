@@ -18,6 +18,14 @@ class CacheServiceProtocol(Protocol):
         """Удаляет все ключи по паттерну. Молча игнорирует ошибки."""
         ...
 
+    async def set_if_absent(self, key: str, value: bytes, ttl: int | None = None) -> bool:
+        """Атомарно устанавливает значение, если ключа нет. Возвращает False, если ключ есть, или при ошибке."""
+        ...
+
+    async def increment(self, key: str) -> int | None:
+        """Атомарно увеличивает счетчик на 1 и возвращает новое значение. Возвращает None при ошибке."""
+        ...
+
     @property
     def key_prefix(self) -> str: ...
 
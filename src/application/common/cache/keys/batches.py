@@ -3,6 +3,7 @@ import json
 
 from uuid import UUID
 
+from src.application.batches.queries.filters import BatchReadFilters
 from src.application.batches.queries.queries import ListBatchesQuery
 from src.application.common.cache.keys import serialize_filters, serialize_pagination, serialize_sort
 
@@ -27,3 +28,27 @@ def get_batches_list_key(query: ListBatchesQuery, prefix: str = "cache") -> str:
 def get_batches_list_pattern(prefix: str = "cache") -> str:
     """Возвращает паттерн для всех ключей списков партий."""
     return f"{prefix}:batches:list:*"
+
+
+def get_batches_data_version_key(prefix: str = "cache") -> str:
+    """Возвращает ключ счетчика версии данных партий (увеличивается при любом изменении партий)."""
+    return f"{prefix}:batches:data_version"
+
+
+def get_batches_export_key(
+    file_format: str, filters: BatchReadFilters | None, data_version: int, prefix: str = "cache"
+) -> str:
+    """Генерирует ключ кэша экспорта партий на основе формата, фильтров и версии данных."""
+    export_dict = {
+        "format": file_format,
+        "filters": serialize_filters(filters) if filters else None,
+        "data_version": data_version,
+    }
+    export_json = json.dumps(export_dict, sort_keys=True, default=str)
+    export_hash = hashlib.sha256(export_json.encode()).hexdigest()[:16]
+    return f"{prefix}:batches:export:{export_hash}"
+
+
+def get_batches_export_running_key(export_key: str) -> str:
+    """Возвращает ключ с ID задачи, которая сейчас выполняет экспорт с ключом export_key."""
+    return f"{export_key}:running"
@@ -1,6 +1,14 @@
-from enum import Enum
+from enum import Enum, StrEnum
 
 
 class ExportImportFileFormatEnum(str, Enum):
     XLSX = "xlsx"
     CSV = "csv"
+
+
+class ExportFileFormatEnum(StrEnum):
+    XLSX = "xlsx"
+    CSV = "csv"
+    CSV_GZ = "csv.gz"
+    CSV_ZST = "csv.zst"
+    PARQUET = "parquet"
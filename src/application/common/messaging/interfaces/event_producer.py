@@ -17,3 +17,15 @@ class EventProducerProtocol(Protocol):
             Exception: При ошибке публикации события
         """
         ...
+
+    async def publish_many(self, events: list[DomainEvent]) -> list[Exception | None]:
+        """
+        Публикует несколько событий и ждет подтверждения брокера для всех.
+
+        Args:
+            events: Доменные события для публикации
+
+        Returns:
+            Результат по каждому событию в порядке events: None при подтвержденной публикации, иначе ошибка
+        """
+        ...
@@ -1,21 +1,27 @@
-from typing import Any, Protocol
+from collections.abc import AsyncIterable
+from typing import Any, BinaryIO, Protocol
 
 
 class FileGeneratorProtocol(Protocol):
     """Протокол для генераторов файлов экспорта."""
 
-    async def generate(
+    async def write(
         self,
-        raw_data: list[Any],
-    ) -> bytes:
+        pages: AsyncIterable[list[Any]],
+        output: BinaryIO,
+    ) -> int:
         """
-        Генерирует файл экспорта с данными.
+        Потоково записывает файл экспорта с данными.
+
+        Страницы записываются по мере получения, поэтому в памяти одновременно
+        находится только текущая страница.
 
         Args:
-            raw_data: Список данных для экспорта
+            pages: Страницы данных для экспорта
+            output: Бинарный файловый объект для записи файла
 
         Returns:
-            Байты сгенерированного файла
+            Количество записанных строк данных
 
         Raises:
             FileGenerationError: При ошибке генерации файла
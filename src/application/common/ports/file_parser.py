@@ -1,4 +1,5 @@
-from typing import Any, Protocol
+from collections.abc import AsyncIterator
+from typing import Any, BinaryIO, Protocol
 
 
 class FileParserProtocol(Protocol):
@@ -18,3 +19,23 @@ class FileParserProtocol(Protocol):
             FileParseError: При ошибке парсинга файла (неверная структура, формат)
         """
         ...
+
+    def parse_stream(self, file: BinaryIO, chunk_size: int = 1000) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Потоково парсит файл, возвращая строки порциями.
+
+        В памяти одновременно находится не больше одной порции строк, поэтому
+        потребление памяти не зависит от размера файла.
+
+        Args:
+            file: Бинарный файловый объект с поддержкой чтения (и seek для XLSX)
+            chunk_size: Максимальное количество строк в порции
+
+        Yields:
+            Списки словарей с данными доменной сущности
+
+        Raises:
+            FileParseError: При ошибке парсинга файла (неверная структура, формат);
+                может возникнуть после того, как часть порций уже получена
+        """
+        ...
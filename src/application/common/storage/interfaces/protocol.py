@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 from src.application.common.storage.dtos import FileInfo
 
@@ -41,6 +41,36 @@ class StorageServiceProtocol(Protocol):
         """
         ...
 
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        stream: BinaryIO,
+        file_extension: str | None = None,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Загружает файл неизвестного размера из потока multipart загрузкой.
+
+        Поток читается частями, поэтому файл целиком в памяти не находится.
+
+        Args:
+            bucket_name: Имя bucket'а в хранилище
+            object_name: Имя объекта в хранилище
+            stream: Бинарный поток с данными файла, читается с текущей позиции до конца
+            file_extension: Расширение файла (например, pdf или .pdf, xlsx или .xlsx, etc.)
+            content_type: MIME-тип файла (если None, определяется по расширению)
+            metadata: Метаданные объекта
+
+        Returns:
+            Путь к загруженному объекту
+
+        Raises:
+            StorageError: При ошибке загрузки
+        """
+        ...
+
     async def download_file(self, bucket_name: str, object_name: str) -> bytes:
         """
         Скачивает файл из хранилища.
@@ -57,6 +87,23 @@ class StorageServiceProtocol(Protocol):
         """
         ...
 
+    async def download_to_file(self, bucket_name: str, object_name: str, destination: BinaryIO) -> int:
+        """
+        Потоково скачивает файл из хранилища в файловый объект.
+
+        Args:
+            bucket_name: Имя bucket'а в хранилище
+            object_name: Имя объекта в хранилище
+            destination: Бинарный файловый объект для записи (позиция после записи не сбрасывается)
+
+        Returns:
+            Количество записанных байт
+
+        Raises:
+            StorageError: При ошибке скачивания
+        """
+        ...
+
     async def delete_file(self, bucket_name: str, object_name: str) -> None:
         """
         Удаляет файл из хранилища.
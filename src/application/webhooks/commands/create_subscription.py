@@ -1,6 +1,7 @@
 from src.application.common.uow.interfaces import UnitOfWorkProtocol
 from src.application.webhooks.dtos.create_subscription import CreateWebhookSubscriptionInputDTO
 from src.application.webhooks.mappers import create_subscription_input_dto_to_entity
+from src.application.webhooks.routing import WebhookRoutingNotifierProtocol
 from src.core.logging import get_logger
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 
@@ -8,8 +9,9 @@ logger = get_logger("command.webhooks")
 
 
 class CreateWebhookSubscriptionCommand:
-    def __init__(self, uow: UnitOfWorkProtocol):
+    def __init__(self, uow: UnitOfWorkProtocol, routing_notifier: WebhookRoutingNotifierProtocol | None = None):
         self._uow = uow
+        self._routing_notifier = routing_notifier
 
     async def execute(self, input_dto: CreateWebhookSubscriptionInputDTO) -> WebhookSubscriptionEntity:
         """Создает новую подписку на webhook"""
@@ -23,6 +25,9 @@ class CreateWebhookSubscriptionCommand:
                 subscription_id = result.uuid
                 logger.info(f"Webhook subscription created successfully: subscription_id={subscription_id}")
 
+            if self._routing_notifier:
+                await self._routing_notifier.notify_changed()
+
             return result
         except Exception as e:
             logger.exception(f"Failed to create webhook subscription: {e}")
@@ -1,14 +1,16 @@
 from uuid import UUID
 
 from src.application.common.uow.interfaces import UnitOfWorkProtocol
+from src.application.webhooks.routing import WebhookRoutingNotifierProtocol
 from src.core.logging import get_logger
 
 logger = get_logger("command.webhooks")
 
 
 class DeleteWebhookSubscriptionCommand:
-    def __init__(self, uow: UnitOfWorkProtocol):
+    def __init__(self, uow: UnitOfWorkProtocol, routing_notifier: WebhookRoutingNotifierProtocol | None = None):
         self._uow = uow
+        self._routing_notifier = routing_notifier
 
     async def execute(self, subscription_id: UUID) -> None:
         """Удаляет подписку на webhook"""
@@ -19,6 +21,9 @@ class DeleteWebhookSubscriptionCommand:
 
                 await self._uow.webhook_subscriptions.delete(subscription_id)
                 logger.info(f"Webhook subscription deleted successfully: subscription_id={subscription_id}")
+
+            if self._routing_notifier:
+                await self._routing_notifier.notify_changed()
         except Exception as e:
             logger.exception(f"Failed to delete webhook subscription: {e}")
             raise
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.application.webhooks.queries.filters import WebhookReadFilters
-from src.domain.common.queries import PaginationSpec
+from src.domain.common.queries import KeysetPaginationSpec, PaginationSpec
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -14,4 +14,4 @@ class ListWebhookSubscriptionsQuery:
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ListWebhookDeliveriesQuery:
     subscription_id: UUID
-    pagination: PaginationSpec | None = None
+    pagination: KeysetPaginationSpec | None = None
@@ -2,6 +2,7 @@ from typing import Protocol
 from uuid import UUID
 
 from src.application.webhooks.queries.queries import ListWebhookSubscriptionsQuery
+from src.domain.common.enums import EventTypesEnum
 from src.domain.common.queries import QueryResult
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 
@@ -16,3 +17,7 @@ class WebhookSubscriptionQueryServiceProtocol(Protocol):
     async def list(self, query: ListWebhookSubscriptionsQuery) -> QueryResult[WebhookSubscriptionEntity]:
         """Получает список всех подписок на webhook с пагинацией"""
         ...
+
+    async def list_active(self, event_type: EventTypesEnum | None = None) -> tuple[WebhookSubscriptionEntity, ...]:
+        """Получает все активные подписки, при event_type — только подписанные на это событие"""
+        ...
@@ -0,0 +1,12 @@
+from typing import Protocol
+
+
+class WebhookRoutingNotifierProtocol(Protocol):
+    """Протокол уведомления процессов доставки webhooks об изменении подписок"""
+
+    async def notify_changed(self) -> None:
+        """
+        Сообщает, что набор подписок изменился и таблицы маршрутизации нужно перечитать.
+        Ошибки не пробрасываются: таблицы в любом случае перечитываются по TTL.
+        """
+        ...
@@ -4,6 +4,7 @@ from src.application.work_centers.mappers import update_dto_to_entity
 from src.core.logging import get_logger
 from src.domain.common.exceptions import InvalidStateError
 from src.domain.work_centers import WorkCenterEntity
+from src.domain.work_centers.events import WorkCenterUpdatedEvent
 
 logger = get_logger("command.work_centers")
 
@@ -29,6 +30,14 @@ class UpdateWorkCenterCommand:
                 updated_entity = update_dto_to_entity(work_center, input_dto)
 
                 result = await self._uow.work_centers.update(updated_entity)
+                work_center.add_domain_event(
+                    WorkCenterUpdatedEvent(
+                        work_center_id=result.uuid,
+                        identifier=result.identifier.value,
+                        name=result.name.value,
+                        aggregate_id=result.uuid,
+                    )
+                )
                 logger.info(f"Work center updated successfully: work_center_id={input_dto.work_center_id}")
                 return result
         except Exception as e:
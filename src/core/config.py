@@ -47,6 +47,9 @@ RABBITMQ_EVENT_EXCHANGE: str = getenv("RABBITMQ_EVENT_EXCHANGE", "events")
 RABBITMQ_EVENT_ROUTING: str | None = getenv("RABBITMQ_EVENT_ROUTING")
 RABBITMQ_CONSUMER_QUEUE: str = getenv("RABBITMQ_CONSUMER_QUEUE", "event_consumer")
 RABBITMQ_CONSUMER_PREFETCH: int = int(getenv("RABBITMQ_CONSUMER_PREFETCH", "10"))
+RABBITMQ_PUBLISHER_CHANNELS: int = int(getenv("RABBITMQ_PUBLISHER_CHANNELS", "4"))
+RABBITMQ_PUBLISHER_MAX_IN_FLIGHT: int = int(getenv("RABBITMQ_PUBLISHER_MAX_IN_FLIGHT", "256"))
+RABBITMQ_PUBLISHER_CONFIRM_TIMEOUT: float = float(getenv("RABBITMQ_PUBLISHER_CONFIRM_TIMEOUT", "30"))
 
 # Celery settings
 CELERY_BROKER_URL: str | None = getenv("CELERY_BROKER_URL")
@@ -60,15 +63,67 @@ CELERY_REDIS_KEY_PREFIX: str = getenv("CELERY_REDIS_KEY_PREFIX", "celery")
 CELERY_TASK_MAX_RETRIES: int = int(getenv("CELERY_TASK_MAX_RETRIES", "3"))
 CELERY_TASK_DEFAULT_RETRY_DELAY: int = int(getenv("CELERY_TASK_DEFAULT_RETRY_DELAY", "60"))
 
+# Outbox settings
+OUTBOX_BATCH_SIZE: int = int(getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_LOCK_DURATION_SECONDS: int = int(getenv("OUTBOX_LOCK_DURATION_SECONDS", "300"))
+OUTBOX_DISPATCH_CONCURRENCY: int = int(getenv("OUTBOX_DISPATCH_CONCURRENCY", "4"))
+OUTBOX_BULK_INSERT_THRESHOLD: int = int(getenv("OUTBOX_BULK_INSERT_THRESHOLD", "100"))
+OUTBOX_COALESCE_EVENTS: bool = getenv("OUTBOX_COALESCE_EVENTS", "false") == "true"
+OUTBOX_COALESCE_MIN_EVENTS: int = int(getenv("OUTBOX_COALESCE_MIN_EVENTS", "10"))
+OUTBOX_PER_EVENT_ACK: bool = getenv("OUTBOX_PER_EVENT_ACK", "false") == "true"
+OUTBOX_BATCH_PUBLISH: bool = getenv("OUTBOX_BATCH_PUBLISH", "true") == "true"
+OUTBOX_RELAY_ENABLED: bool = getenv("OUTBOX_RELAY_ENABLED", "false") == "true"
+OUTBOX_RELAY_CONCURRENCY: int = int(getenv("OUTBOX_RELAY_CONCURRENCY", "2"))
+OUTBOX_RELAY_MIN_POLL_INTERVAL: float = float(getenv("OUTBOX_RELAY_MIN_POLL_INTERVAL", "0.1"))
+OUTBOX_RELAY_MAX_POLL_INTERVAL: float = float(getenv("OUTBOX_RELAY_MAX_POLL_INTERVAL", "5.0"))
+OUTBOX_RELAY_METRICS_INTERVAL: int = int(getenv("OUTBOX_RELAY_METRICS_INTERVAL", "60"))
+OUTBOX_RETENTION_DAYS: int = int(getenv("OUTBOX_RETENTION_DAYS", "7"))
+OUTBOX_RETENTION_MODE: str = getenv("OUTBOX_RETENTION_MODE", "drop")
+OUTBOX_PARTITION_PREMAKE_DAYS: int = int(getenv("OUTBOX_PARTITION_PREMAKE_DAYS", "7"))
+OUTBOX_ARCHIVE_BUCKET: str = getenv("OUTBOX_ARCHIVE_BUCKET", "archives")
+
+# Webhook settings
+WEBHOOK_MAX_CONCURRENCY: int = int(getenv("WEBHOOK_MAX_CONCURRENCY", "50"))
+WEBHOOK_MAX_PER_HOST: int = int(getenv("WEBHOOK_MAX_PER_HOST", "10"))
+WEBHOOK_MIN_PER_HOST: int = int(getenv("WEBHOOK_MIN_PER_HOST", "1"))
+WEBHOOK_AIMD_DECREASE_FACTOR: float = float(getenv("WEBHOOK_AIMD_DECREASE_FACTOR", "0.5"))
+WEBHOOK_RETRY_BASE_DELAY: float = float(getenv("WEBHOOK_RETRY_BASE_DELAY", "10"))
+WEBHOOK_RETRY_MAX_DELAY: float = float(getenv("WEBHOOK_RETRY_MAX_DELAY", "3600"))
+WEBHOOK_RETRY_POLL_INTERVAL: float = float(getenv("WEBHOOK_RETRY_POLL_INTERVAL", "10"))
+WEBHOOK_RETRY_BATCH_SIZE: int = int(getenv("WEBHOOK_RETRY_BATCH_SIZE", "100"))
+WEBHOOK_RETRY_LEASE_SECONDS: int = int(getenv("WEBHOOK_RETRY_LEASE_SECONDS", "300"))
+WEBHOOK_HTTP_MAX_CONNECTIONS: int = int(getenv("WEBHOOK_HTTP_MAX_CONNECTIONS", "100"))
+WEBHOOK_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(getenv("WEBHOOK_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+WEBHOOK_HTTP_KEEPALIVE_EXPIRY: float = float(getenv("WEBHOOK_HTTP_KEEPALIVE_EXPIRY", "30"))
+WEBHOOK_HTTP2: bool = getenv("WEBHOOK_HTTP2", "false") == "true"
+WEBHOOK_METRICS_LOG_INTERVAL: int = int(getenv("WEBHOOK_METRICS_LOG_INTERVAL", "300"))
+WEBHOOK_CIRCUIT_ENABLED: bool = getenv("WEBHOOK_CIRCUIT_ENABLED", "true") == "true"
+WEBHOOK_CIRCUIT_SCOPE: str = getenv("WEBHOOK_CIRCUIT_SCOPE", "host")
+WEBHOOK_CIRCUIT_FAILURE_THRESHOLD: int = int(getenv("WEBHOOK_CIRCUIT_FAILURE_THRESHOLD", "5"))
+WEBHOOK_CIRCUIT_FAILURE_WINDOW: int = int(getenv("WEBHOOK_CIRCUIT_FAILURE_WINDOW", "300"))
+WEBHOOK_CIRCUIT_OPEN_SECONDS: int = int(getenv("WEBHOOK_CIRCUIT_OPEN_SECONDS", "60"))
+WEBHOOK_CIRCUIT_MAX_DEFER: int = int(getenv("WEBHOOK_CIRCUIT_MAX_DEFER", "86400"))
+WEBHOOK_ROUTING_TTL: int = int(getenv("WEBHOOK_ROUTING_TTL", "60"))
+WEBHOOK_ATTEMPTS_RETENTION_DAYS: int = int(getenv("WEBHOOK_ATTEMPTS_RETENTION_DAYS", "14"))
+WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS: int = int(getenv("WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS", "7"))
+
+# Webhook dispatcher settings
+WEBHOOK_DISPATCHER_ENABLED: bool = getenv("WEBHOOK_DISPATCHER_ENABLED", "false") == "true"
+WEBHOOK_DISPATCHER_HEALTH_HOST: str = getenv("WEBHOOK_DISPATCHER_HEALTH_HOST", "0.0.0.0")
+WEBHOOK_DISPATCHER_HEALTH_PORT: int = int(getenv("WEBHOOK_DISPATCHER_HEALTH_PORT", "8081"))
+WEBHOOK_DISPATCHER_SHUTDOWN_TIMEOUT: float = float(getenv("WEBHOOK_DISPATCHER_SHUTDOWN_TIMEOUT", "30"))
+WEBHOOK_DISPATCHER_METRICS_INTERVAL: int = int(getenv("WEBHOOK_DISPATCHER_METRICS_INTERVAL", "60"))
+
 # Cache settings
 CACHE_ENABLED: bool = getenv("CACHE_ENABLED", "true") == "true"
 CACHE_KEY_PREFIX: str = getenv("CACHE_KEY_PREFIX", "cache")
+EVENT_TYPE_CACHE_TTL: int = int(getenv("EVENT_TYPE_CACHE_TTL", "300"))
 
 # MinIO settings
 MINIO_ENDPOINT: str = getenv("MINIO_ENDPOINT", "localhost:9000")
 MINIO_ACCESS_KEY: str = getenv("MINIO_ACCESS_KEY", "minioadmin")
 MINIO_SECRET_KEY: str = getenv("MINIO_SECRET_KEY", "minioadmin")
-MINIO_BUCKETS: str = getenv("MINIO_BUCKETS", "reports,exports,imports")
+MINIO_BUCKETS: str = getenv("MINIO_BUCKETS", "reports,exports,imports,archives")
 MINIO_SECURE: bool = getenv("MINIO_SECURE", "false") == "true"
 MINIO_REGION: str | None = getenv("MINIO_REGION")
 MINIO_FILES_LIFETIME_DAYS: int = int(getenv("MINIO_FILES_LIFETIME_DAYS", "30"))
@@ -85,5 +140,15 @@ SMTP_USE_TLS: bool = getenv("SMTP_USE_TLS", "true").lower() == "true"
 BATCH_CACHE_GET_TTL: int = int(getenv("BATCH_CACHE_GET_TTL", "300"))
 BATCH_CACHE_LIST_TTL: int = int(getenv("BATCH_CACHE_LIST_TTL", "3600"))
 
+# Batch import settings
+BATCH_IMPORT_CHUNK_SIZE: int = int(getenv("BATCH_IMPORT_CHUNK_SIZE", "1000"))
+BATCH_IMPORT_WORKERS: int = int(getenv("BATCH_IMPORT_WORKERS", "0"))
+BATCH_IMPORT_SHARD_SIZE: int = int(getenv("BATCH_IMPORT_SHARD_SIZE", "250"))
+BATCH_IMPORT_COMMIT_EVERY: int = int(getenv("BATCH_IMPORT_COMMIT_EVERY", "10000"))
+
+# Batch export settings
+BATCH_EXPORT_PAGE_SIZE: int = int(getenv("BATCH_EXPORT_PAGE_SIZE", "1000"))
+BATCH_EXPORT_CACHE_TTL: int = int(getenv("BATCH_EXPORT_CACHE_TTL", "3600"))
+
 # Analytics settings
 ANALYTICS_DASHBOARD_TTL: int = int(getenv("ANALYTICS_DASHBOARD_TTL", "300"))
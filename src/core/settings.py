@@ -4,6 +4,12 @@ from src.core.config import (
     ANALYTICS_DASHBOARD_TTL,
     BATCH_CACHE_GET_TTL,
     BATCH_CACHE_LIST_TTL,
+    BATCH_EXPORT_CACHE_TTL,
+    BATCH_EXPORT_PAGE_SIZE,
+    BATCH_IMPORT_CHUNK_SIZE,
+    BATCH_IMPORT_COMMIT_EVERY,
+    BATCH_IMPORT_SHARD_SIZE,
+    BATCH_IMPORT_WORKERS,
     CACHE_ENABLED,
     CACHE_KEY_PREFIX,
     CELERY_BROKER_URL,
@@ -22,6 +28,7 @@ from src.core.config import (
     DB_PORT,
     DB_SCHEMA,
     DB_USER,
+    EVENT_TYPE_CACHE_TTL,
     MINIO_ACCESS_KEY,
     MINIO_BUCKETS,
     MINIO_ENDPOINT,
@@ -29,6 +36,23 @@ from src.core.config import (
     MINIO_REGION,
     MINIO_SECRET_KEY,
     MINIO_SECURE,
+    OUTBOX_ARCHIVE_BUCKET,
+    OUTBOX_BATCH_PUBLISH,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_BULK_INSERT_THRESHOLD,
+    OUTBOX_COALESCE_EVENTS,
+    OUTBOX_COALESCE_MIN_EVENTS,
+    OUTBOX_DISPATCH_CONCURRENCY,
+    OUTBOX_LOCK_DURATION_SECONDS,
+    OUTBOX_PARTITION_PREMAKE_DAYS,
+    OUTBOX_PER_EVENT_ACK,
+    OUTBOX_RELAY_CONCURRENCY,
+    OUTBOX_RELAY_ENABLED,
+    OUTBOX_RELAY_MAX_POLL_INTERVAL,
+    OUTBOX_RELAY_METRICS_INTERVAL,
+    OUTBOX_RELAY_MIN_POLL_INTERVAL,
+    OUTBOX_RETENTION_DAYS,
+    OUTBOX_RETENTION_MODE,
     RABBITMQ_CONSUMER_PREFETCH,
     RABBITMQ_CONSUMER_QUEUE,
     RABBITMQ_EVENT_EXCHANGE,
@@ -36,6 +60,9 @@ from src.core.config import (
     RABBITMQ_HOST,
     RABBITMQ_PASSWORD,
     RABBITMQ_PORT,
+    RABBITMQ_PUBLISHER_CHANNELS,
+    RABBITMQ_PUBLISHER_CONFIRM_TIMEOUT,
+    RABBITMQ_PUBLISHER_MAX_IN_FLIGHT,
     RABBITMQ_USER,
     RABBITMQ_VHOST,
     REDIS_DB,
@@ -48,6 +75,34 @@ from src.core.config import (
     SMTP_PORT,
     SMTP_USE_TLS,
     SMTP_USER,
+    WEBHOOK_AIMD_DECREASE_FACTOR,
+    WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS,
+    WEBHOOK_ATTEMPTS_RETENTION_DAYS,
+    WEBHOOK_CIRCUIT_ENABLED,
+    WEBHOOK_CIRCUIT_FAILURE_THRESHOLD,
+    WEBHOOK_CIRCUIT_FAILURE_WINDOW,
+    WEBHOOK_CIRCUIT_MAX_DEFER,
+    WEBHOOK_CIRCUIT_OPEN_SECONDS,
+    WEBHOOK_CIRCUIT_SCOPE,
+    WEBHOOK_DISPATCHER_ENABLED,
+    WEBHOOK_DISPATCHER_HEALTH_HOST,
+    WEBHOOK_DISPATCHER_HEALTH_PORT,
+    WEBHOOK_DISPATCHER_METRICS_INTERVAL,
+    WEBHOOK_DISPATCHER_SHUTDOWN_TIMEOUT,
+    WEBHOOK_HTTP2,
+    WEBHOOK_HTTP_KEEPALIVE_EXPIRY,
+    WEBHOOK_HTTP_MAX_CONNECTIONS,
+    WEBHOOK_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    WEBHOOK_MAX_CONCURRENCY,
+    WEBHOOK_MAX_PER_HOST,
+    WEBHOOK_METRICS_LOG_INTERVAL,
+    WEBHOOK_MIN_PER_HOST,
+    WEBHOOK_RETRY_BASE_DELAY,
+    WEBHOOK_RETRY_BATCH_SIZE,
+    WEBHOOK_RETRY_LEASE_SECONDS,
+    WEBHOOK_RETRY_MAX_DELAY,
+    WEBHOOK_RETRY_POLL_INTERVAL,
+    WEBHOOK_ROUTING_TTL,
 )
 
 
@@ -76,6 +131,11 @@ class DatabaseSettings:
     def url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    @property
+    def dsn(self) -> str:
+        """DSN для прямого подключения через asyncpg (без драйвера SQLAlchemy)"""
+        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+
     def get_safe_url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:***@{self.host}:{self.port}/{self.name}"
 
@@ -198,6 +258,41 @@ class BatchCacheSettings:
     ttl_list: int = BATCH_CACHE_LIST_TTL
 
 
+@dataclass
+class BatchImportSettings:
+    chunk_size: int = BATCH_IMPORT_CHUNK_SIZE
+    workers: int = BATCH_IMPORT_WORKERS
+    shard_size: int = BATCH_IMPORT_SHARD_SIZE
+    commit_every: int = BATCH_IMPORT_COMMIT_EVERY
+
+    def __post_init__(self) -> None:
+        if self.chunk_size < 1:
+            raise ValueError("BATCH_IMPORT_CHUNK_SIZE must be positive")
+        if self.workers < 0:
+            raise ValueError("BATCH_IMPORT_WORKERS must be non-negative")
+        if self.shard_size < 1:
+            raise ValueError("BATCH_IMPORT_SHARD_SIZE must be positive")
+        if self.commit_every < 0:
+            raise ValueError("BATCH_IMPORT_COMMIT_EVERY must be non-negative")
+
+
+@dataclass
+class BatchExportSettings:
+    page_size: int = BATCH_EXPORT_PAGE_SIZE
+    cache_ttl: int = BATCH_EXPORT_CACHE_TTL
+
+    def __post_init__(self) -> None:
+        if self.page_size < 1:
+            raise ValueError("BATCH_EXPORT_PAGE_SIZE must be positive")
+        if self.cache_ttl < 0:
+            raise ValueError("BATCH_EXPORT_CACHE_TTL must be non-negative")
+
+
+@dataclass
+class EventTypeCacheSettings:
+    ttl: int = EVENT_TYPE_CACHE_TTL
+
+
 @dataclass
 class AnalyticsSettings:
     ttl_dashboard: int = ANALYTICS_DASHBOARD_TTL
@@ -209,3 +304,137 @@ class RabbitMQMessagingSettings:
     event_routing: str | None = RABBITMQ_EVENT_ROUTING
     consumer_queue: str = RABBITMQ_CONSUMER_QUEUE
     consumer_prefetch: int = RABBITMQ_CONSUMER_PREFETCH
+    publisher_channels: int = RABBITMQ_PUBLISHER_CHANNELS
+    publisher_max_in_flight: int = RABBITMQ_PUBLISHER_MAX_IN_FLIGHT
+    publisher_confirm_timeout: float = RABBITMQ_PUBLISHER_CONFIRM_TIMEOUT
+
+    def __post_init__(self) -> None:
+        if self.publisher_channels < 1:
+            raise ValueError("RABBITMQ_PUBLISHER_CHANNELS must be positive")
+        if self.publisher_max_in_flight < 1:
+            raise ValueError("RABBITMQ_PUBLISHER_MAX_IN_FLIGHT must be positive")
+
+
+@dataclass
+class OutboxSettings:
+    batch_size: int = OUTBOX_BATCH_SIZE
+    lock_duration_seconds: int = OUTBOX_LOCK_DURATION_SECONDS
+    per_event_ack: bool = OUTBOX_PER_EVENT_ACK
+    batch_publish: bool = OUTBOX_BATCH_PUBLISH
+    dispatch_concurrency: int = OUTBOX_DISPATCH_CONCURRENCY
+    bulk_insert_threshold: int = OUTBOX_BULK_INSERT_THRESHOLD
+    coalesce_events: bool = OUTBOX_COALESCE_EVENTS
+    coalesce_min_events: int = OUTBOX_COALESCE_MIN_EVENTS
+    relay_enabled: bool = OUTBOX_RELAY_ENABLED
+    relay_concurrency: int = OUTBOX_RELAY_CONCURRENCY
+    relay_min_poll_interval: float = OUTBOX_RELAY_MIN_POLL_INTERVAL
+    relay_max_poll_interval: float = OUTBOX_RELAY_MAX_POLL_INTERVAL
+    relay_metrics_interval: int = OUTBOX_RELAY_METRICS_INTERVAL
+    retention_days: int = OUTBOX_RETENTION_DAYS
+    retention_mode: str = OUTBOX_RETENTION_MODE
+    partition_premake_days: int = OUTBOX_PARTITION_PREMAKE_DAYS
+    archive_bucket: str = OUTBOX_ARCHIVE_BUCKET
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1:
+            raise ValueError("OUTBOX_BATCH_SIZE must be positive")
+        if self.dispatch_concurrency < 1:
+            raise ValueError("OUTBOX_DISPATCH_CONCURRENCY must be positive")
+        if self.bulk_insert_threshold < 1:
+            raise ValueError("OUTBOX_BULK_INSERT_THRESHOLD must be positive")
+        if self.coalesce_min_events < 2:
+            raise ValueError("OUTBOX_COALESCE_MIN_EVENTS must be at least 2")
+        if self.relay_concurrency < 1:
+            raise ValueError("OUTBOX_RELAY_CONCURRENCY must be positive")
+        if self.relay_min_poll_interval <= 0 or self.relay_max_poll_interval < self.relay_min_poll_interval:
+            raise ValueError("OUTBOX_RELAY_*_POLL_INTERVAL must satisfy 0 < min <= max")
+        if self.retention_days < 1:
+            raise ValueError("OUTBOX_RETENTION_DAYS must be positive")
+        if self.retention_mode not in ("drop", "detach", "archive"):
+            raise ValueError("OUTBOX_RETENTION_MODE must be one of: drop, detach, archive")
+        if self.partition_premake_days < 1:
+            raise ValueError("OUTBOX_PARTITION_PREMAKE_DAYS must be positive")
+
+
+@dataclass
+class WebhookSettings:
+    max_concurrency: int = WEBHOOK_MAX_CONCURRENCY
+    max_per_host: int = WEBHOOK_MAX_PER_HOST
+    min_per_host: int = WEBHOOK_MIN_PER_HOST
+    aimd_decrease_factor: float = WEBHOOK_AIMD_DECREASE_FACTOR
+    retry_base_delay: float = WEBHOOK_RETRY_BASE_DELAY
+    retry_max_delay: float = WEBHOOK_RETRY_MAX_DELAY
+    retry_poll_interval: float = WEBHOOK_RETRY_POLL_INTERVAL
+    retry_batch_size: int = WEBHOOK_RETRY_BATCH_SIZE
+    retry_lease_seconds: int = WEBHOOK_RETRY_LEASE_SECONDS
+    http_max_connections: int = WEBHOOK_HTTP_MAX_CONNECTIONS
+    http_max_keepalive_connections: int = WEBHOOK_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    http_keepalive_expiry: float = WEBHOOK_HTTP_KEEPALIVE_EXPIRY
+    http2: bool = WEBHOOK_HTTP2
+    metrics_log_interval: int = WEBHOOK_METRICS_LOG_INTERVAL
+    circuit_enabled: bool = WEBHOOK_CIRCUIT_ENABLED
+    circuit_scope: str = WEBHOOK_CIRCUIT_SCOPE
+    circuit_failure_threshold: int = WEBHOOK_CIRCUIT_FAILURE_THRESHOLD
+    circuit_failure_window: int = WEBHOOK_CIRCUIT_FAILURE_WINDOW
+    circuit_open_seconds: int = WEBHOOK_CIRCUIT_OPEN_SECONDS
+    circuit_max_defer: int = WEBHOOK_CIRCUIT_MAX_DEFER
+    routing_ttl: int = WEBHOOK_ROUTING_TTL
+    attempts_retention_days: int = WEBHOOK_ATTEMPTS_RETENTION_DAYS
+    attempts_partition_premake_days: int = WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            raise ValueError("WEBHOOK_MAX_CONCURRENCY must be positive")
+        if self.max_per_host < 1:
+            raise ValueError("WEBHOOK_MAX_PER_HOST must be positive")
+        if not 1 <= self.min_per_host <= self.max_per_host:
+            raise ValueError("WEBHOOK_MIN_PER_HOST must be between 1 and WEBHOOK_MAX_PER_HOST")
+        if not 0 < self.aimd_decrease_factor < 1:
+            raise ValueError("WEBHOOK_AIMD_DECREASE_FACTOR must be between 0 and 1")
+        if self.retry_base_delay <= 0 or self.retry_max_delay < self.retry_base_delay:
+            raise ValueError("WEBHOOK_RETRY_*_DELAY must satisfy 0 < base <= max")
+        if self.retry_poll_interval <= 0:
+            raise ValueError("WEBHOOK_RETRY_POLL_INTERVAL must be positive")
+        if self.retry_batch_size < 1:
+            raise ValueError("WEBHOOK_RETRY_BATCH_SIZE must be positive")
+        if self.retry_lease_seconds < 1:
+            raise ValueError("WEBHOOK_RETRY_LEASE_SECONDS must be positive")
+        if self.http_max_connections < self.max_concurrency:
+            raise ValueError("WEBHOOK_HTTP_MAX_CONNECTIONS must be >= WEBHOOK_MAX_CONCURRENCY")
+        if self.http_max_keepalive_connections < 0 or self.http_max_keepalive_connections > self.http_max_connections:
+            raise ValueError(
+                "WEBHOOK_HTTP_MAX_KEEPALIVE_CONNECTIONS must be between 0 and WEBHOOK_HTTP_MAX_CONNECTIONS"
+            )
+        if self.http_keepalive_expiry < 0:
+            raise ValueError("WEBHOOK_HTTP_KEEPALIVE_EXPIRY must not be negative")
+        if self.metrics_log_interval < 1:
+            raise ValueError("WEBHOOK_METRICS_LOG_INTERVAL must be positive")
+        if self.circuit_scope not in ("host", "subscription"):
+            raise ValueError("WEBHOOK_CIRCUIT_SCOPE must be one of: host, subscription")
+        if self.circuit_failure_threshold < 1:
+            raise ValueError("WEBHOOK_CIRCUIT_FAILURE_THRESHOLD must be positive")
+        if self.circuit_failure_window < 1 or self.circuit_open_seconds < 1:
+            raise ValueError("WEBHOOK_CIRCUIT_FAILURE_WINDOW and WEBHOOK_CIRCUIT_OPEN_SECONDS must be positive")
+        if self.circuit_max_defer < 0:
+            raise ValueError("WEBHOOK_CIRCUIT_MAX_DEFER must not be negative")
+        if self.routing_ttl < 0:
+            raise ValueError("WEBHOOK_ROUTING_TTL must not be negative")
+        if self.attempts_retention_days < 1:
+            raise ValueError("WEBHOOK_ATTEMPTS_RETENTION_DAYS must be positive")
+        if self.attempts_partition_premake_days < 1:
+            raise ValueError("WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS must be positive")
+
+
+@dataclass
+class WebhookDispatcherSettings:
+    enabled: bool = WEBHOOK_DISPATCHER_ENABLED
+    health_host: str = WEBHOOK_DISPATCHER_HEALTH_HOST
+    health_port: int = WEBHOOK_DISPATCHER_HEALTH_PORT
+    shutdown_timeout: float = WEBHOOK_DISPATCHER_SHUTDOWN_TIMEOUT
+    metrics_interval: int = WEBHOOK_DISPATCHER_METRICS_INTERVAL
+
+    def __post_init__(self) -> None:
+        if self.shutdown_timeout <= 0:
+            raise ValueError("WEBHOOK_DISPATCHER_SHUTDOWN_TIMEOUT must be positive")
+        if self.metrics_interval < 1:
+            raise ValueError("WEBHOOK_DISPATCHER_METRICS_INTERVAL must be positive")
@@ -7,6 +7,8 @@ from src.domain.batches.events.batch_updated import BatchUpdatedEvent
 from src.domain.batches.events.import_completed import BatchesImportCompletedEvent
 from src.domain.batches.events.product_added import ProductAddedToBatchEvent
 from src.domain.batches.events.product_removed import ProductRemovedFromBatchEvent
+from src.domain.batches.events.products_added import ProductsAddedToBatchEvent
+from src.domain.batches.events.products_removed import ProductsRemovedFromBatchEvent
 from src.domain.batches.events.report_generated import ReportGeneratedEvent
 
 __all__ = [
@@ -19,5 +21,7 @@ __all__ = [
     "BatchesImportCompletedEvent",
     "ProductAddedToBatchEvent",
     "ProductRemovedFromBatchEvent",
+    "ProductsAddedToBatchEvent",
+    "ProductsRemovedFromBatchEvent",
     "ReportGeneratedEvent",
 ]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class ProductsRemovedFromBatchEvent(DomainEvent):
+    """Несколько ProductRemovedFromBatchEvent одной партии, объединенные в рамках одного commit"""
+
+    batch_id: UUID
+    product_ids: tuple[UUID, ...]
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from src.domain.batches import BatchEntity
+from src.domain.batches.value_objects import BatchShift
 from src.domain.common.repository_protocol import BaseRepositoryProtocol
 
 
@@ -18,3 +19,23 @@ class BatchRepositoryProtocol(BaseRepositoryProtocol[BatchEntity], Protocol):
     async def get_expired_open_batches(self, before_time: datetime) -> list[BatchEntity]:
         """Находит открытые партии с shift_end_time < before_time."""
         ...
+
+    async def get_by_batch_numbers_and_dates(self, keys: list[tuple[int, date]]) -> list[BatchEntity]:
+        """Находит партии по набору пар (номер партии, дата) одним запросом."""
+        ...
+
+    async def get_existing_numbers_and_dates(self, keys: list[tuple[int, date]]) -> set[tuple[int, date]]:
+        """Возвращает пары (номер партии, дата) из набора, для которых партии уже существуют."""
+        ...
+
+    async def get_shifts(self, work_center_ids: list[UUID], start: datetime, end: datetime) -> list[BatchShift]:
+        """Находит смены партий рабочих центров, пересекающиеся с интервалом [start, end)."""
+        ...
+
+    async def create_many(self, domain_entities: list[BatchEntity]) -> None:
+        """Создает несколько партий за одну операцию (без продуктов)."""
+        ...
+
+    async def update_many(self, domain_entities: list[BatchEntity]) -> None:
+        """Обновляет поля нескольких партий за одну операцию (без продуктов)."""
+        ...
@@ -1,5 +1,18 @@
 from src.domain.batches.services.validate_batch_uniqueness import is_batch_exist
-from src.domain.batches.services.validate_import_row import BatchImportRowValidator, ValidationResult
-from src.domain.batches.services.validate_shift_time_overlap import validate_shift_time_overlap
+from src.domain.batches.services.validate_import_row import (
+    BatchImportRowValidator,
+    ValidationResult,
+    validate_import_columns,
+    validate_import_row_formats,
+)
+from src.domain.batches.services.validate_shift_time_overlap import ShiftSchedule, validate_shift_time_overlap
 
-__all__ = ["BatchImportRowValidator", "ValidationResult", "is_batch_exist", "validate_shift_time_overlap"]
+__all__ = [
+    "BatchImportRowValidator",
+    "ShiftSchedule",
+    "ValidationResult",
+    "is_batch_exist",
+    "validate_import_columns",
+    "validate_import_row_formats",
+    "validate_shift_time_overlap",
+]
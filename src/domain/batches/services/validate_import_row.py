@@ -19,6 +19,52 @@ class ValidationResult:
     validated_row: BatchImportRow | None = None
 
 
+def validate_import_row_formats(row_data: dict[str, Any]) -> ValidationResult:
+    """
+    Валидирует форматы строки импорта без обращения к репозиториям.
+
+    В отличие от BatchImportRowValidator.validate, validated_row заполняется всегда, когда строку
+    удалось разобрать, даже при ошибках форматов: по нему выполняются проверки уникальности.
+
+    Args:
+        row_data: Словарь с данными партии
+
+    Returns:
+        Результат валидации форматов
+    """
+    try:
+        import_row = BatchImportRow.from_dict(row_data)
+    except Exception as e:
+        return ValidationResult(is_valid=False, errors=[f"Ошибка валидации форматов: {e}"])
+
+    format_errors = import_row.validate_formats()
+    return ValidationResult(is_valid=not format_errors, errors=format_errors, validated_row=import_row)
+
+
+def validate_import_columns(rows: list[dict[str, Any]]) -> list[ValidationResult]:
+    """
+    Валидирует форматы набора строк импорта, разбирая данные по колонкам.
+
+    В отличие от validate_import_row_formats, для строки возвращаются ошибки всех колонок,
+    а каждое уникальное значение колонки разбирается один раз (BatchImportRow.from_columns).
+
+    Args:
+        rows: Словари с данными партий
+
+    Returns:
+        Результаты валидации форматов в порядке строк
+    """
+    results: list[ValidationResult] = []
+    for parsed in BatchImportRow.from_columns(rows):
+        if isinstance(parsed, BatchImportRow):
+            format_errors = parsed.validate_formats()
+            results.append(ValidationResult(is_valid=not format_errors, errors=format_errors, validated_row=parsed))
+        else:
+            errors = [f"Ошибка валидации форматов: {error}" for error in parsed]
+            results.append(ValidationResult(is_valid=False, errors=errors))
+    return results
+
+
 class BatchImportRowValidator:
     """
     Domain Service для валидации данных импорта партий.
@@ -52,17 +98,13 @@ class BatchImportRowValidator:
         Returns:
             Результат валидации с ошибками (если есть)
         """
-        errors: list[str] = []
-
         # 1. Валидация форматов через Value Object
-        try:
-            import_row = BatchImportRow.from_dict(row_data)
-            format_errors = import_row.validate_formats()
-            if format_errors:
-                errors.extend(format_errors)
-        except Exception as e:
-            errors.append(f"Ошибка валидации форматов: {e}")
-            return ValidationResult(is_valid=False, errors=errors)
+        format_result = validate_import_row_formats(row_data)
+        import_row = format_result.validated_row
+        if import_row is None:
+            return format_result
+
+        errors: list[str] = list(format_result.errors)
 
         # 2. Проверка уникальности (если не обновление)
         if update_existing:
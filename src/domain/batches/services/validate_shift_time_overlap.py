@@ -1,5 +1,12 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from src.core.time import datetime_naive_to_aware
 from src.domain.batches import BatchEntity
 from src.domain.batches.interfaces.repository import BatchRepositoryProtocol
+from src.domain.batches.value_objects import ShiftTimeRange
 
 
 async def validate_shift_time_overlap(batch: BatchEntity, repository: BatchRepositoryProtocol) -> bool:
@@ -14,3 +21,53 @@ async def validate_shift_time_overlap(batch: BatchEntity, repository: BatchRepos
         ):
             return False
     return True
+
+
+class ShiftSchedule:
+    """
+    Занятые интервалы смен одного рабочего центра для проверки пересечений в памяти.
+
+    Интервалы хранятся отсортированными по началу. Смены рабочего центра не пересекаются
+    (это гарантирует validate_shift_time_overlap при создании и изменении партий), поэтому
+    с новым интервалом может пересечься только ближайший интервал, начавшийся раньше его конца:
+    проверка выполняется за O(log n). Naive datetime считаются UTC.
+    """
+
+    def __init__(self, shifts: Iterable[tuple[UUID, ShiftTimeRange]] = ()) -> None:
+        self._intervals: list[tuple[datetime, datetime, UUID]] = []
+        self._by_batch: dict[UUID, tuple[datetime, datetime, UUID]] = {}
+        for batch_id, shift_time_range in shifts:
+            self.occupy(batch_id, shift_time_range)
+
+    def is_free(self, shift_time_range: ShiftTimeRange, exclude_batch_id: UUID | None = None) -> bool:
+        """Проверяет, что смена не пересекается с занятыми интервалами (кроме интервала exclude_batch_id)"""
+        start, end = self._normalize(shift_time_range)
+        index = bisect_left(self._intervals, (end,))
+        while index > 0:
+            index -= 1
+            _, other_end, batch_id = self._intervals[index]
+            if batch_id == exclude_batch_id:
+                continue
+            return other_end <= start
+        return True
+
+    def occupy(self, batch_id: UUID, shift_time_range: ShiftTimeRange) -> None:
+        """Занимает интервал смены партии; прежний интервал этой партии освобождается"""
+        self.release(batch_id)
+        start, end = self._normalize(shift_time_range)
+        interval = (start, end, batch_id)
+        insort(self._intervals, interval)
+        self._by_batch[batch_id] = interval
+
+    def release(self, batch_id: UUID) -> None:
+        """Освобождает интервал смены партии, если он занят"""
+        interval = self._by_batch.pop(batch_id, None)
+        if interval is not None:
+            self._intervals.pop(bisect_left(self._intervals, interval))
+
+    def __contains__(self, batch_id: UUID) -> bool:
+        return batch_id in self._by_batch
+
+    @staticmethod
+    def _normalize(shift_time_range: ShiftTimeRange) -> tuple[datetime, datetime]:
+        return datetime_naive_to_aware(shift_time_range.start), datetime_naive_to_aware(shift_time_range.end)
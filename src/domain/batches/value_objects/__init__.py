@@ -3,13 +3,14 @@ from src.domain.batches.value_objects.ekn_code import EknCode
 from src.domain.batches.value_objects.import_row import BatchImportRow
 from src.domain.batches.value_objects.nomenclature import Nomenclature
 from src.domain.batches.value_objects.shift import Shift
-from src.domain.batches.value_objects.shift_time import ShiftTimeRange
+from src.domain.batches.value_objects.shift_time import BatchShift, ShiftTimeRange
 from src.domain.batches.value_objects.task_description import TaskDescription
 from src.domain.batches.value_objects.team import Team
 
 __all__ = [
     "BatchImportRow",
     "BatchNumber",
+    "BatchShift",
     "EknCode",
     "Nomenclature",
     "Shift",
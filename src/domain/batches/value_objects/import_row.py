@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any
@@ -10,6 +11,9 @@ from src.domain.batches.value_objects.shift_time import ShiftTimeRange
 from src.domain.batches.value_objects.task_description import TaskDescription
 from src.domain.batches.value_objects.team import Team
 
+# Признак отсутствующей колонки в строке (None может быть значением пустой ячейки)
+_MISSING = object()
+
 
 @dataclass(frozen=True, slots=True)
 class BatchImportRow:
@@ -61,6 +65,80 @@ class BatchImportRow:
         except (KeyError, ValueError, TypeError) as e:
             raise ValueError(f"Ошибка создания BatchImportRow: {e}") from e
 
+    @classmethod
+    def from_columns(cls, rows: list[dict[str, Any]]) -> list["BatchImportRow | list[str]"]:
+        """
+        Создает BatchImportRow для набора строк, разбирая данные по колонкам.
+
+        Каждое уникальное значение колонки разбирается один раз (даты и время смен в файле
+        сильно повторяются), а для строки собираются ошибки всех колонок, а не только первой.
+        Правила разбора те же, что и в from_dict.
+
+        Returns:
+            Для каждой строки BatchImportRow или список ошибок по колонкам
+        """
+        columns = {name: cls._parse_column(rows, name, parser, required) for name, parser, required in _COLUMNS}
+
+        results: list[BatchImportRow | list[str]] = []
+        for index in range(len(rows)):
+            values = {name: column[index] for name, column in columns.items()}
+            errors = [f"{name}: {value}" for name, value in values.items() if isinstance(value, Exception)]
+            if errors:
+                results.append(errors)
+                continue
+
+            try:
+                shift_time_range = ShiftTimeRange(start=values["shift_start"], end=values["shift_end"])
+            except Exception as e:
+                results.append([f"shift_start, shift_end: {e}"])
+                continue
+
+            results.append(
+                cls(
+                    batch_number=values["batch_number"],
+                    batch_date=values["batch_date"],
+                    nomenclature=values["nomenclature"],
+                    ekn_code=values["ekn_code"],
+                    task_description=values["task_description"],
+                    shift=values["shift"],
+                    team=values["team"],
+                    shift_time_range=shift_time_range,
+                    is_closed=values["is_closed"],
+                    closed_at=values["closed_at"],
+                    work_center_identifier=values["work_center_identifier"],
+                    work_center_name=values["work_center_name"],
+                )
+            )
+        return results
+
+    @staticmethod
+    def _parse_column(rows: list[dict[str, Any]], name: str, parser: Callable[[Any], Any], required: bool) -> list[Any]:
+        """Разбирает колонку; ошибка разбора возвращается на месте значения"""
+        parsed: dict[Any, Any] = {}
+        column: list[Any] = []
+        for row in rows:
+            raw = row.get(name, _MISSING)
+            if raw is _MISSING:
+                column.append(ValueError("отсутствует значение") if required else parser(None))
+                continue
+
+            try:
+                value = parsed[raw]
+            except KeyError:
+                try:
+                    value = parser(raw)
+                except Exception as e:
+                    value = e
+                parsed[raw] = value
+            except TypeError:
+                # Нехешируемое значение ячейки разбирается без кэша
+                try:
+                    value = parser(raw)
+                except Exception as e:
+                    value = e
+            column.append(value)
+        return column
+
     def validate_formats(self) -> list[str]:
         """
         Валидирует форматы данных.
@@ -126,3 +204,21 @@ class BatchImportRow:
                         continue
                 raise ValueError(f"Неверный формат datetime: {value}") from e
         raise ValueError(f"Неверный тип для datetime: {type(value)}")
+
+
+# Колонки строки импорта: имя, разбор значения, обязательность (правила from_dict)
+_COLUMNS: tuple[tuple[str, Callable[[Any], Any], bool], ...] = (
+    ("batch_number", lambda value: BatchNumber(int(value)), True),
+    ("batch_date", BatchImportRow._parse_date, True),
+    ("nomenclature", Nomenclature, True),
+    ("ekn_code", EknCode, True),
+    ("task_description", TaskDescription, True),
+    ("shift", Shift, True),
+    ("team", Team, True),
+    ("shift_start", BatchImportRow._parse_datetime, True),
+    ("shift_end", BatchImportRow._parse_datetime, True),
+    ("is_closed", bool, False),
+    ("closed_at", lambda value: BatchImportRow._parse_datetime(value) if value else None, False),
+    ("work_center_identifier", str, True),
+    ("work_center_name", str, True),
+)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from uuid import UUID
 
 from src.domain.common.exceptions import InvalidDateRangeError
 from src.domain.common.value_objects import ValueObject
@@ -16,3 +17,12 @@ class ShiftTimeRange(ValueObject):
 
     def __str__(self) -> str:
         return f"{self.start} - {self.end}"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchShift(ValueObject):
+    """Смена партии на рабочем центре (для проверки пересечений без загрузки партий)"""
+
+    batch_id: UUID
+    work_center_id: UUID
+    shift_time_range: ShiftTimeRange
@@ -14,6 +14,7 @@ class EventTypesEnum(enum.Enum):
     BATCH_DELETED = "batch.deleted"
     BATCH_REPORT_GENERATED = "batch.report_generated"
     PRODUCT_AGGREGATED = "product.aggregated"
+    WORK_CENTER_UPDATED = "work_center.updated"
     WORK_CENTER_DELETED = "work_center.deleted"
     BATCH_IMPORT_COMPLETED = "batch.import_completed"
 
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from uuid import UUID
 
 
 class SortDirection(str, Enum):
@@ -13,6 +15,20 @@ class PaginationSpec:
     offset: int
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetCursor:
+    """Позиция последнего элемента страницы при сортировке по (created_at, uuid) по убыванию"""
+
+    created_at: datetime
+    uuid: UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetPaginationSpec:
+    limit: int
+    after: KeysetCursor | None = None
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SortSpec:
     field: str
@@ -25,3 +41,10 @@ class QueryResult[T]:
     total: int
     limit: int | None
     offset: int | None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KeysetQueryResult[T]:
+    items: list[T]
+    limit: int | None
+    next_cursor: KeysetCursor | None
@@ -1,4 +1,13 @@
 from dataclasses import dataclass
+from typing import Any
+
+
+def _restore_value_object(cls: type, values: tuple[Any, ...]) -> Any:
+    """Восстанавливает Value Object из значений полей без повторной валидации (распаковка pickle)"""
+    value_object = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values, strict=True):
+        object.__setattr__(value_object, name, value)
+    return value_object
 
 
 @dataclass(frozen=True, slots=True)
@@ -10,3 +19,8 @@ class ValueObject:
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Сериализация значениями полей: pickle по умолчанию обходит dataclasses.fields для каждого объекта,
+        # что заметно при передаче строк импорта между процессами
+        return _restore_value_object, (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
@@ -1,5 +1,7 @@
 from src.domain.products.events.product_aggregated import ProductAggregatedEvent
+from src.domain.products.events.products_aggregated import ProductsAggregatedEvent
 
 __all__ = [
     "ProductAggregatedEvent",
+    "ProductsAggregatedEvent",
 ]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class ProductsAggregatedEvent(DomainEvent):
+    """
+    Несколько ProductAggregatedEvent продуктов одной партии с одинаковым aggregated_at,
+    объединенные в рамках одного commit. aggregate_id — партия.
+    """
+
+    batch_id: UUID
+    product_ids: tuple[UUID, ...]
+    aggregated_at: datetime
@@ -21,3 +21,7 @@ class ProductRepositoryProtocol(BaseRepositoryProtocol[ProductEntity], Protocol)
     async def get_by_unique_codes(self, unique_codes: list[str]) -> list[ProductEntity]:
         """Возвращает все продукты из переданного списка уникальных кодов."""
         ...
+
+    async def create_many(self, domain_entities: list[ProductEntity]) -> None:
+        """Создает несколько продуктов за одну операцию."""
+        ...
@@ -22,6 +22,7 @@ class WebhookDeliveryEntity(BaseEntity):
     response_body: str | None = None
     error_message: str | None = None
     delivered_at: datetime | None = None
+    next_attempt_at: datetime | None = None
 
     def __post_init__(self) -> None:
         if self.status == WebhookStatus.SUCCESS:
@@ -40,12 +41,23 @@ class WebhookDeliveryEntity(BaseEntity):
         self.response_body = response_body
         self.delivered_at = delivered_at
         self.error_message = None
+        self.next_attempt_at = None
         self.updated_at = datetime_now()
 
     def mark_failed(self, error_message: str) -> None:
         """Отмечает доставку как неудачную"""
         self.status = WebhookStatus.FAILED
         self.error_message = error_message
+        self.next_attempt_at = None
+        self.updated_at = datetime_now()
+
+    def schedule_retry(self, error_message: str, next_attempt_at: datetime) -> None:
+        """Оставляет доставку в статусе PENDING до следующей попытки"""
+        if self.status != WebhookStatus.PENDING:
+            raise InvalidStateError("Повторить можно только доставку в статусе PENDING")
+
+        self.error_message = error_message
+        self.next_attempt_at = next_attempt_at
         self.updated_at = datetime_now()
 
     def increment_attempts(self) -> None:
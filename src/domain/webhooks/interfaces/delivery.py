@@ -13,3 +13,7 @@ class WebhookDeliveryRepositoryProtocol(Protocol):
     async def update(self, domain_entity: WebhookDeliveryEntity) -> WebhookDeliveryEntity:
         """Обновляет существующую доставку webhook. Выбрасывает DoesNotExistError, если доставка не найдена."""
         ...
+
+    async def create_many(self, domain_entities: list[WebhookDeliveryEntity]) -> None:
+        """Создает несколько доставок webhook за одну операцию"""
+        ...
@@ -1,4 +1,5 @@
 from typing import Protocol
+from uuid import UUID
 
 from src.domain.common.repository_protocol import BaseRepositoryProtocol
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
@@ -7,4 +8,6 @@ from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 class WebhookSubscriptionRepositoryProtocol(BaseRepositoryProtocol[WebhookSubscriptionEntity], Protocol):
     """Протокол репозитория для WebhookSubscription (write-only операции)"""
 
-    pass
+    async def get_by_ids(self, ids: list[UUID]) -> list[WebhookSubscriptionEntity]:
+        """Возвращает подписки из переданного списка ID; отсутствующие пропускаются."""
+        ...
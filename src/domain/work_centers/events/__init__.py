@@ -1,5 +1,7 @@
 from src.domain.work_centers.events.work_center_deleted import WorkCenterDeletedEvent
+from src.domain.work_centers.events.work_center_updated import WorkCenterUpdatedEvent
 
 __all__ = [
     "WorkCenterDeletedEvent",
+    "WorkCenterUpdatedEvent",
 ]
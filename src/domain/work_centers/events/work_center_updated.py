@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.common.events import DomainEvent
+
+
+@dataclass(frozen=True)
+class WorkCenterUpdatedEvent(DomainEvent):
+    work_center_id: UUID
+    identifier: str
+    name: str
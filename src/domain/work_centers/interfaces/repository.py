@@ -8,3 +8,11 @@ class WorkCenterRepositoryProtocol(BaseRepositoryProtocol[WorkCenterEntity], Pro
     async def get_by_identifier(self, identifier: str) -> WorkCenterEntity | None:
         """Находит рабочий центр по идентификатору."""
         ...
+
+    async def get_by_identifiers(self, identifiers: list[str]) -> list[WorkCenterEntity]:
+        """Находит рабочие центры по набору идентификаторов одним запросом."""
+        ...
+
+    async def create_many(self, domain_entities: list[WorkCenterEntity]) -> None:
+        """Создает несколько рабочих центров за одну операцию."""
+        ...
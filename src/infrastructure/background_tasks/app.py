@@ -1,8 +1,11 @@
 import asyncio
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
 
 from celery import Celery
 from celery.signals import worker_process_init, worker_process_shutdown
-from redis.asyncio import ConnectionPool
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.application.common.cache.interfaces import CacheServiceProtocol
@@ -12,6 +15,7 @@ from src.application.common.storage.interfaces import StorageServiceProtocol
 from src.core.database import dispose_engine, init_engine, make_session_factory
 from src.core.logging import get_logger
 from src.core.settings import (
+    BatchImportSettings,
     CacheSettings,
     CelerySettings,
     DatabaseSettings,
@@ -19,14 +23,19 @@ from src.core.settings import (
     RabbitMQMessagingSettings,
     RabbitMQSettings,
     RedisSettings,
+    WebhookSettings,
 )
 from src.infrastructure.background_tasks.beat_schedule import beat_schedule
 from src.infrastructure.common.cache.redis import close_cache, init_cache
 from src.infrastructure.common.storage.minio import init_minio_storage
+from src.infrastructure.events.type_cache import EventTypeCache
 from src.infrastructure.messaging.rabbitmq.connection import RabbitMQConnection
 from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQEventConsumer
 from src.infrastructure.messaging.rabbitmq.mapper import EventRoutingMapper
 from src.infrastructure.messaging.rabbitmq.producer import RabbitMQEventProducer
+from src.infrastructure.webhooks.circuit_breaker import WebhookCircuitBreaker
+from src.infrastructure.webhooks.client import create_webhook_http_client
+from src.infrastructure.webhooks.sender import WebhookSender
 
 logger = get_logger("celery")
 
@@ -39,10 +48,14 @@ _redis_pool: ConnectionPool | None = None
 _event_producer: EventProducerProtocol | None = None
 _event_consumer: EventConsumerProtocol | None = None
 _rabbitmq_connection: RabbitMQConnection | None = None
+_webhook_sender: WebhookSender | None = None
+_webhook_redis_pool: ConnectionPool | None = None
+_import_executor: ProcessPoolExecutor | None = None
 
 rabbitmq_settings = RabbitMQSettings()
 redis_settings = RedisSettings()
 celery_settings = CelerySettings()
+import_settings = BatchImportSettings()
 
 broker_url = celery_settings.get_broker_url(rabbitmq_settings)
 result_backend = celery_settings.get_result_backend_url(redis_settings)
@@ -60,8 +73,11 @@ celery_app = Celery(
         "src.infrastructure.background_tasks.tasks.cleanup_old_minio_files",
         "src.infrastructure.background_tasks.tasks.export_batches",
         "src.infrastructure.background_tasks.tasks.import_batches",
+        "src.infrastructure.background_tasks.tasks.maintain_outbox_partitions",
+        "src.infrastructure.background_tasks.tasks.maintain_webhook_attempt_partitions",
         "src.infrastructure.background_tasks.tasks.process_outbox_events",
         "src.infrastructure.background_tasks.tasks.process_webhook_events",
+        "src.infrastructure.background_tasks.tasks.retry_failed_webhooks",
         "src.infrastructure.background_tasks.tasks.update_dashboard_stats",
     ],
 )
@@ -85,7 +101,7 @@ logger.info(f"Celery app initialized successfully with {len(beat_schedule)} sche
 def init_worker_db(**kwargs) -> None:
     """Инициализирует ресурсы при старте worker процесса"""
     global _engine, _session_factory, _worker_loop, _storage_service, _cache_service, _redis_pool
-    global _event_producer, _event_consumer, _rabbitmq_connection
+    global _event_producer, _event_consumer, _rabbitmq_connection, _webhook_sender, _webhook_redis_pool
     try:
         _worker_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(_worker_loop)
@@ -97,6 +113,8 @@ def init_worker_db(**kwargs) -> None:
         _session_factory = make_session_factory(_engine)
         logger.info("Database engine initialized for worker")
 
+        _worker_loop.run_until_complete(_load_event_type_cache(_session_factory))
+
         cache_settings = CacheSettings()
         logger.info(f"Initializing cache for worker: enabled={cache_settings.enabled}")
         _cache_service, _redis_pool = _worker_loop.run_until_complete(init_cache(cache_settings, raise_error=False))
@@ -119,21 +137,56 @@ def init_worker_db(**kwargs) -> None:
 
         _event_consumer = RabbitMQEventConsumer(_rabbitmq_connection, messaging_settings, routing_mapper)
         logger.info("Event consumer initialized for worker")
+
+        # Один HTTP клиент на процесс: keep-alive соединения с подписчиками переживают отдельные задачи
+        webhook_settings = WebhookSettings()
+        # Отдельный пул для circuit breaker и таблицы маршрутизации: проверка цепи идет на каждый запрос
+        # и не должна упираться в лимит пула кэша
+        _webhook_redis_pool = BlockingConnectionPool.from_url(
+            redis_settings.get_url(), max_connections=webhook_settings.max_concurrency, timeout=1
+        )
+        circuit_breaker = None
+        if webhook_settings.circuit_enabled:
+            circuit_breaker = WebhookCircuitBreaker(webhook_settings, get_webhook_redis())
+        _webhook_sender = WebhookSender(
+            settings=webhook_settings,
+            client=create_webhook_http_client(webhook_settings),
+            circuit_breaker=circuit_breaker,
+        )
+        logger.info("Webhook sender initialized for worker")
     except Exception as e:
         logger.exception(f"Failed to initialize worker resources: {e}")
         raise
 
 
+async def _load_event_type_cache(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Заполняет процессный кэш типов событий (сами типы синхронизирует API при старте)"""
+    try:
+        async with session_factory() as session:
+            await EventTypeCache.load(session)
+        logger.info("Event type cache loaded for worker")
+    except Exception as e:
+        # Кэш заполнится при первом обращении
+        logger.warning(f"Failed to preload event type cache: {e}")
+
+
 @worker_process_shutdown.connect
 def shutdown_worker_db(**kwargs) -> None:
     """Корректно закрывает database engine и storage service при остановке worker процесса"""
     global _engine, _session_factory, _worker_loop, _storage_service, _cache_service, _redis_pool
-    global _event_producer, _event_consumer, _rabbitmq_connection
+    global _event_producer, _event_consumer, _rabbitmq_connection, _webhook_sender, _webhook_redis_pool
+    global _import_executor
+    if _import_executor:
+        _import_executor.shutdown(cancel_futures=True)
+        _import_executor = None
     if _engine and _worker_loop:
         try:
             logger.info("Disposing worker resources")
             if _event_consumer:
                 _worker_loop.run_until_complete(_event_consumer.stop())
+            if _webhook_sender:
+                _worker_loop.run_until_complete(_webhook_sender.close())
+            _worker_loop.run_until_complete(close_cache(_webhook_redis_pool))
             if _event_producer:
                 _worker_loop.run_until_complete(_event_producer.close())
             if _rabbitmq_connection:
@@ -148,6 +201,8 @@ def shutdown_worker_db(**kwargs) -> None:
             _event_producer = None
             _event_consumer = None
             _rabbitmq_connection = None
+            _webhook_sender = None
+            _webhook_redis_pool = None
             _worker_loop.close()
             _worker_loop = None
             asyncio.set_event_loop(None)
@@ -203,6 +258,37 @@ def get_rabbitmq_connection() -> RabbitMQConnection:
     return _rabbitmq_connection
 
 
+def get_webhook_sender() -> WebhookSender:
+    """Возвращает глобальный webhook sender (общий HTTP клиент и лимиты) для использования в задачах"""
+    if _webhook_sender is None:
+        raise RuntimeError("Webhook sender not initialized. Ensure worker_process_init signal was called.")
+    return _webhook_sender
+
+
+def get_webhook_redis() -> Redis:
+    """Возвращает клиент Redis для circuit breaker и таблицы маршрутизации webhooks"""
+    if _webhook_redis_pool is None:
+        raise RuntimeError("Webhook Redis pool not initialized. Ensure worker_process_init signal was called.")
+    return Redis(connection_pool=_webhook_redis_pool)
+
+
+def get_import_executor() -> ProcessPoolExecutor | None:
+    """
+    Возвращает пул процессов для разбора строк импорта или None, если BATCH_IMPORT_WORKERS=0.
+
+    Пул создается при первом импорте в worker процессе и живет до его остановки.
+    Процессы пула запускаются через spawn: fork процесса с открытым event loop
+    и соединениями к БД небезопасен.
+    """
+    global _import_executor
+    if _import_executor is None and import_settings.workers:
+        _import_executor = ProcessPoolExecutor(
+            max_workers=import_settings.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Import process pool started: workers={import_settings.workers}")
+    return _import_executor
+
+
 def run_async_task(coro):
     """
     Запускает async задачу в глобальном event loop worker процесса.
@@ -14,15 +14,9 @@
 
 from celery.schedules import crontab
 
+from src.core.settings import OutboxSettings, WebhookDispatcherSettings, WebhookSettings
+
 beat_schedule = {
-    "process-webhook-events": {
-        "task": "tasks.process_webhook_events",
-        "schedule": 5.0,  # Каждые 5 секунд
-    },
-    "process-outbox-events": {
-        "task": "tasks.process_outbox_events",
-        "schedule": 5.0,  # Каждые 5 секунд
-    },
     "update-dashboard-statistics": {
         "task": "tasks.update_dashboard_stats",
         "schedule": crontab(minute="*/5"),  # Каждые 5 минут
@@ -35,10 +29,32 @@ beat_schedule = {
         "task": "tasks.cleanup_old_minio_files",
         "schedule": crontab(hour=2, minute=0),  # Каждый день в 02:00
     },
-    #
-    # Пример: Повторная отправка webhooks - каждые 15 минут
-    # "retry-failed-webhooks": {
-    #     "task": "tasks.retry_failed_webhooks",
-    #     "schedule": crontab(minute="*/15"),
-    # },
+    "maintain-outbox-partitions": {
+        "task": "tasks.maintain_outbox_partitions",
+        "schedule": crontab(hour=3, minute=0),  # Каждый день в 03:00
+    },
+    "maintain-webhook-attempt-partitions": {
+        "task": "tasks.maintain_webhook_attempt_partitions",
+        "schedule": crontab(hour=3, minute=30),  # Каждый день в 03:30
+    },
+    "retry-failed-webhooks": {
+        "task": "tasks.retry_failed_webhooks",
+        "schedule": WebhookSettings().retry_poll_interval,  # Каждые WEBHOOK_RETRY_POLL_INTERVAL секунд
+    },
 }
+
+# При запущенном outbox relay (python -m src.infrastructure.background_tasks.outbox_relay)
+# периодический polling outbox не нужен
+if not OutboxSettings().relay_enabled:
+    beat_schedule["process-outbox-events"] = {
+        "task": "tasks.process_outbox_events",
+        "schedule": 5.0,  # Каждые 5 секунд
+    }
+
+# При запущенном webhook dispatcher (python -m src.infrastructure.background_tasks.webhook_dispatcher)
+# события из очереди webhooks читает он, периодическая задача не нужна
+if not WebhookDispatcherSettings().enabled:
+    beat_schedule["process-webhook-events"] = {
+        "task": "tasks.process_webhook_events",
+        "schedule": 5.0,  # Каждые 5 секунд
+    }
@@ -0,0 +1,82 @@
+import asyncio
+import json
+
+from collections.abc import Callable
+
+from src.core.logging import get_logger
+
+logger = get_logger("background_tasks.health")
+
+_REASONS = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}
+
+
+class HealthServer:
+    """
+    Минимальный HTTP сервер для проверки состояния процесса.
+
+    GET /health отвечает 200, если check() сообщает о готовности, иначе 503.
+    Тело ответа — JSON с результатом check(). GET /metrics (если задан metrics)
+    отвечает 200 с JSON результатом metrics().
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        check: Callable[[], tuple[bool, dict]],
+        metrics: Callable[[], dict] | None = None,
+    ) -> None:
+        """
+        Args:
+            host: Адрес, на котором слушает сервер
+            port: Порт сервера
+            check: Функция проверки: (готов ли процесс, данные для ответа)
+            metrics: Функция, возвращающая метрики для GET /metrics
+        """
+        self._host = host
+        self._port = port
+        self._check = check
+        self._metrics = metrics
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Запускает сервер"""
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        logger.info(f"Health endpoint listening on http://{self._host}:{self._port}/health")
+
+    async def stop(self) -> None:
+        """Останавливает сервер"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+
+            if len(parts) >= 2 and parts[0] == "GET" and path == "/health":
+                healthy, data = self._check()
+                status = 200 if healthy else 503
+                body = json.dumps({"status": "ok" if healthy else "unavailable", **data}).encode()
+            elif len(parts) >= 2 and parts[0] == "GET" and path == "/metrics" and self._metrics is not None:
+                status = 200
+                body = json.dumps(self._metrics()).encode()
+            else:
+                status = 404
+                body = b'{"detail": "Not Found"}'
+
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug(f"Health request failed: {e}")
+        finally:
+            writer.close()
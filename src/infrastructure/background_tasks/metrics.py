@@ -0,0 +1,64 @@
+import time
+
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+
+@dataclass
+class WindowedMetrics:
+    """
+    Базовые метрики долгоживущего процесса: накопленные счетчики и оконные значения.
+
+    Окно — время между снимками: пропускная способность считается по элементам,
+    обработанным в окне, максимальный lag — по окну. Оконные значения сбрасываются
+    при каждом снимке. Подклассы добавляют свои счетчики в totals().
+    """
+
+    # Ключ пропускной способности в снимке, например throughput_eps (событий в секунду)
+    throughput_key: ClassVar[str] = "throughput"
+
+    started_at: float = field(default_factory=time.monotonic)
+    errors: int = 0
+    last_lag_seconds: float = 0.0
+    window_max_lag_seconds: float = 0.0
+    window_started_at: float = field(default_factory=time.monotonic)
+    window_count: int = 0
+
+    def record_error(self) -> None:
+        """Учитывает ошибку обработки"""
+        self.errors += 1
+
+    def record_window(self, count: int, max_lag_seconds: float | None = None) -> None:
+        """Учитывает обработанные в окне элементы и их максимальный lag"""
+        self.window_count += count
+        if max_lag_seconds is not None:
+            self.last_lag_seconds = max_lag_seconds
+            self.window_max_lag_seconds = max(self.window_max_lag_seconds, max_lag_seconds)
+
+    @property
+    def uptime_seconds(self) -> float:
+        """Время с запуска процесса"""
+        return max(time.monotonic() - self.started_at, 1e-9)
+
+    def totals(self) -> dict:
+        """Возвращает накопленные счетчики без сброса окна"""
+        return {
+            "errors": self.errors,
+            "last_lag_s": round(self.last_lag_seconds, 3),
+        }
+
+    def snapshot(self) -> dict:
+        """Возвращает текущие метрики и сбрасывает оконные счетчики"""
+        now = time.monotonic()
+        window = max(now - self.window_started_at, 1e-9)
+
+        data = {
+            **self.totals(),
+            self.throughput_key: round(self.window_count / window, 2),
+            "max_lag_s": round(self.window_max_lag_seconds, 3),
+        }
+
+        self.window_started_at = now
+        self.window_count = 0
+        self.window_max_lag_seconds = 0.0
+        return data
@@ -0,0 +1,3 @@
+from src.infrastructure.background_tasks.outbox_relay.relay import OutboxRelay
+
+__all__ = ["OutboxRelay"]
@@ -0,0 +1,21 @@
+from src.core.settings import DatabaseSettings, OutboxSettings
+from src.infrastructure.background_tasks.app import get_session_factory
+from src.infrastructure.background_tasks.outbox_relay.relay import OutboxRelay
+from src.infrastructure.background_tasks.service import run_service
+
+
+def _create_relay() -> OutboxRelay:
+    return OutboxRelay(get_session_factory(), OutboxSettings(), listener_dsn=DatabaseSettings().dsn)
+
+
+def main() -> None:
+    """
+    Точка входа долгоживущего outbox relay.
+
+    Запуск: python -m src.infrastructure.background_tasks.outbox_relay
+    """
+    run_service(_create_relay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from collections.abc import Callable
+
+import asyncpg
+
+from src.core.logging import get_logger
+
+logger = get_logger("outbox_relay.listener")
+
+# Канал, в который пишет триггер trg_outbox_events_notify (функция notify_outbox_events, миграция df04b67b3edd)
+OUTBOX_NOTIFY_CHANNEL = "outbox_events"
+
+
+class OutboxNotificationListener:
+    """
+    Слушает Postgres LISTEN/NOTIFY канал, в который пишет триггер на вставку в outbox_events.
+
+    Использует отдельное asyncpg подключение вне пула SQLAlchemy,
+    так как LISTEN привязан к конкретному соединению на всё время жизни.
+    """
+
+    def __init__(self, dsn: str, on_notify: Callable[[], None], channel: str = OUTBOX_NOTIFY_CHANNEL) -> None:
+        """
+        Args:
+            dsn: DSN для подключения к Postgres
+            on_notify: Callback, вызываемый при каждом уведомлении
+            channel: Имя канала уведомлений
+        """
+        self._dsn = dsn
+        self._channel = channel
+        self._on_notify = on_notify
+        self._connection: asyncpg.Connection | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Проверяет, активно ли подключение слушателя"""
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self) -> None:
+        """
+        Открывает подключение и подписывается на канал.
+
+        Raises:
+            Exception: При ошибке подключения к Postgres
+        """
+        if self.is_connected:
+            return
+
+        self._connection = await asyncpg.connect(self._dsn)
+        await self._connection.add_listener(self._channel, self._handle_notification)
+        self._connection.add_termination_listener(self._handle_termination)
+        logger.info(f"Listening for outbox notifications on channel '{self._channel}'")
+
+    async def stop(self) -> None:
+        """Отписывается от канала и закрывает подключение"""
+        if self._connection is None:
+            return
+
+        try:
+            if not self._connection.is_closed():
+                await self._connection.remove_listener(self._channel, self._handle_notification)
+                await self._connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing outbox listener connection: {e}")
+        finally:
+            self._connection = None
+            logger.info("Outbox notification listener stopped")
+
+    def _handle_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        """Пробуждает claimers при поступлении уведомления"""
+        self._on_notify()
+
+    def _handle_termination(self, connection) -> None:
+        """Фиксирует потерю подключения; переподключение выполняет relay"""
+        logger.warning("Outbox listener connection terminated, falling back to polling")
+        self._connection = None
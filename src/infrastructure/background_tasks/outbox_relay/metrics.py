@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from src.infrastructure.background_tasks.metrics import WindowedMetrics
+from src.infrastructure.background_tasks.tasks.process_outbox_events import OutboxProcessingStats
+
+
+@dataclass
+class OutboxRelayMetrics(WindowedMetrics):
+    """
+    Метрики outbox relay: пропускная способность и задержка доставки событий.
+
+    Lag — время от создания outbox записи до её захвата relay.
+    """
+
+    throughput_key = "throughput_eps"
+
+    batches: int = 0
+    processed: int = 0
+    failed: int = 0
+    notifications: int = 0
+
+    def record_batch(self, stats: OutboxProcessingStats) -> None:
+        """Учитывает результат обработки одной пачки"""
+        if stats.total == 0:
+            return
+
+        self.batches += 1
+        self.processed += stats.processed
+        self.failed += stats.failed
+        self.record_window(stats.processed, stats.max_lag_seconds)
+
+    def record_notification(self) -> None:
+        """Учитывает полученное уведомление LISTEN/NOTIFY"""
+        self.notifications += 1
+
+    def totals(self) -> dict:
+        """Возвращает накопленные счетчики без сброса окна"""
+        return {
+            "batches": self.batches,
+            "processed": self.processed,
+            "failed": self.failed,
+            "notifications": self.notifications,
+            "avg_throughput_eps": round(self.processed / self.uptime_seconds, 2),
+            **super().totals(),
+        }
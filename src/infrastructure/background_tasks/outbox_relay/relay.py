@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import get_logger, log_dict
+from src.core.settings import OutboxSettings
+from src.infrastructure.background_tasks.outbox_relay.listener import OutboxNotificationListener
+from src.infrastructure.background_tasks.outbox_relay.metrics import OutboxRelayMetrics
+from src.infrastructure.background_tasks.tasks.process_outbox_events import process_outbox_batch
+
+logger = get_logger("outbox_relay")
+
+
+class OutboxRelay:
+    """
+    Долгоживущий relay для Transactional Outbox.
+
+    Запускает несколько конкурентных claimers, каждый из которых захватывает пачки
+    через claim_pending_events (FOR UPDATE SKIP LOCKED) в собственной сессии.
+    Claimers просыпаются по Postgres NOTIFY от триггера на outbox_events,
+    а при отсутствии уведомлений используют адаптивный polling:
+    полная пачка — сразу следующий захват, пустая — интервал удваивается до максимума.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: OutboxSettings,
+        listener_dsn: str | None = None,
+    ) -> None:
+        """
+        Args:
+            session_factory: Фабрика сессий БД
+            settings: Настройки outbox
+            listener_dsn: DSN для LISTEN подключения; без него relay работает только на polling
+        """
+        self._session_factory = session_factory
+        self._settings = settings
+        self._metrics = OutboxRelayMetrics()
+        self._wakeups = [asyncio.Event() for _ in range(settings.relay_concurrency)]
+        self._stop_event = asyncio.Event()
+        self._listener = OutboxNotificationListener(listener_dsn, self._on_notify) if listener_dsn else None
+
+    @property
+    def metrics(self) -> OutboxRelayMetrics:
+        """Метрики relay"""
+        return self._metrics
+
+    def wake_up(self) -> None:
+        """Пробуждает всех claimers"""
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    def request_stop(self) -> None:
+        """Запрашивает остановку; текущие пачки обрабатываются до конца"""
+        logger.info("Outbox relay stop requested")
+        self._stop_event.set()
+        self.wake_up()
+
+    async def run(self) -> None:
+        """Запускает relay и блокируется до вызова request_stop()"""
+        logger.info(
+            f"Starting outbox relay: concurrency={self._settings.relay_concurrency}, "
+            f"batch_size={self._settings.batch_size}, "
+            f"poll_interval={self._settings.relay_min_poll_interval}-{self._settings.relay_max_poll_interval}s"
+        )
+
+        await self._start_listener()
+
+        claimers = [
+            asyncio.create_task(self._claim_loop(claimer_id), name=f"outbox-claimer-{claimer_id}")
+            for claimer_id in range(self._settings.relay_concurrency)
+        ]
+        reporter = asyncio.create_task(self._report_loop(), name="outbox-relay-reporter")
+
+        try:
+            await self._stop_event.wait()
+            await asyncio.gather(*claimers)
+        finally:
+            reporter.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reporter
+            for claimer in claimers:
+                claimer.cancel()
+            if self._listener:
+                await self._listener.stop()
+            log_dict(logger, logging.INFO, "Outbox relay stopped", self._metrics.snapshot())
+
+    async def _claim_loop(self, claimer_id: int) -> None:
+        """Цикл одного claimer: захват пачки, обработка, ожидание уведомления или таймаута"""
+        wakeup = self._wakeups[claimer_id]
+        interval = self._settings.relay_min_poll_interval
+
+        while not self._stop_event.is_set():
+            wakeup.clear()
+
+            try:
+                stats = await process_outbox_batch(
+                    self._session_factory,
+                    limit=self._settings.batch_size,
+                    lock_duration_seconds=self._settings.lock_duration_seconds,
+                )
+            except Exception as e:
+                self._metrics.record_error()
+                logger.exception(f"Outbox claimer {claimer_id} failed to process batch: {e}")
+                interval = self._settings.relay_max_poll_interval
+            else:
+                self._metrics.record_batch(stats)
+                if stats.total >= self._settings.batch_size:
+                    continue
+                if stats.total:
+                    interval = self._settings.relay_min_poll_interval
+                else:
+                    interval = min(interval * 2, self._settings.relay_max_poll_interval)
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=interval)
+
+    async def _report_loop(self) -> None:
+        """Периодически логирует метрики и восстанавливает LISTEN подключение"""
+        while True:
+            await asyncio.sleep(self._settings.relay_metrics_interval)
+            log_dict(logger, logging.INFO, "Outbox relay metrics", self._metrics.snapshot())
+
+            if self._listener and not self._listener.is_connected:
+                await self._start_listener()
+
+    async def _start_listener(self) -> None:
+        """Подключает LISTEN; при ошибке relay продолжает работу на polling"""
+        if self._listener is None:
+            return
+
+        try:
+            await self._listener.start()
+        except Exception as e:
+            logger.warning(f"Failed to start outbox listener, using polling only: {e}")
+
+    def _on_notify(self) -> None:
+        self._metrics.record_notification()
+        self.wake_up()
@@ -0,0 +1,43 @@
+import asyncio
+import signal
+
+from collections.abc import Callable
+from typing import Protocol
+
+from src.core.config import LOG_LEVEL
+from src.core.logging import setup_logging
+from src.infrastructure.background_tasks.app import init_worker_db, run_async_task, shutdown_worker_db
+
+
+class BackgroundService(Protocol):
+    """Долгоживущий фоновый процесс: run() блокируется до вызова request_stop()"""
+
+    async def run(self) -> None: ...
+
+    def request_stop(self) -> None: ...
+
+
+async def _serve(factory: Callable[[], BackgroundService]) -> None:
+    """Создает сервис, запускает его и останавливает по SIGTERM/SIGINT"""
+    service = factory()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, service.request_stop)
+
+    await service.run()
+
+
+def run_service(factory: Callable[[], BackgroundService]) -> None:
+    """
+    Запускает долгоживущий фоновый процесс с ресурсами worker (БД, брокер, кэш).
+
+    Args:
+        factory: Создает сервис; вызывается внутри event loop worker после инициализации ресурсов
+    """
+    setup_logging(LOG_LEVEL)
+    init_worker_db()
+    try:
+        run_async_task(_serve(factory))
+    finally:
+        shutdown_worker_db()
@@ -3,8 +3,13 @@ from src.infrastructure.background_tasks.tasks.auto_close_expired_batches import
 from src.infrastructure.background_tasks.tasks.cleanup_old_minio_files import cleanup_old_minio_files
 from src.infrastructure.background_tasks.tasks.export_batches import export_batches
 from src.infrastructure.background_tasks.tasks.import_batches import import_batches
+from src.infrastructure.background_tasks.tasks.maintain_outbox_partitions import maintain_outbox_partitions
+from src.infrastructure.background_tasks.tasks.maintain_webhook_attempt_partitions import (
+    maintain_webhook_attempt_partitions,
+)
 from src.infrastructure.background_tasks.tasks.process_outbox_events import process_outbox_events
 from src.infrastructure.background_tasks.tasks.process_webhook_events import process_webhook_events
+from src.infrastructure.background_tasks.tasks.retry_failed_webhooks import retry_failed_webhooks
 from src.infrastructure.background_tasks.tasks.update_dashboard_stats import update_dashboard_stats
 
 __all__ = [
@@ -13,7 +18,10 @@ __all__ = [
     "cleanup_old_minio_files",
     "export_batches",
     "import_batches",
+    "maintain_outbox_partitions",
+    "maintain_webhook_attempt_partitions",
     "process_outbox_events",
     "process_webhook_events",
+    "retry_failed_webhooks",
     "update_dashboard_stats",
 ]
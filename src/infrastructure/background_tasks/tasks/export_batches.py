@@ -2,11 +2,18 @@ from sqlalchemy.exc import DBAPIError, OperationalError
 
 from src.application.batches.dtos.export_batches import ExportBatchesInputDTO
 from src.application.batches.queries.filters import BatchReadFilters
+from src.application.batches.services.export_cache import BatchesExportCache
 from src.application.batches.services.export_service import BatchesExportService
-from src.application.common.dtos import ExportImportFileFormatEnum
+from src.application.common.dtos import ExportFileFormatEnum
 from src.core.logging import get_logger
-from src.core.settings import CelerySettings
-from src.infrastructure.background_tasks.app import celery_app, get_session_factory, get_storage_service, run_async_task
+from src.core.settings import BatchExportSettings, CelerySettings
+from src.infrastructure.background_tasks.app import (
+    celery_app,
+    get_cache_service,
+    get_session_factory,
+    get_storage_service,
+    run_async_task,
+)
 from src.infrastructure.common.file_generators.batches.exports.factory import BatchesExportGeneratorFactory
 from src.infrastructure.persistence.queries.batches import BatchQueryService
 from src.infrastructure.persistence.queries.work_centers import WorkCenterQueryService
@@ -14,6 +21,7 @@ from src.infrastructure.persistence.queries.work_centers import WorkCenterQueryS
 logger = get_logger("celery.tasks.export_batches")
 
 celery_settings = CelerySettings()
+export_settings = BatchExportSettings()
 
 
 def _is_retryable_error(exception: Exception) -> bool:
@@ -24,15 +32,18 @@ def _is_retryable_error(exception: Exception) -> bool:
 @celery_app.task(bind=True, max_retries=None)
 def export_batches(
     self,
-    format: ExportImportFileFormatEnum,
+    format: ExportFileFormatEnum,
     filters: BatchReadFilters,
+    cache_key: str | None = None,
 ) -> dict:
     """
-    Асинхронный экспорт партий в файл (XLSX или CSV).
+    Асинхронный экспорт партий в файл (XLSX, CSV, сжатый CSV или Parquet).
 
     Args:
-        format: Формат файла (xlsx или csv)
+        format: Формат файла (xlsx, csv, csv.gz, csv.zst, parquet)
         filters: Параметры фильтрации партий
+        cache_key: Ключ кэша экспорта (BatchesExportCache); результат сохраняется под ним,
+            а отметка о выполняющейся задаче снимается после завершения
 
     Returns:
         {
@@ -42,17 +53,24 @@ def export_batches(
             "total": 100
         }
     """
-    return run_async_task(_export_batches_async(self, format, filters))
+    return run_async_task(_export_batches_async(self, format, filters, cache_key))
 
 
 async def _export_batches_async(
     task_instance,
-    format: ExportImportFileFormatEnum,
+    format: ExportFileFormatEnum,
     filters: BatchReadFilters,
+    cache_key: str | None,
 ) -> dict:
     """Асинхронная часть задачи экспорта"""
     session_factory = get_session_factory()
     storage_service = get_storage_service()
+    cache_service = get_cache_service()
+    export_cache = (
+        BatchesExportCache(cache_service, storage_service, ttl=export_settings.cache_ttl)
+        if cache_key and cache_service
+        else None
+    )
 
     try:
         async with session_factory() as session:
@@ -65,18 +83,14 @@ async def _export_batches_async(
                 work_center_query_service=work_center_query_service,
                 generator=generator,
                 storage_service=storage_service,
+                page_size=export_settings.page_size,
             )
             input_dto = ExportBatchesInputDTO(format=format, filters=filters)
-            try:
-                result = await export_service.export_batches(input_dto)
-            except Exception as e:
-                logger.exception(f"Failed to export batches: {e}")
-                raise task_instance.retry(
-                    exc=e,
-                    countdown=celery_settings.task_default_retry_delay,
-                ) from e
+            result = await export_service.export_batches(input_dto)
 
             logger.info(f"Export completed: {result.total_batches} batches exported to {result.file_url}")
+            if export_cache is not None:
+                await export_cache.put(cache_key, task_instance.request.id, result)
             return {
                 "success": True,
                 "file_path": result.file_url,
@@ -91,4 +105,7 @@ async def _export_batches_async(
                 exc=e,
                 countdown=celery_settings.task_default_retry_delay,
             ) from e
+        # Присоединившиеся запросы ждут эту задачу, пока она повторяется; после ошибки экспорт запускается заново
+        if export_cache is not None:
+            await export_cache.release(cache_key)
         raise
@@ -1,47 +1,87 @@
-import base64
+import asyncio
+import hashlib
+import tempfile
 
+from dataclasses import replace
+from pathlib import PurePosixPath
+from typing import BinaryIO
 from uuid import UUID
 
 from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.application.batches.commands.add_product import AddProductToBatchCommand
-from src.application.batches.commands.create import CreateBatchCommand
-from src.application.batches.commands.update import UpdateBatchCommand
+from src.application.batches.dtos.import_batches import ImportBatchesOutputDTO
 from src.application.batches.services.import_service import BatchesImportService
 from src.application.common.exceptions import FileParseError
-from src.application.work_centers.commands.create import CreateWorkCenterCommand
+from src.application.common.storage.interfaces import StorageServiceProtocol
 from src.core.logging import get_logger
-from src.core.settings import CelerySettings
+from src.core.settings import BatchImportSettings, CelerySettings
 from src.domain.batches.events import BatchesImportCompletedEvent
-from src.domain.batches.services import BatchImportRowValidator
-from src.infrastructure.background_tasks.app import celery_app, get_session_factory, run_async_task
+from src.infrastructure.background_tasks import states
+from src.infrastructure.background_tasks.app import (
+    celery_app,
+    get_import_executor,
+    get_session_factory,
+    get_storage_service,
+    run_async_task,
+)
 from src.infrastructure.common.file_parsers import FileParserFactory
+from src.infrastructure.common.storage.exceptions import StorageConnectionError, StorageDownloadError
 from src.infrastructure.common.uow.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.persistence.mappers.import_checkpoints import to_import_result
+from src.infrastructure.persistence.repositories.import_checkpoints import BatchImportCheckpointRepository
 
 logger = get_logger("celery.tasks.import_batches")
 
 celery_settings = CelerySettings()
+import_settings = BatchImportSettings()
 
+# Файл импорта до этого размера держится в памяти, больший сбрасывается на диск
+IMPORT_SPOOL_MAX_SIZE = 32 * 1024 * 1024
 
-def _is_retryable_error(exception: Exception) -> bool:
-    """Проверяет, является ли ошибка повторяемой (retryable)"""
-    return isinstance(exception, (OperationalError, DBAPIError))
+# Размер блока чтения при подсчете хеша файла импорта
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_RETRYABLE_ERRORS = (OperationalError, DBAPIError, StorageConnectionError, StorageDownloadError)
+
+
+def _is_retryable_error(exception: BaseException) -> bool:
+    """
+    Проверяет, является ли ошибка повторяемой (retryable).
+
+    Репозитории оборачивают ошибки драйвера в DatabaseException, поэтому проверяется
+    вся цепочка причин (__cause__).
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exception
+    while current is not None and id(current) not in seen:
+        if isinstance(current, _RETRYABLE_ERRORS):
+            return True
+        seen.add(id(current))
+        current = current.__cause__
+    return False
 
 
 @celery_app.task(bind=True, max_retries=None)
 def import_batches(
     self,
-    file_data_base64: str,
-    file_extension: str,
+    object_name: str,
     update_existing: bool = False,
+    dry_run: bool = False,
 ) -> dict:
     """
-    Асинхронный импорт партий из файла.
+    Асинхронный импорт партий из файла, загруженного в bucket imports.
+
+    Файл потоково скачивается во временный файл (XLSX требует произвольного доступа к архиву)
+    и парсится порциями. После завершения импорта объект удаляется из хранилища;
+    при повторе задачи из-за временной ошибки он сохраняется. Контрольная точка импорта
+    привязана к хешу содержимого файла и переживает окончательную ошибку: повторная
+    загрузка того же файла продолжает импорт с первой незакоммиченной строки.
 
     Args:
-        file_data_base64: Байты файла в формате base64
-        file_extension: Расширение файла (xlsx, csv)
+        object_name: Имя объекта в bucket imports; формат определяется по расширению (xlsx, csv)
         update_existing: Обновлять ли существующие партии
+        dry_run: Только проверить файл без записи в БД; результат содержит ожидаемые created и updated
 
     Returns:
         {
@@ -56,84 +96,42 @@ def import_batches(
             ]
         }
     """
-    try:
-        file_data = base64.b64decode(file_data_base64)
-    except Exception as e:
-        logger.error(f"Failed to decode base64 file data: {e}")
-        raise ValueError(f"Invalid base64 file data: {e}") from e
-
-    return run_async_task(_import_batches_async(self, file_data, file_extension, update_existing))
+    return run_async_task(_import_batches_async(self, object_name, update_existing, dry_run))
 
 
 async def _import_batches_async(
     task_instance,
-    file_data: bytes,
-    file_extension: str,
+    object_name: str,
     update_existing: bool,
+    dry_run: bool,
 ) -> dict:
     """Асинхронная часть задачи импорта"""
     session_factory = get_session_factory()
+    storage_service = get_storage_service()
+    file_extension = PurePosixPath(object_name).suffix.lstrip(".")
 
     try:
-        async with session_factory() as session:
-            uow = SqlAlchemyUnitOfWork(session, manual_commit=True)
-
-            async with uow:
-                # Создание зависимостей
-                parser = FileParserFactory.create(file_extension)
-                validator = BatchImportRowValidator(uow.batches, uow.work_centers)
-                create_command = CreateBatchCommand(uow)
-                update_command = UpdateBatchCommand(uow)
-                add_product_command = AddProductToBatchCommand(uow)
-                create_work_center_command = CreateWorkCenterCommand(uow)
-
-                # Создание сервиса импорта
-                import_service = BatchesImportService(
-                    parser=parser,
-                    validator=validator,
-                    create_command=create_command,
-                    update_command=update_command,
-                    add_product_command=add_product_command,
-                    create_work_center_command=create_work_center_command,
-                    work_center_repository=uow.work_centers,
-                    batch_repository=uow.batches,
-                )
+        with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_SIZE) as import_file:
+            await storage_service.download_to_file(BatchesImportService.IMPORT_BUCKET, object_name, import_file)
+            import_file.seek(0)
 
-                # Запуск импорта
-                result = await import_service.import_batches(file_data, update_existing)
-
-                # Регистрация события о завершении импорта
-                uow.register_event(
-                    BatchesImportCompletedEvent(
-                        aggregate_id=UUID(task_instance.request.id),
-                        task_id=UUID(task_instance.request.id),
-                        update_existing=update_existing,
-                        total_rows=result.total,
-                        created=result.created,
-                        updated=result.updated,
-                        skipped=result.failed,
-                        errors=result.errors,
-                    )
-                )
-
-                await uow.commit()
-
-                logger.info(
-                    f"Import completed: total={result.total}, created={result.created}, "
-                    f"updated={result.updated}, failed={result.failed}"
+            if dry_run:
+                result = await _run_dry_run(session_factory, import_file, file_extension, update_existing)
+            else:
+                file_hash = await asyncio.get_running_loop().run_in_executor(None, _hash_file, import_file)
+                result = await _run_import(
+                    task_instance,
+                    session_factory,
+                    import_file,
+                    object_name,
+                    file_hash,
+                    file_extension,
+                    update_existing,
                 )
 
-                return {
-                    "success": True,
-                    "total": result.total,
-                    "created": result.created,
-                    "updated": result.updated,
-                    "failed": result.failed,
-                    "errors": result.errors,
-                }
-
     except FileParseError as e:
         logger.error(f"File parsing failed: {e}")
+        await _delete_import_file(storage_service, object_name)
         return {
             "success": False,
             "total": 0,
@@ -149,4 +147,214 @@ async def _import_batches_async(
                 exc=e,
                 countdown=celery_settings.task_default_retry_delay,
             ) from e
+        # Контрольная точка остается: закоммиченные строки уже в БД, и повторная загрузка файла продолжит импорт
+        await _delete_import_file(storage_service, object_name)
         raise
+
+    await _delete_import_file(storage_service, object_name)
+    return result
+
+
+class _ImportCheckpointer:
+    """
+    Фиксирует импорт по частям и публикует прогресс задачи.
+
+    Каждые commit_every строк транзакция коммитится вместе с контрольной точкой, поэтому
+    повтор задачи после ошибки или падения worker продолжает импорт со следующей строки.
+    """
+
+    def __init__(
+        self,
+        task_instance,
+        uow: SqlAlchemyUnitOfWork,
+        checkpoints: BatchImportCheckpointRepository,
+        file_hash: str,
+        object_name: str,
+        update_existing: bool,
+        committed: ImportBatchesOutputDTO,
+    ):
+        self._task_instance = task_instance
+        self._uow = uow
+        self._checkpoints = checkpoints
+        self._file_hash = file_hash
+        self._object_name = object_name
+        self._update_existing = update_existing
+        self.committed = committed
+
+    async def chunk_imported(self, result: ImportBatchesOutputDTO) -> None:
+        """Коммитит импортированные строки, если с прошлого коммита их набралось commit_every"""
+        commit_every = import_settings.commit_every
+        if commit_every and result.total - self.committed.total >= commit_every:
+            await self._checkpoints.save(
+                self._file_hash, self._object_name, self._task_instance.request.id, self._update_existing, result
+            )
+            await self._uow.commit()
+            self.committed = replace(result, errors=list(result.errors))
+            logger.info(f"Import checkpoint committed: object={self._object_name}, rows={result.total}")
+
+        self._task_instance.update_state(
+            state=states.PROGRESS,
+            meta={
+                "processed": result.total,
+                "committed": self.committed.total,
+                "created": result.created,
+                "updated": result.updated,
+                "failed": result.failed,
+            },
+        )
+
+
+async def _run_import(
+    task_instance,
+    session_factory: async_sessionmaker[AsyncSession],
+    import_file: BinaryIO,
+    object_name: str,
+    file_hash: str,
+    file_extension: str,
+    update_existing: bool,
+) -> dict:
+    """
+    Импортирует партии из файла, фиксируя транзакцию каждые BATCH_IMPORT_COMMIT_EVERY строк.
+
+    Если по содержимому файла есть контрольная точка (предыдущий запуск задачи или предыдущая
+    загрузка того же файла закоммитили часть строк), импорт продолжается с нее.
+    Контрольная точка удаляется в финальной транзакции импорта.
+    """
+    async with session_factory() as session:
+        uow = SqlAlchemyUnitOfWork(session, manual_commit=True)
+        checkpoints = BatchImportCheckpointRepository(session)
+
+        async with uow:
+            checkpoint = await checkpoints.get(file_hash)
+            resume_from = to_import_result(checkpoint) if checkpoint is not None else None
+            if checkpoint is not None:
+                logger.info(
+                    f"Resuming import of {object_name} (first uploaded as {checkpoint.object_name}) "
+                    f"after {checkpoint.rows_committed} committed rows"
+                )
+                update_existing = checkpoint.update_existing
+
+            # Создание сервиса импорта
+            import_service = BatchesImportService(
+                parser=FileParserFactory.create(file_extension),
+                uow=uow,
+                chunk_size=import_settings.chunk_size,
+                executor=get_import_executor(),
+                shard_size=import_settings.shard_size,
+            )
+            checkpointer = _ImportCheckpointer(
+                task_instance,
+                uow,
+                checkpoints,
+                file_hash,
+                object_name,
+                update_existing,
+                committed=resume_from or ImportBatchesOutputDTO(total=0, created=0, updated=0, failed=0, errors=[]),
+            )
+
+            # Запуск импорта
+            try:
+                result = await import_service.import_batches(
+                    import_file,
+                    update_existing,
+                    resume_from=resume_from,
+                    on_chunk_imported=checkpointer.chunk_imported,
+                )
+            except FileParseError as e:
+                committed = checkpointer.committed
+                if not committed.total:
+                    raise
+
+                # Закоммиченные строки остаются в БД; незакоммиченная часть откатывается
+                logger.error(f"File parsing failed after {committed.total} committed rows: {e}")
+                # События откаченных строк остаются в UoW, поэтому удаление фиксируется коммитом сессии
+                await uow.rollback()
+                await checkpoints.delete(file_hash)
+                await session.commit()
+                return {
+                    "success": False,
+                    "total": committed.total,
+                    "created": committed.created,
+                    "updated": committed.updated,
+                    "failed": committed.failed,
+                    "errors": [*committed.errors, {"row": 0, "error": f"Ошибка парсинга файла: {e}"}],
+                }
+
+            await checkpoints.delete(file_hash)
+
+            # Регистрация события о завершении импорта
+            uow.register_event(
+                BatchesImportCompletedEvent(
+                    aggregate_id=UUID(task_instance.request.id),
+                    task_id=UUID(task_instance.request.id),
+                    update_existing=update_existing,
+                    total_rows=result.total,
+                    created=result.created,
+                    updated=result.updated,
+                    skipped=result.failed,
+                    errors=result.errors,
+                )
+            )
+
+            await uow.commit()
+
+            logger.info(
+                f"Import completed: total={result.total}, created={result.created}, "
+                f"updated={result.updated}, failed={result.failed}"
+            )
+
+            return {
+                "success": True,
+                "total": result.total,
+                "created": result.created,
+                "updated": result.updated,
+                "failed": result.failed,
+                "errors": result.errors,
+            }
+
+
+async def _run_dry_run(
+    session_factory: async_sessionmaker[AsyncSession],
+    import_file: BinaryIO,
+    file_extension: str,
+    update_existing: bool,
+) -> dict:
+    """Проверяет файл импорта без записи в БД; событие о завершении импорта не публикуется"""
+    async with session_factory() as session:
+        uow = SqlAlchemyUnitOfWork(session, manual_commit=True)
+
+        async with uow:
+            import_service = BatchesImportService(
+                parser=FileParserFactory.create(file_extension),
+                uow=uow,
+                chunk_size=import_settings.chunk_size,
+            )
+            result = await import_service.validate_import(import_file, update_existing)
+
+            return {
+                "success": True,
+                "dry_run": True,
+                "total": result.total,
+                "created": result.created,
+                "updated": result.updated,
+                "failed": result.failed,
+                "errors": result.errors,
+            }
+
+
+def _hash_file(import_file: BinaryIO) -> str:
+    """Считает SHA-256 содержимого файла и возвращает позицию чтения в начало"""
+    digest = hashlib.sha256()
+    import_file.seek(0)
+    while chunk := import_file.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    import_file.seek(0)
+    return digest.hexdigest()
+
+
+async def _delete_import_file(storage_service: StorageServiceProtocol, object_name: str) -> None:
+    """Удаляет обработанный файл импорта; ошибка удаления не влияет на результат задачи"""
+    try:
+        await storage_service.delete_file(BatchesImportService.IMPORT_BUCKET, object_name)
+    except Exception as e:
+        logger.warning(f"Failed to delete import file {object_name}: {e}")
@@ -0,0 +1,200 @@
+import gzip
+import json
+import tempfile
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.common.storage.interfaces import StorageServiceProtocol
+from src.core.logging import get_logger
+from src.core.settings import OutboxSettings
+from src.core.time import datetime_aware_to_naive, datetime_now
+from src.infrastructure.background_tasks.app import celery_app, get_session_factory, get_storage_service, run_async_task
+from src.infrastructure.persistence.repositories.outbox_partitions import OutboxPartition, OutboxPartitionRepository
+
+logger = get_logger("celery.tasks.maintain_outbox_partitions")
+
+outbox_settings = OutboxSettings()
+
+# Архив собирается в памяти до этого размера, дальше — во временном файле
+ARCHIVE_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+
+@dataclass
+class OutboxMaintenanceStats:
+    """Статистика обслуживания партиций outbox"""
+
+    created: int = 0
+    archived: int = 0
+    detached: int = 0
+    dropped: int = 0
+    skipped: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        """Преобразует статистику в словарь"""
+        return {
+            "success": True,
+            "created": self.created,
+            "archived": self.archived,
+            "detached": self.detached,
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "errors": self.errors,
+        }
+
+
+@celery_app.task(name="tasks.maintain_outbox_partitions")
+def maintain_outbox_partitions() -> dict:
+    """
+    Обслуживает дневные партиции outbox_events.
+
+    Создает партиции на OUTBOX_PARTITION_PREMAKE_DAYS дней вперед и убирает партиции
+    старше OUTBOX_RETENTION_DAYS, если в них нет событий в PENDING или PROCESSING.
+    Способ удаления задается OUTBOX_RETENTION_MODE: drop, detach или archive
+    (выгрузка в gzip NDJSON в MinIO и удаление). Партиция с FAILED событиями в режиме
+    drop перед удалением тоже архивируется.
+
+    Запускается: каждый день в 03:00
+
+    Returns:
+        {
+            "success": True,
+            "created": 1,
+            "archived": 0,
+            "detached": 0,
+            "dropped": 1,
+            "skipped": 0,
+            "errors": 0
+        }
+    """
+    return run_async_task(_maintain_outbox_partitions_async())
+
+
+async def _maintain_outbox_partitions_async() -> dict:
+    """Асинхронная часть задачи обслуживания партиций outbox"""
+    session_factory = get_session_factory()
+    stats = OutboxMaintenanceStats()
+    today = datetime_aware_to_naive(datetime_now()).date()
+
+    async with session_factory() as session:
+        partitions = await OutboxPartitionRepository(session).list_partitions()
+
+    created, errors = await OutboxPartitionRepository.premake_daily_partitions(
+        session_factory, partitions, today, outbox_settings.partition_premake_days
+    )
+    stats.created += len(created)
+    stats.errors += len(errors)
+    for name in created:
+        logger.info(f"Created outbox partition {name}")
+    for day, error in errors.items():
+        logger.error(f"Failed to create outbox partition for {day.isoformat()}: {error}", exc_info=error)
+
+    expired = OutboxPartitionRepository.expired_partitions(partitions, today, outbox_settings.retention_days)
+    cutoff = today - timedelta(days=outbox_settings.retention_days)
+    logger.info(
+        f"Outbox retention: {len(expired)} partition(s) older than {cutoff.isoformat()}, "
+        f"mode={outbox_settings.retention_mode}"
+    )
+
+    for partition in expired:
+        try:
+            await _retire_partition(session_factory, partition, stats)
+        except Exception as e:
+            stats.errors += 1
+            logger.exception(f"Failed to retire outbox partition {partition.name}: {e}")
+
+    logger.info(
+        f"Outbox partitions maintenance completed: created={stats.created}, archived={stats.archived}, "
+        f"detached={stats.detached}, dropped={stats.dropped}, skipped={stats.skipped}, errors={stats.errors}"
+    )
+    return stats.to_dict()
+
+
+async def _retire_partition(
+    session_factory: async_sessionmaker[AsyncSession],
+    partition: OutboxPartition,
+    stats: OutboxMaintenanceStats,
+) -> None:
+    """Архивирует (при необходимости) и убирает одну партицию, если в ней не осталось незавершенных событий"""
+    async with session_factory() as session:
+        counts = await OutboxPartitionRepository(session).count_by_status(partition.name)
+
+    if _has_unfinished_events(partition, counts):
+        stats.skipped += 1
+        return
+
+    # FAILED события автоматически не повторяются и не держат партицию, но удалять их без архива нельзя
+    archived_rows = None
+    if outbox_settings.retention_mode == "archive" or (
+        outbox_settings.retention_mode == "drop" and counts.get("FAILED", 0) > 0
+    ):
+        archived_rows = await _archive_partition(session_factory, get_storage_service(), partition)
+        stats.archived += 1
+
+    async with session_factory() as session:
+        repository = OutboxPartitionRepository(session)
+
+        # Повторная проверка в транзакции удаления: между архивацией и удалением партиция могла измениться
+        counts = await repository.count_by_status(partition.name)
+        if _has_unfinished_events(partition, counts) or (
+            archived_rows is not None and sum(counts.values()) != archived_rows
+        ):
+            logger.warning(f"Outbox partition {partition.name} changed during retention, skipping")
+            stats.skipped += 1
+            return
+
+        if outbox_settings.retention_mode == "detach":
+            await repository.detach_partition(partition.name)
+            await session.commit()
+            stats.detached += 1
+            logger.info(f"Detached outbox partition {partition.name} ({sum(counts.values())} events)")
+        else:
+            await repository.drop_partition(partition.name)
+            await session.commit()
+            stats.dropped += 1
+            logger.info(f"Dropped outbox partition {partition.name} ({sum(counts.values())} events)")
+
+
+def _has_unfinished_events(partition: OutboxPartition, counts: dict[str, int]) -> bool:
+    """Проверяет наличие событий в статусе PENDING или PROCESSING"""
+    unfinished = {status: total for status, total in counts.items() if status in ("PENDING", "PROCESSING")}
+    if unfinished:
+        logger.warning(f"Outbox partition {partition.name} has unfinished events {unfinished}, skipping")
+        return True
+    return False
+
+
+async def _archive_partition(
+    session_factory: async_sessionmaker[AsyncSession],
+    storage_service: StorageServiceProtocol,
+    partition: OutboxPartition,
+) -> int:
+    """
+    Выгружает партицию в MinIO как gzip NDJSON (одно событие на строку).
+
+    Returns:
+        Количество выгруженных событий
+    """
+    object_name = f"outbox_events/{partition.name}.ndjson.gz"
+    rows = 0
+
+    with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_MAX_SIZE) as buffer:
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as archive:
+            async with session_factory() as session:
+                async for row in OutboxPartitionRepository(session).stream_rows(partition.name):
+                    archive.write(json.dumps(row, default=str, ensure_ascii=False).encode() + b"\n")
+                    rows += 1
+
+        await storage_service.upload_file(
+            bucket_name=outbox_settings.archive_bucket,
+            object_name=object_name,
+            file_data=buffer,
+            content_type="application/gzip",
+            metadata={"partition": partition.name, "rows": str(rows)},
+        )
+
+    logger.info(f"Archived outbox partition {partition.name} to {outbox_settings.archive_bucket}/{object_name}")
+    return rows
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+
+from src.core.logging import get_logger
+from src.core.settings import WebhookSettings
+from src.core.time import datetime_aware_to_naive, datetime_now
+from src.infrastructure.background_tasks.app import celery_app, get_session_factory, run_async_task
+from src.infrastructure.persistence.repositories.webhooks.attempt import WebhookDeliveryAttemptPartitionRepository
+
+logger = get_logger("celery.tasks.maintain_webhook_attempt_partitions")
+
+webhook_settings = WebhookSettings()
+
+
+@dataclass
+class WebhookAttemptMaintenanceStats:
+    """Статистика обслуживания партиций журнала попыток webhooks"""
+
+    created: int = 0
+    dropped: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        """Преобразует статистику в словарь"""
+        return {
+            "success": True,
+            "created": self.created,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+@celery_app.task(name="tasks.maintain_webhook_attempt_partitions")
+def maintain_webhook_attempt_partitions() -> dict:
+    """
+    Обслуживает дневные партиции webhook_delivery_attempts.
+
+    Создает партиции на WEBHOOK_ATTEMPTS_PARTITION_PREMAKE_DAYS дней вперед и удаляет партиции
+    старше WEBHOOK_ATTEMPTS_RETENTION_DAYS. Журнал только дополняется, поэтому партиции
+    удаляются целиком без проверки содержимого.
+
+    Запускается: каждый день в 03:30
+
+    Returns:
+        {
+            "success": True,
+            "created": 1,
+            "dropped": 1,
+            "errors": 0
+        }
+    """
+    return run_async_task(_maintain_webhook_attempt_partitions_async())
+
+
+async def _maintain_webhook_attempt_partitions_async() -> dict:
+    """Асинхронная часть задачи обслуживания партиций журнала попыток"""
+    session_factory = get_session_factory()
+    stats = WebhookAttemptMaintenanceStats()
+    today = datetime_aware_to_naive(datetime_now()).date()
+
+    async with session_factory() as session:
+        partitions = await WebhookDeliveryAttemptPartitionRepository(session).list_partitions()
+
+    created, errors = await WebhookDeliveryAttemptPartitionRepository.premake_daily_partitions(
+        session_factory, partitions, today, webhook_settings.attempts_partition_premake_days
+    )
+    stats.created += len(created)
+    stats.errors += len(errors)
+    for name in created:
+        logger.info(f"Created webhook attempts partition {name}")
+    for day, error in errors.items():
+        logger.error(f"Failed to create webhook attempts partition for {day.isoformat()}: {error}", exc_info=error)
+
+    expired = WebhookDeliveryAttemptPartitionRepository.expired_partitions(
+        partitions, today, webhook_settings.attempts_retention_days
+    )
+    for partition in expired:
+        async with session_factory() as session:
+            try:
+                await WebhookDeliveryAttemptPartitionRepository(session).drop_partition(partition.name)
+                await session.commit()
+                stats.dropped += 1
+                logger.info(f"Dropped webhook attempts partition {partition.name}")
+            except Exception as e:
+                await session.rollback()
+                stats.errors += 1
+                logger.exception(f"Failed to drop webhook attempts partition {partition.name}: {e}")
+
+    logger.info(
+        f"Webhook attempts partitions maintenance completed: created={stats.created}, "
+        f"dropped={stats.dropped}, errors={stats.errors}"
+    )
+    return stats.to_dict()
@@ -1,18 +1,55 @@
+import asyncio
 import inspect
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from uuid import UUID
+
 from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.logging import get_logger
-from src.core.settings import CelerySettings
+from src.core.settings import CelerySettings, OutboxSettings
+from src.core.time import datetime_aware_to_naive, datetime_now
+from src.domain.common.events import DomainEvent
 from src.infrastructure.background_tasks.app import celery_app, get_event_producer, get_session_factory, run_async_task
 from src.infrastructure.events.handlers.factory import create_handler_instance
 from src.infrastructure.events.handlers.registry import EventHandlerRegistry
 from src.infrastructure.events.serializer import EventSerializer
+from src.infrastructure.persistence.models.outbox_event import OutboxEvent
 from src.infrastructure.persistence.repositories.outbox import OutboxRepository
 
 logger = get_logger("celery.tasks.process_outbox_events")
 
 celery_settings = CelerySettings()
+outbox_settings = OutboxSettings()
+
+
+@dataclass
+class OutboxProcessingStats:
+    """Статистика обработки пачки outbox событий"""
+
+    processed: int = 0
+    failed: int = 0
+    total: int = 0
+    max_lag_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Преобразует статистику в словарь"""
+        return {
+            "success": True,
+            "processed": self.processed,
+            "failed": self.failed,
+            "total": self.total,
+        }
+
+
+@dataclass
+class OutboxDispatchOutcome:
+    """Итоги обработки событий до фиксации их статусов"""
+
+    done_ids: list[UUID] = field(default_factory=list)
+    failed: dict[UUID, str] = field(default_factory=dict)
 
 
 def _is_retryable_error(exception: Exception) -> bool:
@@ -43,60 +80,14 @@ async def _process_outbox_events_async(task_instance) -> dict:
     """Асинхронная часть задачи обработки outbox событий"""
     session_factory = get_session_factory()
 
-    processed_count = 0
-    failed_count = 0
-
     try:
-        async with session_factory() as session:
-            outbox_repo = OutboxRepository(session)
-
-            logger.info("Starting outbox events processing")
-            events = await outbox_repo.claim_pending_events(limit=100, lock_duration_seconds=300)
-
-            if not events:
-                logger.debug("No pending events to process")
-                return {
-                    "success": True,
-                    "processed": 0,
-                    "failed": 0,
-                    "total": 0,
-                }
-
-            logger.info(f"Claimed {len(events)} events for processing")
-
-            for outbox_event in events:
-                try:
-                    await _process_single_event(outbox_event, outbox_repo, session)
-                    processed_count += 1
-                    logger.debug(f"Successfully processed event {outbox_event.uuid}")
-                except Exception as e:
-                    failed_count += 1
-                    error_message = str(e)
-                    logger.exception(
-                        f"Failed to process event {outbox_event.uuid}: {error_message}",
-                        extra={"event_id": str(outbox_event.uuid), "event_name": outbox_event.event_name},
-                    )
-
-                    try:
-                        await outbox_repo.mark_event_failed(outbox_event.uuid, error_message)
-                        await session.commit()
-                    except Exception as commit_error:
-                        logger.exception(
-                            f"Failed to mark event {outbox_event.uuid} as failed: {commit_error}",
-                            extra={"event_id": str(outbox_event.uuid)},
-                        )
-                        await session.rollback()
-
-            logger.info(
-                f"Outbox events processing completed: processed={processed_count}, failed={failed_count}, total={len(events)}"
-            )
-
-            return {
-                "success": True,
-                "processed": processed_count,
-                "failed": failed_count,
-                "total": len(events),
-            }
+        logger.info("Starting outbox events processing")
+        stats = await process_outbox_batch(
+            session_factory,
+            limit=outbox_settings.batch_size,
+            lock_duration_seconds=outbox_settings.lock_duration_seconds,
+        )
+        return stats.to_dict()
 
     except Exception as e:
         logger.exception(f"Failed to process outbox events: {e}")
@@ -108,19 +99,258 @@ async def _process_outbox_events_async(task_instance) -> dict:
         raise
 
 
-async def _process_single_event(
-    outbox_event,
-    outbox_repo: OutboxRepository,
-    session,
+async def process_outbox_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: int,
+    lock_duration_seconds: int,
+) -> OutboxProcessingStats:
+    """
+    Захватывает одну пачку pending событий и обрабатывает её.
+
+    Используется как периодической задачей, так и долгоживущим outbox relay.
+
+    Args:
+        session_factory: Фабрика сессий БД
+        limit: Максимальное количество событий в пачке
+        lock_duration_seconds: Время блокировки захваченных событий
+
+    Returns:
+        Статистика обработки пачки
+    """
+    stats = OutboxProcessingStats()
+
+    async with session_factory() as session:
+        outbox_repo = OutboxRepository(session)
+
+        events = await outbox_repo.claim_pending_events(limit=limit, lock_duration_seconds=lock_duration_seconds)
+
+        if not events:
+            logger.debug("No pending events to process")
+            return stats
+
+        # Фиксируем захват сразу: откат после ошибки отдельного события не должен снимать блокировку пачки.
+        # Отсоединяем события от сессии захвата: дальше они обрабатываются в сессиях партиций.
+        await session.commit()
+        session.expunge_all()
+
+        stats.total = len(events)
+        now = datetime_aware_to_naive(datetime_now())
+        stats.max_lag_seconds = max((now - event.created_at).total_seconds() for event in events)
+
+        partitions = partition_by_aggregate(events)
+        logger.info(f"Claimed {len(events)} events in {len(partitions)} partition(s) for processing")
+
+        # Пакетная публикация возможна только при фиксации статусов всей пачкой:
+        # при per_event_ack событие получает DONE сразу после обработки
+        batch_publish = outbox_settings.batch_publish and not outbox_settings.per_event_ack
+
+        outcome = await dispatch_partitions(
+            partitions,
+            session_factory,
+            process_event=_handle_single_event if batch_publish else _process_single_event,
+            concurrency=outbox_settings.dispatch_concurrency,
+        )
+
+        if batch_publish:
+            await _publish_confirmed(events, outcome)
+
+        done_ids = outcome.done_ids
+        if not outbox_settings.per_event_ack:
+            done_ids = await _acknowledge_batch(outbox_repo, session, outcome.done_ids, outcome.failed)
+
+        stats.processed = len(done_ids)
+        stats.failed = stats.total - stats.processed
+
+        logger.info(
+            f"Outbox events processing completed: processed={stats.processed}, failed={stats.failed}, total={stats.total}"
+        )
+
+    return stats
+
+
+def partition_by_aggregate(events: list[OutboxEvent]) -> list[list[OutboxEvent]]:
+    """
+    Разбивает события на партиции по aggregate_id.
+    Порядок событий внутри партиции совпадает с порядком захвата (created_at).
+    """
+    partitions: dict[UUID, list[OutboxEvent]] = {}
+    for event in events:
+        partitions.setdefault(event.aggregate_id, []).append(event)
+    return list(partitions.values())
+
+
+async def dispatch_partitions(
+    partitions: list[list[OutboxEvent]],
+    session_factory: async_sessionmaker[AsyncSession],
+    process_event: Callable[[OutboxEvent, AsyncSession], Awaitable[object]],
+    concurrency: int,
+) -> OutboxDispatchOutcome:
+    """
+    Обрабатывает партиции конкурентно, не более concurrency одновременно.
+
+    События одного агрегата обрабатываются строго последовательно в своей сессии,
+    события разных агрегатов не ждут друг друга.
+
+    Args:
+        partitions: Партиции событий (см. partition_by_aggregate)
+        session_factory: Фабрика сессий; каждая партиция получает свою сессию
+        process_event: Обработчик одного события
+        concurrency: Максимальное количество одновременно обрабатываемых партиций
+
+    Returns:
+        Итоги обработки: успешно обработанные и неудачные события
+    """
+    outcome = OutboxDispatchOutcome()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_partition(partition: list[OutboxEvent]) -> None:
+        async with semaphore:
+            await _process_partition(partition, session_factory, process_event, outcome)
+
+    await asyncio.gather(*(_run_partition(partition) for partition in partitions))
+    return outcome
+
+
+async def _process_partition(
+    partition: list[OutboxEvent],
+    session_factory: async_sessionmaker[AsyncSession],
+    process_event: Callable[[OutboxEvent, AsyncSession], Awaitable[object]],
+    outcome: OutboxDispatchOutcome,
 ) -> None:
     """
-    Обрабатывает одно событие из outbox.
+    Последовательно обрабатывает события одного агрегата в отдельной сессии.
+
+    Изменения каждого успешно обработанного события фиксируются сразу, поэтому откат
+    после ошибки следующего события не затрагивает уже обработанные.
+    """
+    done_ids: list[UUID] = []
+
+    async with session_factory() as session:
+        outbox_repo = OutboxRepository(session)
+
+        for outbox_event in partition:
+            try:
+                await process_event(outbox_event, session)
+                if not outbox_settings.per_event_ack:
+                    await session.commit()
+                logger.debug(f"Successfully processed event {outbox_event.uuid}")
+            except Exception as e:
+                error_message = str(e)
+                logger.exception(
+                    f"Failed to process event {outbox_event.uuid}: {error_message}",
+                    extra={"event_id": str(outbox_event.uuid), "event_name": outbox_event.event_name},
+                )
+                await session.rollback()
+                outcome.failed[outbox_event.uuid] = error_message
+                if outbox_settings.per_event_ack:
+                    await _acknowledge_per_event(outbox_repo, session, [], {outbox_event.uuid: error_message})
+            else:
+                # При per_event_ack изменения обработчиков фиксируются вместе со статусом DONE
+                if outbox_settings.per_event_ack and not await _acknowledge_per_event(
+                    outbox_repo, session, [outbox_event.uuid], {}
+                ):
+                    continue
+                done_ids.append(outbox_event.uuid)
+
+    outcome.done_ids.extend(done_ids)
+
+
+async def _acknowledge_batch(
+    outbox_repo: OutboxRepository,
+    session: AsyncSession,
+    done_ids: list[UUID],
+    failed: dict[UUID, str],
+) -> list[UUID]:
+    """
+    Фиксирует итоговые статусы всей пачки одной транзакцией.
+
+    Если транзакция не прошла, откатывает её и повторяет фиксацию по одному событию,
+    чтобы одна проблемная запись не блокировала подтверждение остальных.
+
+    Returns:
+        Список событий, успешно отмеченных как DONE
+    """
+    try:
+        await outbox_repo.mark_events_done(done_ids)
+        await outbox_repo.mark_events_failed(failed)
+        await session.commit()
+        return done_ids
+    except Exception as e:
+        logger.exception(f"Failed to acknowledge outbox batch, falling back to per-event acknowledgement: {e}")
+        await session.rollback()
+
+    acked_ids: list[UUID] = []
+    for event_id in done_ids:
+        if await _acknowledge_per_event(outbox_repo, session, [event_id], {}):
+            acked_ids.append(event_id)
+    for event_id, error_message in failed.items():
+        await _acknowledge_per_event(outbox_repo, session, [], {event_id: error_message})
+    return acked_ids
+
+
+async def _acknowledge_per_event(
+    outbox_repo: OutboxRepository,
+    session: AsyncSession,
+    done_ids: list[UUID],
+    failed: dict[UUID, str],
+) -> bool:
+    """
+    Фиксирует статус одного события в отдельной транзакции.
+
+    Returns:
+        True, если статус зафиксирован. Иначе событие остается в PROCESSING, и
+        claim_pending_events захватит его повторно после истечения locked_until.
+    """
+    try:
+        await outbox_repo.mark_events_done(done_ids)
+        await outbox_repo.mark_events_failed(failed)
+        await session.commit()
+        return True
+    except Exception as e:
+        event_ids = [*done_ids, *failed.keys()]
+        logger.exception(
+            f"Failed to acknowledge outbox event {event_ids[0]}: {e}",
+            extra={"event_id": str(event_ids[0])},
+        )
+        await session.rollback()
+        return False
+
+
+async def _publish_confirmed(events: list[OutboxEvent], outcome: OutboxDispatchOutcome) -> None:
+    """
+    Публикует успешно обработанные события пачки одним конвейером с подтверждениями брокера.
+
+    События без подтверждения переносятся из done_ids в failed, поэтому DONE получают
+    только события, которые брокер подтвердил.
 
     Args:
-        outbox_event: OutboxEvent из БД
-        outbox_repo: OutboxRepository для обновления статуса
-        session: AsyncSession для транзакции
+        events: Все события пачки в порядке захвата
+        outcome: Итоги обработки, изменяются на месте
     """
+    done = set(outcome.done_ids)
+    to_publish = [event for event in events if event.uuid in done]
+    if not to_publish:
+        return
+
+    try:
+        results = await get_event_producer().publish_many([_deserialize_event(event) for event in to_publish])
+    except Exception as e:
+        logger.exception(f"Failed to publish outbox batch to RabbitMQ: {e}")
+        results = [e] * len(to_publish)
+
+    rejected: dict[UUID, str] = {}
+    for outbox_event, error in zip(to_publish, results, strict=True):
+        if error is not None:
+            rejected[outbox_event.uuid] = f"Publish not confirmed: {error}"
+
+    if rejected:
+        logger.warning(f"RabbitMQ did not confirm {len(rejected)}/{len(to_publish)} event(s)")
+        outcome.done_ids = [event_id for event_id in outcome.done_ids if event_id not in rejected]
+        outcome.failed.update(rejected)
+
+
+def _deserialize_event(outbox_event: OutboxEvent) -> DomainEvent:
+    """Восстанавливает доменное событие из записи outbox"""
     event_data = {
         "event_name": outbox_event.event_name,
         "event_version": outbox_event.event_version,
@@ -128,8 +358,24 @@ async def _process_single_event(
         "occurred_at": outbox_event.occurred_at.isoformat(),
         "payload": outbox_event.payload,
     }
+    return EventSerializer.deserialize(event_data)
 
-    deserialized_event = EventSerializer.deserialize(event_data)
+
+async def _handle_single_event(
+    outbox_event: OutboxEvent,
+    session: AsyncSession,
+) -> DomainEvent:
+    """
+    Вызывает обработчики одного события из outbox без публикации в RabbitMQ.
+
+    Args:
+        outbox_event: OutboxEvent из БД
+        session: AsyncSession для обработчиков
+
+    Returns:
+        Десериализованное доменное событие
+    """
+    deserialized_event = _deserialize_event(outbox_event)
 
     event_type = type(deserialized_event)
     handlers = EventHandlerRegistry.get_handlers(event_type)
@@ -139,27 +385,45 @@ async def _process_single_event(
             f"No handlers registered for event type {event_type.__name__} (event_id={outbox_event.uuid})",
             extra={"event_id": str(outbox_event.uuid), "event_type": event_type.__name__},
         )
-    else:
-        for handler_class in handlers:
-            try:
-                handler_instance = create_handler_instance(handler_class, session)
+        return deserialized_event
+
+    for handler_class in handlers:
+        try:
+            handler_instance = create_handler_instance(handler_class, session)
+
+            if not hasattr(handler_instance, "handle"):
+                raise ValueError(f"Handler {type(handler_instance).__name__} does not have handle method")
+
+            if not callable(handler_instance.handle):
+                raise ValueError(f"Handler {type(handler_instance).__name__} does not have callable handle method")
+
+            if inspect.iscoroutinefunction(handler_instance.handle):
+                await handler_instance.handle(deserialized_event)
+            else:
+                handler_instance.handle(deserialized_event)
+        except Exception as e:
+            logger.exception(
+                f"Handler {handler_class.__name__} failed for event {outbox_event.uuid}: {e}",
+                extra={"event_id": str(outbox_event.uuid), "handler": handler_class.__name__},
+            )
+            raise
 
-                if not hasattr(handler_instance, "handle"):
-                    raise ValueError(f"Handler {type(handler_instance).__name__} does not have handle method")
+    return deserialized_event
 
-                if not callable(handler_instance.handle):
-                    raise ValueError(f"Handler {type(handler_instance).__name__} does not have callable handle method")
 
-                if inspect.iscoroutinefunction(handler_instance.handle):
-                    await handler_instance.handle(deserialized_event)
-                else:
-                    handler_instance.handle(deserialized_event)
-            except Exception as e:
-                logger.exception(
-                    f"Handler {handler_class.__name__} failed for event {outbox_event.uuid}: {e}",
-                    extra={"event_id": str(outbox_event.uuid), "handler": handler_class.__name__},
-                )
-                raise
+async def _process_single_event(
+    outbox_event: OutboxEvent,
+    session: AsyncSession,
+) -> None:
+    """
+    Обрабатывает одно событие из outbox: вызывает обработчики и публикует событие.
+    Статус события фиксируется вызывающим кодом.
+
+    Args:
+        outbox_event: OutboxEvent из БД
+        session: AsyncSession для обработчиков
+    """
+    deserialized_event = await _handle_single_event(outbox_event, session)
 
     try:
         event_producer = get_event_producer()
@@ -170,6 +434,3 @@ async def _process_single_event(
             extra={"event_id": str(outbox_event.uuid), "event_name": outbox_event.event_name},
         )
         raise
-
-    await outbox_repo.mark_event_done(outbox_event.uuid)
-    await session.commit()
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging import get_logger
 from src.core.settings import CelerySettings, RabbitMQMessagingSettings
+from src.core.time import datetime_naive_to_aware, datetime_now
 from src.domain.common.enums import EventTypesEnum
 from src.domain.common.events import DomainEvent
 from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
@@ -23,14 +24,18 @@ from src.infrastructure.background_tasks.app import (
     get_event_consumer,
     get_rabbitmq_connection,
     get_session_factory,
+    get_webhook_redis,
+    get_webhook_sender,
     run_async_task,
 )
+from src.infrastructure.common.uow.event_coalescer import EventCoalescer
 from src.infrastructure.events.registry import EventRegistry
 from src.infrastructure.events.serializer import EventSerializer
-from src.infrastructure.persistence.queries.webhooks.subscription import WebhookSubscriptionQueryService
-from src.infrastructure.persistence.repositories.event_type import EventTypeRepository
+from src.infrastructure.events.type_cache import EventTypeCache
+from src.infrastructure.persistence.repositories.webhooks.attempt import WebhookDeliveryAttemptRepository
 from src.infrastructure.persistence.repositories.webhooks.delivery import WebhookDeliveryRepository
-from src.infrastructure.webhooks.sender import WebhookSender
+from src.infrastructure.webhooks.routing import WebhookRoutingTable
+from src.infrastructure.webhooks.sender import WebhookAttempt, WebhookSender
 
 if TYPE_CHECKING:
     from aio_pika.abc import AbstractQueue
@@ -48,7 +53,9 @@ class ProcessingStats:
     processed: int = 0
     webhooks_sent: int = 0
     webhooks_failed: int = 0
+    webhooks_scheduled: int = 0
     errors: list[str] = field(default_factory=list)
+    max_lag_seconds: float = 0.0
 
     def to_dict(self) -> dict:
         """Преобразует статистику в словарь"""
@@ -57,6 +64,7 @@ class ProcessingStats:
             "processed": self.processed,
             "webhooks_sent": self.webhooks_sent,
             "webhooks_failed": self.webhooks_failed,
+            "webhooks_scheduled": self.webhooks_scheduled,
             "errors": self.errors,
         }
 
@@ -66,34 +74,6 @@ def _is_retryable_error(exception: Exception) -> bool:
     return isinstance(exception, (OperationalError, DBAPIError))
 
 
-async def _get_active_subscriptions_for_event(
-    query_service: WebhookSubscriptionQueryService, event_type: EventTypesEnum
-) -> list[WebhookSubscriptionEntity]:
-    """
-    Получает активные подписки для указанного типа события.
-
-    Args:
-        query_service: Сервис для запросов подписок
-        event_type: Тип события webhook
-
-    Returns:
-        Список активных подписок, которые подписаны на указанный тип события
-    """
-    from src.application.webhooks.queries.filters import WebhookReadFilters
-    from src.application.webhooks.queries.queries import ListWebhookSubscriptionsQuery
-    from src.domain.common.queries import PaginationSpec
-
-    query = ListWebhookSubscriptionsQuery(
-        filters=WebhookReadFilters(event_type=event_type),
-        pagination=PaginationSpec(limit=1000, offset=0),
-    )
-    result = await query_service.list(query)
-
-    active_subscriptions = [sub for sub in result.items if sub.is_active]
-    logger.debug(f"Found {len(active_subscriptions)} active subscriptions for event_type={event_type!s}")
-    return active_subscriptions
-
-
 def _extract_event_payload(event: DomainEvent) -> dict:
     """
     Извлекает payload из доменного события.
@@ -233,6 +213,7 @@ def process_webhook_events(self) -> dict:
             "processed": 0,
             "webhooks_sent": 0,
             "webhooks_failed": 0,
+            "webhooks_scheduled": 0,
             "errors": []
         }
     """
@@ -241,49 +222,53 @@ def process_webhook_events(self) -> dict:
 
 async def _process_single_subscription(
     subscription: WebhookSubscriptionEntity,
-    event_type_id: UUID,
     event_type: EventTypesEnum,
     event_payload: dict,
-    delivery_repository: WebhookDeliveryRepository,
+    body: bytes,
+    delivery: WebhookDeliveryEntity,
     webhook_sender: WebhookSender,
+    attempts: list[WebhookAttempt],
     stats: ProcessingStats,
-) -> None:
+) -> WebhookDeliveryEntity:
     """
-    Обрабатывает одну подписку: создает delivery, отправляет webhook и обновляет статус.
+    Отправляет webhook одной подписке и обновляет сущность доставки в памяти.
+    Доставка и попытка сохраняются в БД вызывающим кодом вместе с остальными доставками события.
 
     Args:
         subscription: Подписка на webhook
-        event_type_id: UUID типа события
         event_type: Тип события
         event_payload: Данные события
-        delivery_repository: Репозиторий для доставок
+        body: Сериализованное тело webhook, общее для всех подписок события
+        delivery: Сущность доставки со статусом PENDING
         webhook_sender: Сервис для отправки webhooks
+        attempts: Журнал попыток события, в который добавляется попытка
         stats: Статистика обработки
+
+    Returns:
+        Доставка с итоговым статусом
     """
     try:
-        delivery = _create_delivery_entity(subscription, event_type_id, event_type, event_payload)
-        delivery = await delivery_repository.create(delivery)
-
-        logger.debug(
-            f"Created delivery subscription_id={subscription.uuid} "
-            f"event_type={event_type!s} delivery_id={delivery.uuid}"
-        )
-
         delivery = await webhook_sender.send_webhook(
             subscription=subscription,
             event_type=event_type,
             payload=event_payload,
             delivery=delivery,
+            body=body,
+            attempt_log=attempts,
         )
 
-        await delivery_repository.update(delivery)
-
         if delivery.status == WebhookStatus.SUCCESS:
             stats.webhooks_sent += 1
             logger.info(
                 f"Webhook sent successfully subscription_id={subscription.uuid} "
                 f"event_type={event_type!s} delivery_id={delivery.uuid}"
             )
+        elif delivery.status == WebhookStatus.PENDING:
+            stats.webhooks_scheduled += 1
+            logger.info(
+                f"Webhook retry scheduled subscription_id={subscription.uuid} "
+                f"event_type={event_type!s} delivery_id={delivery.uuid} next_attempt_at={delivery.next_attempt_at}"
+            )
         else:
             stats.webhooks_failed += 1
             logger.warning(
@@ -299,13 +284,16 @@ async def _process_single_subscription(
             exc_info=True,
         )
         stats.errors.append(f"Subscription {subscription.uuid!s}: {e!s}")
+        delivery.mark_failed(f"Unexpected error: {e!s}")
+
+    return delivery
 
 
 async def _process_single_event(
     event: DomainEvent,
     message: aio_pika.IncomingMessage,
-    query_service: WebhookSubscriptionQueryService,
     delivery_repository: WebhookDeliveryRepository,
+    attempt_repository: WebhookDeliveryAttemptRepository,
     webhook_sender: WebhookSender,
     session: AsyncSession,
     stats: ProcessingStats,
@@ -316,14 +304,16 @@ async def _process_single_event(
     Args:
         event: Доменное событие
         message: Сообщение из RabbitMQ
-        query_service: Сервис для запросов подписок
         delivery_repository: Репозиторий для доставок
+        attempt_repository: Журнал попыток отправки
         webhook_sender: Сервис для отправки webhooks
         session: Сессия базы данных
         stats: Статистика обработки
     """
     try:
         stats.processed += 1
+        lag = (datetime_now() - datetime_naive_to_aware(event.occurred_at)).total_seconds()
+        stats.max_lag_seconds = max(stats.max_lag_seconds, lag)
         logger.debug(f"Processing event: {type(event).__name__}, aggregate_id={event.aggregate_id}")
 
         event_name, _ = EventRegistry.get_event_metadata(type(event))
@@ -335,7 +325,7 @@ async def _process_single_event(
             await message.ack()
             return
 
-        active_subscriptions = await _get_active_subscriptions_for_event(query_service, webhook_event_type)
+        active_subscriptions = await WebhookRoutingTable.get_subscriptions(session, webhook_event_type)
 
         if not active_subscriptions:
             logger.debug(
@@ -344,11 +334,11 @@ async def _process_single_event(
             await message.ack()
             return
 
-        event_payload = _extract_event_payload(event)
+        # Подписчики получают события v1: объединенное событие v2 разворачивается обратно по продуктам
+        event_payloads = [_extract_event_payload(v1_event) for v1_event in EventCoalescer.expand(event)]
 
-        event_type_repository = EventTypeRepository(session)
-        event_type_model = await event_type_repository.get_by_event_type(webhook_event_type)
-        if event_type_model is None:
+        event_type_id = await EventTypeCache.get_id(session, str(webhook_event_type))
+        if event_type_id is None:
             logger.error(
                 f"Event type {webhook_event_type} not found in database, skipping webhook delivery: "
                 f"aggregate_id={event.aggregate_id}"
@@ -356,17 +346,31 @@ async def _process_single_event(
             await message.ack()
             return
 
-        for subscription in active_subscriptions:
-            await _process_single_subscription(
-                subscription=subscription,
-                event_type_id=event_type_model.uuid,
-                event_type=webhook_event_type,
-                event_payload=event_payload,
-                delivery_repository=delivery_repository,
-                webhook_sender=webhook_sender,
-                stats=stats,
+        # Тело сериализуется один раз на payload и отправляется всем подпискам, подписи считаются по этим байтам
+        bodies = [webhook_sender.build_body(webhook_event_type, event_payload) for event_payload in event_payloads]
+
+        # Подписки обслуживаются конкурентно (лимиты — в WebhookSender); доставки с итоговым статусом
+        # и попытки сохраняются после отправки двумя многострочными INSERT
+        attempts: list[WebhookAttempt] = []
+        deliveries = await asyncio.gather(
+            *(
+                _process_single_subscription(
+                    subscription=subscription,
+                    event_type=webhook_event_type,
+                    event_payload=event_payload,
+                    body=body,
+                    delivery=_create_delivery_entity(subscription, event_type_id, webhook_event_type, event_payload),
+                    webhook_sender=webhook_sender,
+                    attempts=attempts,
+                    stats=stats,
+                )
+                for event_payload, body in zip(event_payloads, bodies, strict=True)
+                for subscription in active_subscriptions
             )
+        )
 
+        await delivery_repository.create_many(list(deliveries))
+        await attempt_repository.append_many(attempts)
         await session.commit()
         await message.ack()
         logger.debug(f"Acknowledged message: delivery_tag={message.delivery_tag}")
@@ -382,6 +386,42 @@ async def _process_single_event(
             logger.error(f"Failed to nack message: {nack_error}")
 
 
+async def process_webhook_message(
+    message: aio_pika.IncomingMessage,
+    session: AsyncSession,
+    webhook_sender: WebhookSender,
+    stats: ProcessingStats,
+) -> None:
+    """
+    Обрабатывает одно сообщение из очереди webhooks и подтверждает его.
+
+    Используется как периодической задачей, так и долгоживущим webhook dispatcher.
+    Сообщение, которое не удалось десериализовать, отклоняется без повторной доставки;
+    при ошибке обработки сообщение возвращается в очередь.
+
+    Args:
+        message: Сообщение из RabbitMQ
+        session: Сессия базы данных
+        webhook_sender: Сервис для отправки webhooks
+        stats: Статистика обработки
+    """
+    event = await _deserialize_rabbitmq_message(message)
+    if event is None:
+        logger.warning(f"Failed to deserialize message, nacking: delivery_tag={message.delivery_tag}")
+        await message.nack(requeue=False)
+        return
+
+    await _process_single_event(
+        event=event,
+        message=message,
+        delivery_repository=WebhookDeliveryRepository(session),
+        attempt_repository=WebhookDeliveryAttemptRepository(session),
+        webhook_sender=webhook_sender,
+        session=session,
+        stats=stats,
+    )
+
+
 async def _process_webhook_events_async(task_instance) -> dict:
     """Асинхронная часть задачи обработки webhook событий"""
     session_factory = get_session_factory()
@@ -395,37 +435,23 @@ async def _process_webhook_events_async(task_instance) -> dict:
             get_event_consumer()
             messages, channel = await _read_rabbitmq_messages(limit=100, timeout=1.0)
 
-            query_service = WebhookSubscriptionQueryService(session)
-            delivery_repository = WebhookDeliveryRepository(session)
-            webhook_sender = WebhookSender()
+            webhook_sender = get_webhook_sender()
+            await WebhookRoutingTable.sync_version(get_webhook_redis())
 
             try:
                 for message in messages:
-                    event = await _deserialize_rabbitmq_message(message)
-                    if event is None:
-                        logger.warning(f"Failed to deserialize message, nacking: delivery_tag={message.delivery_tag}")
-                        await message.nack(requeue=False)
-                        continue
-
-                    await _process_single_event(
-                        event=event,
-                        message=message,
-                        query_service=query_service,
-                        delivery_repository=delivery_repository,
-                        webhook_sender=webhook_sender,
-                        session=session,
-                        stats=stats,
-                    )
+                    await process_webhook_message(message, session, webhook_sender, stats)
 
             finally:
-                await webhook_sender.close()
+                webhook_sender.log_host_metrics()
                 if channel and not channel.is_closed:
                     await channel.close()
                     logger.debug("Closed RabbitMQ channel")
 
             logger.info(
                 f"Webhook events processing completed: processed={stats.processed}, "
-                f"webhooks_sent={stats.webhooks_sent}, webhooks_failed={stats.webhooks_failed}"
+                f"webhooks_sent={stats.webhooks_sent}, webhooks_failed={stats.webhooks_failed}, "
+                f"webhooks_scheduled={stats.webhooks_scheduled}"
             )
 
             return stats.to_dict()
@@ -0,0 +1,160 @@
+import asyncio
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.core.settings import WebhookSettings
+from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
+from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
+from src.domain.webhooks.enums import WebhookStatus
+from src.infrastructure.background_tasks.app import (
+    celery_app,
+    get_session_factory,
+    get_webhook_sender,
+    run_async_task,
+)
+from src.infrastructure.persistence.repositories.webhooks.attempt import WebhookDeliveryAttemptRepository
+from src.infrastructure.persistence.repositories.webhooks.delivery import WebhookDeliveryRepository
+from src.infrastructure.persistence.repositories.webhooks.subscription import WebhookSubscriptionRepository
+from src.infrastructure.webhooks.sender import WebhookAttempt, WebhookSender
+
+logger = get_logger("celery.tasks.retry_failed_webhooks")
+
+webhook_settings = WebhookSettings()
+
+
+@dataclass
+class WebhookRetryStats:
+    """Статистика повторной отправки webhooks"""
+
+    claimed: int = 0
+    sent: int = 0
+    rescheduled: int = 0
+    failed: int = 0
+
+    def to_dict(self) -> dict:
+        """Преобразует статистику в словарь"""
+        return {
+            "success": True,
+            "claimed": self.claimed,
+            "sent": self.sent,
+            "rescheduled": self.rescheduled,
+            "failed": self.failed,
+        }
+
+
+@celery_app.task(name="tasks.retry_failed_webhooks")
+def retry_failed_webhooks() -> dict:
+    """
+    Повторяет доставки webhooks, у которых наступило время следующей попытки.
+
+    Захватывает до WEBHOOK_RETRY_BATCH_SIZE доставок в статусе PENDING с next_attempt_at <= now,
+    отправляет их конкурентно и сохраняет результат: SUCCESS, новая попытка по расписанию
+    или FAILED, если попытки подписки исчерпаны.
+
+    Запускается: каждые WEBHOOK_RETRY_POLL_INTERVAL секунд
+
+    Returns:
+        {
+            "success": True,
+            "claimed": 3,
+            "sent": 2,
+            "rescheduled": 1,
+            "failed": 0
+        }
+    """
+    return run_async_task(_retry_failed_webhooks_async())
+
+
+async def _retry_failed_webhooks_async() -> dict:
+    """Асинхронная часть задачи повторной отправки webhooks"""
+    session_factory = get_session_factory()
+    stats = WebhookRetryStats()
+
+    async with session_factory() as session:
+        delivery_repository = WebhookDeliveryRepository(session)
+
+        # Захват фиксируется сразу: на время отправки доставки защищены lease в next_attempt_at
+        deliveries = await delivery_repository.claim_due_deliveries(
+            limit=webhook_settings.retry_batch_size,
+            lease_seconds=webhook_settings.retry_lease_seconds,
+        )
+        await session.commit()
+
+        stats.claimed = len(deliveries)
+        if not deliveries:
+            logger.debug("No webhook deliveries due for retry")
+            return stats.to_dict()
+
+        subscriptions = await _load_subscriptions(session, {delivery.subscription_id for delivery in deliveries})
+
+        webhook_sender = get_webhook_sender()
+        attempts: list[WebhookAttempt] = []
+        try:
+            deliveries = await asyncio.gather(
+                *(
+                    _retry_delivery(delivery, subscriptions.get(delivery.subscription_id), webhook_sender, attempts)
+                    for delivery in deliveries
+                )
+            )
+        finally:
+            webhook_sender.log_host_metrics()
+
+        await delivery_repository.update_many(list(deliveries))
+        await WebhookDeliveryAttemptRepository(session).append_many(attempts)
+        await session.commit()
+
+    for delivery in deliveries:
+        if delivery.status == WebhookStatus.SUCCESS:
+            stats.sent += 1
+        elif delivery.status == WebhookStatus.PENDING:
+            stats.rescheduled += 1
+        else:
+            stats.failed += 1
+
+    logger.info(
+        f"Webhook retries completed: claimed={stats.claimed}, sent={stats.sent}, "
+        f"rescheduled={stats.rescheduled}, failed={stats.failed}"
+    )
+    return stats.to_dict()
+
+
+async def _load_subscriptions(
+    session: AsyncSession, subscription_ids: set[UUID]
+) -> dict[UUID, WebhookSubscriptionEntity]:
+    """Загружает подписки доставок одним запросом; удаленные подписки пропускаются"""
+    subscriptions = {
+        subscription.uuid: subscription
+        for subscription in await WebhookSubscriptionRepository(session).get_by_ids(list(subscription_ids))
+    }
+    for subscription_id in subscription_ids - subscriptions.keys():
+        logger.warning(f"Subscription {subscription_id} not found, its deliveries will be marked as failed")
+    return subscriptions
+
+
+async def _retry_delivery(
+    delivery: WebhookDeliveryEntity,
+    subscription: WebhookSubscriptionEntity | None,
+    webhook_sender: WebhookSender,
+    attempts: list[WebhookAttempt],
+) -> WebhookDeliveryEntity:
+    """Выполняет очередную попытку доставки"""
+    if subscription is None or not subscription.is_active:
+        delivery.mark_failed("Подписка удалена или отключена")
+        return delivery
+
+    try:
+        return await webhook_sender.send_webhook(
+            subscription=subscription,
+            event_type=delivery.event_type,
+            payload=delivery.payload.value,
+            delivery=delivery,
+            attempt_log=attempts,
+        )
+    except Exception as e:
+        logger.exception(f"Error retrying webhook delivery_id={delivery.uuid}: {e}")
+        delivery.mark_failed(f"Unexpected error: {e!s}")
+        return delivery
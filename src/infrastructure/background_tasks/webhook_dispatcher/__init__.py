@@ -0,0 +1,3 @@
+from src.infrastructure.background_tasks.webhook_dispatcher.dispatcher import WebhookDispatcher
+
+__all__ = ["WebhookDispatcher"]
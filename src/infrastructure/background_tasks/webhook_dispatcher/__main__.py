@@ -0,0 +1,36 @@
+from src.core.settings import RabbitMQMessagingSettings, WebhookDispatcherSettings
+from src.infrastructure.background_tasks.app import (
+    get_rabbitmq_connection,
+    get_session_factory,
+    get_webhook_redis,
+    get_webhook_sender,
+)
+from src.infrastructure.background_tasks.service import run_service
+from src.infrastructure.background_tasks.webhook_dispatcher.dispatcher import WebhookDispatcher
+from src.infrastructure.messaging.rabbitmq.mapper import EventRoutingMapper
+
+
+def _create_dispatcher() -> WebhookDispatcher:
+    messaging_settings = RabbitMQMessagingSettings()
+    return WebhookDispatcher(
+        get_rabbitmq_connection(),
+        messaging_settings,
+        EventRoutingMapper(messaging_settings.event_routing),
+        get_session_factory(),
+        WebhookDispatcherSettings(),
+        get_webhook_sender(),
+        get_webhook_redis(),
+    )
+
+
+def main() -> None:
+    """
+    Точка входа долгоживущего webhook dispatcher.
+
+    Запуск: python -m src.infrastructure.background_tasks.webhook_dispatcher
+    """
+    run_service(_create_dispatcher)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import logging
+
+import aio_pika
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.logging import get_logger, log_dict
+from src.core.settings import RabbitMQMessagingSettings, WebhookDispatcherSettings
+from src.infrastructure.background_tasks.health import HealthServer
+from src.infrastructure.background_tasks.tasks.process_webhook_events import ProcessingStats, process_webhook_message
+from src.infrastructure.background_tasks.webhook_dispatcher.metrics import WebhookDispatcherMetrics
+from src.infrastructure.messaging.rabbitmq.connection import RabbitMQConnection
+from src.infrastructure.messaging.rabbitmq.consumer import RabbitMQEventConsumer
+from src.infrastructure.messaging.rabbitmq.mapper import EventRoutingMapper
+from src.infrastructure.webhooks.routing import WebhookRoutingTable
+from src.infrastructure.webhooks.sender import WebhookSender
+
+logger = get_logger("webhook_dispatcher")
+
+
+class WebhookDispatcher(RabbitMQEventConsumer):
+    """
+    Долгоживущий dispatcher webhooks.
+
+    Получает события из очереди webhooks через basic.consume и обрабатывает каждое
+    сообщение в своей задаче и своей сессии БД; число одновременно обрабатываемых
+    сообщений ограничено RABBITMQ_CONSUMER_PREFETCH. WebhookSender (HTTP клиент и лимиты)
+    общий на весь процесс. Подписки берутся из WebhookRoutingTable, которая сбрасывается
+    по уведомлениям об изменении подписок из Redis. Состояние доступно через GET /health,
+    метрики запросов по хостам подписчиков — через GET /metrics.
+    """
+
+    def __init__(
+        self,
+        connection: RabbitMQConnection,
+        messaging_settings: RabbitMQMessagingSettings,
+        routing_mapper: EventRoutingMapper,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: WebhookDispatcherSettings,
+        webhook_sender: WebhookSender,
+        redis: Redis,
+    ) -> None:
+        """
+        Args:
+            connection: Менеджер подключения к RabbitMQ
+            messaging_settings: Настройки messaging
+            routing_mapper: Маппер для routing keys
+            session_factory: Фабрика сессий БД
+            settings: Настройки dispatcher
+            webhook_sender: Общий sender процесса; закрывается вместе с ресурсами процесса
+            redis: Клиент Redis для уведомлений об изменении подписок
+        """
+        super().__init__(connection, messaging_settings, routing_mapper)
+        self._session_factory = session_factory
+        self._dispatcher_settings = settings
+        self._webhook_sender = webhook_sender
+        self._redis = redis
+        self._metrics = WebhookDispatcherMetrics()
+        self._stop_event = asyncio.Event()
+        self._health_server = HealthServer(
+            settings.health_host,
+            settings.health_port,
+            self._health_check,
+            metrics=lambda: {"hosts": webhook_sender.host_metrics()},
+        )
+
+    @property
+    def metrics(self) -> WebhookDispatcherMetrics:
+        """Метрики dispatcher"""
+        return self._metrics
+
+    def request_stop(self) -> None:
+        """Запрашивает остановку; текущие сообщения обрабатываются до конца"""
+        logger.info("Webhook dispatcher stop requested")
+        self._stop_event.set()
+
+    async def run(self) -> None:
+        """Запускает dispatcher и блокируется до вызова request_stop()"""
+        logger.info(
+            f"Starting webhook dispatcher: queue={self._settings.consumer_queue}, "
+            f"prefetch={self._settings.consumer_prefetch}"
+        )
+
+        await self._health_server.start()
+        reporter = asyncio.create_task(self._report_loop(), name="webhook-dispatcher-reporter")
+        routing_listener = asyncio.create_task(
+            WebhookRoutingTable.listen(self._redis), name="webhook-dispatcher-routing-listener"
+        )
+
+        try:
+            await self.start()
+            await self._stop_event.wait()
+        finally:
+            for task in (reporter, routing_listener):
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            await self.stop(timeout=self._dispatcher_settings.shutdown_timeout)
+            await self._health_server.stop()
+            log_dict(logger, logging.INFO, "Webhook dispatcher stopped", self._metrics.snapshot())
+
+    async def process_message(self, message: aio_pika.IncomingMessage) -> None:
+        """Обрабатывает одно сообщение в отдельной сессии и учитывает результат в метриках"""
+        stats = ProcessingStats()
+        async with self._session_factory() as session:
+            await process_webhook_message(message, session, self._webhook_sender, stats)
+        self._metrics.record_message(stats)
+
+    async def _report_loop(self) -> None:
+        """Периодически логирует метрики"""
+        while True:
+            await asyncio.sleep(self._dispatcher_settings.metrics_interval)
+            log_dict(
+                logger,
+                logging.INFO,
+                "Webhook dispatcher metrics",
+                {**self._metrics.snapshot(), "in_flight": self.in_flight},
+            )
+            self._webhook_sender.log_host_metrics()
+
+    def _health_check(self) -> tuple[bool, dict]:
+        return self.is_running, {"in_flight": self.in_flight, **self._metrics.totals()}
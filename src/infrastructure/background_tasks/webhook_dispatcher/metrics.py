@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from src.infrastructure.background_tasks.metrics import WindowedMetrics
+from src.infrastructure.background_tasks.tasks.process_webhook_events import ProcessingStats
+
+
+@dataclass
+class WebhookDispatcherMetrics(WindowedMetrics):
+    """
+    Метрики webhook dispatcher: пропускная способность и задержка доставки.
+
+    Lag — время от возникновения события до начала его обработки dispatcher.
+    """
+
+    throughput_key = "throughput_mps"
+
+    messages: int = 0
+    webhooks_sent: int = 0
+    webhooks_failed: int = 0
+    webhooks_scheduled: int = 0
+
+    def record_message(self, stats: ProcessingStats) -> None:
+        """Учитывает результат обработки одного сообщения"""
+        self.messages += 1
+        self.webhooks_sent += stats.webhooks_sent
+        self.webhooks_failed += stats.webhooks_failed
+        self.webhooks_scheduled += stats.webhooks_scheduled
+        self.errors += len(stats.errors)
+        self.record_window(1, stats.max_lag_seconds if stats.processed else None)
+
+    def totals(self) -> dict:
+        """Возвращает накопленные счетчики без сброса окна"""
+        return {
+            "messages": self.messages,
+            "webhooks_sent": self.webhooks_sent,
+            "webhooks_failed": self.webhooks_failed,
+            "webhooks_scheduled": self.webhooks_scheduled,
+            **super().totals(),
+        }
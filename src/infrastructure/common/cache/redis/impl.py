@@ -67,3 +67,22 @@ class RedisCacheService(CacheServiceProtocol):
             logger.warning(f"Failed to delete cache pattern {pattern}: {e}")
             if self._raise_errors:
                 raise
+
+    async def set_if_absent(self, key: str, value: bytes, ttl: int | None = None) -> bool:
+        """Атомарно устанавливает значение, если ключа нет (SET NX). Возвращает False, если ключ есть, или при ошибке."""
+        try:
+            return bool(await self._client.set(key, value, ex=ttl, nx=True))
+        except Exception as e:
+            logger.warning(f"Failed to set cache key {key} if absent: {e}")
+            if self._raise_errors:
+                raise
+            return False
+
+    async def increment(self, key: str) -> int | None:
+        """Атомарно увеличивает счетчик на 1 (INCR) и возвращает новое значение. Возвращает None при ошибке."""
+        try:
+            return await self._client.incr(key)
+        except Exception as e:
+            logger.warning(f"Failed to increment cache key {key}: {e}")
+            if self._raise_errors:
+                raise
@@ -5,11 +5,13 @@ from src.infrastructure.common.exceptions.database import (
     MappingException,
     OutboxRepositoryException,
 )
+from src.infrastructure.common.exceptions.messaging import MessagePublishException
 
 __all__ = [
     "ConnectionException",
     "DatabaseException",
     "InfrastructureException",
     "MappingException",
+    "MessagePublishException",
     "OutboxRepositoryException",
 ]
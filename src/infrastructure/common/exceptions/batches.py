@@ -11,3 +11,7 @@ class BatchExcelGenerationError(BatchReportGenerationError):
 
 class BatchPDFGenerationError(BatchReportGenerationError):
     """Исключение для ошибок генерации PDF отчетов батчей."""
+
+
+class BatchExportGenerationError(BatchReportGenerationError):
+    """Исключение для ошибок генерации файлов экспорта батчей."""
@@ -0,0 +1,5 @@
+from src.infrastructure.common.exceptions.base import InfrastructureException
+
+
+class MessagePublishException(InfrastructureException):
+    """Ошибка публикации сообщения в брокер"""
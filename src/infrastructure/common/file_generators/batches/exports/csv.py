@@ -1,9 +1,10 @@
 import asyncio
 import csv
 
+from collections.abc import AsyncIterable
 from dataclasses import fields
-from functools import partial
-from io import StringIO
+from io import TextIOWrapper
+from typing import BinaryIO
 
 from src.application.batches.dtos.raw_data import BatchRawDataDTO
 from src.application.batches.mappers import raw_data_dto_to_row
@@ -16,51 +17,63 @@ logger = get_logger("batches.export.csv")
 class BatchesExportCsvGenerator:
     """Генератор CSV файлов для экспорта списка партий."""
 
-    async def generate(self, raw_data: list[BatchRawDataDTO]) -> bytes:
+    async def write(self, pages: AsyncIterable[list[BatchRawDataDTO]], output: BinaryIO) -> int:
         """
-        Генерирует CSV файл со списком партий.
+        Потоково записывает CSV файл со списком партий.
+
+        Каждая страница кодируется и записывается в output сразу после получения.
 
         Args:
-            batches: Список партий для экспорта
+            pages: Страницы партий для экспорта
+            output: Бинарный файловый объект для записи файла
 
         Returns:
-            Байты сгенерированного CSV файла
+            Количество записанных партий
 
         Raises:
             BatchExcelGenerationError: При ошибке генерации CSV
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(self._generate_sync, raw_data))
-
-    def _generate_sync(self, batches: list[BatchRawDataDTO]) -> bytes:
+        loop = asyncio.get_running_loop()
+        stream = self._open_stream(output)
+        text_output = TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            writer = csv.writer(text_output, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+            await loop.run_in_executor(
+                None, self._write_rows_sync, writer, [[field.name for field in fields(BatchRawDataDTO)]]
+            )
+
+            total = 0
+            async for batches in pages:
+                rows = [raw_data_dto_to_row(batch) for batch in batches]
+                await loop.run_in_executor(None, self._write_rows_sync, writer, rows)
+                total += len(batches)
+        finally:
+            # Файловый объект остается открытым для загрузки в хранилище
+            text_output.detach()
+
+        await loop.run_in_executor(None, self._close_stream, stream)
+
+        logger.info(f"Сгенерирован CSV файл для экспорта {total} партий")
+        return total
+
+    def _open_stream(self, output: BinaryIO) -> BinaryIO:
+        """Возвращает поток, в который записываются байты CSV (сжатые форматы оборачивают output)"""
+        return output
+
+    def _close_stream(self, stream: BinaryIO) -> None:
+        """Завершает запись в поток, не закрывая output"""
+        stream.flush()
+
+    @staticmethod
+    def _write_rows_sync(writer, rows: list[list]) -> None:
         """
-        Синхронная генерация CSV файла.
-
-        Args:
-            batches: Список партий для экспорта
-
-        Returns:
-            Байты сгенерированного CSV файла
+        Синхронная запись строк CSV файла.
 
         Raises:
             BatchExcelGenerationError: При ошибке генерации CSV
         """
         try:
-            output = StringIO()
-            writer = csv.writer(output, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL)
-
-            headers = [field.name for field in fields(BatchRawDataDTO)]
-            writer.writerow(headers)
-
-            for batch in batches:
-                row = raw_data_dto_to_row(batch)
-                writer.writerow(row)
-
-            output.seek(0)
-            result_bytes = output.getvalue().encode("utf-8-sig")
-
-            logger.info(f"Сгенерирован CSV файл для экспорта {len(batches)} партий")
-            return result_bytes
+            writer.writerows(rows)
         except Exception as e:
             logger.error(f"Ошибка генерации CSV файла для экспорта: {e}")
             raise BatchExcelGenerationError(f"Ошибка генерации CSV файла для экспорта: {e}") from e
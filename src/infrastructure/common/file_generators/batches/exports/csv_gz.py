@@ -0,0 +1,19 @@
+import gzip
+
+from typing import BinaryIO
+
+from src.infrastructure.common.file_generators.batches.exports.csv import BatchesExportCsvGenerator
+
+
+class BatchesExportCsvGzipGenerator(BatchesExportCsvGenerator):
+    """Генератор CSV файлов, сжатых gzip, для экспорта списка партий."""
+
+    # Уровень 6 (как у утилиты gzip): заметно быстрее 9 при почти том же размере файла
+    COMPRESS_LEVEL = 6
+
+    def _open_stream(self, output: BinaryIO) -> BinaryIO:
+        return gzip.GzipFile(fileobj=output, mode="wb", compresslevel=self.COMPRESS_LEVEL, mtime=0)
+
+    def _close_stream(self, stream: BinaryIO) -> None:
+        # Закрытие GzipFile дописывает контрольную сумму, но не закрывает output
+        stream.close()
@@ -0,0 +1,26 @@
+from typing import BinaryIO
+
+from src.infrastructure.common.exceptions.batches import BatchExportGenerationError
+from src.infrastructure.common.file_generators.batches.exports.csv import BatchesExportCsvGenerator
+
+try:
+    import zstandard
+except ImportError:  # Необязательная зависимость (extra export)
+    zstandard = None
+
+
+class BatchesExportCsvZstdGenerator(BatchesExportCsvGenerator):
+    """Генератор CSV файлов, сжатых zstd, для экспорта списка партий."""
+
+    COMPRESS_LEVEL = 3
+
+    def __init__(self):
+        if zstandard is None:
+            raise BatchExportGenerationError("Для экспорта в csv.zst требуется пакет zstandard")
+
+    def _open_stream(self, output: BinaryIO) -> BinaryIO:
+        return zstandard.ZstdCompressor(level=self.COMPRESS_LEVEL).stream_writer(output, closefd=False)
+
+    def _close_stream(self, stream: BinaryIO) -> None:
+        # Закрытие завершает zstd frame, но не закрывает output
+        stream.close()
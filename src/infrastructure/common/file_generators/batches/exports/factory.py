@@ -2,6 +2,9 @@ from typing import ClassVar
 
 from src.application.common.ports.file_generator import FileGeneratorProtocol
 from src.infrastructure.common.file_generators.batches.exports.csv import BatchesExportCsvGenerator
+from src.infrastructure.common.file_generators.batches.exports.csv_gz import BatchesExportCsvGzipGenerator
+from src.infrastructure.common.file_generators.batches.exports.csv_zst import BatchesExportCsvZstdGenerator
+from src.infrastructure.common.file_generators.batches.exports.parquet import BatchesExportParquetGenerator
 from src.infrastructure.common.file_generators.batches.exports.xlsx import BatchesExportExcelGenerator
 
 
@@ -13,6 +16,9 @@ class BatchesExportGeneratorFactory:
     _generators: ClassVar[dict[str, type[FileGeneratorProtocol]]] = {
         "xlsx": BatchesExportExcelGenerator,
         "csv": BatchesExportCsvGenerator,
+        "csv.gz": BatchesExportCsvGzipGenerator,
+        "csv.zst": BatchesExportCsvZstdGenerator,
+        "parquet": BatchesExportParquetGenerator,
     }
 
     @classmethod
@@ -21,13 +27,14 @@ class BatchesExportGeneratorFactory:
         Создает генератор на основе формата файла.
 
         Args:
-            file_format: Формат файла (xlsx, csv)
+            file_format: Формат файла (xlsx, csv, csv.gz, csv.zst, parquet)
 
         Returns:
             Экземпляр генератора, реализующий FileGeneratorProtocol
 
         Raises:
             ValueError: Если формат файла не поддерживается
+            BatchExportGenerationError: Если для формата не установлена необязательная зависимость
         """
         format_lower = file_format.lower().lstrip(".")
 
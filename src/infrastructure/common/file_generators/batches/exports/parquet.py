@@ -0,0 +1,132 @@
+import asyncio
+
+from collections.abc import AsyncIterable
+from dataclasses import fields
+from typing import Any, BinaryIO
+from uuid import UUID
+
+from src.application.batches.dtos.raw_data import BatchRawDataDTO
+from src.core.logging import get_logger
+from src.infrastructure.common.exceptions.batches import BatchExportGenerationError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Необязательная зависимость (extra export)
+    pa = None
+    pq = None
+
+logger = get_logger("batches.export.parquet")
+
+# Колонки с небольшим количеством различных значений; остальные хранятся без словаря
+DICTIONARY_COLUMNS = [
+    "nomenclature",
+    "ekn_code",
+    "shift",
+    "team",
+    "task_description",
+    "work_center_identifier",
+    "work_center_name",
+]
+
+
+def _arrow_type(field_name: str) -> Any:
+    """Тип колонки Parquet для поля BatchRawDataDTO"""
+    if field_name == "batch_number":
+        return pa.int64()
+    if field_name == "batch_date":
+        return pa.date32()
+    if field_name == "is_closed":
+        return pa.bool_()
+    if field_name in ("shift_start", "shift_end", "created_at", "updated_at", "closed_at"):
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+class BatchesExportParquetGenerator:
+    """
+    Генератор Apache Parquet файлов для экспорта списка партий.
+
+    Колонки типизированы (числа, даты, timestamp в UTC), повторяющиеся строковые колонки
+    хранятся со словарем, данные сжимаются zstd. Страницы накапливаются в Arrow до
+    ROW_GROUP_SIZE строк и записываются отдельными row group по мере получения.
+    """
+
+    ROW_GROUP_SIZE = 64 * 1024
+
+    def __init__(self):
+        if pa is None:
+            raise BatchExportGenerationError("Для экспорта в parquet требуется пакет pyarrow")
+        self._schema = pa.schema([(field.name, _arrow_type(field.name)) for field in fields(BatchRawDataDTO)])
+
+    async def write(self, pages: AsyncIterable[list[BatchRawDataDTO]], output: BinaryIO) -> int:
+        """
+        Потоково записывает Parquet файл со списком партий.
+
+        Args:
+            pages: Страницы партий для экспорта
+            output: Бинарный файловый объект для записи файла
+
+        Returns:
+            Количество записанных партий
+
+        Raises:
+            BatchExportGenerationError: При ошибке генерации Parquet
+        """
+        loop = asyncio.get_running_loop()
+        writer = await loop.run_in_executor(None, self._open_writer_sync, output)
+        try:
+            record_batches: list[pa.RecordBatch] = []
+            buffered = 0
+            total = 0
+            async for batches in pages:
+                record_batches.append(await loop.run_in_executor(None, self._to_record_batch_sync, batches))
+                buffered += len(batches)
+                total += len(batches)
+                if buffered >= self.ROW_GROUP_SIZE:
+                    await loop.run_in_executor(None, self._write_row_group_sync, writer, record_batches)
+                    record_batches = []
+                    buffered = 0
+
+            if record_batches:
+                await loop.run_in_executor(None, self._write_row_group_sync, writer, record_batches)
+        finally:
+            await loop.run_in_executor(None, writer.close)
+
+        logger.info(f"Сгенерирован Parquet файл для экспорта {total} партий")
+        return total
+
+    def _open_writer_sync(self, output: BinaryIO) -> "pq.ParquetWriter":
+        try:
+            return pq.ParquetWriter(
+                pa.PythonFile(output, mode="w"),
+                self._schema,
+                compression="zstd",
+                use_dictionary=DICTIONARY_COLUMNS,
+            )
+        except Exception as e:
+            logger.error(f"Ошибка генерации Parquet файла для экспорта: {e}")
+            raise BatchExportGenerationError(f"Ошибка генерации Parquet файла для экспорта: {e}") from e
+
+    def _to_record_batch_sync(self, batches: list[BatchRawDataDTO]) -> "pa.RecordBatch":
+        """Преобразует страницу партий в колонки Arrow"""
+        try:
+            columns = []
+            for field in self._schema:
+                values = [getattr(batch, field.name) for batch in batches]
+                if field.name == "uuid":
+                    values = [str(value) if isinstance(value, UUID) else value for value in values]
+                columns.append(pa.array(values, type=field.type))
+            return pa.RecordBatch.from_arrays(columns, schema=self._schema)
+        except Exception as e:
+            logger.error(f"Ошибка генерации Parquet файла для экспорта: {e}")
+            raise BatchExportGenerationError(f"Ошибка генерации Parquet файла для экспорта: {e}") from e
+
+    def _write_row_group_sync(self, writer: "pq.ParquetWriter", record_batches: list["pa.RecordBatch"]) -> None:
+        """Записывает накопленные страницы одной row group"""
+        try:
+            table = pa.Table.from_batches(record_batches, schema=self._schema)
+            writer.write_table(table, row_group_size=table.num_rows)
+        except Exception as e:
+            logger.error(f"Ошибка генерации Parquet файла для экспорта: {e}")
+            raise BatchExportGenerationError(f"Ошибка генерации Parquet файла для экспорта: {e}") from e
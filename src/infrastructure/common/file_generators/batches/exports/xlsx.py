@@ -1,8 +1,8 @@
 import asyncio
 
+from collections.abc import AsyncIterable
 from dataclasses import fields
-from functools import partial
-from io import BytesIO
+from typing import BinaryIO
 
 from openpyxl import Workbook
 
@@ -17,60 +17,66 @@ logger = get_logger("batches.export.xlsx")
 class BatchesExportExcelGenerator:
     """Генератор Excel файлов для экспорта списка партий."""
 
-    async def generate(self, raw_data: list[BatchRawDataDTO]) -> bytes:
+    async def write(self, pages: AsyncIterable[list[BatchRawDataDTO]], output: BinaryIO) -> int:
         """
-        Генерирует Excel файл со списком партий.
+        Потоково записывает Excel файл со списком партий.
+
+        Книга открывается в режиме write_only: строки листа сразу сериализуются
+        во временный файл openpyxl, и в памяти не накапливаются ячейки всего листа.
 
         Args:
-            raw_data: Список партий для экспорта
+            pages: Страницы партий для экспорта
+            output: Бинарный файловый объект для записи файла
 
         Returns:
-            Байты сгенерированного Excel файла
+            Количество записанных партий
 
         Raises:
             BatchExcelGenerationError: При ошибке генерации Excel
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, partial(self._generate_sync, raw_data))
-
-    def _generate_sync(self, batches: list[BatchRawDataDTO]) -> bytes:
+        loop = asyncio.get_running_loop()
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        await loop.run_in_executor(
+            None, self._append_rows_sync, ws, [[field.name for field in fields(BatchRawDataDTO)]]
+        )
+
+        total = 0
+        async for batches in pages:
+            rows = [raw_data_dto_to_row(batch) for batch in batches]
+            await loop.run_in_executor(None, self._append_rows_sync, ws, rows)
+            total += len(batches)
+
+        await loop.run_in_executor(None, self._save_sync, wb, output)
+
+        logger.info(f"Сгенерирован Excel файл для экспорта {total} партий")
+        return total
+
+    @staticmethod
+    def _append_rows_sync(ws, rows: list[list]) -> None:
         """
-        Синхронная генерация Excel файла.
-
-        Args:
-            batches: Список партий для экспорта
-
-        Returns:
-            Байты сгенерированного Excel файла
+        Синхронная запись строк листа.
 
         Raises:
             BatchExcelGenerationError: При ошибке генерации Excel
         """
         try:
-            wb = Workbook()
-            ws = wb.active
-
-            headers = [field.name for field in fields(BatchRawDataDTO)]
-
-            for col_idx, header in enumerate(headers, start=1):
-                cell = ws.cell(row=1, column=col_idx)
-                cell.value = header
-
-            row = 2
-            for batch in batches:
-                row_values = raw_data_dto_to_row(batch)
-                for col_idx, value in enumerate(row_values, start=1):
-                    ws.cell(row=row, column=col_idx).value = value
-                row += 1
-
-            buffer = BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
+            for row in rows:
+                ws.append(row)
+        except Exception as e:
+            logger.error(f"Ошибка генерации Excel файла для экспорта: {e}")
+            raise BatchExcelGenerationError(f"Ошибка генерации Excel файла для экспорта: {e}") from e
 
-            result_bytes = buffer.getvalue()
+    @staticmethod
+    def _save_sync(wb: Workbook, output: BinaryIO) -> None:
+        """
+        Синхронное сохранение книги в output.
 
-            logger.info(f"Сгенерирован Excel файл для экспорта {len(batches)} партий")
-            return result_bytes
+        Raises:
+            BatchExcelGenerationError: При ошибке генерации Excel
+        """
+        try:
+            wb.save(output)
         except Exception as e:
             logger.error(f"Ошибка генерации Excel файла для экспорта: {e}")
             raise BatchExcelGenerationError(f"Ошибка генерации Excel файла для экспорта: {e}") from e
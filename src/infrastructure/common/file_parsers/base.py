@@ -0,0 +1,33 @@
+import asyncio
+
+from collections.abc import AsyncIterator, Generator
+from itertools import islice
+from typing import Any
+
+
+async def iterate_in_chunks(rows: Generator[dict[str, Any]], chunk_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Читает строки из синхронного генератора порциями в отдельном потоке.
+
+    Генератор продвигается только при запросе следующей порции, поэтому чтение файла
+    не опережает обработку. При досрочном завершении итерации генератор закрывается,
+    освобождая ресурсы парсера (файл, книгу XLSX).
+
+    Args:
+        rows: Генератор строк файла
+        chunk_size: Максимальное количество строк в порции
+
+    Yields:
+        Непустые порции строк
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    try:
+        while True:
+            chunk = await asyncio.to_thread(lambda: list(islice(rows, chunk_size)))
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        rows.close()
@@ -1,10 +1,13 @@
 import asyncio
 import csv
 
+from collections.abc import AsyncIterator, Generator
 from io import BytesIO, TextIOWrapper
+from typing import BinaryIO
 
 from src.application.common.exceptions.file_parser import FileParseError
 from src.application.common.ports.file_parser import FileParserProtocol
+from src.infrastructure.common.file_parsers.base import iterate_in_chunks
 
 
 class CsvFileParser(FileParserProtocol):
@@ -47,6 +50,26 @@ class CsvFileParser(FileParserProtocol):
         except Exception as e:
             raise FileParseError(f"Ошибка парсинга CSV файла: {e}") from e
 
+    async def parse_stream(self, file: BinaryIO, chunk_size: int = 1000) -> AsyncIterator[list[dict[str, str]]]:
+        """
+        Потоково парсит CSV файл порциями по chunk_size строк.
+
+        Файл читается построчно через буфер TextIOWrapper; сам файловый объект
+        не закрывается, за его жизненный цикл отвечает вызывающий код.
+
+        Args:
+            file: Бинарный файловый объект CSV
+            chunk_size: Максимальное количество строк в порции
+
+        Yields:
+            Порции словарей с данными
+
+        Raises:
+            FileParseError: При ошибке парсинга файла
+        """
+        async for chunk in iterate_in_chunks(self._iter_rows(file), chunk_size):
+            yield chunk
+
     def _parse_sync(self, file_data: bytes) -> list[dict[str, str]]:
         """
         Синхронный метод парсинга CSV файла.
@@ -60,21 +83,30 @@ class CsvFileParser(FileParserProtocol):
         Raises:
             FileParseError: При ошибке парсинга
         """
-        try:
-            file_stream = BytesIO(file_data)
-            text_stream = TextIOWrapper(file_stream, encoding=self._encoding)
+        return list(self._iter_rows(BytesIO(file_data)))
 
+    def _iter_rows(self, file: BinaryIO) -> Generator[dict[str, str]]:
+        """
+        Лениво читает строки CSV файла, пропуская пустые.
+
+        Args:
+            file: Бинарный файловый объект CSV
+
+        Yields:
+            Словари с данными строки
+
+        Raises:
+            FileParseError: При ошибке парсинга
+        """
+        text_stream = TextIOWrapper(file, encoding=self._encoding, newline="")
+        try:
             reader = csv.DictReader(text_stream, delimiter=self._delimiter)
 
-            result = []
             for row in reader:
                 if not row or all(not value for value in row.values()):
                     continue
 
-                result.append(dict(row))
-
-            text_stream.close()
-            return result
+                yield dict(row)
 
         except UnicodeDecodeError as e:
             raise FileParseError(f"Ошибка декодирования CSV файла (кодировка: {self._encoding}): {e}") from e
@@ -82,3 +114,6 @@ class CsvFileParser(FileParserProtocol):
             raise FileParseError(f"Ошибка парсинга CSV файла: {e}") from e
         except Exception as e:
             raise FileParseError(f"Ошибка чтения CSV файла: {e}") from e
+        finally:
+            # Отсоединяем обертку, чтобы не закрыть исходный файловый объект
+            text_stream.detach()
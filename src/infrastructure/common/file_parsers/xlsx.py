@@ -1,12 +1,14 @@
 import asyncio
 
+from collections.abc import AsyncIterator, Generator
 from io import BytesIO
-from typing import Any
+from typing import Any, BinaryIO
 
 from openpyxl import load_workbook
 
 from src.application.common.exceptions.file_parser import FileParseError
 from src.application.common.ports.file_parser import FileParserProtocol
+from src.infrastructure.common.file_parsers.base import iterate_in_chunks
 
 
 class XlsxFileParser(FileParserProtocol):
@@ -38,6 +40,26 @@ class XlsxFileParser(FileParserProtocol):
         except Exception as e:
             raise FileParseError(f"Ошибка парсинга XLSX файла: {e}") from e
 
+    async def parse_stream(self, file: BinaryIO, chunk_size: int = 1000) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Потоково парсит XLSX файл порциями по chunk_size строк.
+
+        Книга открывается в режиме read_only: openpyxl читает XML листа из архива
+        по мере итерации, не загружая лист целиком.
+
+        Args:
+            file: Бинарный файловый объект XLSX (должен поддерживать seek)
+            chunk_size: Максимальное количество строк в порции
+
+        Yields:
+            Порции словарей с данными
+
+        Raises:
+            FileParseError: При ошибке парсинга файла
+        """
+        async for chunk in iterate_in_chunks(self._iter_rows(file), chunk_size):
+            yield chunk
+
     def _parse_sync(self, file_data: bytes) -> list[dict[str, Any]]:
         """
         Синхронный метод парсинга XLSX файла.
@@ -48,49 +70,53 @@ class XlsxFileParser(FileParserProtocol):
         Returns:
             Список словарей с данными
 
+        Raises:
+            FileParseError: При ошибке парсинга
+        """
+        return list(self._iter_rows(BytesIO(file_data)))
+
+    def _iter_rows(self, file: BinaryIO) -> Generator[dict[str, Any]]:
+        """
+        Лениво читает строки активного листа, пропуская пустые.
+
+        Args:
+            file: Бинарный файловый объект XLSX
+
+        Yields:
+            Словари с данными строки; ключи - значения из первой строки (заголовки)
+
         Raises:
             FileParseError: При ошибке парсинга
         """
         try:
-            file_stream = BytesIO(file_data)
-            workbook = load_workbook(file_stream, read_only=True, data_only=True)
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception as e:
+            raise FileParseError(f"Ошибка чтения XLSX файла: {e}") from e
 
+        try:
             if not workbook.sheetnames:
-                workbook.close()
                 raise FileParseError("XLSX файл не содержит листов")
 
-            worksheet = workbook.active
-
-            rows = list(worksheet.iter_rows(values_only=True))
+            rows = workbook.active.iter_rows(values_only=True)
 
-            if not rows:
-                workbook.close()
-                return []
+            header_row = next(rows, None)
+            if header_row is None:
+                return
 
-            headers = [str(cell) if cell is not None else "" for cell in rows[0]]
+            headers = [str(cell) if cell is not None else "" for cell in header_row]
 
             if not headers or all(not header for header in headers):
-                workbook.close()
                 raise FileParseError("XLSX файл не содержит заголовков в первой строке")
 
-            data_rows = rows[1:]
-
-            result = []
-            for row in data_rows:
+            for row in rows:
                 if all(cell is None for cell in row):
                     continue
 
-                row_dict = {}
-                for idx, header in enumerate(headers):
-                    value = row[idx] if idx < len(row) else None
-                    row_dict[header] = value
-
-                result.append(row_dict)
-
-            workbook.close()
-            return result
+                yield {header: row[idx] if idx < len(row) else None for idx, header in enumerate(headers)}
 
         except FileParseError:
             raise
         except Exception as e:
             raise FileParseError(f"Ошибка чтения XLSX файла: {e}") from e
+        finally:
+            workbook.close()
@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from io import BytesIO
 from pathlib import Path
+from typing import BinaryIO
 
 from minio import Minio
 from minio.error import S3Error
@@ -22,6 +23,12 @@ from src.infrastructure.common.storage.utils import get_content_type
 
 logger = get_logger("storage.minio")
 
+# Размер части multipart загрузки потока неизвестной длины (минимум S3 — 5 МиБ)
+STREAM_PART_SIZE = 10 * 1024 * 1024
+
+# Размер блока при потоковом скачивании объекта
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class MinIOStorageServiceImpl(StorageServiceProtocol):
     """Сервис для работы с MinIO хранилищем."""
@@ -120,6 +127,58 @@ class MinIOStorageServiceImpl(StorageServiceProtocol):
             logger.error(f"Failed to upload file {object_name}: {e}")
             raise StorageUploadError(f"Failed to upload file {object_name}: {e}") from e
 
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_name: str,
+        stream: BinaryIO,
+        file_extension: str | None = None,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Загружает файл неизвестного размера из потока multipart загрузкой.
+
+        MinIO клиент читает поток частями по STREAM_PART_SIZE и загружает каждую часть
+        отдельным запросом, поэтому в памяти находится не больше одной части.
+
+        Args:
+            bucket_name: Имя bucket'а в хранилище
+            object_name: Имя объекта в хранилище
+            stream: Бинарный поток с данными файла, читается с текущей позиции до конца
+            file_extension: Расширение файла (например, pdf или .pdf, xlsx или .xlsx, etc.)
+            content_type: MIME-тип файла (если None, определяется по расширению)
+            metadata: Метаданные объекта
+
+        Returns:
+            Путь к загруженному объекту
+
+        Raises:
+            StorageUploadError: При ошибке загрузки
+        """
+        try:
+            if content_type is None:
+                if file_extension is None:
+                    file_extension = Path(object_name).suffix
+                content_type = get_content_type(file_extension)
+
+            result = await asyncio.to_thread(
+                self._client.put_object,
+                bucket_name,
+                object_name,
+                stream,
+                -1,
+                content_type=content_type,
+                metadata=metadata,
+                part_size=STREAM_PART_SIZE,
+            )
+
+            logger.info(f"Uploaded file stream: {object_name} (etag: {result.etag})")
+            return object_name
+        except S3Error as e:
+            logger.error(f"Failed to upload file stream {object_name}: {e}")
+            raise StorageUploadError(f"Failed to upload file {object_name}: {e}") from e
+
     async def download_file(self, bucket_name: str, object_name: str) -> bytes:
         """
         Скачивает файл из хранилища.
@@ -156,6 +215,46 @@ class MinIOStorageServiceImpl(StorageServiceProtocol):
             logger.error(f"Failed to download file {object_name}: {e}")
             raise StorageDownloadError(f"Failed to download file {object_name}: {e}") from e
 
+    async def download_to_file(self, bucket_name: str, object_name: str, destination: BinaryIO) -> int:
+        """
+        Потоково скачивает файл из хранилища в файловый объект блоками по STREAM_CHUNK_SIZE.
+
+        Args:
+            bucket_name: Имя bucket'а в хранилище
+            object_name: Имя объекта в хранилище
+            destination: Бинарный файловый объект для записи (позиция после записи не сбрасывается)
+
+        Returns:
+            Количество записанных байт
+
+        Raises:
+            StorageDownloadError: При ошибке скачивания
+            StorageNotFoundError: Если файл не найден
+        """
+        try:
+            size = await asyncio.to_thread(self._download_to_file_sync, bucket_name, object_name, destination)
+            logger.info(f"Downloaded file: {object_name} ({size} bytes)")
+            return size
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                logger.warning(f"File not found: {object_name}")
+                raise StorageNotFoundError(f"File not found: {object_name}") from e
+            logger.error(f"Failed to download file {object_name}: {e}")
+            raise StorageDownloadError(f"Failed to download file {object_name}: {e}") from e
+
+    def _download_to_file_sync(self, bucket_name: str, object_name: str, destination: BinaryIO) -> int:
+        """Синхронно копирует объект в файловый объект, не держа его в памяти целиком."""
+        response = self._client.get_object(bucket_name, object_name)
+        try:
+            size = 0
+            for chunk in response.stream(STREAM_CHUNK_SIZE):
+                destination.write(chunk)
+                size += len(chunk)
+            return size
+        finally:
+            response.close()
+            response.release_conn()
+
     async def delete_file(self, bucket_name: str, object_name: str) -> None:
         """
         Удаляет файл из хранилища.
@@ -19,6 +19,9 @@ def get_content_type(file_extension: str | None = None) -> str:
         ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         ".xls": "application/vnd.ms-excel",
         ".csv": "text/csv",
+        ".csv.gz": "application/gzip",
+        ".csv.zst": "application/zstd",
+        ".parquet": "application/vnd.apache.parquet",
         ".pdf": "application/pdf",
         ".json": "application/json",
     }
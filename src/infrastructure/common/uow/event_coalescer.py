@@ -0,0 +1,145 @@
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from src.domain.batches.events import (
+    ProductAddedToBatchEvent,
+    ProductRemovedFromBatchEvent,
+    ProductsAddedToBatchEvent,
+    ProductsRemovedFromBatchEvent,
+)
+from src.domain.common.events import DomainEvent
+from src.domain.products.events import ProductAggregatedEvent, ProductsAggregatedEvent
+
+
+@dataclass(frozen=True)
+class _CoalescingRule:
+    """Правило объединения: ключ группы и сборка объединенного события (v2) из группы событий v1"""
+
+    group_key: Callable[[DomainEvent], Hashable]
+    merge: Callable[[list[DomainEvent]], DomainEvent]
+    expand: Callable[[DomainEvent], list[DomainEvent]]
+
+
+_RULES: dict[type[DomainEvent], _CoalescingRule] = {
+    ProductAddedToBatchEvent: _CoalescingRule(
+        group_key=lambda event: event.batch_id,
+        merge=lambda events: ProductsAddedToBatchEvent(
+            aggregate_id=events[0].batch_id,
+            occurred_at=events[-1].occurred_at,
+            batch_id=events[0].batch_id,
+            product_ids=tuple(event.product_id for event in events),
+        ),
+        expand=lambda event: [
+            ProductAddedToBatchEvent(
+                aggregate_id=event.aggregate_id,
+                occurred_at=event.occurred_at,
+                product_id=product_id,
+                batch_id=event.batch_id,
+            )
+            for product_id in event.product_ids
+        ],
+    ),
+    ProductRemovedFromBatchEvent: _CoalescingRule(
+        group_key=lambda event: event.batch_id,
+        merge=lambda events: ProductsRemovedFromBatchEvent(
+            aggregate_id=events[0].batch_id,
+            occurred_at=events[-1].occurred_at,
+            batch_id=events[0].batch_id,
+            product_ids=tuple(event.product_id for event in events),
+        ),
+        expand=lambda event: [
+            ProductRemovedFromBatchEvent(
+                aggregate_id=event.aggregate_id,
+                occurred_at=event.occurred_at,
+                product_id=product_id,
+                batch_id=event.batch_id,
+            )
+            for product_id in event.product_ids
+        ],
+    ),
+    # aggregate_id у ProductAggregatedEvent — продукт, поэтому группируем по партии и времени агрегации
+    ProductAggregatedEvent: _CoalescingRule(
+        group_key=lambda event: (event.batch_id, event.aggregated_at),
+        merge=lambda events: ProductsAggregatedEvent(
+            aggregate_id=events[0].batch_id,
+            occurred_at=events[-1].occurred_at,
+            batch_id=events[0].batch_id,
+            product_ids=tuple(event.product_id for event in events),
+            aggregated_at=events[0].aggregated_at,
+        ),
+        expand=lambda event: [
+            ProductAggregatedEvent(
+                aggregate_id=product_id,
+                occurred_at=event.occurred_at,
+                product_id=product_id,
+                batch_id=event.batch_id,
+                aggregated_at=event.aggregated_at,
+            )
+            for product_id in event.product_ids
+        ],
+    ),
+}
+
+_MERGED_TYPES: dict[type[DomainEvent], _CoalescingRule] = {
+    ProductsAddedToBatchEvent: _RULES[ProductAddedToBatchEvent],
+    ProductsRemovedFromBatchEvent: _RULES[ProductRemovedFromBatchEvent],
+    ProductsAggregatedEvent: _RULES[ProductAggregatedEvent],
+}
+
+
+class EventCoalescer:
+    """
+    Объединяет однотипные события по продуктам одной партии в одно событие v2.
+
+    Группа — непрерывная серия событий одного типа с одинаковым ключом: любое другое
+    событие между ними завершает серию, поэтому чередующиеся добавления и удаления
+    продукта не переставляются. Серия объединяется, только если в ней не меньше
+    min_events событий: одиночные изменения через API по-прежнему публикуются как v1.
+    Объединенное событие занимает место серии, порядок событий сохраняется.
+    """
+
+    def __init__(self, min_events: int) -> None:
+        self._min_events = min_events
+
+    def coalesce(self, events: list[DomainEvent]) -> list[DomainEvent]:
+        """Возвращает новый список событий с объединенными сериями"""
+        result: list[DomainEvent] = []
+        run: list[DomainEvent] = []
+        run_key: tuple[type[DomainEvent], Hashable] | None = None
+
+        for event in events:
+            rule = _RULES.get(type(event))
+            key = (type(event), rule.group_key(event)) if rule is not None else None
+            if run and key != run_key:
+                result.extend(self._merge_run(run_key, run))
+                run = []
+            if key is None:
+                result.append(event)
+            else:
+                run.append(event)
+                run_key = key
+
+        if run:
+            result.extend(self._merge_run(run_key, run))
+        return result
+
+    def _merge_run(
+        self,
+        run_key: tuple[type[DomainEvent], Hashable],
+        run: list[DomainEvent],
+    ) -> list[DomainEvent]:
+        """Объединяет серию, если она достаточно длинная, иначе возвращает её как есть"""
+        if len(run) < self._min_events:
+            return run
+        return [_RULES[run_key[0]].merge(run)]
+
+    @staticmethod
+    def expand(event: DomainEvent) -> list[DomainEvent]:
+        """
+        Разворачивает объединенное событие v2 обратно в события v1 для потребителей,
+        которые работают только с v1. Прочие события возвращаются как есть.
+        """
+        rule = _MERGED_TYPES.get(type(event))
+        if rule is None:
+            return [event]
+        return rule.expand(event)
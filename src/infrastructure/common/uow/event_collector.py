@@ -1,9 +1,10 @@
+from collections.abc import Mapping
 from uuid import UUID, uuid4
 
 from src.core.time import datetime_aware_to_naive, datetime_now
 from src.domain.common.events import DomainEvent
+from src.infrastructure.common.uow.event_coalescer import EventCoalescer
 from src.infrastructure.common.uow.identity_map import IdentityMap
-from src.infrastructure.persistence.models.event_type import EventType
 from src.infrastructure.persistence.models.outbox_event import OutboxEvent, OutboxEventStatusEnum
 
 
@@ -24,10 +25,12 @@ class EventCollector:
     Собирает доменные события из отслеживаемых агрегатов и преобразует их в OutboxEvent.
     Работает совместно с IdentityMap для извлечения событий из всех агрегатов в рамках UOW.
     Поддерживает регистрацию standalone событий (события вне доменных сущностей).
+    При переданном coalescer объединяет события по продуктам одной партии в события v2.
     """
 
-    def __init__(self, identity_map: IdentityMap) -> None:
+    def __init__(self, identity_map: IdentityMap, coalescer: EventCoalescer | None = None) -> None:
         self._identity_map = identity_map
+        self._coalescer = coalescer
         self._standalone_events: list[DomainEvent] = []
 
     def register_event(self, event: DomainEvent) -> None:
@@ -37,25 +40,36 @@ class EventCollector:
         """
         self._standalone_events.append(event)
 
-    def collect_events(self, event_types: list[EventType]) -> list[OutboxEvent]:
+    def get_pending_events(self) -> list[DomainEvent]:
         """
-        Собирает все доменные события из tracked агрегатов и standalone событий,
-        преобразует в OutboxEvent.
-        События НЕ очищаются здесь - это делается после успешного commit.
+        Возвращает все несохраненные доменные события из tracked агрегатов и standalone события
+        (после объединения, если оно включено).
         """
-        outbox_events: list[OutboxEvent] = []
+        pending_events: list[DomainEvent] = []
 
         for entity in self._identity_map.get_all():
-            domain_events = entity.get_domain_events()
-            for domain_event in domain_events:
-                outbox_event = self._convert_to_outbox(domain_event, event_types)
-                outbox_events.append(outbox_event)
+            pending_events.extend(entity.get_domain_events())
+
+        pending_events.extend(self._standalone_events)
+
+        if self._coalescer is not None:
+            return self._coalescer.coalesce(pending_events)
+        return pending_events
 
-        for standalone_event in self._standalone_events:
-            outbox_event = self._convert_to_outbox(standalone_event, event_types)
-            outbox_events.append(outbox_event)
+    def collect_events(
+        self,
+        domain_events: list[DomainEvent],
+        event_type_ids: Mapping[tuple[str, int], UUID],
+    ) -> list[OutboxEvent]:
+        """
+        Преобразует доменные события (см. get_pending_events) в OutboxEvent.
+        События НЕ очищаются здесь - это делается после успешного commit.
 
-        return outbox_events
+        Args:
+            domain_events: Доменные события
+            event_type_ids: Отображение (event_name, event_version) -> uuid типа события
+        """
+        return [self._convert_to_outbox(domain_event, event_type_ids) for domain_event in domain_events]
 
     def clear_events(self) -> None:
         """
@@ -67,7 +81,7 @@ class EventCollector:
 
         self._standalone_events.clear()
 
-    def _convert_to_outbox(self, event: DomainEvent, event_types: list[EventType]) -> OutboxEvent:
+    def _convert_to_outbox(self, event: DomainEvent, event_type_ids: Mapping[tuple[str, int], UUID]) -> OutboxEvent:
         """Преобразует доменное событие в OutboxEvent для сохранения в БД"""
         from src.infrastructure.events.serializer import EventSerializer
 
@@ -75,8 +89,7 @@ class EventCollector:
 
         dedup_key = generate_dedup_key(event)
 
-        event_type_map: dict[str, UUID] = {event_type.name: event_type.uuid for event_type in event_types}
-        event_type_id = event_type_map[serialized["event_name"]]
+        event_type_id = event_type_ids[(serialized["event_name"], serialized["event_version"])]
 
         return OutboxEvent(
             uuid=uuid4(),
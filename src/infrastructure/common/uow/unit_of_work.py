@@ -5,16 +5,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.common.uow.interfaces import UnitOfWorkProtocol
 from src.core.logging import get_logger
+from src.core.settings import OutboxSettings
 from src.domain.batches.interfaces.repository import BatchRepositoryProtocol
 from src.domain.common.events import DomainEvent
 from src.domain.products.interfaces.repository import ProductRepositoryProtocol
 from src.domain.webhooks.interfaces.delivery import WebhookDeliveryRepositoryProtocol
 from src.domain.webhooks.interfaces.subscription import WebhookSubscriptionRepositoryProtocol
 from src.domain.work_centers.interfaces.repository import WorkCenterRepositoryProtocol
+from src.infrastructure.common.uow.event_coalescer import EventCoalescer
 from src.infrastructure.common.uow.event_collector import EventCollector
 from src.infrastructure.common.uow.identity_map import IdentityMap
+from src.infrastructure.events.registry import EventRegistry
+from src.infrastructure.events.type_cache import EventTypeCache
 from src.infrastructure.persistence.repositories.batches import BatchRepository
-from src.infrastructure.persistence.repositories.event_type import EventTypeRepository
 from src.infrastructure.persistence.repositories.outbox import OutboxRepository
 from src.infrastructure.persistence.repositories.products import ProductRepository
 from src.infrastructure.persistence.repositories.webhooks.delivery import WebhookDeliveryRepository
@@ -23,6 +26,8 @@ from src.infrastructure.persistence.repositories.work_centers import WorkCenterR
 
 logger = get_logger("uow")
 
+outbox_settings = OutboxSettings()
+
 
 class SqlAlchemyUnitOfWork(UnitOfWorkProtocol):
     """
@@ -43,8 +48,9 @@ class SqlAlchemyUnitOfWork(UnitOfWorkProtocol):
         self._manual_commit = manual_commit
 
         self._identity_map = IdentityMap()
-        self._event_collector = EventCollector(self._identity_map)
-        self._outbox_repository = OutboxRepository(session)
+        coalescer = EventCoalescer(outbox_settings.coalesce_min_events) if outbox_settings.coalesce_events else None
+        self._event_collector = EventCollector(self._identity_map, coalescer)
+        self._outbox_repository = OutboxRepository(session, bulk_insert_threshold=outbox_settings.bulk_insert_threshold)
 
         self._batch_repo = BatchRepository(session)
         self._product_repo = ProductRepository(session)
@@ -52,8 +58,6 @@ class SqlAlchemyUnitOfWork(UnitOfWorkProtocol):
         self._webhook_subscription_repo = WebhookSubscriptionRepository(session)
         self._webhook_delivery_repo = WebhookDeliveryRepository(session)
 
-        self._event_type_repository = EventTypeRepository(session)
-
     @property
     def batches(self) -> BatchRepositoryProtocol:
         """Proxy репозиторий для партий с трекингом агрегатов"""
@@ -120,11 +124,13 @@ class SqlAlchemyUnitOfWork(UnitOfWorkProtocol):
         """
         await self._session.flush()
 
-        event_types = await self._event_type_repository.list()
+        domain_events = self._event_collector.get_pending_events()
 
-        outbox_events = self._event_collector.collect_events(event_types)
+        if domain_events:
+            event_keys = {EventRegistry.get_event_metadata(type(event)) for event in domain_events}
+            event_type_ids = await EventTypeCache.get_ids(self._session, event_keys)
+            outbox_events = self._event_collector.collect_events(domain_events, event_type_ids)
 
-        if outbox_events:
             logger.info(f"Collected {len(outbox_events)} domain event(s)")
             for event in outbox_events:
                 logger.debug(f"Event: {event.event_name} v{event.event_version} aggregate_id={event.aggregate_id}")
@@ -150,8 +156,8 @@ class _TrackedRepositoryWrapper:
     """
     Wrapper для автоматического трекинга сущностей в IdentityMap.
 
-    Критично: для create/update добавляет исходную сущность ДО вызова репозитория,
-    чтобы сохранить доменные события, которые теряются при преобразовании через to_domain_entity().
+    Критично: для create/update (и create_many/update_many) добавляет исходные сущности ДО вызова
+    репозитория, чтобы сохранить доменные события, которые теряются при преобразовании через to_domain_entity().
     """
 
     def __init__(self, repository, identity_map: IdentityMap):
@@ -170,11 +176,14 @@ class _TrackedRepositoryWrapper:
                 entity = args[0]
                 if hasattr(entity, "uuid"):
                     self._identity_map.add(entity)
+            elif name in ("create_many", "update_many") and args:
+                for entity in args[0]:
+                    self._identity_map.add(entity)
 
             result = await attr(*args, **kwargs)
 
             # Для остальных методов добавляем результат ПОСЛЕ вызова
-            if name not in ("create", "update"):
+            if name not in ("create", "update", "create_many", "update_many"):
                 if hasattr(result, "uuid"):
                     self._identity_map.add(result)
                 elif isinstance(result, list):
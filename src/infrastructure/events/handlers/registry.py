@@ -10,9 +10,12 @@ from src.domain.batches.events import (
     BatchUpdatedEvent,
     ProductAddedToBatchEvent,
     ProductRemovedFromBatchEvent,
+    ProductsAddedToBatchEvent,
+    ProductsRemovedFromBatchEvent,
 )
 from src.domain.common.events import DomainEvent
-from src.domain.work_centers.events import WorkCenterDeletedEvent
+from src.domain.products.events import ProductAggregatedEvent, ProductsAggregatedEvent
+from src.domain.work_centers.events import WorkCenterDeletedEvent, WorkCenterUpdatedEvent
 
 T = TypeVar("T", bound=DomainEvent)
 
@@ -65,6 +68,7 @@ def _initialize_registry() -> None:
     """Инициализирует реестр всех обработчиков событий системы"""
     EventHandlerRegistry.register(BatchClosedEvent, BatchReportGenerationHandler)
 
+    EventHandlerRegistry.register(WorkCenterUpdatedEvent, BatchCacheInvalidationHandler)
     EventHandlerRegistry.register(WorkCenterDeletedEvent, BatchCacheInvalidationHandler)
     EventHandlerRegistry.register(BatchCreatedEvent, BatchCacheInvalidationHandler)
     EventHandlerRegistry.register(BatchUpdatedEvent, BatchCacheInvalidationHandler)
@@ -74,6 +78,10 @@ def _initialize_registry() -> None:
     EventHandlerRegistry.register(BatchAggregatedEvent, BatchCacheInvalidationHandler)
     EventHandlerRegistry.register(ProductAddedToBatchEvent, BatchCacheInvalidationHandler)
     EventHandlerRegistry.register(ProductRemovedFromBatchEvent, BatchCacheInvalidationHandler)
+    EventHandlerRegistry.register(ProductsAddedToBatchEvent, BatchCacheInvalidationHandler)
+    EventHandlerRegistry.register(ProductsRemovedFromBatchEvent, BatchCacheInvalidationHandler)
+    EventHandlerRegistry.register(ProductAggregatedEvent, BatchCacheInvalidationHandler)
+    EventHandlerRegistry.register(ProductsAggregatedEvent, BatchCacheInvalidationHandler)
 
 
 _initialize_registry()
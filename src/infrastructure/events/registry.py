@@ -9,13 +9,15 @@ from src.domain.batches.events import (
     BatchUpdatedEvent,
     ProductAddedToBatchEvent,
     ProductRemovedFromBatchEvent,
+    ProductsAddedToBatchEvent,
+    ProductsRemovedFromBatchEvent,
 )
 from src.domain.batches.events.import_completed import BatchesImportCompletedEvent
 from src.domain.batches.events.report_generated import ReportGeneratedEvent
 from src.domain.common.enums import EventTypesEnum
 from src.domain.common.events import DomainEvent
-from src.domain.products.events import ProductAggregatedEvent
-from src.domain.work_centers.events import WorkCenterDeletedEvent
+from src.domain.products.events import ProductAggregatedEvent, ProductsAggregatedEvent
+from src.domain.work_centers.events import WorkCenterDeletedEvent, WorkCenterUpdatedEvent
 
 T = TypeVar("T", bound=DomainEvent)
 
@@ -82,8 +84,14 @@ def _initialize_registry() -> None:
     EventRegistry.register(EventTypesEnum.BATCH_DELETED, 1, BatchDeletedEvent)
     EventRegistry.register(EventTypesEnum.BATCH_REPORT_GENERATED, 1, ReportGeneratedEvent)
     EventRegistry.register(EventTypesEnum.PRODUCT_AGGREGATED, 1, ProductAggregatedEvent)
+    EventRegistry.register(EventTypesEnum.WORK_CENTER_UPDATED, 1, WorkCenterUpdatedEvent)
     EventRegistry.register(EventTypesEnum.WORK_CENTER_DELETED, 1, WorkCenterDeletedEvent)
     EventRegistry.register(EventTypesEnum.BATCH_IMPORT_COMPLETED, 1, BatchesImportCompletedEvent)
 
+    # v2: объединенные события по продуктам (см. EventCoalescer)
+    EventRegistry.register(EventTypesEnum.BATCH_PRODUCT_ADDED, 2, ProductsAddedToBatchEvent)
+    EventRegistry.register(EventTypesEnum.BATCH_PRODUCT_REMOVED, 2, ProductsRemovedFromBatchEvent)
+    EventRegistry.register(EventTypesEnum.PRODUCT_AGGREGATED, 2, ProductsAggregatedEvent)
+
 
 _initialize_registry()
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging import get_logger
 from src.infrastructure.events.registry import EventRegistry
+from src.infrastructure.events.type_cache import EventTypeCache
 from src.infrastructure.persistence.repositories.event_type import EventTypeRepository
 
 logger = get_logger("events.sync")
@@ -31,3 +32,5 @@ class EventTypeSyncService:
                 raise
 
         await self._session.commit()
+
+        await EventTypeCache.load(self._session)
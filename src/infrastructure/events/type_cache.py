@@ -0,0 +1,73 @@
+import time
+
+from collections.abc import Iterable
+from typing import ClassVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.logging import get_logger
+from src.core.settings import EventTypeCacheSettings
+from src.infrastructure.persistence.repositories.event_type import EventTypeRepository
+
+logger = get_logger("events.type_cache")
+
+
+class EventTypeCache:
+    """
+    Процессный кэш реестра типов событий: (event_name, event_version) -> uuid в event_types.
+
+    Заполняется после EventTypeSyncService.sync() при старте API и Celery worker,
+    перечитывается из БД по истечении TTL или при запросе неизвестного типа
+    (например, тип добавлен другим процессом). Каждая перезагрузка увеличивает версию кэша.
+    """
+
+    _ids: ClassVar[dict[tuple[str, int], UUID]] = {}
+    _version: ClassVar[int] = 0
+    _loaded_at: ClassVar[float | None] = None
+    _ttl: ClassVar[int] = EventTypeCacheSettings().ttl
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> None:
+        """Перечитывает все типы событий из БД"""
+        event_types = await EventTypeRepository(session).list()
+        cls._ids = {(event_type.name, event_type.version): event_type.uuid for event_type in event_types}
+        cls._version += 1
+        cls._loaded_at = time.monotonic()
+        logger.debug(f"Event type cache loaded: {len(cls._ids)} type(s), version={cls._version}")
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Помечает кэш устаревшим; следующий запрос перечитает его из БД"""
+        cls._loaded_at = None
+
+    @classmethod
+    def version(cls) -> int:
+        """Версия кэша, увеличивается при каждой перезагрузке"""
+        return cls._version
+
+    @classmethod
+    def is_stale(cls) -> bool:
+        """Проверяет, нужно ли перечитать кэш"""
+        return cls._loaded_at is None or time.monotonic() - cls._loaded_at >= cls._ttl
+
+    @classmethod
+    async def get_ids(cls, session: AsyncSession, keys: Iterable[tuple[str, int]]) -> dict[tuple[str, int], UUID]:
+        """
+        Возвращает отображение (event_name, event_version) -> uuid, гарантируя наличие запрошенных ключей,
+        если они есть в БД. Результат нельзя изменять.
+
+        Args:
+            session: Сессия, через которую перечитывается кэш при необходимости
+            keys: Нужные пары (event_name, event_version)
+        """
+        ids = cls._ids
+        if cls.is_stale() or any(key not in ids for key in keys):
+            await cls.load(session)
+        return cls._ids
+
+    @classmethod
+    async def get_id(cls, session: AsyncSession, event_name: str, event_version: int = 1) -> UUID | None:
+        """Возвращает uuid типа события или None, если такого типа нет в БД"""
+        key = (event_name, event_version)
+        return (await cls.get_ids(session, [key])).get(key)
@@ -1,3 +1,5 @@
+import asyncio
+
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -15,7 +17,14 @@ logger = get_logger("rabbitmq.consumer")
 
 
 class RabbitMQEventConsumer:
-    """Реализация консюмера событий для RabbitMQ"""
+    """
+    Реализация консюмера событий для RabbitMQ.
+
+    Сообщения доставляются брокером (basic.consume) и обрабатываются конкурентно,
+    каждое в своей задаче. Число одновременно обрабатываемых сообщений ограничено
+    prefetch_count: брокер не присылает больше неподтвержденных сообщений, чем consumer_prefetch.
+    Подклассы реализуют process_message и сами подтверждают сообщения (ack/nack).
+    """
 
     def __init__(
         self,
@@ -36,12 +45,26 @@ class RabbitMQEventConsumer:
         self._routing_mapper = routing_mapper
         self._channel: AbstractChannel | None = None
         self._queue: AbstractQueue | None = None
+        self._consumer_tag: str | None = None
+        self._in_flight: set[asyncio.Task] = set()
         self._is_running = False
 
+    @property
+    def is_running(self) -> bool:
+        """Консюмер запущен и его канал открыт"""
+        return self._is_running and self._channel is not None and not self._channel.is_closed
+
+    @property
+    def in_flight(self) -> int:
+        """Количество сообщений, которые обрабатываются прямо сейчас"""
+        return len(self._in_flight)
+
     async def start(self) -> None:
         """
         Запускает консюмер для чтения событий.
 
+        Возвращает управление после подписки на очередь; сообщения обрабатываются в фоне до вызова stop().
+
         Raises:
             Exception: При ошибке запуска консюмера
         """
@@ -67,28 +90,26 @@ class RabbitMQEventConsumer:
 
             await self._queue.bind(exchange, routing_key="#")
 
+            self._consumer_tag = await self._queue.consume(self._on_message)
+            self._is_running = True
+
             logger.info(
                 f"Consumer started: queue={self._settings.consumer_queue}, "
                 f"exchange={self._settings.event_exchange}, prefetch={self._settings.consumer_prefetch}"
             )
-
-            self._is_running = True
-
-            async with self._queue.iterator() as queue_iter:
-                async for message in queue_iter:
-                    try:
-                        await self.process_event(message)
-                    except Exception as e:
-                        logger.exception(f"Error handling message: {e}")
-                        await message.nack(requeue=True)
         except Exception as e:
             logger.exception(f"Failed to start consumer: {e}")
             self._is_running = False
             raise
 
-    async def stop(self) -> None:
+    async def stop(self, timeout: float | None = None) -> None:
         """
-        Останавливает консюмер.
+        Останавливает консюмер: прекращает получение новых сообщений и дожидается обработки текущих.
+
+        Сообщения, не обработанные за timeout, остаются неподтвержденными и будут доставлены повторно.
+
+        Args:
+            timeout: Максимальное время ожидания текущих сообщений в секундах (None — без ограничения)
 
         Raises:
             Exception: При ошибке остановки консюмера
@@ -98,13 +119,40 @@ class RabbitMQEventConsumer:
 
         self._is_running = False
 
+        if self._queue and self._consumer_tag and self._channel and not self._channel.is_closed:
+            await self._queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+
+        if self._in_flight:
+            logger.info(f"Waiting for {len(self._in_flight)} in-flight message(s)")
+            _, pending = await asyncio.wait(set(self._in_flight), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"{len(pending)} message(s) were not processed before shutdown and will be redelivered")
+                await asyncio.gather(*pending, return_exceptions=True)
+
         if self._channel and not self._channel.is_closed:
             await self._channel.close()
-            self._channel = None
-            self._queue = None
+        self._channel = None
+        self._queue = None
 
         logger.info("Consumer stopped")
 
+    async def _on_message(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        """Запускает обработку сообщения в отдельной задаче, не блокируя получение следующих"""
+        task = asyncio.create_task(self._handle_message(message))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _handle_message(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        try:
+            await self.process_message(message)
+        except Exception as e:
+            logger.exception(f"Error handling message: {e}")
+            if not message.processed:
+                await message.nack(requeue=True)
+
     @abstractmethod
     async def process_message(self, message: aio_pika.IncomingMessage) -> None:
         """
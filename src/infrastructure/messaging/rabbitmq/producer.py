@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from typing import TYPE_CHECKING
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
 from src.core.logging import get_logger
 from src.core.settings import RabbitMQMessagingSettings
 from src.domain.common.events import DomainEvent
+from src.infrastructure.common.exceptions import MessagePublishException
 from src.infrastructure.events.registry import EventRegistry
 from src.infrastructure.events.serializer import EventSerializer
 from src.infrastructure.messaging.rabbitmq.connection import RabbitMQConnection
@@ -19,7 +21,14 @@ logger = get_logger("rabbitmq.producer")
 
 
 class RabbitMQEventProducer:
-    """Реализация продюсера событий для RabbitMQ"""
+    """
+    Реализация продюсера событий для RabbitMQ.
+
+    Публикует через пул каналов с publisher confirms. Число неподтвержденных сообщений
+    ограничено окном max_in_flight: внутри окна публикации идут конвейером, без ожидания
+    подтверждения предыдущего сообщения. События одного агрегата всегда публикуются
+    через один канал, поэтому их порядок в брокере сохраняется.
+    """
 
     def __init__(
         self,
@@ -38,26 +47,43 @@ class RabbitMQEventProducer:
         self._connection = connection
         self._settings = settings
         self._routing_mapper = routing_mapper
-        self._channel: AbstractChannel | None = None
-        self._exchange: AbstractExchange | None = None
+        self._channels: list[AbstractChannel] = []
+        self._exchanges: list[AbstractExchange] = []
+        self._pool_lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(settings.publisher_max_in_flight)
+
+    async def _ensure_exchanges(self) -> None:
+        """Открывает пул каналов с publisher confirms и объявляет exchange, если это еще не сделано"""
+        if self._exchanges and all(not channel.is_closed for channel in self._channels):
+            return
+
+        async with self._pool_lock:
+            if self._exchanges and all(not channel.is_closed for channel in self._channels):
+                return
 
-    async def _ensure_exchange(self) -> None:
-        """Создает exchange если его еще нет"""
-        if self._exchange is None:
+            await self._close_channels()
             conn = await self._connection.get_connection()
-            self._channel = await conn.channel()
-            await self._channel.set_qos(prefetch_count=1)
-
-            self._exchange = await self._channel.declare_exchange(
-                self._settings.event_exchange,
-                aio_pika.ExchangeType.TOPIC,
-                durable=True,
+            channels: list[AbstractChannel] = []
+            exchanges: list[AbstractExchange] = []
+            for _ in range(self._settings.publisher_channels):
+                channel = await conn.channel(publisher_confirms=True)
+                exchange = await channel.declare_exchange(
+                    self._settings.event_exchange,
+                    aio_pika.ExchangeType.TOPIC,
+                    durable=True,
+                )
+                channels.append(channel)
+                exchanges.append(exchange)
+            # Пул заменяется целиком: публикации без блокировки видят либо старый, либо полный новый список
+            self._channels = channels
+            self._exchanges = exchanges
+            logger.debug(
+                f"Exchange '{self._settings.event_exchange}' declared on {len(self._channels)} confirm channel(s)"
             )
-            logger.debug(f"Exchange '{self._settings.event_exchange}' declared")
 
     async def publish(self, event: DomainEvent) -> None:
         """
-        Публикует доменное событие в RabbitMQ.
+        Публикует доменное событие в RabbitMQ и ждет подтверждения брокера.
 
         Args:
             event: Доменное событие для публикации
@@ -65,39 +91,102 @@ class RabbitMQEventProducer:
         Raises:
             Exception: При ошибке публикации события
         """
-        try:
-            if not EventRegistry.is_registered(type(event)):
-                logger.warning(f"Event {type(event).__name__} is not registered, skipping publication")
-                return
+        if not EventRegistry.is_registered(type(event)):
+            logger.warning(f"Event {type(event).__name__} is not registered, skipping publication")
+            return
 
-            await self._ensure_exchange()
+        try:
+            await self._ensure_exchanges()
+            await self._publish_confirmed(event)
+        except Exception as e:
+            logger.exception(f"Failed to publish event {type(event).__name__}: {e}")
+            raise
 
-            event_name, _ = EventRegistry.get_event_metadata(type(event))
-            routing_key = self._routing_mapper.get_routing_key(event_name)
+    async def publish_many(self, events: list[DomainEvent]) -> list[Exception | None]:
+        """
+        Публикует события конвейером и ждет подтверждения всех.
 
-            serialized_event = EventSerializer.serialize(event)
-            message_body = json.dumps(serialized_event).encode("utf-8")
+        Args:
+            events: Доменные события для публикации
 
-            message = aio_pika.Message(
-                message_body,
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                headers={
-                    "event_name": event_name,
-                    "event_version": serialized_event["event_version"],
-                    "aggregate_id": str(event.aggregate_id),
-                },
-            )
+        Returns:
+            Результат по каждому событию в порядке events: None, если брокер подтвердил
+            публикацию (или событие не зарегистрировано и пропущено), иначе ошибка
+        """
+        if not events:
+            return []
 
-            await self._exchange.publish(message, routing_key=routing_key)
-            logger.debug(f"Published event {event_name} (routing_key={routing_key}, aggregate_id={event.aggregate_id})")
+        try:
+            await self._ensure_exchanges()
         except Exception as e:
-            logger.exception(f"Failed to publish event {type(event).__name__}: {e}")
-            raise
+            logger.exception(f"Failed to open publisher channels: {e}")
+            return [e] * len(events)
+
+        # Задачи создаются по порядку событий, поэтому внутри канала сообщения уходят в том же порядке
+        results = await asyncio.gather(
+            *(self._publish_confirmed(event) for event in events),
+            return_exceptions=True,
+        )
+
+        failed = 0
+        outcome: list[Exception | None] = []
+        for event, result in zip(events, results, strict=True):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error(
+                    f"Failed to publish event {type(event).__name__} (aggregate_id={event.aggregate_id}): {result}"
+                )
+                outcome.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                outcome.append(None)
+
+        logger.debug(f"Published {len(events) - failed}/{len(events)} event(s) with confirms")
+        return outcome
+
+    async def _publish_confirmed(self, event: DomainEvent) -> None:
+        """Публикует одно событие в окне in-flight и ждет подтверждения брокера"""
+        if not EventRegistry.is_registered(type(event)):
+            logger.warning(f"Event {type(event).__name__} is not registered, skipping publication")
+            return
+
+        event_name, _ = EventRegistry.get_event_metadata(type(event))
+        routing_key = self._routing_mapper.get_routing_key(event_name)
+
+        serialized_event = EventSerializer.serialize(event)
+        message_body = json.dumps(serialized_event).encode("utf-8")
+
+        message = aio_pika.Message(
+            message_body,
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            headers={
+                "event_name": event_name,
+                "event_version": serialized_event["event_version"],
+                "aggregate_id": str(event.aggregate_id),
+            },
+        )
+
+        # Снимок пула: _close_channels может заменить список на пустой во время публикации
+        exchanges = self._exchanges
+        if not exchanges:
+            raise MessagePublishException(
+                f"Нет открытых каналов для публикации события {event_name} (aggregate_id={event.aggregate_id})"
+            )
+        exchange = exchanges[event.aggregate_id.int % len(exchanges)]
+        async with self._in_flight:
+            await exchange.publish(message, routing_key=routing_key, timeout=self._settings.publisher_confirm_timeout)
+        logger.debug(f"Published event {event_name} (routing_key={routing_key}, aggregate_id={event.aggregate_id})")
+
+    async def _close_channels(self) -> None:
+        for channel in self._channels:
+            if not channel.is_closed:
+                await channel.close()
+        self._channels = []
+        self._exchanges = []
 
     async def close(self) -> None:
-        """Закрывает канал продюсера"""
-        if self._channel and not self._channel.is_closed:
-            await self._channel.close()
-            self._channel = None
-            self._exchange = None
+        """Закрывает каналы продюсера"""
+        async with self._pool_lock:
+            await self._close_channels()
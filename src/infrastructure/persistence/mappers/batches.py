@@ -51,27 +51,37 @@ def to_domain_entity(batch_model: Batch) -> BatchEntity:
         raise MappingException(f"Ошибка маппинга persistence -> domain для Batch: {e}") from e
 
 
+def to_persistence_row(batch_entity: BatchEntity) -> dict:
+    """Конвертирует domain domain_entity BatchEntity в строку batches (без продуктов) для пакетной записи"""
+    try:
+        return {
+            "uuid": batch_entity.uuid,
+            "created_at": datetime_aware_to_naive(batch_entity.created_at),
+            "updated_at": datetime_aware_to_naive(batch_entity.updated_at),
+            "is_closed": batch_entity.is_closed,
+            "closed_at": datetime_aware_to_naive(batch_entity.closed_at),
+            "task_description": batch_entity.task_description.value,
+            "shift": batch_entity.shift.value,
+            "team": batch_entity.team.value,
+            "batch_number": batch_entity.batch_number.value,
+            "batch_date": batch_entity.batch_date,
+            "nomenclature": batch_entity.nomenclature.value,
+            "ekn_code": batch_entity.ekn_code.value,
+            "shift_start_time": datetime_aware_to_naive(batch_entity.shift_time_range.start),
+            "shift_end_time": datetime_aware_to_naive(batch_entity.shift_time_range.end),
+            "work_center_id": batch_entity.work_center_id,
+        }
+    except Exception as e:
+        raise MappingException(f"Ошибка маппинга domain -> persistence для Batch: {e}") from e
+
+
 def to_persistence_model(batch_entity: BatchEntity) -> Batch:
     """Конвертирует domain domain_entity BatchEntity в persistence модель Batch"""
+    row = to_persistence_row(batch_entity)
     try:
-        return Batch(
-            uuid=batch_entity.uuid,
-            created_at=datetime_aware_to_naive(batch_entity.created_at),
-            updated_at=datetime_aware_to_naive(batch_entity.updated_at),
-            is_closed=batch_entity.is_closed,
-            closed_at=datetime_aware_to_naive(batch_entity.closed_at),
-            task_description=batch_entity.task_description.value,
-            shift=batch_entity.shift.value,
-            team=batch_entity.team.value,
-            batch_number=batch_entity.batch_number.value,
-            batch_date=batch_entity.batch_date,
-            nomenclature=batch_entity.nomenclature.value,
-            ekn_code=batch_entity.ekn_code.value,
-            shift_start_time=datetime_aware_to_naive(batch_entity.shift_time_range.start),
-            shift_end_time=datetime_aware_to_naive(batch_entity.shift_time_range.end),
-            work_center_id=batch_entity.work_center_id,
-            products=[product_to_persistence_model(p) for p in batch_entity.products],
-        )
+        return Batch(**row, products=[product_to_persistence_model(p) for p in batch_entity.products])
+    except MappingException:
+        raise
     except Exception as e:
         raise MappingException(f"Ошибка маппинга domain -> persistence для Batch: {e}") from e
 
@@ -0,0 +1,13 @@
+from src.application.batches.dtos.import_batches import ImportBatchesOutputDTO
+from src.infrastructure.persistence.models.batch_import_checkpoint import BatchImportCheckpoint
+
+
+def to_import_result(checkpoint: BatchImportCheckpoint) -> ImportBatchesOutputDTO:
+    """Маппер из контрольной точки в отчет импорта по закоммиченным строкам"""
+    return ImportBatchesOutputDTO(
+        total=checkpoint.rows_committed,
+        created=checkpoint.created,
+        updated=checkpoint.updated,
+        failed=checkpoint.failed,
+        errors=list(checkpoint.errors),
+    )
@@ -21,17 +21,22 @@ def to_domain_entity(product_model: Product) -> ProductEntity:
         raise MappingException(f"Ошибка маппинга persistence -> domain для Product: {e}") from e
 
 
-def to_persistence_model(product_entity: ProductEntity) -> Product:
-    """Конвертирует domain domain_entity ProductEntity в persistence модель Product"""
+def to_persistence_row(product_entity: ProductEntity) -> dict:
+    """Конвертирует domain domain_entity ProductEntity в строку products для пакетной записи"""
     try:
-        return Product(
-            uuid=product_entity.uuid,
-            created_at=datetime_aware_to_naive(product_entity.created_at),
-            updated_at=datetime_aware_to_naive(product_entity.updated_at),
-            unique_code=product_entity.unique_code.value,
-            batch_id=product_entity.batch_id,
-            is_aggregated=product_entity.is_aggregated,
-            aggregated_at=datetime_aware_to_naive(product_entity.aggregated_at),
-        )
+        return {
+            "uuid": product_entity.uuid,
+            "created_at": datetime_aware_to_naive(product_entity.created_at),
+            "updated_at": datetime_aware_to_naive(product_entity.updated_at),
+            "unique_code": product_entity.unique_code.value,
+            "batch_id": product_entity.batch_id,
+            "is_aggregated": product_entity.is_aggregated,
+            "aggregated_at": datetime_aware_to_naive(product_entity.aggregated_at),
+        }
     except Exception as e:
         raise MappingException(f"Ошибка маппинга domain -> persistence для Product: {e}") from e
+
+
+def to_persistence_model(product_entity: ProductEntity) -> Product:
+    """Конвертирует domain domain_entity ProductEntity в persistence модель Product"""
+    return Product(**to_persistence_row(product_entity))
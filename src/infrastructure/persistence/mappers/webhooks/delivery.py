@@ -26,34 +26,43 @@ def to_domain_entity(delivery_model: WebhookDelivery) -> WebhookDeliveryEntity:
             response_body=delivery_model.response_body,
             error_message=delivery_model.error_message,
             delivered_at=datetime_naive_to_aware(delivery_model.delivered_at) if delivery_model.delivered_at else None,
+            next_attempt_at=datetime_naive_to_aware(delivery_model.next_attempt_at)
+            if delivery_model.next_attempt_at
+            else None,
         )
     except Exception as e:
         raise MappingException(f"Ошибка маппинга persistence -> domain для WebhookDelivery: {e}") from e
 
 
-def to_persistence_model(delivery_entity: WebhookDeliveryEntity) -> WebhookDelivery:
-    """Конвертирует domain entity WebhookDeliveryEntity в persistence модель WebhookDelivery"""
+def to_persistence_row(delivery_entity: WebhookDeliveryEntity) -> dict:
+    """Конвертирует domain entity WebhookDeliveryEntity в строку webhook_deliveries для пакетной записи"""
     try:
-        delivery_model = WebhookDelivery(
-            uuid=delivery_entity.uuid,
-            created_at=datetime_aware_to_naive(delivery_entity.created_at),
-            updated_at=datetime_aware_to_naive(delivery_entity.updated_at) if delivery_entity.updated_at else None,
-            subscription_id=delivery_entity.subscription_id,
-            event_type_id=delivery_entity.event_type_id,
-            event_type=str(delivery_entity.event_type),
-            payload=delivery_entity.payload.value,
-            status=delivery_entity.status,
-            attempts=delivery_entity.attempts.value,
-            response_status=delivery_entity.response_status.value
+        return {
+            "uuid": delivery_entity.uuid,
+            "created_at": datetime_aware_to_naive(delivery_entity.created_at),
+            "updated_at": datetime_aware_to_naive(delivery_entity.updated_at) if delivery_entity.updated_at else None,
+            "subscription_id": delivery_entity.subscription_id,
+            "event_type_id": delivery_entity.event_type_id,
+            "event_type": str(delivery_entity.event_type),
+            "payload": delivery_entity.payload.value,
+            "status": delivery_entity.status,
+            "attempts": delivery_entity.attempts.value,
+            "response_status": delivery_entity.response_status.value
             if delivery_entity.response_status is not None
             else None,
-            response_body=delivery_entity.response_body,
-            error_message=delivery_entity.error_message,
-            delivered_at=datetime_aware_to_naive(delivery_entity.delivered_at)
+            "response_body": delivery_entity.response_body,
+            "error_message": delivery_entity.error_message,
+            "delivered_at": datetime_aware_to_naive(delivery_entity.delivered_at)
             if delivery_entity.delivered_at
             else None,
-        )
-
-        return delivery_model
+            "next_attempt_at": datetime_aware_to_naive(delivery_entity.next_attempt_at)
+            if delivery_entity.next_attempt_at
+            else None,
+        }
     except Exception as e:
         raise MappingException(f"Ошибка маппинга domain -> persistence для WebhookDelivery: {e}") from e
+
+
+def to_persistence_model(delivery_entity: WebhookDeliveryEntity) -> WebhookDelivery:
+    """Конвертирует domain entity WebhookDeliveryEntity в persistence модель WebhookDelivery"""
+    return WebhookDelivery(**to_persistence_row(delivery_entity))
@@ -19,15 +19,20 @@ def to_domain_entity(work_center_model: WorkCenter) -> WorkCenterEntity:
         raise MappingException(f"Ошибка маппинга persistence -> domain для WorkCenter: {e}") from e
 
 
-def to_persistence_model(work_center_entity: WorkCenterEntity, existing_model: WorkCenter | None = None) -> WorkCenter:
-    """Конвертирует domain domain_entity WorkCenterEntity в persistence модель WorkCenter"""
+def to_persistence_row(work_center_entity: WorkCenterEntity) -> dict:
+    """Конвертирует domain domain_entity WorkCenterEntity в строку work_centers для пакетной записи"""
     try:
-        return WorkCenter(
-            uuid=work_center_entity.uuid,
-            created_at=datetime_aware_to_naive(work_center_entity.created_at),
-            updated_at=datetime_aware_to_naive(work_center_entity.updated_at),
-            identifier=work_center_entity.identifier.value,
-            name=work_center_entity.name.value,
-        )
+        return {
+            "uuid": work_center_entity.uuid,
+            "created_at": datetime_aware_to_naive(work_center_entity.created_at),
+            "updated_at": datetime_aware_to_naive(work_center_entity.updated_at),
+            "identifier": work_center_entity.identifier.value,
+            "name": work_center_entity.name.value,
+        }
     except Exception as e:
         raise MappingException(f"Ошибка маппинга domain -> persistence для WorkCenter: {e}") from e
+
+
+def to_persistence_model(work_center_entity: WorkCenterEntity, existing_model: WorkCenter | None = None) -> WorkCenter:
+    """Конвертирует domain domain_entity WorkCenterEntity в persistence модель WorkCenter"""
+    return WorkCenter(**to_persistence_row(work_center_entity))
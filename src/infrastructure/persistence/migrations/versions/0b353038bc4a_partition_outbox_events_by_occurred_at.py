@@ -0,0 +1,180 @@
+"""partition_outbox_events_by_occurred_at
+
+Revision ID: 0b353038bc4a
+Revises: df04b67b3edd
+Create Date: 2026-10-18 14:37:05.604112
+
+"""
+from datetime import UTC, datetime, timedelta
+from typing import Sequence, Union
+
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b353038bc4a'
+down_revision: Union[str, Sequence[str], None] = 'df04b67b3edd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Количество дневных партиций, создаваемых заранее; дальше их поддерживает задача maintain_outbox_partitions
+PREMAKE_DAYS = 7
+
+COLUMNS = (
+    "uuid, created_at, updated_at, event_type_id, event_name, event_version, aggregate_id, payload, "
+    "occurred_at, status, attempts, locked_until, processed_at, last_error, correlation_id, causation_id, "
+    "event_metadata, dedup_key"
+)
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("uuid", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("event_type_id", sa.Uuid(), nullable=True),
+        sa.Column("event_name", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("event_version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+        sa.Column("aggregate_id", sa.Uuid(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "PENDING", "PROCESSING", "DONE", "FAILED", name="outboxeventstatusenum", schema="public", create_type=False
+            ),
+            nullable=False,
+            server_default=sa.text("'PENDING'"),
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("correlation_id", sa.Uuid(), nullable=True),
+        sa.Column("causation_id", sa.Uuid(), nullable=True),
+        sa.Column("event_metadata", sa.JSON(), nullable=True),
+        sa.Column("dedup_key", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["event_type_id"], ["public.event_types.uuid"], name="fk_outbox_events_event_type_id"
+        ),
+    ]
+
+
+def _drop_notify_trigger() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_outbox_events_notify ON public.outbox_events")
+
+
+def _create_notify_trigger() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER trg_outbox_events_notify
+        AFTER INSERT ON public.outbox_events
+        FOR EACH STATEMENT EXECUTE FUNCTION public.notify_outbox_events()
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Переименовываем старую таблицу и освобождаем имена её индексов и ограничений
+    _drop_notify_trigger()
+    op.rename_table("outbox_events", "outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_status_locked", table_name="outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_created_at", table_name="outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_status", table_name="outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_aggregate_id", table_name="outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_event_name", table_name="outbox_events_old", schema="public")
+    op.drop_index("idx_outbox_event_type_id", table_name="outbox_events_old", schema="public")
+    op.execute("ALTER TABLE public.outbox_events_old DROP CONSTRAINT IF EXISTS uq_outbox_event_dedup_key")
+    op.execute("ALTER TABLE public.outbox_events_old DROP CONSTRAINT IF EXISTS outbox_events_uuid_key")
+    op.execute("ALTER TABLE public.outbox_events_old DROP CONSTRAINT IF EXISTS outbox_events_pkey")
+
+    # Партиционированная таблица. Ключ партиционирования обязан входить в PK и unique ограничения.
+    # dedup_key содержит occurred_at события, поэтому (dedup_key, occurred_at) уникален так же, как dedup_key.
+    op.create_table(
+        "outbox_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("uuid", "occurred_at", name="outbox_events_pkey"),
+        sa.UniqueConstraint("dedup_key", "occurred_at", name="uq_outbox_event_dedup_key"),
+        schema="public",
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+
+    # Все существующие события попадают в legacy партицию, которая удаляется retention как обычная дневная
+    tomorrow = datetime.now(UTC).date() + timedelta(days=1)
+    op.execute(
+        f"""
+        CREATE TABLE public.outbox_events_legacy PARTITION OF public.outbox_events
+        FOR VALUES FROM (MINVALUE) TO ('{tomorrow.isoformat()}')
+        """
+    )
+    for offset in range(PREMAKE_DAYS):
+        day = tomorrow + timedelta(days=offset)
+        op.execute(
+            f"""
+            CREATE TABLE public.outbox_events_p{day:%Y%m%d} PARTITION OF public.outbox_events
+            FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')
+            """
+        )
+    op.execute("CREATE TABLE public.outbox_events_default PARTITION OF public.outbox_events DEFAULT")
+
+    op.execute(f"INSERT INTO public.outbox_events ({COLUMNS}) SELECT {COLUMNS} FROM public.outbox_events_old")
+    op.drop_table("outbox_events_old", schema="public")
+
+    op.create_index("idx_outbox_aggregate_id", "outbox_events", ["aggregate_id"], unique=False, schema="public")
+    op.create_index("idx_outbox_event_type_id", "outbox_events", ["event_type_id"], unique=False, schema="public")
+    # Частичный индекс для claim_pending_events: растет вместе с backlog, а не с историей
+    op.create_index(
+        "idx_outbox_pending",
+        "outbox_events",
+        ["created_at"],
+        unique=False,
+        schema="public",
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+    )
+
+    _create_notify_trigger()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_notify_trigger()
+    op.rename_table("outbox_events", "outbox_events_partitioned", schema="public")
+    op.drop_index("idx_outbox_pending", table_name="outbox_events_partitioned", schema="public")
+    op.drop_index("idx_outbox_event_type_id", table_name="outbox_events_partitioned", schema="public")
+    op.drop_index("idx_outbox_aggregate_id", table_name="outbox_events_partitioned", schema="public")
+    op.execute("ALTER TABLE public.outbox_events_partitioned DROP CONSTRAINT IF EXISTS uq_outbox_event_dedup_key")
+    op.execute("ALTER TABLE public.outbox_events_partitioned DROP CONSTRAINT IF EXISTS outbox_events_pkey")
+
+    op.create_table(
+        "outbox_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("uuid", name="outbox_events_pkey"),
+        sa.UniqueConstraint("uuid"),
+        sa.UniqueConstraint("dedup_key", name="uq_outbox_event_dedup_key"),
+        schema="public",
+    )
+    op.execute(
+        f"INSERT INTO public.outbox_events ({COLUMNS}) SELECT {COLUMNS} FROM public.outbox_events_partitioned "
+        "ON CONFLICT DO NOTHING"
+    )
+    # Удаление партиционированной таблицы удаляет и все её партиции
+    op.drop_table("outbox_events_partitioned", schema="public")
+
+    op.create_index("idx_outbox_event_name", "outbox_events", ["event_name"], unique=False, schema="public")
+    op.create_index("idx_outbox_aggregate_id", "outbox_events", ["aggregate_id"], unique=False, schema="public")
+    op.create_index("idx_outbox_status", "outbox_events", ["status"], unique=False, schema="public")
+    op.create_index("idx_outbox_created_at", "outbox_events", ["created_at"], unique=False, schema="public")
+    op.create_index(
+        "idx_outbox_status_locked",
+        "outbox_events",
+        ["status", "locked_until"],
+        unique=False,
+        schema="public",
+    )
+    op.create_index("idx_outbox_event_type_id", "outbox_events", ["event_type_id"], unique=False, schema="public")
+
+    _create_notify_trigger()
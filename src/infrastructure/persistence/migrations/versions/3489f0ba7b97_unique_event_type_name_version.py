@@ -0,0 +1,42 @@
+"""unique_event_type_name_version
+
+Revision ID: 3489f0ba7b97
+Revises: 0b353038bc4a
+Create Date: 2026-10-18 16:02:47.913520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3489f0ba7b97'
+down_revision: Union[str, Sequence[str], None] = '0b353038bc4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Одно событие может быть зарегистрировано в нескольких версиях (например, batch.product_added v1 и v2)
+    op.drop_constraint("uq_event_type_name", "event_types", type_="unique", schema="public")
+    op.create_unique_constraint(
+        "uq_event_type_name_version",
+        "event_types",
+        ["name", "version"],
+        schema="public",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Версии > 1 нужно удалить; если на них ссылаются outbox_events или webhook_deliveries, откат упадет
+    op.execute("DELETE FROM public.event_types WHERE version > 1")
+    op.drop_constraint("uq_event_type_name_version", "event_types", type_="unique", schema="public")
+    op.create_unique_constraint(
+        "uq_event_type_name",
+        "event_types",
+        ["name"],
+        schema="public",
+    )
@@ -0,0 +1,56 @@
+"""webhook_subscription_events_jsonb_gin
+
+Revision ID: 3bc28ab19232
+Revises: 7d948c1069ed
+Create Date: 2026-10-18 21:07:45.318906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3bc28ab19232'
+down_revision: Union[str, Sequence[str], None] = '7d948c1069ed'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'webhook_subscriptions',
+        'events',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='events::jsonb',
+        schema='public'
+    )
+    # jsonb_path_ops: индекс меньше обычного GIN и поддерживает нужный фильтру по событию оператор @>
+    op.create_index(
+        'idx_webhook_subscription_events',
+        'webhook_subscriptions',
+        ['events'],
+        unique=False,
+        schema='public',
+        postgresql_using='gin',
+        postgresql_ops={'events': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_webhook_subscription_events', table_name='webhook_subscriptions', schema='public')
+    op.alter_column(
+        'webhook_subscriptions',
+        'events',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='events::json',
+        schema='public'
+    )
@@ -0,0 +1,42 @@
+"""add_next_attempt_at_to_webhook_deliveries
+
+Revision ID: 7d948c1069ed
+Revises: 3489f0ba7b97
+Create Date: 2026-10-18 18:41:12.504187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d948c1069ed'
+down_revision: Union[str, Sequence[str], None] = '3489f0ba7b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'webhook_deliveries',
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+        schema='public'
+    )
+    # Частичный индекс для планировщика ретраев: содержит только доставки, ожидающие повторной попытки
+    op.create_index(
+        'idx_webhook_delivery_next_attempt',
+        'webhook_deliveries',
+        ['next_attempt_at'],
+        unique=False,
+        schema='public',
+        postgresql_where=sa.text("status = 'PENDING' AND next_attempt_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_webhook_delivery_next_attempt', table_name='webhook_deliveries', schema='public')
+    op.drop_column('webhook_deliveries', 'next_attempt_at', schema='public')
@@ -0,0 +1,99 @@
+"""webhook_delivery_attempts_and_keyset_index
+
+Revision ID: a4c7e91d2f60
+Revises: 3bc28ab19232
+Create Date: 2026-10-18 22:16:03.881427
+
+"""
+from datetime import UTC, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e91d2f60'
+down_revision: Union[str, Sequence[str], None] = '3bc28ab19232'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Количество дневных партиций, создаваемых заранее; дальше их поддерживает задача maintain_webhook_attempt_partitions
+PREMAKE_DAYS = 7
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Доставки удаляются вместе с подпиской на стороне БД, а не загрузкой всех доставок в сессию
+    op.drop_constraint(
+        'webhook_deliveries_subscription_id_fkey', 'webhook_deliveries', type_='foreignkey', schema='public'
+    )
+    op.create_foreign_key(
+        'webhook_deliveries_subscription_id_fkey',
+        'webhook_deliveries',
+        'webhook_subscriptions',
+        ['subscription_id'],
+        ['uuid'],
+        source_schema='public',
+        referent_schema='public',
+        ondelete='CASCADE',
+    )
+    # Уникальный индекс по uuid дублирует первичный ключ и только замедляет вставку
+    op.execute("ALTER TABLE public.webhook_deliveries DROP CONSTRAINT IF EXISTS webhook_deliveries_uuid_key")
+    # Keyset пагинация доставок подписки; индекс также используется каскадным удалением подписки
+    op.create_index(
+        'idx_webhook_delivery_subscription_created',
+        'webhook_deliveries',
+        ['subscription_id', 'created_at', 'uuid'],
+        unique=False,
+        schema='public',
+    )
+
+    # Журнал попыток: только вставки, удаление — целыми дневными партициями
+    op.create_table(
+        'webhook_delivery_attempts',
+        sa.Column('delivery_id', sa.Uuid(), nullable=False),
+        sa.Column('attempt', sa.Integer(), nullable=False),
+        sa.Column('attempted_at', sa.DateTime(), nullable=False),
+        sa.Column('subscription_id', sa.Uuid(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('response_status', sa.Integer(), nullable=True),
+        sa.Column('error_kind', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column('error_message', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint('delivery_id', 'attempt', 'attempted_at', name='webhook_delivery_attempts_pkey'),
+        schema='public',
+        postgresql_partition_by='RANGE (attempted_at)',
+    )
+
+    today = datetime.now(UTC).date()
+    for offset in range(PREMAKE_DAYS + 1):
+        day = today + timedelta(days=offset)
+        op.execute(
+            f"""
+            CREATE TABLE public.webhook_delivery_attempts_p{day:%Y%m%d} PARTITION OF public.webhook_delivery_attempts
+            FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')
+            """
+        )
+    op.execute("CREATE TABLE public.webhook_delivery_attempts_default PARTITION OF public.webhook_delivery_attempts DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Удаление партиционированной таблицы удаляет и все её партиции
+    op.drop_table('webhook_delivery_attempts', schema='public')
+
+    op.drop_index('idx_webhook_delivery_subscription_created', table_name='webhook_deliveries', schema='public')
+    op.create_unique_constraint('webhook_deliveries_uuid_key', 'webhook_deliveries', ['uuid'], schema='public')
+    op.drop_constraint(
+        'webhook_deliveries_subscription_id_fkey', 'webhook_deliveries', type_='foreignkey', schema='public'
+    )
+    op.create_foreign_key(
+        'webhook_deliveries_subscription_id_fkey',
+        'webhook_deliveries',
+        'webhook_subscriptions',
+        ['subscription_id'],
+        ['uuid'],
+        source_schema='public',
+        referent_schema='public',
+    )
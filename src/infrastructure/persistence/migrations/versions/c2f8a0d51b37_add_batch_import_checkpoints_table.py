@@ -0,0 +1,43 @@
+"""add_batch_import_checkpoints_table
+
+Revision ID: c2f8a0d51b37
+Revises: a4c7e91d2f60
+Create Date: 2026-10-18 23:40:12.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f8a0d51b37'
+down_revision: Union[str, Sequence[str], None] = 'a4c7e91d2f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Контрольные точки порционного импорта партий; строка живет только пока импорт файла не завершен
+    op.create_table(
+        'batch_import_checkpoints',
+        sa.Column('object_name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('task_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('update_existing', sa.Boolean(), nullable=False),
+        sa.Column('rows_committed', sa.Integer(), nullable=False),
+        sa.Column('created', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.JSON(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('object_name'),
+        schema='public',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('batch_import_checkpoints', schema='public')
@@ -0,0 +1,46 @@
+"""add_outbox_events_notify_trigger
+
+Revision ID: df04b67b3edd
+Revises: 8e068efda6c5
+Create Date: 2026-10-18 10:12:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'df04b67b3edd'
+down_revision: Union[str, Sequence[str], None] = '8e068efda6c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Statement-level триггер: одно уведомление на INSERT, независимо от количества строк.
+    # Имя канала должно совпадать с OUTBOX_NOTIFY_CHANNEL в outbox_relay/listener.py.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.notify_outbox_events() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('outbox_events', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_outbox_events_notify
+        AFTER INSERT ON public.outbox_events
+        FOR EACH STATEMENT EXECUTE FUNCTION public.notify_outbox_events()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_outbox_events_notify ON public.outbox_events")
+    op.execute("DROP FUNCTION IF EXISTS public.notify_outbox_events()")
@@ -0,0 +1,28 @@
+"""add_batch_created_uuid_index
+
+Revision ID: e51b9c3a7d04
+Revises: c2f8a0d51b37
+Create Date: 2026-10-18 23:58:41.207913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e51b9c3a7d04'
+down_revision: Union[str, Sequence[str], None] = 'c2f8a0d51b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset пагинация партий при потоковом экспорте
+    op.create_index('idx_batch_created_uuid', 'batches', ['created_at', 'uuid'], unique=False, schema='public')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_batch_created_uuid', table_name='batches', schema='public')
@@ -0,0 +1,43 @@
+"""key_batch_import_checkpoints_by_file_hash
+
+Revision ID: f3a6d2b8c915
+Revises: e51b9c3a7d04
+Create Date: 2026-10-19 10:12:44.381027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6d2b8c915'
+down_revision: Union[str, Sequence[str], None] = 'e51b9c3a7d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Контрольная точка ищется по SHA-256 содержимого файла: повторная загрузка того же файла
+    # получает новое имя объекта, но продолжает импорт. Для существующих точек хеш неизвестен,
+    # поэтому ключом для них становится имя объекта.
+    op.add_column(
+        'batch_import_checkpoints',
+        sa.Column('file_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        schema='public',
+    )
+    op.execute("UPDATE public.batch_import_checkpoints SET file_hash = object_name")
+    op.alter_column('batch_import_checkpoints', 'file_hash', nullable=False, schema='public')
+    op.drop_constraint('batch_import_checkpoints_pkey', 'batch_import_checkpoints', type_='primary', schema='public')
+    op.create_primary_key('batch_import_checkpoints_pkey', 'batch_import_checkpoints', ['file_hash'], schema='public')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('batch_import_checkpoints_pkey', 'batch_import_checkpoints', type_='primary', schema='public')
+    # Имя объекта уникально для каждой загрузки, поэтому снова подходит для первичного ключа
+    op.create_primary_key('batch_import_checkpoints_pkey', 'batch_import_checkpoints', ['object_name'], schema='public')
+    op.drop_column('batch_import_checkpoints', 'file_hash', schema='public')
@@ -21,6 +21,7 @@ class Batch(BaseModel, table=True):
         Index("idx_batch_number", "batch_number"),
         Index("idx_batch_date", "batch_date"),
         Index("idx_batch_number_date", "batch_number", "batch_date"),
+        Index("idx_batch_created_uuid", "created_at", "uuid"),
     )
 
     # статус партии
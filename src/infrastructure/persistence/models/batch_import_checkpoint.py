@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+from src.core.time import datetime_now
+from src.infrastructure.persistence.models.base import meta
+
+
+class BatchImportCheckpoint(SQLModel, table=True):
+    """
+    Контрольная точка импорта партий: сколько строк файла уже закоммичено и отчет по ним.
+
+    Пишется в той же транзакции, что и порция импорта, поэтому после падения worker
+    повторный запуск задачи продолжает импорт ровно со следующей строки.
+    Ключ — SHA-256 содержимого файла: после окончательной ошибки повторная загрузка
+    того же файла тоже продолжает импорт. Удаляется вместе с финальным commit импорта.
+    """
+
+    __tablename__ = "batch_import_checkpoints"
+
+    metadata = meta
+
+    file_hash: str = Field(primary_key=True)
+    object_name: str
+    task_id: str
+    update_existing: bool
+    rows_committed: int
+    created: int
+    updated: int
+    failed: int
+    errors: list = Field(sa_column=Column(JSON, nullable=False))
+    updated_at: datetime = Field(default_factory=lambda: datetime_now(naive=True))
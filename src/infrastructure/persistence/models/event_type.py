@@ -1,4 +1,4 @@
-from sqlalchemy import Index
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field
 
 from src.infrastructure.persistence.models.base import BaseModel
@@ -11,9 +11,10 @@ class EventType(BaseModel, table=True):
     __table_args__ = (
         Index("idx_event_type_name", "name"),
         Index("idx_event_type_version", "version"),
+        UniqueConstraint("name", "version", name="uq_event_type_name_version"),
     )
 
-    name: str = Field(nullable=False, index=True, unique=True)
+    name: str = Field(nullable=False, index=True)
     version: int = Field(nullable=False, default=1, index=True)
     webhook_enabled: bool = Field(nullable=False, default=True)
     description: str | None = Field(default=None, nullable=True)
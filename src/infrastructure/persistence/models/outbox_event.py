@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Index
+from sqlalchemy import JSON, Index, UniqueConstraint, text
 from sqlmodel import Column, Field, Relationship
 
 from src.infrastructure.persistence.models.base import BaseModel
@@ -19,24 +19,30 @@ class OutboxEventStatusEnum(str, Enum):
 
 
 class OutboxEvent(BaseModel, table=True):
-    """Transactional Outbox для доменных событий"""
+    """
+    Transactional Outbox для доменных событий.
+
+    В БД таблица партиционирована по диапазонам occurred_at (по дням, см. миграцию 0b353038bc4a),
+    поэтому первичный ключ (uuid, occurred_at) и уникальность (dedup_key, occurred_at) включают occurred_at.
+    Партициями управляет задача maintain_outbox_partitions.
+    """
 
     __tablename__ = "outbox_events"
     __table_args__ = (
-        Index("idx_outbox_event_name", "event_name"),
         Index("idx_outbox_aggregate_id", "aggregate_id"),
-        Index("idx_outbox_status", "status"),
-        Index("idx_outbox_created_at", "created_at"),
-        Index("idx_outbox_status_locked", "status", "locked_until"),
         Index("idx_outbox_event_type_id", "event_type_id"),
+        Index("idx_outbox_pending", "created_at", postgresql_where=text("status IN ('PENDING', 'PROCESSING')")),
+        UniqueConstraint("dedup_key", "occurred_at", name="uq_outbox_event_dedup_key"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
     )
 
-    event_type_id: UUID = Field(foreign_key="event_types.uuid", index=True)
-    event_name: str | None = Field(default=None, nullable=True, index=True)
+    uuid: UUID = Field(primary_key=True, default_factory=uuid4)
+    event_type_id: UUID = Field(foreign_key="event_types.uuid")
+    event_name: str | None = Field(default=None, nullable=True)
     event_version: int = Field(nullable=False, default=1)
-    aggregate_id: UUID = Field(nullable=False, index=True)
+    aggregate_id: UUID = Field(nullable=False)
     payload: dict = Field(sa_column=Column(JSON, nullable=False))
-    occurred_at: datetime = Field(nullable=False)
+    occurred_at: datetime = Field(primary_key=True)
     status: OutboxEventStatusEnum = Field(default=OutboxEventStatusEnum.PENDING, nullable=False)
     attempts: int = Field(default=0, nullable=False)
     locked_until: datetime | None = Field(default=None, nullable=True)
@@ -45,7 +51,7 @@ class OutboxEvent(BaseModel, table=True):
     correlation_id: UUID | None = Field(default=None, nullable=True)
     causation_id: UUID | None = Field(default=None, nullable=True)
     event_metadata: dict | None = Field(default=None, sa_column=Column(JSON, nullable=True))
-    dedup_key: str | None = Field(default=None, nullable=True, unique=True)
+    dedup_key: str | None = Field(default=None, nullable=True)
 
     # связи
     event_type: EventType = Relationship(
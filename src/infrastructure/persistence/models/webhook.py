@@ -1,13 +1,14 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import JSON, Column, Index
+from sqlalchemy import JSON, Column, Index, text
 from sqlalchemy import Enum as SQLEnum
-from sqlmodel import Field, Relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, Relationship, SQLModel
 
 from src.domain.common.enums import EventTypesEnum
 from src.domain.webhooks.enums import WebhookStatus
-from src.infrastructure.persistence.models.base import BaseModel
+from src.infrastructure.persistence.models.base import BaseModel, meta
 from src.infrastructure.persistence.models.event_type import EventType
 
 
@@ -15,26 +16,48 @@ class WebhookSubscription(BaseModel, table=True):
     """Подписка на вебхуки с поддержкой событий"""
 
     __tablename__ = "webhook_subscriptions"
+    __table_args__ = (
+        Index(
+            "idx_webhook_subscription_events",
+            "events",
+            postgresql_using="gin",
+            postgresql_ops={"events": "jsonb_path_ops"},
+        ),
+    )
 
     url: str
-    events: list[EventTypesEnum] = Field(sa_column=Column(JSON))
+    events: list[EventTypesEnum] = Field(sa_column=Column(JSONB))
     secret_key: str
     is_active: bool = True
     retry_count: int = 3
     timeout_seconds: int = 10
 
-    # связи
+    # связи; доставки удаляются вместе с подпиской через ON DELETE CASCADE, без загрузки в сессию
     deliveries: list["WebhookDelivery"] = Relationship(
         back_populates="subscription",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"},
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
     )
 
 
 class WebhookDelivery(BaseModel, table=True):
-    """Доставка вебхука"""
+    """
+    Доставка вебхука.
+
+    Доставки пишутся пакетами (WebhookDeliveryRepository.create_many/update_many) без загрузки
+    связей; история попыток хранится отдельно в webhook_delivery_attempts.
+    """
 
     __tablename__ = "webhook_deliveries"
-    __table_args__ = (Index("idx_webhook_delivery_event_type_id", "event_type_id"),)
+    __table_args__ = (
+        Index("idx_webhook_delivery_event_type_id", "event_type_id"),
+        # Keyset пагинация доставок подписки по (created_at, uuid) в обоих направлениях
+        Index("idx_webhook_delivery_subscription_created", "subscription_id", "created_at", "uuid"),
+        Index(
+            "idx_webhook_delivery_next_attempt",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING' AND next_attempt_at IS NOT NULL"),
+        ),
+    )
 
     event_type: str | None = Field(default=None, nullable=True)
     status: WebhookStatus = Field(sa_column=Column(SQLEnum(WebhookStatus)))
@@ -45,9 +68,11 @@ class WebhookDelivery(BaseModel, table=True):
     response_body: str | None = None
     error_message: str | None = None
     delivered_at: datetime | None = None
+    next_attempt_at: datetime | None = None
 
     subscription_id: UUID = Field(
         foreign_key="webhook_subscriptions.uuid",
+        ondelete="CASCADE",
         sa_column_kwargs={"nullable": False},
     )
 
@@ -58,11 +83,32 @@ class WebhookDelivery(BaseModel, table=True):
         index=True,
     )
 
-    # связи
-    subscription: WebhookSubscription = Relationship(
-        back_populates="deliveries",
-        sa_relationship_kwargs={"lazy": "selectin"},
-    )
-    event_type_ref: EventType = Relationship(
-        sa_relationship_kwargs={"lazy": "selectin"},
-    )
+    # связи загружаются только при обращении: запись и чтение доставок их не используют
+    subscription: WebhookSubscription = Relationship(back_populates="deliveries")
+    event_type_ref: EventType = Relationship()
+
+
+class WebhookDeliveryAttempt(SQLModel, table=True):
+    """
+    Попытка отправки вебхука: узкая append-only запись на каждый HTTP запрос.
+
+    В БД таблица партиционирована по дням по attempted_at (см. миграцию a4c7e91d2f60), поэтому
+    первичный ключ (delivery_id, attempt, attempted_at) включает attempted_at;
+    партиции старше WEBHOOK_ATTEMPTS_RETENTION_DAYS удаляет задача maintain_webhook_attempt_partitions.
+    Внешних ключей нет, чтобы вставка не проверяла доставки и подписки; попытки удаленных
+    подписок удаляются вместе с партициями.
+    """
+
+    __tablename__ = "webhook_delivery_attempts"
+    __table_args__ = ({"postgresql_partition_by": "RANGE (attempted_at)"},)
+
+    metadata = meta
+
+    delivery_id: UUID = Field(primary_key=True)
+    attempt: int = Field(primary_key=True)
+    attempted_at: datetime = Field(primary_key=True)
+    subscription_id: UUID
+    duration_ms: int | None = None
+    response_status: int | None = None
+    error_kind: str | None = None
+    error_message: str | None = None
@@ -4,19 +4,22 @@ from dataclasses import asdict
 from typing import ClassVar
 from uuid import UUID
 
-from sqlalchemy import Select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
 
 from src.application.batches.queries.filters import BatchReadFilters
-from src.application.batches.queries.queries import ListBatchesQuery
+from src.application.batches.queries.queries import ListBatchesKeysetQuery, ListBatchesQuery
 from src.application.batches.queries.service import BatchQueryServiceProtocol
 from src.application.batches.queries.sort import BatchSortField
 from src.application.common.cache.interfaces import CacheServiceProtocol
 from src.application.common.cache.keys.batches import get_batch_key, get_batches_list_key
 from src.core.logging import get_logger
 from src.core.settings import BatchCacheSettings
+from src.core.time import datetime_aware_to_naive, datetime_naive_to_aware
 from src.domain.batches import BatchEntity
-from src.domain.common.queries import QueryResult
+from src.domain.common.queries import KeysetCursor, KeysetQueryResult, QueryResult
+from src.infrastructure.common.exceptions import DatabaseException
 from src.infrastructure.persistence.mappers.batches import (
     dict_to_domain,
     domain_to_json_bytes,
@@ -86,6 +89,51 @@ class BatchQueryService(
 
         return stmt, count_stmt
 
+    async def list_keyset(self, query: ListBatchesKeysetQuery) -> KeysetQueryResult[BatchEntity]:
+        """
+        Получает партии от новых к старым с keyset пагинацией.
+
+        Страница читается по индексу (created_at, uuid) начиная с курсора, поэтому стоимость
+        запроса не зависит от номера страницы. Рабочий центр не загружается, продукты загружаются
+        одним запросом на страницу и только при include_products.
+        """
+        try:
+            stmt = (
+                select(Batch)
+                .options(
+                    noload(Batch.work_center),
+                    selectinload(Batch.products) if query.include_products else noload(Batch.products),
+                )
+                .order_by(Batch.created_at.desc(), Batch.uuid.desc())
+            )
+            stmt, _ = self._apply_filters(stmt, stmt, query.filters)
+
+            pagination = query.pagination
+            if pagination.after is not None:
+                stmt = stmt.where(
+                    tuple_(Batch.created_at, Batch.uuid)
+                    < (datetime_aware_to_naive(pagination.after.created_at), pagination.after.uuid)
+                )
+            # Лишняя строка показывает, есть ли следующая страница
+            stmt = stmt.limit(pagination.limit + 1)
+
+            result = await self._session.execute(stmt)
+            batch_models = list(result.scalars().all())
+
+            next_cursor = None
+            if len(batch_models) > pagination.limit:
+                batch_models = batch_models[: pagination.limit]
+                last = batch_models[-1]
+                next_cursor = KeysetCursor(created_at=datetime_naive_to_aware(last.created_at), uuid=last.uuid)
+
+            return KeysetQueryResult[BatchEntity](
+                items=[to_domain_entity(batch) for batch in batch_models],
+                limit=pagination.limit,
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при получении страницы партий: {e}") from e
+
 
 class CachedBatchQueryServiceProxy(BatchQueryService):
     """Обертка над BatchQueryService с добавлением кэширования."""
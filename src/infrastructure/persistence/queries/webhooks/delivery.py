@@ -1,9 +1,10 @@
-from sqlalchemy import func, select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.webhooks.queries.delivery import WebhookDeliveryQueryServiceProtocol
 from src.application.webhooks.queries.queries import ListWebhookDeliveriesQuery
-from src.domain.common.queries import QueryResult
+from src.core.time import datetime_aware_to_naive, datetime_naive_to_aware
+from src.domain.common.queries import KeysetCursor, KeysetQueryResult
 from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
 from src.infrastructure.common.exceptions import DatabaseException
 from src.infrastructure.persistence.mappers.webhooks.delivery import to_domain_entity
@@ -14,28 +15,45 @@ class WebhookDeliveryQueryService(WebhookDeliveryQueryServiceProtocol):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_by_subscription_id(self, query: ListWebhookDeliveriesQuery) -> QueryResult[WebhookDeliveryEntity]:
-        """Получает список доставок для подписки с пагинацией"""
-        try:
-            stmt = select(WebhookDelivery).where(WebhookDelivery.subscription_id == query.subscription_id)
-            count_stmt = select(WebhookDelivery).where(WebhookDelivery.subscription_id == query.subscription_id)
+    async def get_by_subscription_id(
+        self, query: ListWebhookDeliveriesQuery
+    ) -> KeysetQueryResult[WebhookDeliveryEntity]:
+        """
+        Получает доставки подписки от новых к старым с keyset пагинацией.
 
-            total_result = await self._session.execute(select(func.count()).select_from(count_stmt.subquery()))
-            total = total_result.scalar_one() or 0
+        Страница читается по индексу (subscription_id, created_at, uuid) начиная с курсора,
+        поэтому стоимость запроса не зависит от номера страницы; общее количество не считается.
+        """
+        try:
+            stmt = (
+                select(WebhookDelivery)
+                .where(WebhookDelivery.subscription_id == query.subscription_id)
+                .order_by(WebhookDelivery.created_at.desc(), WebhookDelivery.uuid.desc())
+            )
 
-            if query.pagination:
-                stmt = stmt.offset(query.pagination.offset).limit(query.pagination.limit)
+            pagination = query.pagination
+            if pagination is not None:
+                if pagination.after is not None:
+                    stmt = stmt.where(
+                        tuple_(WebhookDelivery.created_at, WebhookDelivery.uuid)
+                        < (datetime_aware_to_naive(pagination.after.created_at), pagination.after.uuid)
+                    )
+                # Лишняя строка показывает, есть ли следующая страница
+                stmt = stmt.limit(pagination.limit + 1)
 
             result = await self._session.execute(stmt)
-            delivery_models = result.scalars().all()
-
-            entities = [to_domain_entity(delivery) for delivery in delivery_models]
-
-            return QueryResult[WebhookDeliveryEntity](
-                items=entities,
-                total=total,
-                limit=query.pagination.limit if query.pagination else None,
-                offset=query.pagination.offset if query.pagination else None,
+            delivery_models = list(result.scalars().all())
+
+            next_cursor = None
+            if pagination is not None and len(delivery_models) > pagination.limit:
+                delivery_models = delivery_models[: pagination.limit]
+                last = delivery_models[-1]
+                next_cursor = KeysetCursor(created_at=datetime_naive_to_aware(last.created_at), uuid=last.uuid)
+
+            return KeysetQueryResult[WebhookDeliveryEntity](
+                items=[to_domain_entity(delivery) for delivery in delivery_models],
+                limit=pagination.limit if pagination else None,
+                next_cursor=next_cursor,
             )
         except Exception as e:
             raise DatabaseException(f"Ошибка базы данных при получении доставок webhook: {e}") from e
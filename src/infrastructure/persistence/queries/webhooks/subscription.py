@@ -1,11 +1,11 @@
 from uuid import UUID
 
-from sqlalchemy import cast, func, select
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.webhooks.queries.queries import ListWebhookSubscriptionsQuery
 from src.application.webhooks.queries.subscription import WebhookSubscriptionQueryServiceProtocol
+from src.domain.common.enums import EventTypesEnum
 from src.domain.common.queries import QueryResult
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 from src.infrastructure.common.exceptions import DatabaseException
@@ -58,6 +58,18 @@ class WebhookSubscriptionQueryService(WebhookSubscriptionQueryServiceProtocol):
         except Exception as e:
             raise DatabaseException(f"Ошибка базы данных при получении списка подписок на webhook: {e}") from e
 
+    async def list_active(self, event_type: EventTypesEnum | None = None) -> tuple[WebhookSubscriptionEntity, ...]:
+        """Получает все активные подписки, при event_type — только подписанные на это событие"""
+        try:
+            stmt = select(WebhookSubscription).where(WebhookSubscription.is_active.is_(True))
+            if event_type is not None:
+                stmt = stmt.where(_contains_event(event_type))
+
+            result = await self._session.execute(stmt)
+            return tuple(to_domain_entity(subscription) for subscription in result.scalars().all())
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при получении активных подписок на webhook: {e}") from e
+
     def _apply_filters(self, stmt, count_stmt, filters):
         """Применяет фильтры к запросу"""
         from src.application.webhooks.queries.filters import WebhookReadFilters
@@ -66,10 +78,12 @@ class WebhookSubscriptionQueryService(WebhookSubscriptionQueryServiceProtocol):
             raise ValueError("filters должен быть типа WebhookReadFilters")
 
         if filters.event_type is not None:
-            event_type_value = str(filters.event_type)
-            events_jsonb = cast(WebhookSubscription.events, JSONB)
-            filter_array = func.jsonb_build_array(event_type_value)
-            stmt = stmt.where(events_jsonb.op("@>")(filter_array))
-            count_stmt = count_stmt.where(events_jsonb.op("@>")(filter_array))
+            stmt = stmt.where(_contains_event(filters.event_type))
+            count_stmt = count_stmt.where(_contains_event(filters.event_type))
 
         return stmt, count_stmt
+
+
+def _contains_event(event_type: EventTypesEnum):
+    """Условие events @> '["<event>"]'; использует GIN индекс idx_webhook_subscription_events"""
+    return WebhookSubscription.events.op("@>")(func.jsonb_build_array(str(event_type)))
@@ -1,18 +1,37 @@
 from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Date, Integer, bindparam, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
+from sqlalchemy.sql.selectable import TableValuedAlias
 
-from src.core.time import datetime_aware_to_naive
+from src.core.time import datetime_aware_to_naive, datetime_naive_to_aware
 from src.domain.batches import BatchEntity
 from src.domain.batches.interfaces.repository import BatchRepositoryProtocol
+from src.domain.batches.value_objects import BatchShift, ShiftTimeRange
 from src.domain.common.exceptions import DoesNotExistError
 from src.infrastructure.common.exceptions import DatabaseException
-from src.infrastructure.persistence.mappers.batches import to_domain_entity, to_persistence_model
+from src.infrastructure.persistence.mappers.batches import to_domain_entity, to_persistence_model, to_persistence_row
 from src.infrastructure.persistence.models.batch import Batch
 from src.infrastructure.persistence.repositories.base import BaseRepository
 
+# Колонки, изменяемые пакетным обновлением партий (продукты записываются отдельно)
+_MUTABLE_COLUMNS = (
+    "updated_at",
+    "is_closed",
+    "closed_at",
+    "task_description",
+    "shift",
+    "team",
+    "nomenclature",
+    "ekn_code",
+    "shift_start_time",
+    "shift_end_time",
+    "work_center_id",
+)
+
 
 class BatchRepository(BaseRepository[BatchEntity, Batch], BatchRepositoryProtocol):
     def __init__(self, session: AsyncSession):
@@ -69,3 +88,119 @@ class BatchRepository(BaseRepository[BatchEntity, Batch], BatchRepositoryProtoco
             return [self._to_domain_entity(batch) for batch in batch_models]
         except Exception as e:
             raise DatabaseException(f"Ошибка базы данных при поиске просроченных партий: {e}") from e
+
+    async def get_by_batch_numbers_and_dates(self, keys: list[tuple[int, date]]) -> list[BatchEntity]:
+        """Находит партии по набору пар (номер партии, дата) одним запросом; продукты загружаются, рабочий центр нет"""
+        if not keys:
+            return []
+
+        try:
+            requested = _keys_table(keys)
+            stmt = (
+                select(self._model_class)
+                .join(
+                    requested,
+                    (self._model_class.batch_number == requested.c.batch_number)
+                    & (self._model_class.batch_date == requested.c.batch_date),
+                )
+                .options(noload(self._model_class.work_center))
+            )
+            result = await self._session.execute(stmt)
+            return [self._to_domain_entity(batch) for batch in result.scalars().all()]
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при поиске партий по номерам и датам: {e}") from e
+
+    async def get_existing_numbers_and_dates(self, keys: list[tuple[int, date]]) -> set[tuple[int, date]]:
+        """Возвращает пары (номер партии, дата) из набора, для которых партии уже существуют"""
+        if not keys:
+            return set()
+
+        try:
+            requested = _keys_table(keys)
+            stmt = select(self._model_class.batch_number, self._model_class.batch_date).join(
+                requested,
+                (self._model_class.batch_number == requested.c.batch_number)
+                & (self._model_class.batch_date == requested.c.batch_date),
+            )
+            result = await self._session.execute(stmt)
+            return {(row.batch_number, row.batch_date) for row in result}
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при проверке существования партий: {e}") from e
+
+    async def get_shifts(self, work_center_ids: list[UUID], start: datetime, end: datetime) -> list[BatchShift]:
+        """Находит смены партий рабочих центров, пересекающиеся с интервалом [start, end), без загрузки партий"""
+        if not work_center_ids:
+            return []
+
+        try:
+            stmt = select(
+                self._model_class.uuid,
+                self._model_class.work_center_id,
+                self._model_class.shift_start_time,
+                self._model_class.shift_end_time,
+            ).where(
+                self._model_class.work_center_id.in_(work_center_ids),
+                self._model_class.shift_start_time < datetime_aware_to_naive(end),
+                self._model_class.shift_end_time > datetime_aware_to_naive(start),
+            )
+            result = await self._session.execute(stmt)
+            return [
+                BatchShift(
+                    batch_id=row.uuid,
+                    work_center_id=row.work_center_id,
+                    shift_time_range=ShiftTimeRange(
+                        start=datetime_naive_to_aware(row.shift_start_time),
+                        end=datetime_naive_to_aware(row.shift_end_time),
+                    ),
+                )
+                for row in result
+            ]
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при поиске смен рабочих центров: {e}") from e
+
+    async def create_many(self, domain_entities: list[BatchEntity]) -> None:
+        """
+        Создает несколько партий многострочным INSERT без добавления объектов в сессию.
+        Продукты партий не записываются: они создаются через репозиторий продуктов.
+        """
+        if not domain_entities:
+            return
+
+        try:
+            # executemany с INSERT разбивается SQLAlchemy на многострочные VALUES (insertmanyvalues)
+            await self._session.execute(insert(Batch), [to_persistence_row(entity) for entity in domain_entities])
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при создании {self._model_name}: {e}") from e
+
+    async def update_many(self, domain_entities: list[BatchEntity]) -> None:
+        """Обновляет поля нескольких партий по первичному ключу одним executemany UPDATE, без продуктов"""
+        if not domain_entities:
+            return
+
+        rows = []
+        for entity in domain_entities:
+            row = to_persistence_row(entity)
+            rows.append({column: row[column] for column in ("uuid", *_MUTABLE_COLUMNS)})
+
+        try:
+            await self._session.execute(update(Batch), rows)
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при обновлении {self._model_name}: {e}") from e
+
+
+def _keys_table(keys: list[tuple[int, date]]) -> TableValuedAlias:
+    """
+    Набор пар (номер партии, дата) как таблица unnest(:numbers, :dates).
+
+    Два параметра-массива вместо пары параметров на ключ: размер набора не ограничен
+    лимитом количества параметров запроса.
+    """
+    numbers, dates = zip(*keys, strict=True)
+    return (
+        func.unnest(
+            bindparam("batch_numbers", list(numbers), type_=ARRAY(Integer())),
+            bindparam("batch_dates", list(dates), type_=ARRAY(Date())),
+        )
+        .table_valued("batch_number", "batch_date")
+        .render_derived(name="requested")
+    )
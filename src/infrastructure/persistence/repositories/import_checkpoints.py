@@ -0,0 +1,62 @@
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.batches.dtos.import_batches import ImportBatchesOutputDTO
+from src.core.time import datetime_now
+from src.infrastructure.common.exceptions import DatabaseException
+from src.infrastructure.persistence.models.batch_import_checkpoint import BatchImportCheckpoint
+
+
+class BatchImportCheckpointRepository:
+    """Контрольные точки импорта партий; работает в транзакции импорта"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get(self, file_hash: str) -> BatchImportCheckpoint | None:
+        """Возвращает контрольную точку импорта файла, если импорт уже закоммитил часть строк"""
+        try:
+            result = await self._session.execute(
+                select(BatchImportCheckpoint).where(BatchImportCheckpoint.file_hash == file_hash)
+            )
+            return result.scalar_one_or_none()
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при получении контрольной точки импорта: {e}") from e
+
+    async def save(
+        self,
+        file_hash: str,
+        object_name: str,
+        task_id: str,
+        update_existing: bool,
+        result: ImportBatchesOutputDTO,
+    ) -> None:
+        """Создает или обновляет контрольную точку одним INSERT ... ON CONFLICT DO UPDATE"""
+        values = {
+            "object_name": object_name,
+            "task_id": task_id,
+            "update_existing": update_existing,
+            "rows_committed": result.total,
+            "created": result.created,
+            "updated": result.updated,
+            "failed": result.failed,
+            "errors": result.errors,
+            "updated_at": datetime_now(naive=True),
+        }
+        try:
+            stmt = insert(BatchImportCheckpoint).values(file_hash=file_hash, **values)
+            await self._session.execute(
+                stmt.on_conflict_do_update(index_elements=[BatchImportCheckpoint.file_hash], set_=values)
+            )
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при сохранении контрольной точки импорта: {e}") from e
+
+    async def delete(self, file_hash: str) -> None:
+        """Удаляет контрольную точку импорта файла"""
+        try:
+            await self._session.execute(
+                delete(BatchImportCheckpoint).where(BatchImportCheckpoint.file_hash == file_hash)
+            )
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при удалении контрольной точки импорта: {e}") from e
@@ -1,22 +1,43 @@
 from datetime import timedelta
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import String, Uuid, and_, any_, bindparam, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.core.time import datetime_now
 from src.infrastructure.common.exceptions import OutboxRepositoryException
 from src.infrastructure.persistence.models.outbox_event import OutboxEvent, OutboxEventStatusEnum
 
+# Ключ advisory lock, сериализующего захват пачек всеми claimers (relay и задача Celery)
+OUTBOX_CLAIM_LOCK_KEY = 0x6F7574626F78  # "outbox"
+
 
 class OutboxRepository:
     """Репозиторий для работы с Transactional Outbox"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, bulk_insert_threshold: int | None = None):
+        """
+        Args:
+            session: Сессия БД
+            bulk_insert_threshold: Начиная с этого количества событий insert_events использует
+                bulk INSERT вместо ORM; None — всегда ORM
+        """
         self._session = session
+        self._bulk_insert_threshold = bulk_insert_threshold
 
     async def insert_events(self, events: list[OutboxEvent]) -> list[OutboxEvent]:
-        """Вставляет несколько событий в outbox в рамках текущей транзакции"""
+        """
+        Вставляет несколько событий в outbox в рамках текущей транзакции.
+
+        Большие пачки вставляются bulk INSERT в обход unit of work сессии; события с уже
+        существующим dedup_key при этом пропускаются (ON CONFLICT DO NOTHING).
+        """
+        if self._bulk_insert_threshold is not None and len(events) >= self._bulk_insert_threshold:
+            await self.bulk_insert_events(events)
+            return events
+
         try:
             self._session.add_all(events)
             await self._session.flush()
@@ -24,6 +45,24 @@ class OutboxRepository:
         except Exception as e:
             raise OutboxRepositoryException(f"Ошибка при вставке событий в outbox: {e}") from e
 
+    async def bulk_insert_events(self, events: list[OutboxEvent]) -> None:
+        """
+        Вставляет события многострочными INSERT без добавления объектов в сессию.
+        События с уже существующим dedup_key пропускаются.
+        """
+        if not events:
+            return
+
+        columns = OutboxEvent.__table__.columns.keys()
+        rows = [{column: getattr(event, column) for column in columns} for event in events]
+
+        try:
+            # executemany с INSERT разбивается SQLAlchemy на многострочные VALUES (insertmanyvalues)
+            stmt = insert(OutboxEvent).on_conflict_do_nothing(index_elements=["dedup_key", "occurred_at"])
+            await self._session.execute(stmt, rows)
+        except Exception as e:
+            raise OutboxRepositoryException(f"Ошибка при пакетной вставке событий в outbox: {e}") from e
+
     async def claim_pending_events(
         self,
         limit: int = 100,
@@ -32,18 +71,42 @@ class OutboxRepository:
         """
         Захватывает pending события для обработки (для будущего воркера).
         Использует FOR UPDATE SKIP LOCKED для конкурентной обработки.
+
+        Также повторно захватывает события в PROCESSING с истекшей блокировкой:
+        их обработчик упал или не смог зафиксировать статус после захвата.
+
+        События агрегата, у которого уже есть захваченное другим claimer событие, пропускаются,
+        поэтому события одного агрегата обрабатываются по порядку даже при нескольких claimers.
+        Захваты сериализуются advisory lock до конца транзакции, чтобы параллельный захват
+        видел уже зафиксированные PROCESSING события.
         """
         try:
             now = datetime_now(naive=True)
             locked_until = now + timedelta(seconds=lock_duration_seconds)
 
+            await self._session.execute(select(func.pg_advisory_xact_lock(OUTBOX_CLAIM_LOCK_KEY)))
+
+            in_flight = aliased(OutboxEvent)
             stmt = (
                 select(OutboxEvent)
                 .where(
-                    OutboxEvent.status == OutboxEventStatusEnum.PENDING,
                     or_(
-                        OutboxEvent.locked_until.is_(None),
-                        OutboxEvent.locked_until < now,
+                        and_(
+                            OutboxEvent.status == OutboxEventStatusEnum.PENDING,
+                            or_(
+                                OutboxEvent.locked_until.is_(None),
+                                OutboxEvent.locked_until < now,
+                            ),
+                        ),
+                        and_(
+                            OutboxEvent.status == OutboxEventStatusEnum.PROCESSING,
+                            OutboxEvent.locked_until < now,
+                        ),
+                    ),
+                    ~exists().where(
+                        in_flight.aggregate_id == OutboxEvent.aggregate_id,
+                        in_flight.status == OutboxEventStatusEnum.PROCESSING,
+                        in_flight.locked_until >= now,
                     ),
                 )
                 .order_by(OutboxEvent.created_at)
@@ -66,38 +129,77 @@ class OutboxRepository:
             raise OutboxRepositoryException(f"Ошибка при захвате событий из outbox: {e}") from e
 
     async def mark_event_done(self, event_id: UUID) -> None:
-        """Отмечает событие как успешно обработанное (для будущего воркера)"""
+        """Отмечает событие как успешно обработанное"""
+        await self.mark_events_done([event_id])
+
+    async def mark_event_failed(self, event_id: UUID, error: str) -> None:
+        """Отмечает событие как неудачно обработанное"""
+        await self.mark_events_failed({event_id: error})
+
+    async def mark_events_done(self, event_ids: list[UUID]) -> None:
+        """
+        Отмечает события как успешно обработанные одним UPDATE ... WHERE uuid = ANY(:ids).
+        Не загружает записи в сессию.
+        """
+        if not event_ids:
+            return
+
         try:
             now = datetime_now(naive=True)
-            event = await self._session.get(OutboxEvent, event_id)
-            if event:
-                event.status = OutboxEventStatusEnum.DONE
-                event.locked_until = None
-                event.processed_at = now
-                event.updated_at = now
-            await self._session.flush()
+            stmt = (
+                update(OutboxEvent)
+                .where(OutboxEvent.uuid == any_(bindparam("event_ids", event_ids, type_=ARRAY(Uuid()))))
+                .values(
+                    status=OutboxEventStatusEnum.DONE,
+                    locked_until=None,
+                    processed_at=now,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.execute(stmt)
         except Exception as e:
-            raise OutboxRepositoryException(f"Ошибка при отметке события как выполненного: {e}") from e
+            raise OutboxRepositoryException(f"Ошибка при отметке событий как выполненных: {e}") from e
+
+    async def mark_events_failed(self, errors: dict[UUID, str]) -> None:
+        """
+        Отмечает события как неудачно обработанные одним UPDATE ... FROM unnest(:ids, :errors).
+        Для каждого события сохраняется своё сообщение об ошибке.
+        """
+        if not errors:
+            return
 
-    async def mark_event_failed(self, event_id: UUID, error: str) -> None:
-        """Отмечает событие как неудачно обработанное (для будущего воркера)"""
         try:
             now = datetime_now(naive=True)
-            event = await self._session.get(OutboxEvent, event_id)
-            if event:
-                event.status = OutboxEventStatusEnum.FAILED
-                event.last_error = error
-                event.locked_until = None
-                event.updated_at = now
-            await self._session.flush()
+            failed = (
+                func.unnest(
+                    bindparam("event_ids", list(errors.keys()), type_=ARRAY(Uuid())),
+                    bindparam("errors", list(errors.values()), type_=ARRAY(String())),
+                )
+                .table_valued("event_id", "error")
+                .render_derived(name="failed")
+            )
+            stmt = (
+                update(OutboxEvent)
+                .where(OutboxEvent.uuid == failed.c.event_id)
+                .values(
+                    status=OutboxEventStatusEnum.FAILED,
+                    last_error=failed.c.error,
+                    locked_until=None,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self._session.execute(stmt)
         except Exception as e:
-            raise OutboxRepositoryException(f"Ошибка при отметке события как неудачного: {e}") from e
+            raise OutboxRepositoryException(f"Ошибка при отметке событий как неудачных: {e}") from e
 
     async def retry_failed_event(self, event_id: UUID) -> None:
         """Возвращает failed событие обратно в pending для повторной обработки (для будущего воркера)"""
         try:
             now = datetime_now(naive=True)
-            event = await self._session.get(OutboxEvent, event_id)
+            result = await self._session.execute(select(OutboxEvent).where(OutboxEvent.uuid == event_id))
+            event = result.scalar_one_or_none()
             if event and event.status == OutboxEventStatusEnum.FAILED:
                 event.status = OutboxEventStatusEnum.PENDING
                 event.locked_until = None
@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from src.infrastructure.common.exceptions import OutboxRepositoryException
+from src.infrastructure.persistence.repositories.partitions import DailyPartitionRepository, TablePartition
+
+# Партиция outbox_events; тип общий для всех таблиц с дневными партициями
+OutboxPartition = TablePartition
+
+
+class OutboxPartitionRepository(DailyPartitionRepository):
+    """Управление дневными партициями outbox_events (DDL и чтение партиций целиком)"""
+
+    table_name = "outbox_events"
+    partition_key = "occurred_at"
+    exception_class = OutboxRepositoryException
+
+    async def count_by_status(self, partition_name: str) -> dict[str, int]:
+        """Считает события партиции по статусам (имена значений enum в БД: PENDING, DONE, ...)"""
+        try:
+            result = await self._session.execute(
+                text(f'SELECT status::text AS status, count(*) AS total FROM public."{partition_name}" GROUP BY status')
+            )
+            return {row.status: row.total for row in result}
+        except Exception as e:
+            raise OutboxRepositoryException(f"Ошибка при подсчете событий партиции {partition_name}: {e}") from e
@@ -0,0 +1,185 @@
+import re
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.common.exceptions import DatabaseException, InfrastructureException
+
+_BOUND_PATTERN = re.compile(r"FOR VALUES FROM \((?P<start>[^)]+)\) TO \((?P<end>[^)]+)\)")
+
+
+@dataclass(frozen=True)
+class TablePartition:
+    """Партиция таблицы; границы None означают MINVALUE/MAXVALUE или DEFAULT партицию"""
+
+    name: str
+    range_start: datetime | None
+    range_end: datetime | None
+    is_default: bool = False
+
+    def covers(self, day: date) -> bool:
+        """Проверяет, попадает ли начало дня в диапазон партиции"""
+        if self.is_default:
+            return False
+        moment = datetime.combine(day, datetime.min.time())
+        return (self.range_start is None or self.range_start <= moment) and (
+            self.range_end is None or moment < self.range_end
+        )
+
+
+class DailyPartitionRepository:
+    """
+    Управление дневными партициями таблицы, партиционированной по диапазону времени
+    (DDL и чтение партиций целиком).
+
+    Наследники задают имя таблицы, колонку партиционирования и класс исключения.
+    """
+
+    table_name: str
+    partition_key: str
+    exception_class: type[InfrastructureException] = DatabaseException
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @classmethod
+    async def premake_daily_partitions(
+        cls,
+        session_factory: async_sessionmaker[AsyncSession],
+        partitions: list[TablePartition],
+        today: date,
+        days: int,
+    ) -> tuple[list[str], dict[date, Exception]]:
+        """
+        Создает недостающие дневные партиции с today на days дней вперед,
+        каждую в отдельной транзакции.
+
+        Args:
+            session_factory: Фабрика сессий БД
+            partitions: Существующие партиции (см. list_partitions)
+            today: Первый день
+            days: Количество дней вперед
+
+        Returns:
+            Имена созданных партиций и ошибки по дням, для которых партицию создать не удалось
+            (обычно в DEFAULT партиции уже есть строки за этот день)
+        """
+        created: list[str] = []
+        errors: dict[date, Exception] = {}
+        for offset in range(days + 1):
+            day = today + timedelta(days=offset)
+            if any(partition.covers(day) for partition in partitions):
+                continue
+
+            async with session_factory() as session:
+                try:
+                    created.append(await cls(session).create_daily_partition(day))
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    errors[day] = e
+        return created, errors
+
+    @staticmethod
+    def expired_partitions(partitions: list[TablePartition], today: date, retention_days: int) -> list[TablePartition]:
+        """Возвращает партиции, которые закончились раньше, чем retention_days дней назад"""
+        cutoff = datetime.combine(today - timedelta(days=retention_days), datetime.min.time())
+        return [
+            partition
+            for partition in partitions
+            if not partition.is_default and partition.range_end is not None and partition.range_end <= cutoff
+        ]
+
+    async def list_partitions(self) -> list[TablePartition]:
+        """Возвращает партиции таблицы, отсортированные по началу диапазона"""
+        try:
+            result = await self._session.execute(
+                text(
+                    """
+                    SELECT child.relname AS name, pg_get_expr(child.relpartbound, child.oid) AS bound
+                    FROM pg_inherits
+                    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                    JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+                    WHERE ns.nspname = 'public' AND parent.relname = :table_name
+                    """
+                ),
+                {"table_name": self.table_name},
+            )
+            partitions = [self._parse_partition(row.name, row.bound) for row in result]
+        except InfrastructureException:
+            raise
+        except Exception as e:
+            raise self.exception_class(f"Ошибка при получении партиций {self.table_name}: {e}") from e
+
+        return sorted(partitions, key=lambda partition: (partition.is_default, partition.range_start or datetime.min))
+
+    async def create_daily_partition(self, day: date) -> str:
+        """Создает партицию на сутки day, если её еще нет; возвращает имя партиции"""
+        name = f"{self.table_name}_p{day:%Y%m%d}"
+        try:
+            await self._session.execute(
+                text(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS public."{name}" PARTITION OF public.{self.table_name}
+                    FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')
+                    """
+                )
+            )
+        except Exception as e:
+            raise self.exception_class(f"Ошибка при создании партиции {name}: {e}") from e
+        return name
+
+    async def stream_rows(self, partition_name: str, chunk_size: int = 1000) -> AsyncIterator[dict]:
+        """Потоково читает все строки партиции через серверный курсор"""
+        try:
+            result = await self._session.stream(
+                text(f'SELECT * FROM public."{partition_name}" ORDER BY {self.partition_key}'),
+                execution_options={"yield_per": chunk_size},
+            )
+            async for row in result.mappings():
+                yield dict(row)
+        except Exception as e:
+            raise self.exception_class(f"Ошибка при чтении партиции {partition_name}: {e}") from e
+
+    async def detach_partition(self, partition_name: str) -> None:
+        """Отсоединяет партицию; таблица остается в схеме public как обычная"""
+        try:
+            await self._session.execute(
+                text(f'ALTER TABLE public.{self.table_name} DETACH PARTITION public."{partition_name}"')
+            )
+        except Exception as e:
+            raise self.exception_class(f"Ошибка при отсоединении партиции {partition_name}: {e}") from e
+
+    async def drop_partition(self, partition_name: str) -> None:
+        """Отсоединяет и удаляет партицию вместе с данными"""
+        await self.detach_partition(partition_name)
+        try:
+            await self._session.execute(text(f'DROP TABLE public."{partition_name}"'))
+        except Exception as e:
+            raise self.exception_class(f"Ошибка при удалении партиции {partition_name}: {e}") from e
+
+    def _parse_partition(self, name: str, bound: str) -> TablePartition:
+        """Разбирает выражение границ партиции из pg_get_expr(relpartbound)"""
+        if bound == "DEFAULT":
+            return TablePartition(name=name, range_start=None, range_end=None, is_default=True)
+
+        match = _BOUND_PATTERN.search(bound)
+        if match is None:
+            raise self.exception_class(f"Не удалось разобрать границы партиции {name}: {bound}")
+
+        return TablePartition(
+            name=name,
+            range_start=_parse_bound_value(match.group("start")),
+            range_end=_parse_bound_value(match.group("end")),
+        )
+
+
+def _parse_bound_value(value: str) -> datetime | None:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
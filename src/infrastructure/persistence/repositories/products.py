@@ -1,12 +1,12 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.products import ProductEntity
 from src.domain.products.interfaces.repository import ProductRepositoryProtocol
 from src.infrastructure.common.exceptions import DatabaseException
-from src.infrastructure.persistence.mappers.products import to_domain_entity, to_persistence_model
+from src.infrastructure.persistence.mappers.products import to_domain_entity, to_persistence_model, to_persistence_row
 from src.infrastructure.persistence.models.product import Product
 from src.infrastructure.persistence.repositories.base import BaseRepository
 
@@ -66,3 +66,13 @@ class ProductRepository(BaseRepository[ProductEntity, Product], ProductRepositor
             raise DatabaseException(f"Ошибка базы данных при получении продуктов по уникальным кодам: {e}") from e
 
         return [self._to_domain_entity(p) for p in products]
+
+    async def create_many(self, domain_entities: list[ProductEntity]) -> None:
+        """Создает несколько продуктов многострочным INSERT без добавления объектов в сессию"""
+        if not domain_entities:
+            return
+
+        try:
+            await self._session.execute(insert(Product), [to_persistence_row(entity) for entity in domain_entities])
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при создании {self._model_name}: {e}") from e
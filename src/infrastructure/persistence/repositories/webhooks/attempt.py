@@ -0,0 +1,46 @@
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.time import datetime_aware_to_naive
+from src.infrastructure.common.exceptions import DatabaseException
+from src.infrastructure.persistence.models.webhook import WebhookDeliveryAttempt
+from src.infrastructure.persistence.repositories.partitions import DailyPartitionRepository
+from src.infrastructure.webhooks.sender import WebhookAttempt
+
+
+class WebhookDeliveryAttemptRepository:
+    """Append-only журнал попыток отправки webhooks"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def append_many(self, attempts: list[WebhookAttempt]) -> None:
+        """Добавляет попытки многострочным INSERT без добавления объектов в сессию"""
+        if not attempts:
+            return
+
+        rows = [
+            {
+                "delivery_id": attempt.delivery_id,
+                "attempt": attempt.attempt,
+                "attempted_at": datetime_aware_to_naive(attempt.attempted_at),
+                "subscription_id": attempt.subscription_id,
+                "duration_ms": attempt.duration_ms,
+                "response_status": attempt.response_status,
+                "error_kind": attempt.error_kind,
+                "error_message": attempt.error_message,
+            }
+            for attempt in attempts
+        ]
+
+        try:
+            await self._session.execute(insert(WebhookDeliveryAttempt), rows)
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при записи попыток доставки webhook: {e}") from e
+
+
+class WebhookDeliveryAttemptPartitionRepository(DailyPartitionRepository):
+    """Управление дневными партициями webhook_delivery_attempts"""
+
+    table_name = "webhook_delivery_attempts"
+    partition_key = "attempted_at"
@@ -1,14 +1,103 @@
+from datetime import timedelta
+
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.time import datetime_aware_to_naive, datetime_now
 from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
+from src.domain.webhooks.enums import WebhookStatus
 from src.domain.webhooks.interfaces.delivery import WebhookDeliveryRepositoryProtocol
-from src.infrastructure.persistence.mappers.webhooks.delivery import to_domain_entity, to_persistence_model
+from src.infrastructure.common.exceptions import DatabaseException
+from src.infrastructure.persistence.mappers.webhooks.delivery import (
+    to_domain_entity,
+    to_persistence_model,
+    to_persistence_row,
+)
 from src.infrastructure.persistence.models.webhook import WebhookDelivery
 from src.infrastructure.persistence.repositories.base import BaseRepository
 
+# Поля, которые меняются после создания доставки (попытки и их результат)
+_MUTABLE_COLUMNS = (
+    "updated_at",
+    "status",
+    "attempts",
+    "response_status",
+    "response_body",
+    "error_message",
+    "delivered_at",
+    "next_attempt_at",
+)
+
 
 class WebhookDeliveryRepository(
     BaseRepository[WebhookDeliveryEntity, WebhookDelivery], WebhookDeliveryRepositoryProtocol
 ):
     def __init__(self, session: AsyncSession):
         super().__init__(session, WebhookDelivery, to_domain_entity, to_persistence_model)
+
+    async def create_many(self, domain_entities: list[WebhookDeliveryEntity]) -> None:
+        """
+        Создает несколько доставок многострочным INSERT без добавления объектов в сессию.
+        Доставки записываются сразу с итоговым статусом попытки.
+        """
+        if not domain_entities:
+            return
+
+        try:
+            # executemany с INSERT разбивается SQLAlchemy на многострочные VALUES (insertmanyvalues)
+            await self._session.execute(
+                insert(WebhookDelivery), [to_persistence_row(entity) for entity in domain_entities]
+            )
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при создании {self._model_name}: {e}") from e
+
+    async def update_many(self, domain_entities: list[WebhookDeliveryEntity]) -> None:
+        """
+        Обновляет изменяемые поля нескольких доставок по первичному ключу одним executemany UPDATE,
+        без предварительного SELECT.
+        """
+        if not domain_entities:
+            return
+
+        rows = []
+        for entity in domain_entities:
+            row = to_persistence_row(entity)
+            rows.append({column: row[column] for column in ("uuid", *_MUTABLE_COLUMNS)})
+
+        try:
+            await self._session.execute(update(WebhookDelivery), rows)
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при обновлении {self._model_name}: {e}") from e
+
+    async def claim_due_deliveries(self, limit: int, lease_seconds: int) -> list[WebhookDeliveryEntity]:
+        """
+        Захватывает PENDING доставки, у которых наступило время следующей попытки.
+
+        Одним UPDATE ... RETURNING по подзапросу с FOR UPDATE SKIP LOCKED сдвигает next_attempt_at
+        на lease_seconds, чтобы после commit захвата доставку не взял другой планировщик, пока идет отправка.
+        Если процесс упадет, доставка снова станет доступной по истечении lease.
+        """
+        try:
+            now = datetime_aware_to_naive(datetime_now())
+            due = (
+                select(WebhookDelivery.uuid)
+                .where(
+                    WebhookDelivery.status == WebhookStatus.PENDING,
+                    WebhookDelivery.next_attempt_at.is_not(None),
+                    WebhookDelivery.next_attempt_at <= now,
+                )
+                .order_by(WebhookDelivery.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            stmt = (
+                update(WebhookDelivery)
+                .where(WebhookDelivery.uuid.in_(due.scalar_subquery()))
+                .values(next_attempt_at=now + timedelta(seconds=lease_seconds))
+                .returning(WebhookDelivery)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self._session.execute(stmt)
+            return [self._to_domain_entity(model) for model in result.scalars().all()]
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при захвате доставок для повтора: {e}") from e
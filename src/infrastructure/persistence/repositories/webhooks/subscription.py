@@ -1,7 +1,12 @@
+from uuid import UUID
+
+from sqlalchemy import Uuid, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 from src.domain.webhooks.interfaces.subscription import WebhookSubscriptionRepositoryProtocol
+from src.infrastructure.common.exceptions import DatabaseException
 from src.infrastructure.persistence.mappers.webhooks.subscription import to_domain_entity, to_persistence_model
 from src.infrastructure.persistence.models.webhook import WebhookSubscription
 from src.infrastructure.persistence.repositories.base import BaseRepository
@@ -12,3 +17,18 @@ class WebhookSubscriptionRepository(
 ):
     def __init__(self, session: AsyncSession):
         super().__init__(session, WebhookSubscription, to_domain_entity, to_persistence_model)
+
+    async def get_by_ids(self, ids: list[UUID]) -> list[WebhookSubscriptionEntity]:
+        """Возвращает подписки из переданного списка ID одним запросом WHERE uuid = ANY(:ids)"""
+        try:
+            if not ids:
+                return []
+            stmt = select(self._model_class).where(
+                self._model_class.uuid == any_(bindparam("subscription_ids", ids, type_=ARRAY(Uuid())))
+            )
+            result = await self._session.execute(stmt)
+            subscriptions = result.scalars().all()
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при получении подписок по ID: {e}") from e
+
+        return [self._to_domain_entity(s) for s in subscriptions]
@@ -1,10 +1,15 @@
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from src.domain.work_centers import WorkCenterEntity
 from src.domain.work_centers.interfaces import WorkCenterRepositoryProtocol
 from src.infrastructure.common.exceptions import DatabaseException
-from src.infrastructure.persistence.mappers.work_centers import to_domain_entity, to_persistence_model
+from src.infrastructure.persistence.mappers.work_centers import (
+    to_domain_entity,
+    to_persistence_model,
+    to_persistence_row,
+)
 from src.infrastructure.persistence.models.work_center import WorkCenter
 from src.infrastructure.persistence.repositories.base import BaseRepository
 
@@ -25,3 +30,31 @@ class WorkCenterRepository(BaseRepository[WorkCenterEntity, WorkCenter], WorkCen
             raise DatabaseException(f"Ошибка базы данных при поиске рабочего центра по идентификатору: {e}") from e
 
         return self._to_domain_entity(work_center_model)
+
+    async def get_by_identifiers(self, identifiers: list[str]) -> list[WorkCenterEntity]:
+        """Находит рабочие центры по набору идентификаторов одним запросом, не загружая их партии"""
+        if not identifiers:
+            return []
+
+        try:
+            stmt = (
+                select(self._model_class)
+                .where(self._model_class.identifier.in_(identifiers))
+                .options(noload(self._model_class.batches))
+            )
+            result = await self._session.execute(stmt)
+            work_center_models = result.scalars().all()
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при поиске рабочих центров по идентификаторам: {e}") from e
+
+        return [self._to_domain_entity(work_center) for work_center in work_center_models]
+
+    async def create_many(self, domain_entities: list[WorkCenterEntity]) -> None:
+        """Создает несколько рабочих центров многострочным INSERT без добавления объектов в сессию"""
+        if not domain_entities:
+            return
+
+        try:
+            await self._session.execute(insert(WorkCenter), [to_persistence_row(entity) for entity in domain_entities])
+        except Exception as e:
+            raise DatabaseException(f"Ошибка базы данных при создании {self._model_name}: {e}") from e
@@ -0,0 +1,228 @@
+import enum
+import time
+
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+
+from src.core.logging import get_logger
+from src.core.settings import WebhookSettings
+
+logger = get_logger("webhooks.circuit_breaker")
+
+KEY_PREFIX = "webhooks:circuit"
+
+# Возвращает {код состояния, секунд до следующей пробы, ошибок подряд}:
+# 0 — closed, 1 — open, 2 — выдана проба (half-open)
+_ACQUIRE_SCRIPT = """
+local state = redis.call('HMGET', KEYS[1], 'open_until', 'failures')
+local open_until = tonumber(state[1] or '0')
+local now = tonumber(ARGV[1])
+if open_until == 0 then
+    return {0, '0', tonumber(state[2] or '0')}
+end
+if now < open_until then
+    return {1, tostring(open_until - now)}
+end
+if redis.call('SET', KEYS[2], '1', 'NX', 'EX', ARGV[2]) then
+    return {2, '0'}
+end
+return {1, tostring(math.max(redis.call('TTL', KEYS[2]), 1))}
+"""
+
+# Возвращает 1, если после ошибки цепь открыта
+_FAILURE_SCRIPT = """
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+local opened = 0
+if ARGV[5] == '1' or failures >= tonumber(ARGV[2]) then
+    redis.call('HSET', KEYS[1], 'open_until', tostring(tonumber(ARGV[1]) + tonumber(ARGV[3])), 'failures', '0')
+    redis.call('DEL', KEYS[2])
+    opened = 1
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return opened
+"""
+
+
+class CircuitState(enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+_STATES = {0: CircuitState.CLOSED, 1: CircuitState.OPEN, 2: CircuitState.HALF_OPEN}
+
+
+@dataclass(frozen=True)
+class CircuitDecision:
+    """Решение circuit breaker перед запросом"""
+
+    state: CircuitState
+    retry_after: float = 0.0
+    # Ошибки подряд, учтенные к моменту решения в CLOSED
+    failures: int = 0
+
+    @property
+    def allowed(self) -> bool:
+        """Можно ли выполнять запрос; в HALF_OPEN запрос — единственная проба"""
+        return self.state != CircuitState.OPEN
+
+
+@dataclass
+class _LocalCircuit:
+    failures: int = 0
+    open_until: float = 0.0
+    probe_until: float = 0.0
+    expires_at: float = 0.0
+
+
+class WebhookCircuitBreaker:
+    """
+    Circuit breaker для отправки webhooks по ключу (хост или подписка).
+
+    CLOSED: запросы выполняются, ошибки (таймаут, ошибка соединения, 5xx) считаются подряд;
+    счетчик сбрасывается успехом или через WEBHOOK_CIRCUIT_FAILURE_WINDOW секунд без ошибок.
+    После WEBHOOK_CIRCUIT_FAILURE_THRESHOLD ошибок цепь открывается на WEBHOOK_CIRCUIT_OPEN_SECONDS.
+    OPEN: запросы не выполняются. HALF_OPEN: по истечении времени один запрос во всех процессах
+    пропускается как проба; успех закрывает цепь, ошибка снова открывает.
+
+    Состояние хранится в Redis и общее для всех воркеров. Если Redis недоступен,
+    используется состояние процесса.
+    """
+
+    def __init__(self, settings: WebhookSettings, redis: Redis | None = None) -> None:
+        """
+        Args:
+            settings: Настройки webhooks
+            redis: Клиент Redis; без него состояние хранится только в процессе
+        """
+        self._settings = settings
+        self._redis = redis
+        self._acquire_script = redis.register_script(_ACQUIRE_SCRIPT) if redis is not None else None
+        self._failure_script = redis.register_script(_FAILURE_SCRIPT) if redis is not None else None
+        self._local: dict[str, _LocalCircuit] = {}
+        self._redis_available = True
+
+    async def acquire(self, key: str) -> CircuitDecision:
+        """Проверяет цепь перед запросом; в HALF_OPEN занимает пробу"""
+        if self._redis is not None:
+            try:
+                code, retry_after, *failures = await self._acquire_script(
+                    keys=self._keys(key), args=[time.time(), self._settings.circuit_open_seconds]
+                )
+                self._on_redis_success()
+                return CircuitDecision(
+                    state=_STATES[int(code)],
+                    retry_after=float(retry_after),
+                    failures=int(failures[0]) if failures else 0,
+                )
+            except Exception as e:
+                self._on_redis_error(e)
+
+        return self._acquire_local(key)
+
+    async def record_success(self, key: str, decision: CircuitDecision) -> None:
+        """
+        Закрывает цепь после успешного запроса.
+
+        В CLOSED без учтенных ошибок сбрасывать нечего, поэтому обычный успешный запрос
+        не обращается к Redis; ошибки, учтенные другими процессами после acquire,
+        истекают через WEBHOOK_CIRCUIT_FAILURE_WINDOW.
+        """
+        if decision.state == CircuitState.CLOSED and not decision.failures:
+            return
+
+        if decision.state == CircuitState.HALF_OPEN:
+            logger.info(f"Circuit closed for {key}")
+
+        if self._redis is not None:
+            try:
+                await self._redis.delete(*self._keys(key))
+                self._on_redis_success()
+                return
+            except Exception as e:
+                self._on_redis_error(e)
+
+        self._local.pop(key, None)
+
+    async def record_failure(self, key: str, decision: CircuitDecision) -> None:
+        """Учитывает ошибку запроса; открывает цепь при достижении порога или неудачной пробе"""
+        probe = decision.state == CircuitState.HALF_OPEN
+        opened = None
+
+        if self._redis is not None:
+            try:
+                opened = bool(
+                    await self._failure_script(
+                        keys=self._keys(key),
+                        args=[
+                            time.time(),
+                            self._settings.circuit_failure_threshold,
+                            self._settings.circuit_open_seconds,
+                            self._settings.circuit_open_seconds + self._settings.circuit_failure_window,
+                            "1" if probe else "0",
+                        ],
+                    )
+                )
+                self._on_redis_success()
+            except Exception as e:
+                self._on_redis_error(e)
+
+        if opened is None:
+            opened = self._record_failure_local(key, probe)
+
+        if opened:
+            logger.warning(
+                f"Circuit opened for {key} for {self._settings.circuit_open_seconds}s"
+                + (" (probe failed)" if probe else "")
+            )
+
+    def _keys(self, key: str) -> list[str]:
+        return [f"{KEY_PREFIX}:{key}", f"{KEY_PREFIX}:{key}:probe"]
+
+    def _acquire_local(self, key: str) -> CircuitDecision:
+        now = time.monotonic()
+        circuit = self._get_local(key, now)
+        if circuit is None or not circuit.open_until:
+            return CircuitDecision(state=CircuitState.CLOSED, failures=circuit.failures if circuit else 0)
+        if now < circuit.open_until:
+            return CircuitDecision(state=CircuitState.OPEN, retry_after=circuit.open_until - now)
+        if now < circuit.probe_until:
+            return CircuitDecision(state=CircuitState.OPEN, retry_after=circuit.probe_until - now)
+
+        circuit.probe_until = now + self._settings.circuit_open_seconds
+        return CircuitDecision(state=CircuitState.HALF_OPEN)
+
+    def _record_failure_local(self, key: str, probe: bool) -> bool:
+        now = time.monotonic()
+        circuit = self._get_local(key, now) or self._local.setdefault(key, _LocalCircuit())
+        circuit.failures += 1
+        circuit.expires_at = now + self._settings.circuit_open_seconds + self._settings.circuit_failure_window
+
+        if probe or circuit.failures >= self._settings.circuit_failure_threshold:
+            circuit.failures = 0
+            circuit.open_until = now + self._settings.circuit_open_seconds
+            circuit.probe_until = 0.0
+            return True
+        return False
+
+    def _get_local(self, key: str, now: float) -> _LocalCircuit | None:
+        circuit = self._local.get(key)
+        if circuit is not None and now >= circuit.expires_at:
+            del self._local[key]
+            return None
+        return circuit
+
+    def _on_redis_success(self) -> None:
+        if not self._redis_available:
+            self._redis_available = True
+            logger.info("Redis is available again, circuit breaker state is shared")
+
+    def _on_redis_error(self, error: Exception) -> None:
+        # Предупреждение один раз на период недоступности, чтобы не писать его на каждый запрос
+        if self._redis_available:
+            self._redis_available = False
+            logger.warning(f"Redis is unavailable, circuit breaker falls back to process state: {error}")
@@ -0,0 +1,34 @@
+import importlib.util
+
+import httpx
+
+from src.core.logging import get_logger
+from src.core.settings import WebhookSettings
+
+logger = get_logger("webhooks.client")
+
+
+def create_webhook_http_client(settings: WebhookSettings) -> httpx.AsyncClient:
+    """
+    Создает HTTP клиент для отправки webhooks с настроенным пулом соединений.
+
+    Клиент рассчитан на всё время жизни процесса: соединения с хостами подписчиков
+    переиспользуются между задачами, пока не истечет keepalive_expiry.
+    HTTP/2 включается, только если установлен пакет h2 (httpx[http2]).
+    """
+    http2 = settings.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("WEBHOOK_HTTP2 is enabled but the h2 package is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    logger.info(
+        f"Webhook HTTP client: max_connections={settings.http_max_connections}, "
+        f"max_keepalive={settings.http_max_keepalive_connections}, "
+        f"keepalive_expiry={settings.http_keepalive_expiry}s, http2={http2}"
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2)
@@ -10,6 +10,36 @@ logger = get_logger("webhooks.hmac")
 class HMACSigner:
     """Сервис для создания и проверки HMAC подписей webhook payload"""
 
+    @staticmethod
+    def serialize_payload(payload: dict) -> bytes:
+        """
+        Сериализует payload в канонический JSON (ключи отсортированы, UTF-8).
+
+        Эти байты отправляются телом webhook и по ним же считается подпись.
+        """
+        return json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def sign_body(body: bytes, secret_key: str) -> str:
+        """
+        Создает HMAC-SHA256 подпись для тела webhook запроса.
+
+        Args:
+            body: Тело запроса в байтах
+            secret_key: Секретный ключ для подписи
+
+        Returns:
+            Подпись в формате 'sha256=hex_signature'
+
+        Raises:
+            ValueError: Если secret_key пустой
+        """
+        if not secret_key:
+            raise ValueError("Не удалось создать подпись: secret_key не может быть пустым")
+
+        signature = hmac.new(secret_key.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return f"sha256={signature}"
+
     @staticmethod
     def sign_payload(payload: dict, secret_key: str) -> str:
         """
@@ -26,16 +56,7 @@ class HMACSigner:
             ValueError: Если secret_key пустой или payload невалидный
         """
         try:
-            if not secret_key:
-                raise ValueError("secret_key не может быть пустым")
-
-            payload_json = json.dumps(payload, sort_keys=True, ensure_ascii=False)
-            payload_bytes = payload_json.encode("utf-8")
-            secret_bytes = secret_key.encode("utf-8")
-
-            signature = hmac.new(secret_bytes, payload_bytes, hashlib.sha256).hexdigest()
-
-            return f"sha256={signature}"
+            return HMACSigner.sign_body(HMACSigner.serialize_payload(payload), secret_key)
         except (TypeError, ValueError) as e:
             logger.warning(f"Ошибка при создании подписи: {e}")
             raise ValueError(f"Не удалось создать подпись: {e}") from e
@@ -43,6 +64,25 @@ class HMACSigner:
             logger.warning(f"Неожиданная ошибка при создании подписи: {e}")
             raise ValueError(f"Не удалось создать подпись: {e}") from e
 
+    @staticmethod
+    def verify_body(body: bytes, signature: str, secret_key: str) -> bool:
+        """
+        Проверяет HMAC-SHA256 подпись по исходному телу запроса, байт в байт.
+
+        Args:
+            body: Тело запроса в байтах, как оно получено
+            signature: Подпись в формате 'sha256=hex_signature'
+            secret_key: Секретный ключ для проверки
+
+        Returns:
+            True если подпись валидна, False в противном случае
+        """
+        try:
+            return HMACSigner._compare(HMACSigner.sign_body(body, secret_key), signature)
+        except Exception as e:
+            logger.warning(f"Ошибка при проверке подписи: {e}")
+            return False
+
     @staticmethod
     def verify_signature(payload: dict, signature: str, secret_key: str) -> bool:
         """
@@ -61,32 +101,36 @@ class HMACSigner:
                 logger.warning("secret_key пустой при проверке подписи")
                 return False
 
-            if not signature:
-                logger.warning("signature пустая при проверке подписи")
-                return False
+            return HMACSigner._compare(HMACSigner.sign_payload(payload, secret_key), signature)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ошибка при проверке подписи: {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"Неожиданная ошибка при проверке подписи: {e}")
+            return False
 
-            if not signature.startswith("sha256="):
-                logger.warning(f"Неверный формат подписи: {signature}")
-                return False
+    @staticmethod
+    def _compare(expected_signature: str, signature: str) -> bool:
+        """Сравнивает ожидаемую подпись с полученной за постоянное время"""
+        if not signature:
+            logger.warning("signature пустая при проверке подписи")
+            return False
 
-            expected_signature = HMACSigner.sign_payload(payload, secret_key)
-            received_signature_value = signature.split("=", 1)[1]
+        if not signature.startswith("sha256="):
+            logger.warning(f"Неверный формат подписи: {signature}")
+            return False
 
-            if not received_signature_value:
-                logger.warning("Пустое значение подписи после 'sha256='")
-                return False
+        received_signature_value = signature.split("=", 1)[1]
+
+        if not received_signature_value:
+            logger.warning("Пустое значение подписи после 'sha256='")
+            return False
 
-            expected_signature_value = expected_signature.split("=", 1)[1]
+        expected_signature_value = expected_signature.split("=", 1)[1]
 
-            is_valid = hmac.compare_digest(expected_signature_value, received_signature_value)
+        is_valid = hmac.compare_digest(expected_signature_value, received_signature_value)
 
-            if not is_valid:
-                logger.warning("Подпись не совпадает")
+        if not is_valid:
+            logger.warning("Подпись не совпадает")
 
-            return is_valid
-        except (TypeError, ValueError) as e:
-            logger.warning(f"Ошибка при проверке подписи: {e}")
-            return False
-        except Exception as e:
-            logger.warning(f"Неожиданная ошибка при проверке подписи: {e}")
-            return False
+        return is_valid
@@ -0,0 +1,104 @@
+import asyncio
+import contextlib
+
+from collections.abc import AsyncIterator
+
+import httpx
+
+
+class _HostLimit:
+    """Текущий лимит хоста и число запросов к нему в полете"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+
+    def has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+
+class HostConcurrencyLimiter:
+    """
+    Ограничивает число одновременных HTTP запросов webhooks: общее и на один хост.
+
+    Хостом считается пара host:port из URL подписки. Медленный хост занимает не больше
+    max_per_host слотов, поэтому не может занять весь общий лимит и задержать остальные.
+
+    Лимит хоста адаптивный (AIMD): каждый перегруженный ответ (таймаут, 5xx, 429) умножает его
+    на decrease_factor, но не ниже min_per_host; каждый нормальный ответ увеличивает на 1/лимит,
+    т.е. примерно на 1 за лимит успешных ответов, до max_per_host.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_per_host: int,
+        min_per_host: int | None = None,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Максимум одновременных запросов на процесс
+            max_per_host: Максимум одновременных запросов к одному хосту
+            min_per_host: Нижняя граница адаптивного лимита хоста; по умолчанию max_per_host (лимит постоянный)
+            decrease_factor: Множитель лимита хоста при перегруженном ответе
+        """
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._max_per_host = max_per_host
+        self._min_per_host = max_per_host if min_per_host is None else min_per_host
+        self._decrease_factor = decrease_factor
+        self._hosts: dict[str, _HostLimit] = {}
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Ключ хоста для URL"""
+        parsed = httpx.URL(url)
+        return f"{parsed.host}:{parsed.port or (443 if parsed.scheme == 'https' else 80)}"
+
+    def limits(self) -> dict[str, float]:
+        """Текущие лимиты по хостам"""
+        return {key: round(host.limit, 2) for key, host in self._hosts.items()}
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, url: str) -> AsyncIterator[None]:
+        """Занимает слот хоста, затем общий слот, на время запроса"""
+        host = self._get_host(self.host_key(url))
+
+        # Сначала слот хоста: запросы к перегруженному хосту ждут, не занимая общий лимит
+        async with host.condition:
+            await host.condition.wait_for(host.has_slot)
+            host.in_flight += 1
+
+        try:
+            async with self._global:
+                yield
+        finally:
+            async with host.condition:
+                host.in_flight -= 1
+                host.condition.notify()
+
+    async def record(self, url: str, overloaded: bool) -> None:
+        """
+        Корректирует лимит хоста по результату запроса.
+
+        Args:
+            url: URL запроса
+            overloaded: Хост перегружен (таймаут, 5xx, 429)
+        """
+        host = self._get_host(self.host_key(url))
+        async with host.condition:
+            if overloaded:
+                host.limit = max(float(self._min_per_host), host.limit * self._decrease_factor)
+                return
+
+            previous = int(host.limit)
+            host.limit = min(float(self._max_per_host), host.limit + 1 / host.limit)
+            if int(host.limit) > previous:
+                host.condition.notify()
+
+    def _get_host(self, key: str) -> _HostLimit:
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = _HostLimit(self._max_per_host)
+        return host
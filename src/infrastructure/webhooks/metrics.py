@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+
+# Верхние границы корзин гистограммы задержки в секундах; последняя корзина — всё, что дольше
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class HostRequestStats:
+    """Гистограмма задержки и счетчики ошибок запросов к одному хосту"""
+
+    requests: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def observe(self, latency: float, error_kind: str | None) -> None:
+        """Учитывает один запрос"""
+        self.requests += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.buckets[_bucket_index(latency)] += 1
+        if error_kind is not None:
+            self.errors[error_kind] = self.errors.get(error_kind, 0) + 1
+
+    def to_dict(self) -> dict:
+        """Сводка в виде словаря; гистограмма — количество запросов по корзинам le_<граница>"""
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS] + ["le_inf"]
+        return {
+            "requests": self.requests,
+            "errors": sum(self.errors.values()),
+            "error_kinds": dict(self.errors),
+            "avg_latency_s": round(self.latency_sum / self.requests, 3) if self.requests else 0.0,
+            "max_latency_s": round(self.latency_max, 3),
+            "latency_histogram": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class WebhookHostMetrics:
+    """
+    Метрики HTTP запросов webhooks по хостам подписчиков.
+
+    Показывают, какой подписчик замедляет доставку: задержка учитывается без ожидания
+    слота в HostConcurrencyLimiter, ошибки разделены по видам (timeout, connect, http_4xx, ...).
+    """
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, HostRequestStats] = {}
+
+    def observe(self, host: str, latency: float, error_kind: str | None = None) -> None:
+        """Учитывает один запрос к хосту"""
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = HostRequestStats()
+        stats.observe(latency, error_kind)
+
+    def snapshot(self, reset: bool = False) -> dict[str, dict]:
+        """
+        Возвращает метрики по хостам, самые медленные — первыми.
+
+        Args:
+            reset: Сбросить накопленные значения после снимка
+        """
+        data = {
+            host: stats.to_dict()
+            for host, stats in sorted(
+                self._hosts.items(), key=lambda item: item[1].latency_sum / max(item[1].requests, 1), reverse=True
+            )
+        }
+        if reset:
+            self._hosts = {}
+        return data
+
+
+def _bucket_index(latency: float) -> int:
+    for index, bound in enumerate(LATENCY_BUCKETS):
+        if latency <= bound:
+            return index
+    return len(LATENCY_BUCKETS)
@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+from typing import ClassVar
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.webhooks.routing import WebhookRoutingNotifierProtocol
+from src.core.logging import get_logger
+from src.core.settings import WebhookSettings
+from src.domain.common.enums import EventTypesEnum
+from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
+from src.infrastructure.persistence.queries.webhooks.subscription import WebhookSubscriptionQueryService
+
+logger = get_logger("webhooks.routing")
+
+ROUTING_CHANNEL = "webhooks:routing:changed"
+ROUTING_VERSION_KEY = "webhooks:routing:version"
+
+# Пауза перед переподпиской на канал после ошибки Redis
+_LISTEN_RETRY_DELAY = 5
+
+
+class RedisWebhookRoutingNotifier(WebhookRoutingNotifierProtocol):
+    """Уведомляет об изменении подписок: увеличивает версию в Redis и публикует сообщение в канал"""
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def notify_changed(self) -> None:
+        """Сообщает, что набор подписок изменился"""
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                version = (await pipe.incr(ROUTING_VERSION_KEY).publish(ROUTING_CHANNEL, b"changed").execute())[0]
+            logger.debug(f"Webhook routing change published: version={version}")
+        except Exception as e:
+            logger.warning(f"Failed to publish webhook routing change, workers will reload on TTL: {e}")
+
+
+class WebhookRoutingTable:
+    """
+    Процессная таблица маршрутизации webhooks: тип события -> активные подписки на него.
+
+    Перечитывается целиком одним запросом при изменении подписок (уведомление через Redis),
+    по истечении WEBHOOK_ROUTING_TTL или после invalidate(). Webhook dispatcher слушает канал
+    ROUTING_CHANNEL; Celery задачи сверяют версию ROUTING_VERSION_KEY в начале запуска.
+    При WEBHOOK_ROUTING_TTL=0 таблица не используется и подписки читаются из БД на каждое событие
+    (по GIN индексу idx_webhook_subscription_events). Результат нельзя изменять.
+    """
+
+    _routes: ClassVar[dict[EventTypesEnum, tuple[WebhookSubscriptionEntity, ...]]] = {}
+    _loaded_at: ClassVar[float | None] = None
+    _version: ClassVar[bytes | None] = None
+    _ttl: ClassVar[int] = WebhookSettings().routing_ttl
+    _lock: ClassVar[asyncio.Lock | None] = None
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> None:
+        """Перечитывает активные подписки из БД"""
+        subscriptions = await WebhookSubscriptionQueryService(session).list_active()
+        routes: dict[EventTypesEnum, list[WebhookSubscriptionEntity]] = {}
+        for subscription in subscriptions:
+            for event_type in dict.fromkeys(subscription.events.value):
+                routes.setdefault(event_type, []).append(subscription)
+
+        cls._routes = {event_type: tuple(items) for event_type, items in routes.items()}
+        cls._loaded_at = time.monotonic()
+        logger.debug(
+            f"Webhook routing table loaded: {len(subscriptions)} active subscription(s), "
+            f"{len(cls._routes)} event type(s)"
+        )
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Помечает таблицу устаревшей; следующий запрос перечитает её из БД"""
+        cls._loaded_at = None
+
+    @classmethod
+    def is_stale(cls) -> bool:
+        """Проверяет, нужно ли перечитать таблицу"""
+        return cls._loaded_at is None or time.monotonic() - cls._loaded_at >= cls._ttl
+
+    @classmethod
+    async def get_subscriptions(
+        cls, session: AsyncSession, event_type: EventTypesEnum
+    ) -> tuple[WebhookSubscriptionEntity, ...]:
+        """
+        Возвращает активные подписки на тип события.
+
+        Args:
+            session: Сессия, через которую таблица перечитывается при необходимости
+            event_type: Тип события webhook
+        """
+        if cls._ttl == 0:
+            return await WebhookSubscriptionQueryService(session).list_active(event_type)
+
+        if cls.is_stale():
+            if cls._lock is None:
+                cls._lock = asyncio.Lock()
+            # Одновременные сообщения dispatcher перечитывают таблицу один раз
+            async with cls._lock:
+                if cls.is_stale():
+                    await cls.load(session)
+
+        return cls._routes.get(event_type, ())
+
+    @classmethod
+    async def sync_version(cls, redis: Redis) -> None:
+        """Сверяет версию подписок в Redis и сбрасывает таблицу, если подписки изменились"""
+        try:
+            version = await redis.get(ROUTING_VERSION_KEY)
+        except Exception as e:
+            logger.debug(f"Failed to read webhook routing version, relying on TTL: {e}")
+            return
+
+        if version != cls._version:
+            cls._version = version
+            cls.invalidate()
+
+    @classmethod
+    async def listen(cls, redis: Redis) -> None:
+        """Сбрасывает таблицу по каждому сообщению в ROUTING_CHANNEL; работает до отмены задачи"""
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(ROUTING_CHANNEL)
+                # Пока подписки не было, изменения могли быть пропущены
+                cls.invalidate()
+                logger.info(f"Listening for webhook routing changes on {ROUTING_CHANNEL}")
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        cls.invalidate()
+                        logger.debug("Webhook routing table invalidated")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Webhook routing listener failed, resubscribing in {_LISTEN_RETRY_DELAY}s: {e}")
+                await asyncio.sleep(_LISTEN_RETRY_DELAY)
+            finally:
+                await pubsub.aclose()
@@ -1,25 +1,37 @@
-import asyncio
+import logging
+import random
+import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from uuid import UUID
 
 import httpx
 
-from src.core.logging import get_logger
+from src.core.logging import get_logger, log_dict
+from src.core.settings import WebhookSettings
 from src.core.time import datetime_now
 from src.domain.common.enums import EventTypesEnum
 from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
+from src.infrastructure.webhooks.circuit_breaker import CircuitDecision, CircuitState, WebhookCircuitBreaker
+from src.infrastructure.webhooks.client import create_webhook_http_client
 from src.infrastructure.webhooks.hmac import HMACSigner
+from src.infrastructure.webhooks.limiter import HostConcurrencyLimiter
+from src.infrastructure.webhooks.metrics import WebhookHostMetrics
 
 logger = get_logger("webhooks.sender")
 
+# Длина сообщения об ошибке в журнале попыток; полный текст последней ошибки хранится в доставке
+ATTEMPT_ERROR_MESSAGE_MAX_LENGTH = 255
+
 
 @dataclass(frozen=True)
 class WebhookRequest:
     """Данные для отправки webhook запроса"""
 
     url: str
-    payload: dict
+    content: bytes
     headers: dict[str, str]
     timeout: int
 
@@ -32,18 +44,109 @@ class WebhookResponse:
     status_code: int | None = None
     body: str | None = None
     error_message: str | None = None
+    error_kind: str | None = None
+    duration: float | None = None
+
+    @property
+    def is_endpoint_failure(self) -> bool:
+        """Ошибка говорит о недоступности endpoint (учитывается circuit breaker)"""
+        return self.error_kind in ("timeout", "connect", "request", "http_5xx")
+
+    @property
+    def is_overloaded(self) -> bool:
+        """Endpoint перегружен (уменьшает лимит хоста)"""
+        return self.error_kind in ("timeout", "http_5xx") or self.status_code == 429
+
+
+@dataclass(frozen=True)
+class WebhookAttempt:
+    """Запись журнала попыток: одна выполненная HTTP попытка доставки"""
+
+    delivery_id: UUID
+    subscription_id: UUID
+    attempt: int
+    attempted_at: datetime
+    duration_ms: int | None
+    response_status: int | None
+    error_kind: str | None
+    error_message: str | None
 
 
 class WebhookSender:
-    """Сервис для отправки HTTP запросов webhooks с ретраями и таймаутом"""
+    """
+    Сервис для отправки HTTP запросов webhooks с таймаутом.
+
+    Каждый вызов send_webhook — одна попытка под HostConcurrencyLimiter. Повторные попытки
+    не ждут внутри вызова: доставка остается PENDING с next_attempt_at, и её повторяет
+    задача tasks.retry_failed_webhooks.
+
+    Если circuit breaker хоста (или подписки) открыт, запрос не выполняется: доставка
+    откладывается до следующей пробы без расхода попыток.
+    """
+
+    def __init__(
+        self,
+        limiter: HostConcurrencyLimiter | None = None,
+        settings: WebhookSettings | None = None,
+        client: httpx.AsyncClient | None = None,
+        metrics: WebhookHostMetrics | None = None,
+        circuit_breaker: WebhookCircuitBreaker | None = None,
+    ) -> None:
+        """
+        Args:
+            limiter: Ограничитель конкурентности запросов; по умолчанию создается из settings
+            settings: Настройки webhooks; по умолчанию WebhookSettings()
+            client: HTTP клиент; по умолчанию создается при первом запросе через create_webhook_http_client
+            metrics: Метрики запросов по хостам; по умолчанию собственный экземпляр
+            circuit_breaker: Circuit breaker; по умолчанию с состоянием в процессе, если он включен
+        """
+        self._client = client
+        self._settings = settings or WebhookSettings()
+        if limiter is None:
+            limiter = HostConcurrencyLimiter(
+                self._settings.max_concurrency,
+                self._settings.max_per_host,
+                min_per_host=self._settings.min_per_host,
+                decrease_factor=self._settings.aimd_decrease_factor,
+            )
+        self._limiter = limiter
+        if circuit_breaker is None and self._settings.circuit_enabled:
+            circuit_breaker = WebhookCircuitBreaker(self._settings)
+        self._circuit_breaker = circuit_breaker
+        self._metrics = metrics or WebhookHostMetrics()
+        self._metrics_logged_at = time.monotonic()
+
+    @property
+    def metrics(self) -> WebhookHostMetrics:
+        """Метрики HTTP запросов по хостам подписчиков"""
+        return self._metrics
+
+    def log_host_metrics(self, force: bool = False) -> None:
+        """
+        Пишет в лог метрики по хостам за период и сбрасывает их.
+
+        Без force пишет не чаще раза в WEBHOOK_METRICS_LOG_INTERVAL секунд.
+        """
+        now = time.monotonic()
+        if not force and now - self._metrics_logged_at < self._settings.metrics_log_interval:
+            return
+        self._metrics_logged_at = now
 
-    def __init__(self) -> None:
-        self._client: httpx.AsyncClient | None = None
+        for host, data in self.host_metrics(reset=True).items():
+            log_dict(logger, logging.INFO, f"Webhook host metrics: host={host}", data)
+
+    def host_metrics(self, reset: bool = False) -> dict[str, dict]:
+        """Метрики запросов по хостам вместе с текущим адаптивным лимитом хоста"""
+        limits = self._limiter.limits()
+        return {
+            host: {**data, "concurrency_limit": limits.get(host)}
+            for host, data in self._metrics.snapshot(reset=reset).items()
+        }
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Получает или создает HTTP клиент"""
         if self._client is None:
-            self._client = httpx.AsyncClient()
+            self._client = create_webhook_http_client(self._settings)
 
         return self._client
 
@@ -61,39 +164,68 @@ class WebhookSender:
             "data": data,
         }
 
+    def build_body(self, event_type: EventTypesEnum, payload: dict) -> bytes:
+        """
+        Сериализует тело webhook для события один раз.
+
+        Одни и те же байты отправляются всем подписчикам события; для каждой подписки
+        считается только HMAC по ним со своим секретом.
+        """
+        return HMACSigner.serialize_payload(self._build_webhook_payload(event_type, payload))
+
     def _build_request(
-        self, subscription: WebhookSubscriptionEntity, event_type: EventTypesEnum, payload: dict
+        self, subscription: WebhookSubscriptionEntity, event_type: EventTypesEnum, body: bytes
     ) -> WebhookRequest:
-        """Строит объект запроса с payload и заголовками"""
-        webhook_payload = self._build_webhook_payload(event_type, payload)
-        signature = HMACSigner.sign_payload(webhook_payload, subscription.secret_key.value)
-
+        """Строит объект запроса с готовым телом и подписью по этим же байтам"""
         headers = {
             "Content-Type": "application/json",
-            "X-Webhook-Signature": signature,
+            "X-Webhook-Signature": HMACSigner.sign_body(body, subscription.secret_key.value),
             "X-Webhook-Event": str(event_type),
         }
 
         return WebhookRequest(
             url=subscription.url.value,
-            payload=webhook_payload,
+            content=body,
             headers=headers,
             timeout=subscription.timeout.value,
         )
 
     def _calculate_retry_delay(self, attempt_number: int) -> float:
-        """Вычисляет задержку для ретрая с экспоненциальной задержкой"""
-        base_delay = 1.0
-        return base_delay * (2 ** (attempt_number - 1))
+        """
+        Вычисляет задержку для ретрая: экспоненциальная с ограничением сверху и джиттером.
+        Половина задержки фиксирована, половина случайна, чтобы ретраи многих доставок
+        к одному упавшему хосту не приходили одновременно.
+        """
+        delay = min(self._settings.retry_base_delay * (2 ** (attempt_number - 1)), self._settings.retry_max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
 
     async def _execute_request(self, request: WebhookRequest) -> WebhookResponse:
-        """Выполняет одну попытку отправки HTTP запроса"""
+        """Выполняет одну попытку отправки HTTP запроса и учитывает её в метриках и лимите хоста"""
         client = await self._get_client()
 
+        try:
+            host = HostConcurrencyLimiter.host_key(request.url)
+        except Exception as e:
+            return WebhookResponse(success=False, error_message=f"Request error: {e!s}", error_kind="request")
+
+        latency = 0.0
+        async with self._limiter.acquire(request.url):
+            started = time.perf_counter()
+            try:
+                response = await self._post(client, request)
+            finally:
+                latency = time.perf_counter() - started
+
+        self._metrics.observe(host, latency, response.error_kind)
+        await self._limiter.record(request.url, overloaded=response.is_overloaded)
+        return replace(response, duration=latency)
+
+    async def _post(self, client: httpx.AsyncClient, request: WebhookRequest) -> WebhookResponse:
+        """Отправляет HTTP запрос и преобразует результат или ошибку в WebhookResponse"""
         try:
             response = await client.post(
                 request.url,
-                json=request.payload,
+                content=request.content,
                 headers=request.headers,
                 timeout=request.timeout,
             )
@@ -112,18 +244,21 @@ class WebhookSender:
                 status_code=response.status_code,
                 body=response_body,
                 error_message=f"HTTP {response.status_code}: {response_body}",
+                error_kind="http_5xx" if response.status_code >= 500 else "http_4xx",
             )
 
         except httpx.TimeoutException:
             return WebhookResponse(
                 success=False,
                 error_message=f"Timeout after {request.timeout}s",
+                error_kind="timeout",
             )
 
         except httpx.RequestError as e:
             return WebhookResponse(
                 success=False,
                 error_message=f"Request error: {e!s}",
+                error_kind="connect" if isinstance(e, httpx.ConnectError) else "request",
             )
 
         except Exception as e:
@@ -131,6 +266,7 @@ class WebhookSender:
             return WebhookResponse(
                 success=False,
                 error_message=f"Unexpected error: {e!s}",
+                error_kind="unexpected",
             )
 
     async def send_webhook(
@@ -139,50 +275,80 @@ class WebhookSender:
         event_type: EventTypesEnum,
         payload: dict,
         delivery: WebhookDeliveryEntity,
+        body: bytes | None = None,
+        attempt_log: list[WebhookAttempt] | None = None,
     ) -> WebhookDeliveryEntity:
         """
-        Отправляет webhook с ретраями и таймаутом.
+        Выполняет одну попытку отправки webhook.
+
+        При неудаче, если попытки подписки не исчерпаны, доставка остается PENDING
+        с next_attempt_at, иначе отмечается как FAILED.
 
         Args:
             subscription: Подписка на webhook
             event_type: Тип события
             payload: Данные события (извлеченные из доменного события)
             delivery: Сущность доставки для обновления
+            body: Тело запроса из build_body(event_type, payload), общее для всех подписчиков события;
+                если не передано, сериализуется из payload
+            attempt_log: Список, в который добавляется запись о выполненной попытке; вызывающий код
+                сохраняет записи пакетом. Отложенная circuit breaker доставка записи не создает.
 
         Returns:
             Обновленная сущность доставки
         """
-        request = self._build_request(subscription, event_type, payload)
+        if body is None:
+            body = self.build_body(event_type, payload)
+        request = self._build_request(subscription, event_type, body)
         max_attempts = subscription.retry_count.value + 1
 
-        for attempt in range(1, max_attempts + 1):
-            delivery.increment_attempts()
+        circuit_key = self._circuit_key(subscription, request.url)
+        decision = await self._circuit_breaker.acquire(circuit_key) if self._circuit_breaker else None
+        if decision is not None and not decision.allowed:
+            return self._defer_delivery(subscription, event_type, delivery, circuit_key, decision)
 
-            logger.info(
-                f"Отправка webhook attempt={attempt}/{max_attempts} "
-                f"subscription_id={subscription.uuid} event={event_type!s} url={request.url}"
-            )
+        delivery.increment_attempts()
+        attempt = delivery.attempts.value
 
-            response = await self._execute_request(request)
+        logger.info(
+            f"Отправка webhook attempt={attempt}/{max_attempts} "
+            f"subscription_id={subscription.uuid} event={event_type!s} url={request.url}"
+        )
 
-            if response.success:
-                delivery.mark_success(
-                    response_status=response.status_code or 200,
-                    response_body=response.body or "",
-                    delivered_at=datetime_now(),
-                )
+        attempted_at = datetime_now()
+        response = await self._execute_request(request)
+        if attempt_log is not None:
+            attempt_log.append(self._build_attempt(subscription, delivery, attempt, attempted_at, response))
+        if decision is not None:
+            await self._record_circuit_result(circuit_key, decision, response)
+
+        if response.success:
+            delivery.mark_success(
+                response_status=response.status_code or 200,
+                response_body=response.body or "",
+                delivered_at=datetime_now(),
+            )
 
-                logger.info(
-                    f"Webhook успешно отправлен subscription_id={subscription.uuid} "
-                    f"event={event_type!s} status={response.status_code} attempts={attempt}"
-                )
+            logger.info(
+                f"Webhook успешно отправлен subscription_id={subscription.uuid} "
+                f"event={event_type!s} status={response.status_code} attempts={attempt}"
+            )
 
-                return delivery
+            return delivery
 
-            self._log_failed_attempt(subscription, event_type, attempt, response)
+        self._log_failed_attempt(subscription, event_type, attempt, response)
 
-            if attempt < max_attempts:
-                await self._wait_before_retry(attempt, subscription, event_type)
+        if attempt < max_attempts:
+            delay = self._calculate_retry_delay(attempt)
+            delivery.schedule_retry(
+                response.error_message or "Unknown error",
+                next_attempt_at=datetime_now() + timedelta(seconds=delay),
+            )
+            logger.info(
+                f"Повторная попытка через {delay:.1f}s subscription_id={subscription.uuid} "
+                f"event={event_type!s} attempt={attempt + 1}"
+            )
+            return delivery
 
         final_error_message = f"Все попытки исчерпаны: {response.error_message or 'Unknown error'}"
         delivery.mark_failed(final_error_message)
@@ -194,6 +360,80 @@ class WebhookSender:
 
         return delivery
 
+    @staticmethod
+    def _build_attempt(
+        subscription: WebhookSubscriptionEntity,
+        delivery: WebhookDeliveryEntity,
+        attempt: int,
+        attempted_at: datetime,
+        response: WebhookResponse,
+    ) -> WebhookAttempt:
+        """Создает запись журнала попыток по результату запроса"""
+        error_message = response.error_message
+        if error_message is not None:
+            error_message = error_message[:ATTEMPT_ERROR_MESSAGE_MAX_LENGTH]
+
+        return WebhookAttempt(
+            delivery_id=delivery.uuid,
+            subscription_id=subscription.uuid,
+            attempt=attempt,
+            attempted_at=attempted_at,
+            duration_ms=round(response.duration * 1000) if response.duration is not None else None,
+            response_status=response.status_code,
+            error_kind=response.error_kind,
+            error_message=error_message,
+        )
+
+    def _circuit_key(self, subscription: WebhookSubscriptionEntity, url: str) -> str:
+        """Ключ circuit breaker: хост URL подписки или сама подписка (WEBHOOK_CIRCUIT_SCOPE)"""
+        if self._settings.circuit_scope == "subscription":
+            return f"subscription:{subscription.uuid}"
+        try:
+            return f"host:{HostConcurrencyLimiter.host_key(url)}"
+        except Exception:
+            return f"subscription:{subscription.uuid}"
+
+    async def _record_circuit_result(self, key: str, decision: CircuitDecision, response: WebhookResponse) -> None:
+        """Передает результат запроса в circuit breaker; ответы 4xx цепь не открывают"""
+        if response.is_endpoint_failure:
+            await self._circuit_breaker.record_failure(key, decision)
+        elif decision.state != CircuitState.CLOSED or response.success:
+            await self._circuit_breaker.record_success(key, decision)
+
+    def _defer_delivery(
+        self,
+        subscription: WebhookSubscriptionEntity,
+        event_type: EventTypesEnum,
+        delivery: WebhookDeliveryEntity,
+        circuit_key: str,
+        decision: CircuitDecision,
+    ) -> WebhookDeliveryEntity:
+        """
+        Откладывает доставку до следующей пробы открытой цепи, не расходуя попытку.
+
+        Доставка, которая откладывается дольше WEBHOOK_CIRCUIT_MAX_DEFER секунд с момента создания,
+        отмечается как FAILED.
+        """
+        if (datetime_now() - delivery.created_at).total_seconds() >= self._settings.circuit_max_defer:
+            delivery.mark_failed(f"Circuit breaker открыт для {circuit_key} дольше {self._settings.circuit_max_defer}s")
+            logger.error(
+                f"Webhook не отправлен: circuit breaker открыт subscription_id={subscription.uuid} "
+                f"event={event_type!s} circuit={circuit_key}"
+            )
+            return delivery
+
+        # Джиттер, чтобы отложенные доставки не пришли одновременно к восстановившемуся хосту
+        delay = decision.retry_after + random.uniform(0, self._settings.retry_base_delay)
+        delivery.schedule_retry(
+            f"Circuit breaker открыт для {circuit_key}",
+            next_attempt_at=datetime_now() + timedelta(seconds=delay),
+        )
+        logger.info(
+            f"Webhook отложен на {delay:.1f}s: circuit breaker открыт subscription_id={subscription.uuid} "
+            f"event={event_type!s} circuit={circuit_key}"
+        )
+        return delivery
+
     def _log_failed_attempt(
         self,
         subscription: WebhookSubscriptionEntity,
@@ -212,17 +452,3 @@ class WebhookSender:
                 f"Ошибка при отправке webhook subscription_id={subscription.uuid} "
                 f"event={event_type!s} attempt={attempt} error={response.error_message}"
             )
-
-    async def _wait_before_retry(
-        self,
-        attempt: int,
-        subscription: WebhookSubscriptionEntity,
-        event_type: EventTypesEnum,
-    ) -> None:
-        """Ожидает перед повторной попыткой"""
-        delay = self._calculate_retry_delay(attempt)
-        logger.info(
-            f"Повторная попытка через {delay}s subscription_id={subscription.uuid} "
-            f"event={event_type!s} attempt={attempt + 1}"
-        )
-        await asyncio.sleep(delay)
@@ -1,14 +1,16 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from redis.asyncio import Redis
 
 from src.core.config import LOG_LEVEL
 from src.core.database import dispose_engine, init_engine, make_session_factory
 from src.core.logging import get_logger, setup_logging
-from src.core.settings import CacheSettings, DatabaseSettings, MinIOSettings
+from src.core.settings import CacheSettings, DatabaseSettings, MinIOSettings, RedisSettings
 from src.infrastructure.common.cache.redis import close_cache, init_cache
 from src.infrastructure.common.storage.minio import init_minio_storage
 from src.infrastructure.events.sync_service import EventTypeSyncService
+from src.infrastructure.webhooks.routing import RedisWebhookRoutingNotifier
 
 setup_logging(LOG_LEVEL)
 logger = get_logger("app")
@@ -39,6 +41,10 @@ async def lifespan(app: FastAPI):
         app.state.cache_service = cache_service
         app.state.redis_pool = redis_pool
 
+        # Уведомления воркеров об изменении подписок на webhooks (не зависят от CACHE_ENABLED)
+        webhook_redis = Redis.from_url(RedisSettings().get_url())
+        app.state.webhook_routing_notifier = RedisWebhookRoutingNotifier(webhook_redis)
+
         # Storage
         minio_settings = MinIOSettings()
         logger.info(f"Initializing MinIO storage: endpoint={minio_settings.endpoint}")
@@ -56,6 +62,7 @@ async def lifespan(app: FastAPI):
     logger.info("Application shutdown initiated")
     try:
         await close_cache(redis_pool)
+        await webhook_redis.aclose()
         await dispose_engine(engine)
         logger.info("Application shutdown completed")
     except Exception as e:
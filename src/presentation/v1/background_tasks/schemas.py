@@ -17,3 +17,4 @@ class TaskStartedResponse(BaseModel):
     task_id: str = Field(..., description="ID задачи")
     status: str = Field(default="PENDING", description="Статус задачи")
     message: str = Field(default="Task started", description="Сообщение")
+    result: dict[str, Any] | None = Field(None, description="Результат, если он уже готов (например, экспорт из кэша)")
@@ -5,16 +5,17 @@ from fastapi import Depends, Request
 from src.application.batches.reports.adapters import ReportStorageAdapter
 from src.application.batches.reports.ports import ReportGeneratorProtocol
 from src.application.batches.reports.services import ReportDataService, ReportEmailService, ReportGenerationService
+from src.application.batches.services.export_cache import BatchesExportCache
 from src.application.common.email.interfaces import EmailServiceProtocol
 from src.application.common.storage.interfaces import StorageServiceProtocol
 from src.application.work_centers.queries.service import WorkCenterQueryServiceProtocol
 from src.core.logging import get_logger
-from src.core.settings import EmailSettings
+from src.core.settings import BatchExportSettings, EmailSettings
 from src.infrastructure.common.email.smtp import SMTPEmailService
 from src.infrastructure.common.file_generators.batches.reports import BatchExcelReportGenerator, BatchPDFReportGenerator
 from src.infrastructure.persistence.queries.work_centers import WorkCenterQueryService
 from src.presentation.v1.batches.di.queries import batch_query
-from src.presentation.v1.common.di import async_session, uow
+from src.presentation.v1.common.di import async_session, cache, uow
 
 logger = get_logger("di.reports")
 
@@ -27,6 +28,17 @@ async def get_storage_service(request: Request) -> StorageServiceProtocol:
 storage_service = Annotated[StorageServiceProtocol, Depends(get_storage_service)]
 
 
+async def get_export_cache(cache_service: cache, storage: storage_service) -> BatchesExportCache | None:
+    """Dependency для получения кэша экспорта партий (None, если кэш выключен)."""
+    export_settings = BatchExportSettings()
+    if cache_service is None or not cache_service.enabled or not export_settings.cache_ttl:
+        return None
+    return BatchesExportCache(cache_service, storage, ttl=export_settings.cache_ttl)
+
+
+export_cache = Annotated[BatchesExportCache | None, Depends(get_export_cache)]
+
+
 async def get_work_center_query_service(session: async_session) -> WorkCenterQueryServiceProtocol:
     """Dependency для получения WorkCenterQueryService."""
     return WorkCenterQueryService(session)
@@ -1,13 +1,15 @@
-import base64
+from uuid import uuid4
 
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 
-from src.application.common.dtos import ExportImportFileFormatEnum
+from src.application.batches.services.import_service import BatchesImportService, generate_import_object_name
+from src.application.common.dtos import ExportFileFormatEnum, ExportImportFileFormatEnum
 from src.infrastructure.background_tasks import states
 from src.infrastructure.background_tasks.tasks import export_batches as export_batches_task
 from src.infrastructure.background_tasks.tasks import import_batches as import_batches_task
 from src.presentation.exceptions.base import PresentationException
 from src.presentation.v1.background_tasks.schemas import TaskStartedResponse
+from src.presentation.v1.batches.di.services import export_cache, storage_service
 from src.presentation.v1.batches.mappers import batch_filters_params_to_query
 from src.presentation.v1.batches.schemas.filters import BatchFiltersParams
 
@@ -16,13 +18,17 @@ router = APIRouter()
 
 @router.post("/import", response_model=TaskStartedResponse, status_code=status.HTTP_202_ACCEPTED)
 async def import_batches(
+    storage: storage_service,
     file: UploadFile = File(..., description="Файл с партиями (xlsx/csv)"),
     update_existing: bool = False,
+    dry_run: bool = Query(False, description="Только проверить файл и вернуть отчет об ошибках без записи"),
 ) -> TaskStartedResponse:
     """
     Импортирует партии из файла.
 
-    Импорт выполняется асинхронно в фоновой задаче.
+    Файл потоково загружается в bucket imports, импорт выполняется асинхронно
+    в фоновой задаче, которая получает только имя объекта. С dry_run задача
+    проверяет весь файл и возвращает отчет, ничего не записывая.
     """
     file_extension = file.filename.split(".")[-1].lower() if file.filename else ""
 
@@ -33,35 +39,69 @@ async def import_batches(
             f"Unsupported file format: {file_extension}. Supported formats: {', '.join(allowed_extensions)}"
         )
 
-    file_data = await file.read()
-    file_data_base64 = base64.b64encode(file_data).decode("utf-8")
-
-    task = import_batches_task.delay(
-        file_data_base64=file_data_base64, file_extension=file_extension, update_existing=update_existing
+    object_name = await storage.upload_stream(
+        bucket_name=BatchesImportService.IMPORT_BUCKET,
+        object_name=generate_import_object_name(file_extension),
+        stream=file.file,
+        file_extension=file_extension,
     )
 
+    task = import_batches_task.delay(object_name=object_name, update_existing=update_existing, dry_run=dry_run)
+
     return TaskStartedResponse(
         task_id=task.id,
         status=states.PENDING,
-        message="Import task started",
+        message="Import dry run task started" if dry_run else "Import task started",
     )
 
 
 @router.post("/export", response_model=TaskStartedResponse, status_code=status.HTTP_202_ACCEPTED)
 async def export_batches(
-    format: ExportImportFileFormatEnum = Query(..., description="Формат экспорта"),
+    cache: export_cache,
+    format: ExportFileFormatEnum = Query(..., description="Формат экспорта"),
     filters: BatchFiltersParams = Depends(),
 ) -> TaskStartedResponse:
     """
     Экспортирует партии в файл.
 
-    Экспорт выполняется асинхронно в фоновой задаче.
+    Экспорт выполняется асинхронно в фоновой задаче. Если файл с тем же форматом и фильтрами
+    уже создан и партии с тех пор не менялись, сразу возвращается его presigned URL;
+    одинаковые запросы во время экспорта получают ID уже выполняющейся задачи.
     """
     filters = batch_filters_params_to_query(filters, return_none=False)
-    task = export_batches_task.delay(format=format, filters=filters)
+    if cache is None:
+        task = export_batches_task.delay(format=format, filters=filters)
+        return TaskStartedResponse(task_id=task.id, status=states.PENDING, message="Export task started")
 
-    return TaskStartedResponse(
-        task_id=task.id,
-        status=states.PENDING,
-        message="Export task started",
-    )
+    cache_key = await cache.get_key(format.value, filters)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return TaskStartedResponse(
+            task_id=cached.task_id,
+            status=states.SUCCESS,
+            message="Export served from cache",
+            result={
+                "success": True,
+                "file_path": cached.result.file_url,
+                "download_url": cached.result.presigned_url,
+                "total": cached.result.total_batches,
+                "cached": True,
+            },
+        )
+
+    task_id = str(uuid4())
+    running_task_id = await cache.claim(cache_key, task_id)
+    if running_task_id is not None:
+        return TaskStartedResponse(
+            task_id=running_task_id, status=states.PENDING, message="Export task already running"
+        )
+
+    try:
+        export_batches_task.apply_async(
+            kwargs={"format": format, "filters": filters, "cache_key": cache_key}, task_id=task_id
+        )
+    except Exception:
+        await cache.release(cache_key)
+        raise
+
+    return TaskStartedResponse(task_id=task_id, status=states.PENDING, message="Export task started")
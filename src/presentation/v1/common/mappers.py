@@ -1,6 +1,12 @@
-from src.domain.common.queries import PaginationSpec
+import base64
+import binascii
+
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.common.queries import KeysetCursor, KeysetPaginationSpec, PaginationSpec
 from src.presentation.exceptions import SerializationException
-from src.presentation.v1.common.schemas import PaginationParams
+from src.presentation.v1.common.schemas import KeysetPaginationParams, PaginationParams
 
 
 def pagination_params_to_spec(params: PaginationParams) -> PaginationSpec | None:
@@ -11,3 +17,27 @@ def pagination_params_to_spec(params: PaginationParams) -> PaginationSpec | None
         return None
     except Exception as e:
         raise SerializationException(f"Ошибка сериализации PaginationParams: {e}") from e
+
+
+def encode_keyset_cursor(cursor: KeysetCursor | None) -> str | None:
+    """Кодирует курсор keyset пагинации в непрозрачную строку для ответа API"""
+    if cursor is None:
+        return None
+    raw = f"{cursor.created_at.isoformat()}|{cursor.uuid}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(value: str) -> KeysetCursor:
+    """Декодирует курсор, полученный из encode_keyset_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        created_at, uuid = raw.split("|")
+        return KeysetCursor(created_at=datetime.fromisoformat(created_at), uuid=UUID(uuid))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise SerializationException(f"Некорректный курсор пагинации: {value}") from e
+
+
+def keyset_pagination_params_to_spec(params: KeysetPaginationParams) -> KeysetPaginationSpec:
+    """Конвертирует KeysetPaginationParams в KeysetPaginationSpec"""
+    after = decode_keyset_cursor(params.cursor) if params.cursor else None
+    return KeysetPaginationSpec(limit=params.limit, after=after)
@@ -22,6 +22,13 @@ class PaginationParams(BaseModel):
     offset: Annotated[int | None, Query(ge=0, description="Смещение от начала")] = 0
 
 
+class KeysetPaginationParams(BaseModel):
+    limit: Annotated[int, Query(ge=1, le=100, description="Лимит элементов на странице")] = 25
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы (next_cursor из предыдущего ответа)")
+    ] = None
+
+
 class SortParams(BaseModel):
     sort_field: Annotated[str | None, Query(description="Поле для сортировки")] = "created_at"
     sort_direction: Annotated[SortDirection | None, Query(description="Направление сортировки")] = SortDirection.DESC
@@ -1,20 +1,33 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from src.application.webhooks.commands.create_subscription import CreateWebhookSubscriptionCommand
 from src.application.webhooks.commands.delete_subscription import DeleteWebhookSubscriptionCommand
+from src.application.webhooks.routing import WebhookRoutingNotifierProtocol
 from src.presentation.v1.common.di import uow
 
 
-async def get_create_webhook_subscription_command(unit_of_work: uow) -> CreateWebhookSubscriptionCommand:
+async def get_webhook_routing_notifier(request: Request) -> WebhookRoutingNotifierProtocol | None:
+    """Dependency для получения WebhookRoutingNotifier из app.state."""
+    return getattr(request.app.state, "webhook_routing_notifier", None)
+
+
+routing_notifier = Annotated[WebhookRoutingNotifierProtocol | None, Depends(get_webhook_routing_notifier)]
+
+
+async def get_create_webhook_subscription_command(
+    unit_of_work: uow, notifier: routing_notifier
+) -> CreateWebhookSubscriptionCommand:
     """Dependency для CreateWebhookSubscriptionCommand"""
-    return CreateWebhookSubscriptionCommand(unit_of_work)
+    return CreateWebhookSubscriptionCommand(unit_of_work, notifier)
 
 
-async def get_delete_webhook_subscription_command(unit_of_work: uow) -> DeleteWebhookSubscriptionCommand:
+async def get_delete_webhook_subscription_command(
+    unit_of_work: uow, notifier: routing_notifier
+) -> DeleteWebhookSubscriptionCommand:
     """Dependency для DeleteWebhookSubscriptionCommand"""
-    return DeleteWebhookSubscriptionCommand(unit_of_work)
+    return DeleteWebhookSubscriptionCommand(unit_of_work, notifier)
 
 
 create_webhook_subscription = Annotated[
@@ -6,8 +6,8 @@ from src.application.webhooks.queries.queries import ListWebhookDeliveriesQuery,
 from src.domain.webhooks.entities.delivery import WebhookDeliveryEntity
 from src.domain.webhooks.entities.subscription import WebhookSubscriptionEntity
 from src.presentation.exceptions import SerializationException
-from src.presentation.v1.common.mappers import pagination_params_to_spec
-from src.presentation.v1.common.schemas import PaginationParams
+from src.presentation.v1.common.mappers import keyset_pagination_params_to_spec, pagination_params_to_spec
+from src.presentation.v1.common.schemas import KeysetPaginationParams, PaginationParams
 from src.presentation.v1.webhooks.schemas import (
     CreateWebhookSubscriptionRequest,
     WebhookDeliveryResponse,
@@ -70,6 +70,7 @@ def delivery_entity_to_response(entity: WebhookDeliveryEntity) -> WebhookDeliver
             response_body=entity.response_body,
             error_message=entity.error_message,
             delivered_at=entity.delivered_at,
+            next_attempt_at=entity.next_attempt_at,
         )
     except Exception as e:
         raise SerializationException(f"Ошибка сериализации WebhookDeliveryEntity в response: {e}") from e
@@ -98,9 +99,9 @@ def build_list_webhook_subscriptions_query(
 
 def build_list_webhook_deliveries_query(
     subscription_id: UUID,
-    pagination_params: PaginationParams,
+    pagination_params: KeysetPaginationParams,
 ) -> ListWebhookDeliveriesQuery:
     """Создает ListWebhookDeliveriesQuery из параметров запроса"""
-    pagination = pagination_params_to_spec(pagination_params)
+    pagination = keyset_pagination_params_to_spec(pagination_params)
 
     return ListWebhookDeliveriesQuery(subscription_id=subscription_id, pagination=pagination)
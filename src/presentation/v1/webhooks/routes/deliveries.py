@@ -2,7 +2,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends
 
-from src.presentation.v1.common.schemas import PaginationParams
+from src.presentation.v1.common.mappers import encode_keyset_cursor
+from src.presentation.v1.common.schemas import KeysetPaginationParams
 from src.presentation.v1.webhooks.di.queries import list_webhook_deliveries
 from src.presentation.v1.webhooks.mappers import (
     build_list_webhook_deliveries_query,
@@ -17,16 +18,17 @@ router = APIRouter()
 async def list_webhook_deliveries(
     subscription_id: UUID,
     query_handler: list_webhook_deliveries,
-    pagination_params: PaginationParams = Depends(),
+    pagination_params: KeysetPaginationParams = Depends(),
 ) -> ListWebhookDeliveriesResponse:
     """
-    Получает список доставок для подписки на webhook с пагинацией.
+    Получает список доставок для подписки на webhook, от новых к старым.
+
+    Пагинация по курсору: для следующей страницы передайте next_cursor из ответа в параметре cursor.
     """
     query = build_list_webhook_deliveries_query(subscription_id, pagination_params)
     result = await query_handler.execute(query)
     return ListWebhookDeliveriesResponse(
         items=[delivery_entity_to_response(delivery) for delivery in result.items],
-        total=result.total,
         limit=result.limit,
-        offset=result.offset,
+        next_cursor=encode_keyset_cursor(result.next_cursor),
     )
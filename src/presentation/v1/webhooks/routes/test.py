@@ -24,9 +24,10 @@ async def test_webhook(
     received_at = datetime.now(UTC).isoformat()
 
     headers_dict = dict(request.headers)
-    signature_header = headers_dict.get("X-Webhook-Signature")
-    event_header = headers_dict.get("X-Webhook-Event")
+    signature_header = request.headers.get("X-Webhook-Signature")
+    event_header = request.headers.get("X-Webhook-Event")
 
+    body = await request.body()
     try:
         payload = await request.json()
     except Exception as e:
@@ -37,7 +38,8 @@ async def test_webhook(
 
     if secret_key and signature_header:
         try:
-            signature_valid = HMACSigner.verify_signature(payload, signature_header, secret_key)
+            # Подпись считается по телу запроса в том виде, в каком оно отправлено
+            signature_valid = HMACSigner.verify_body(body, signature_header, secret_key)
             logger.info(f"Проверка подписи: valid={signature_valid}")
         except Exception as e:
             logger.warning(f"Ошибка при проверке подписи: {e}")
@@ -75,6 +75,9 @@ class WebhookDeliveryResponse(UUIDSchema, TimestampSchema, BaseModel):
     response_body: str | None = Field(None, description="Тело ответа")
     error_message: str | None = Field(None, description="Сообщение об ошибке")
     delivered_at: datetime | None = Field(None, description="Время доставки")
+    next_attempt_at: datetime | None = Field(
+        None, description="Время следующей попытки (для доставок в статусе pending)"
+    )
 
     class Config:
         from_attributes = True
@@ -83,10 +86,9 @@ class WebhookDeliveryResponse(UUIDSchema, TimestampSchema, BaseModel):
 class ListWebhookDeliveriesResponse(BaseModel):
     """Response schema для списка доставок webhook"""
 
-    items: list[WebhookDeliveryResponse] = Field(..., description="Список доставок")
-    total: int = Field(..., description="Общее количество доставок")
+    items: list[WebhookDeliveryResponse] = Field(..., description="Список доставок, от новых к старым")
     limit: int | None = Field(None, description="Лимит элементов на странице")
-    offset: int | None = Field(None, description="Смещение от начала")
+    next_cursor: str | None = Field(None, description="Курсор следующей страницы; null на последней странице")
 
     class Config:
         from_attributes = True